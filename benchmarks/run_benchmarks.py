@@ -0,0 +1,499 @@
+"""
+리포지토리/서비스 벤치마크
+
+규모별로 합성 프로젝트(synthetic_project.py)를 만든 뒤 cinescribe.repository의 모든 공개 메서드,
+AssetImportService.import_image, DocumentService 저장/읽기 왕복, 라이브러리 검색의 시간을 재고
+커밋끼리 비교할 수 있는 JSON으로 저장한다. 라이브러리(~/.cinescribe)는 임시 HOME 아래에 만들어
+실제 사용자 데이터를 건드리지 않는다.
+
+    python benchmarks/run_benchmarks.py --scales small medium --out bench.json
+    python benchmarks/run_benchmarks.py --compare base.json bench.json --threshold 1.25
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import inspect
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+BENCH_DIR = Path(__file__).resolve().parent
+SRC_DIR = BENCH_DIR.parent / "src"
+for path in (str(SRC_DIR), str(BENCH_DIR)):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from synthetic_project import SCALES, SyntheticProject, board_json, generate_library, generate_project, make_image  # noqa: E402
+
+RESULTS_VERSION = 1
+
+
+@dataclass
+class Case:
+    name: str  # '<클래스>.<메서드>' 또는 서비스 작업 이름
+    run: Callable[[Any], Any]
+    # 반복마다 시간 밖에서 인자를 준비하고(setup) 정리한다(teardown). 상태를 바꾸는 메서드용
+    setup: Optional[Callable[[], Any]] = None
+    teardown: Optional[Callable[[Any], None]] = None
+
+
+@dataclass
+class Result:
+    name: str
+    scale: str
+    repeat: int
+    min_ms: float
+    median_ms: float
+    mean_ms: float
+    max_ms: float
+
+
+def _measure(case: Case, repeat: int) -> List[float]:
+    timings: List[float] = []
+    # 첫 실행은 페이지 캐시/바이트코드 예열용으로 버린다
+    for i in range(repeat + 1):
+        arg = case.setup() if case.setup else None
+        started = time.perf_counter()
+        case.run(arg)
+        elapsed = time.perf_counter() - started
+        if case.teardown:
+            case.teardown(arg)
+        if i:
+            timings.append(elapsed * 1000)
+    return timings
+
+
+@contextlib.contextmanager
+def _quiet() -> Iterator[None]:
+    # 일부 리포지토리가 디버그 출력을 하므로 측정 중에는 버린다
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def _open(db_path: str) -> sqlite3.Connection:
+    # 연결을 받는 리포지토리 메서드는 리포지토리의 _connect()와 같은 Row 팩토리를 가정한다
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def _connection(db_path: str) -> Callable[[], sqlite3.Connection]:
+    return lambda: _open(db_path)
+
+
+def _commit_close(conn: sqlite3.Connection) -> None:
+    conn.commit()
+    conn.close()
+
+
+# ---- 케이스 목록 ----
+
+def repository_cases(p: SyntheticProject, work_dir: str) -> List[Case]:
+    from cinescribe.repository import (
+        AssetCheckRepository,
+        AssetRepository,
+        AudioRepository,
+        BoardIndexRepository,
+        CharacterRepository,
+        CinematicRepository,
+        DocumentRepository,
+        FinalImageRepository,
+        LibraryRepository,
+        ProjectRepository,
+        RevisionRepository,
+        SceneShotRepository,
+        SearchIndexRepository,
+    )
+    from cinescribe.repository.document_repository import Document
+    from cinescribe.repository.library_repository import LibraryProject
+
+    db = p.db_path
+    rng = random.Random(p.seed + 2)
+    mid = lambda ids: ids[len(ids) // 2]  # noqa: E731
+    scene = mid(p.scene_ids)
+    shot = mid(p.shot_ids)
+    code = p.shot_codes[len(p.shot_codes) // 2]
+    asset = mid(p.asset_ids)
+    char = mid(p.character_ids)
+    final_image = mid(p.final_image_ids)
+    doc_key = p.document_keys[0]
+    counter = iter(range(10 ** 9))
+    cases: List[Case] = []
+
+    def add(name: str, run: Callable[[Any], Any], setup=None, teardown=None) -> None:
+        cases.append(Case(name, run, setup, teardown))
+
+    # 생성자는 스키마 확인/업그레이드를 하고 앱 곳곳에서 자주 만들어지므로 따로 잰다
+    for cls in (ProjectRepository, CharacterRepository, SceneShotRepository, AssetRepository, AudioRepository,
+                CinematicRepository, DocumentRepository, FinalImageRepository, RevisionRepository,
+                BoardIndexRepository, SearchIndexRepository, AssetCheckRepository):
+        add(f"{cls.__name__}.__init__", lambda _, cls=cls: cls(db))
+    add("LibraryRepository.__init__", lambda _: LibraryRepository())
+
+    project = ProjectRepository(db)
+    add("ProjectRepository.get_info", lambda _: project.get_info())
+    add("ProjectRepository.get_tags", lambda _: project.get_tags())
+    add("ProjectRepository.add_tag", lambda _: project.add_tag("bench"), teardown=lambda _: project.remove_tag("bench"))
+    add("ProjectRepository.remove_tag", lambda _: project.remove_tag("bench"), setup=lambda: project.add_tag("bench"))
+    add("ProjectRepository.update_tags", lambda _: project.update_tags("bench,synthetic"))
+    add("ProjectRepository.update_title", lambda _: project.update_title(f"Benchmark {p.scale.name}"))
+    add("ProjectRepository.update_logline_synopsis", lambda _: project.update_logline_synopsis("logline", "synopsis " * 200))
+
+    library = LibraryRepository()
+    target = p.library_paths[len(p.library_paths) // 2]
+
+    def temp_project() -> str:
+        path = os.path.join(work_dir, "library", f"temp_{next(counter)}.sqlite")
+        library.upsert_project(LibraryProject(None, "temp", path, "", None, None, None, 1))
+        return path
+
+    add("LibraryRepository.list_projects", lambda _: library.list_projects())
+    add("LibraryRepository.list_projects[query]", lambda _: library.list_projects("rain"))
+    add("LibraryRepository.upsert_project", lambda path: library.upsert_project(
+        LibraryProject(None, "new", path, "", None, None, None, 1)),
+        setup=lambda: os.path.join(work_dir, "library", f"new_{next(counter)}.sqlite"), teardown=library.remove)
+    add("LibraryRepository.remove", lambda path: library.remove(path), setup=temp_project)
+    add("LibraryRepository.relocate", lambda path: library.relocate(path, path + ".moved"),
+        setup=temp_project, teardown=lambda path: library.remove(path + ".moved"))
+    add("LibraryRepository.archive", lambda _: library.archive(target, False))
+    add("LibraryRepository.mark_opened_now", lambda _: library.mark_opened_now(target))
+    add("LibraryRepository.set_thumbnail", lambda _: library.set_thumbnail(target, None))
+    add("LibraryRepository.update_file_states", lambda _: library.update_file_states(
+        ("ok", 1024, 0.0, 1, path) for path in p.library_paths))
+    add("LibraryRepository.list_roots", lambda _: library.list_roots())
+    add("LibraryRepository.add_root", lambda _: library.add_root(work_dir), teardown=lambda _: library.remove_root(work_dir))
+    add("LibraryRepository.remove_root", lambda _: library.remove_root(work_dir), setup=lambda: library.add_root(work_dir))
+
+    characters = CharacterRepository(db)
+    add("CharacterRepository.list_characters", lambda _: characters.list_characters())
+    add("CharacterRepository.list_characters_with_assets", lambda _: characters.list_characters_with_assets())
+    add("CharacterRepository.get", lambda _: characters.get(char))
+    add("CharacterRepository.create", lambda _: characters.create("bench"))
+    add("CharacterRepository.update", lambda _: characters.update(char, personality="calm " * 20, goal="escape"))
+    add("CharacterRepository.link_image", lambda _: characters.link_image(char, asset))
+    add("CharacterRepository.delete", lambda cid: characters.delete(cid), setup=lambda: characters.create("bench"))
+
+    shots = SceneShotRepository(db)
+    scene_shots = [s.id for s in shots.list_shots(scene)]
+    add("SceneShotRepository.list_scenes", lambda _: shots.list_scenes())
+    add("SceneShotRepository.list_shots", lambda _: shots.list_shots(scene))
+    add("SceneShotRepository.list_timeline", lambda _: shots.list_timeline())
+    add("SceneShotRepository.list_audio_cues", lambda _: shots.list_audio_cues())
+    add("SceneShotRepository.count_shots", lambda _: shots.count_shots())
+    add("SceneShotRepository.count_shots_by_scene", lambda _: shots.count_shots_by_scene())
+    add("SceneShotRepository.iter_shot_list", lambda _: sum(1 for _ in shots.iter_shot_list()))
+    add("SceneShotRepository.get_shot", lambda _: shots.get_shot(shot))
+    add("SceneShotRepository.create_scene", lambda _: shots.create_scene(name="bench"))
+    add("SceneShotRepository.create_shot", lambda _: shots.create_shot(scene, "bench", "desc", asset))
+    add("SceneShotRepository.create_shots", lambda _: shots.create_shots(scene, p.asset_ids[:20]))
+    add("SceneShotRepository.duplicate_shot", lambda _: shots.duplicate_shot(shot))
+    add("SceneShotRepository.link_shot_asset", lambda _: shots.link_shot_asset(shot, asset))
+    add("SceneShotRepository.update_scene_notes", lambda _: shots.update_scene_notes(scene, "notes " * 50))
+    add("SceneShotRepository.update_shot_meta", lambda _: shots.update_shot_meta(shot, code, "description " * 20))
+    add("SceneShotRepository.update_shot_details", lambda _: shots.update_shot_details(
+        shot, shot_type="CU", lens="50mm", image_prompt="rain rooftop " * 20, duration_sec=2.5))
+    add("SceneShotRepository.update_shots_order", lambda _: shots.update_shots_order(scene, list(reversed(scene_shots))))
+    add("SceneShotRepository.move_scene", lambda _: shots.move_scene(scene, 1), teardown=lambda _: shots.move_scene(scene, -1))
+    add("SceneShotRepository.delete_shot", lambda sid: shots.delete_shot(sid),
+        setup=lambda: shots.create_shot(scene, "bench", "", asset))
+    add("SceneShotRepository.delete_scene", lambda sid: shots.delete_scene(sid), setup=lambda: _scene_with_shots(shots, p))
+
+    assets = AssetRepository(db)
+    sample = assets.get_by_id(asset)
+
+    def fake_image() -> dict:
+        n = next(counter)
+        return dict(original_path=None, project_path=f"bench/{n}.png", filename=f"{n}.png", ext=".png",
+                    width=64, height=64, hash_sha256=f"bench{n:059d}", thumbnail_path=None)
+
+    add("AssetRepository.get_by_id", lambda _: assets.get_by_id(asset))
+    add("AssetRepository.get_by_hash", lambda _: assets.get_by_hash(sample.hash_sha256))
+    add("AssetRepository.search_images", lambda _: assets.search_images())
+    add("AssetRepository.search_images[query]", lambda _: assets.search_images("img_00"))
+    add("AssetRepository.list_all", lambda _: assets.list_all())
+    add("AssetRepository.list_file_stats", lambda _: assets.list_file_stats())
+    add("AssetRepository.is_asset_referenced", lambda _: assets.is_asset_referenced(asset))
+    add("AssetRepository.update_tags", lambda _: assets.update_tags(asset, "bench,rain"))
+    add("AssetRepository.set_thumbnail_path", lambda _: assets.set_thumbnail_path(asset, sample.thumbnail_path))
+    add("AssetRepository.update_file_stats", lambda _: assets.update_file_stats((64, 0.0, a) for a in p.asset_ids))
+    add("AssetRepository.update_content", lambda _: assets.update_content(
+        asset, sample.hash_sha256, sample.width, sample.height, 64, 0.0))
+    add("AssetRepository.upsert_image", lambda item: assets.upsert_image(**item), setup=fake_image)
+    add("AssetRepository.upsert_images", lambda items: assets.upsert_images(items),
+        setup=lambda: [fake_image() for _ in range(100)])
+    add("AssetRepository.delete_asset", lambda aid: assets.delete_asset(aid),
+        setup=lambda: assets.upsert_image(**fake_image()))
+
+    final_images = FinalImageRepository(db)
+    scene_images = [img.id for img in final_images.list_images(scene)]
+    add("FinalImageRepository.list_scenes", lambda _: final_images.list_scenes())
+    add("FinalImageRepository.list_images", lambda _: final_images.list_images(scene))
+    add("FinalImageRepository.count_images_by_scene", lambda _: final_images.count_images_by_scene())
+    add("FinalImageRepository.delete_scene", lambda sid: final_images.delete_scene(sid), setup=lambda: _scene_with_shots(shots, p))
+    add("FinalImageRepository.create_scene", lambda _: final_images.create_scene(name="bench"))
+    add("FinalImageRepository.create_image", lambda _: final_images.create_image(scene, "bench", asset))
+    add("FinalImageRepository.update_image_meta", lambda _: final_images.update_image_meta(final_image, "desc " * 20))
+    add("FinalImageRepository.link_image_asset", lambda _: final_images.link_image_asset(final_image, asset))
+    add("FinalImageRepository.update_images_order", lambda _: final_images.update_images_order(
+        scene, list(reversed(scene_images))))
+    add("FinalImageRepository.delete_image", lambda iid: final_images.delete_image(iid),
+        setup=lambda: final_images.create_image(scene, "bench", asset))
+
+    # 보드: 저장은 매번 다른 내용이어야 실제로 쓴다(같은 내용은 해시 비교 후 건너뜀)
+    for cls, board, list_key in ((AudioRepository, "audio", "cues"), (CinematicRepository, "cinematic", "sequences")):
+        repo = cls(db)
+        seqs = [r.seq for r in repo.history()]
+        name = cls.__name__
+        add(f"{name}.get", lambda _, repo=repo: repo.get())
+        add(f"{name}.find_entries", lambda _, repo=repo: repo.find_entries(key="shot", value=code))
+        add(f"{name}.get_entry_unit", lambda _, repo=repo, list_key=list_key: repo.get_entry_unit(f"$.{list_key}[0]"))
+        add(f"{name}.history", lambda _, repo=repo: repo.history())
+        add(f"{name}.diff_revisions", lambda _, repo=repo, seqs=seqs: repo.diff_revisions(seqs[1], seqs[0]))
+        add(f"{name}.export_to_file", lambda _, repo=repo, board=board: repo.export_to_file(
+            os.path.join(work_dir, f"{board}.json")))
+        add(f"{name}.upsert", lambda content, repo=repo: repo.upsert("json", content),
+            setup=lambda list_key=list_key: board_json(rng, p.shot_codes, p.scale.board_units, list_key))
+        add(f"{name}.restore_revision", lambda _, repo=repo, seqs=seqs: repo.restore_revision(seqs[0]))
+
+    documents = DocumentRepository(db)
+    doc_seqs = [r.seq for r in documents.history(doc_key)]
+    add("DocumentRepository.get", lambda _: documents.get(doc_key))
+    add("DocumentRepository.list_keys", lambda _: documents.list_keys())
+    add("DocumentRepository.search", lambda _: documents.search("rain"))
+    add("DocumentRepository.find_entries", lambda _: documents.find_entries(doc_key, key="shot", value=code))
+    add("DocumentRepository.get_entry_unit", lambda _: documents.get_entry_unit(doc_key, "$.items[0]"))
+    add("DocumentRepository.history", lambda _: documents.history(doc_key))
+    add("DocumentRepository.diff_revisions", lambda _: documents.diff_revisions(doc_key, doc_seqs[1], doc_seqs[0]))
+    add("DocumentRepository.export_to_file", lambda _: documents.export_to_file(doc_key, os.path.join(work_dir, "doc.json")))
+    add("DocumentRepository.upsert", lambda doc: documents.upsert(doc), setup=lambda: Document(
+        None, doc_key, "json", board_json(rng, p.shot_codes, p.scale.board_units // 5 + 1, "items")))
+    add("DocumentRepository.restore_revision", lambda _: documents.restore_revision(doc_key, doc_seqs[0]))
+
+    revisions = RevisionRepository(db)
+    cinematic_seqs = [r.seq for r in revisions.history("cinematic")]
+    add("RevisionRepository.history", lambda _: revisions.history("cinematic"))
+    add("RevisionRepository.content_at", lambda _: revisions.content_at("cinematic", cinematic_seqs[-1]))
+    add("RevisionRepository.diff", lambda _: revisions.diff("cinematic", cinematic_seqs[-1], cinematic_seqs[0]))
+    add("RevisionRepository.latest_hash", lambda conn: revisions.latest_hash(conn, "cinematic"),
+        setup=_connection(db), teardown=_commit_close)
+    add("RevisionRepository.record", lambda conn: revisions.record(
+        conn, "bench", "text", f"revision {next(counter)} " * 100, None), setup=_connection(db), teardown=_commit_close)
+
+    board_index = BoardIndexRepository(db)
+    add("BoardIndexRepository.find", lambda _: board_index.find(board="audio", key="shot", value=code))
+    add("BoardIndexRepository.find[value_like]", lambda _: board_index.find(value_like="%rooftop%"))
+    add("BoardIndexRepository.find_references", lambda _: board_index.find_references(code))
+    add("BoardIndexRepository.get_unit", lambda _: board_index.get_unit("cinematic", "$.sequences[0]"))
+    add("BoardIndexRepository.is_indexed", lambda conn: board_index.is_indexed(conn, "audio"),
+        setup=_connection(db), teardown=_commit_close)
+
+    def refresh_args() -> Tuple[sqlite3.Connection, str]:
+        return _open(db), board_json(rng, p.shot_codes, p.scale.board_units, "items")
+
+    add("BoardIndexRepository.refresh", lambda args: board_index.refresh(args[0], "doc:bench", "json", args[1]),
+        setup=refresh_args, teardown=lambda args: _commit_close(args[0]))
+
+    search_index = SearchIndexRepository(db)
+    add("SearchIndexRepository.search", lambda _: search_index.search("옥상"))
+    add("SearchIndexRepository.search[and]", lambda _: search_index.search("rain night"))
+    add("SearchIndexRepository.index_document", lambda conn: search_index.index_document(
+        conn, 10 ** 6, "bench", "rain rooftop " * 500), setup=_connection(db), teardown=_commit_close)
+    add("SearchIndexRepository.rebuild", lambda _: search_index.rebuild())
+
+    checks = AssetCheckRepository(db)
+    add("AssetCheckRepository.begin", lambda _: checks.begin(resume=False))
+    add("AssetCheckRepository.current_run", lambda _: checks.current_run())
+    add("AssetCheckRepository.record", lambda _: checks.record((a, 64, 0.0, "ok") for a in p.asset_ids))
+    add("AssetCheckRepository.checked_since", lambda _: checks.checked_since(0.0))
+    add("AssetCheckRepository.forget", lambda _: checks.forget(p.asset_ids[:10]))
+    add("AssetCheckRepository.finish", lambda _: checks.finish())
+    return cases
+
+
+def _scene_with_shots(shots, p: SyntheticProject) -> int:
+    scene_id = shots.create_scene(name="bench")
+    shots.create_shots(scene_id, p.asset_ids[:10])
+    return scene_id
+
+
+def service_cases(p: SyntheticProject, work_dir: str) -> List[Case]:
+    from cinescribe.service import AssetImportService, DocumentService, LibraryService
+
+    rng = random.Random(p.seed + 3)
+    counter = iter(range(10 ** 9))
+    importer = AssetImportService(p.db_path)
+    documents = DocumentService(p.db_path)
+    library = LibraryService()
+    board = json.loads(board_json(rng, p.shot_codes, p.scale.board_units, "items"))
+    text = "\n".join(" ".join(rng.sample(p.shot_codes, min(5, len(p.shot_codes)))) for _ in range(p.scale.board_units))
+
+    def new_image() -> str:
+        # 매번 다른 내용이어야 중복 제거 없이 실제로 복사/썸네일을 만든다
+        path = os.path.join(work_dir, f"import_{next(counter)}.png")
+        make_image(path, rng, size=(640, 360))
+        return path
+
+    def json_round_trip(_) -> None:
+        board["title"] = f"rev {next(counter)}"
+        documents.save_json("bench_board", board)
+        documents.load_json("bench_board")
+
+    def text_round_trip(_) -> None:
+        documents.save_text("bench_text", f"{next(counter)}\n{text}")
+        documents.load_text("bench_text")
+
+    return [
+        Case("AssetImportService.import_image", lambda path: importer.import_image(path), setup=new_image),
+        Case("DocumentService.json_round_trip", json_round_trip),
+        Case("DocumentService.text_round_trip", text_round_trip),
+        Case("DocumentService.load_json", lambda _: documents.load_json(p.document_keys[0])),
+        Case("LibraryService.search", lambda _: library.search()),
+        Case("LibraryService.search[query]", lambda _: library.search("rain")),
+    ]
+
+
+def uncovered_methods(names: List[str]) -> List[str]:
+    """cinescribe.repository의 공개 메서드 중 케이스가 없는 것(새 메서드를 추가하면 여기에 뜬다)."""
+    import cinescribe.repository as repository
+
+    covered = {name.split("[")[0] for name in names}
+    missing = []
+    for class_name in repository.__all__:
+        cls = getattr(repository, class_name)
+        for method, _ in inspect.getmembers(cls, inspect.isfunction):
+            if not method.startswith("_") and f"{class_name}.{method}" not in covered:
+                missing.append(f"{class_name}.{method}")
+    return missing
+
+
+# ---- 실행/비교 ----
+
+def run(scales: List[str], repeat: int, name_filter: Optional[str], keep: Optional[str]) -> dict:
+    work_root = keep or tempfile.mkdtemp(prefix="cinescribe_bench_")
+    # 라이브러리/스냅샷 등 ~/.cinescribe 아래 파일이 실제 사용자 폴더에 생기지 않도록
+    os.environ["HOME"] = os.environ["USERPROFILE"] = os.path.join(work_root, "home")
+    results: List[Result] = []
+    names: List[str] = []
+    try:
+        for scale_name in scales:
+            scale = SCALES[scale_name]
+            work_dir = os.path.join(work_root, scale_name)
+            started = time.perf_counter()
+            with _quiet():
+                project = generate_project(work_dir, scale)
+                generate_library(work_dir, project)
+            print(f"[{scale_name}] 합성 프로젝트 생성 {time.perf_counter() - started:.1f}s", file=sys.stderr)
+            with _quiet():
+                cases = repository_cases(project, work_dir) + service_cases(project, work_dir)
+            for case in cases:
+                names.append(case.name)
+                if name_filter and name_filter not in case.name:
+                    continue
+                with _quiet():
+                    timings = _measure(case, repeat)
+                result = Result(
+                    name=case.name,
+                    scale=scale_name,
+                    repeat=repeat,
+                    min_ms=round(min(timings), 4),
+                    median_ms=round(statistics.median(timings), 4),
+                    mean_ms=round(statistics.fmean(timings), 4),
+                    max_ms=round(max(timings), 4),
+                )
+                results.append(result)
+                print(f"[{scale_name}] {case.name:<55} {result.median_ms:10.3f} ms", file=sys.stderr)
+    finally:
+        if keep is None:
+            shutil.rmtree(work_root, ignore_errors=True)
+    return {
+        "version": RESULTS_VERSION,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sqlite": sqlite3.sqlite_version,
+        "cpu_count": os.cpu_count(),
+        "repeat": repeat,
+        "scales": {name: asdict(SCALES[name]) for name in scales},
+        "uncovered": uncovered_methods(sorted(set(names))),
+        "results": [asdict(r) for r in results],
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BENCH_DIR.parent, capture_output=True, text=True, timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def compare(base_path: str, head_path: str, threshold: float) -> int:
+    """중앙값 비율(head/base)을 출력하고 threshold보다 느려진 항목이 있으면 1을 돌려준다."""
+    with open(base_path, "r", encoding="utf-8") as f:
+        base = json.load(f)
+    with open(head_path, "r", encoding="utf-8") as f:
+        head = json.load(f)
+    before = {(r["scale"], r["name"]): r for r in base["results"]}
+    slower = 0
+    print(f"{base.get('git_commit')} -> {head.get('git_commit')} (중앙값 비율, >{threshold:.2f}이면 느려짐)")
+    for r in head["results"]:
+        old = before.get((r["scale"], r["name"]))
+        if old is None:
+            print(f"  new   [{r['scale']}] {r['name']}: {r['median_ms']:.3f} ms")
+            continue
+        ratio = r["median_ms"] / old["median_ms"] if old["median_ms"] else float("inf")
+        mark = "  "
+        if ratio > threshold:
+            mark = "✗ "
+            slower += 1
+        elif ratio < 1 / threshold:
+            mark = "✓ "
+        print(f"{mark}{ratio:6.2f}x [{r['scale']}] {r['name']}: {old['median_ms']:.3f} -> {r['median_ms']:.3f} ms")
+    print(f"느려진 항목 {slower}개")
+    return 1 if slower else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="cinescribe 리포지토리/서비스 벤치마크")
+    parser.add_argument("--scales", nargs="+", choices=sorted(SCALES), default=["small", "medium"])
+    parser.add_argument("--repeat", type=int, default=5, help="케이스마다 반복 횟수(예열 1회 제외)")
+    parser.add_argument("--filter", default=None, help="이름에 이 문자열이 들어간 케이스만")
+    parser.add_argument("--out", default=None, help="결과 JSON 경로(기본: 표준 출력)")
+    parser.add_argument("--keep", default=None, metavar="DIR", help="합성 프로젝트를 이 폴더에 만들고 남겨 둠")
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "HEAD"), help="두 결과 JSON 비교")
+    parser.add_argument("--threshold", type=float, default=1.25, help="--compare에서 느려짐으로 볼 비율")
+    args = parser.parse_args()
+    if args.compare:
+        return compare(args.compare[0], args.compare[1], args.threshold)
+    data = run(args.scales, max(1, args.repeat), args.filter, args.keep)
+    if data["uncovered"]:
+        print(f"케이스가 없는 리포지토리 메서드: {', '.join(data['uncovered'])}", file=sys.stderr)
+    text = json.dumps(data, ensure_ascii=False, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text)
+        print(f"✓ {args.out} (케이스 {len(data['results'])}개)", file=sys.stderr)
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,226 @@
+"""
+벤치마크용 합성 프로젝트 생성기
+
+같은 seed와 규모(Scale)면 항상 같은 내용의 프로젝트를 만든다: 장면 N개 x 샷 M개,
+실제 작은 PNG 에셋 K개, 캐릭터, 큰 JSON 보드(오디오/시네마틱/문서), 라이브러리 등록 프로젝트.
+라이브러리는 ~/.cinescribe 아래에 있으므로 호출하는 쪽에서 HOME을 임시 폴더로 돌려 둔다.
+
+    python benchmarks/synthetic_project.py ./bench_out --scale medium
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from PIL import Image  # noqa: E402
+
+# 검색 벤치마크가 실제로 걸리도록 한국어/영어 낱말을 섞는다
+WORDS = (
+    "옥상 골목 비 새벽 자동차 추격 창문 그림자 계단 지하철 편의점 카페 바다 안개 불빛 "
+    "rooftop alley rain dawn chase window shadow stairs subway neon harbor fog night close wide"
+).split()
+SHOT_TYPES = ("WS", "MS", "CU", "ECU", "OTS", "POV")
+MOVEMENTS = ("static", "pan", "tilt", "dolly", "handheld", "crane")
+
+
+@dataclass
+class Scale:
+    name: str
+    scenes: int
+    shots_per_scene: int
+    assets: int
+    characters: int
+    # 오디오/시네마틱/문서 보드의 항목 수
+    board_units: int
+    documents: int
+    library_projects: int
+
+
+SCALES: Dict[str, Scale] = {
+    "small": Scale("small", scenes=5, shots_per_scene=10, assets=20, characters=10,
+                   board_units=50, documents=5, library_projects=50),
+    "medium": Scale("medium", scenes=20, shots_per_scene=25, assets=200, characters=40,
+                    board_units=500, documents=20, library_projects=300),
+    "large": Scale("large", scenes=50, shots_per_scene=100, assets=1000, characters=100,
+                   board_units=5000, documents=50, library_projects=2000),
+}
+
+
+@dataclass
+class SyntheticProject:
+    db_path: str
+    scale: Scale
+    seed: int
+    scene_ids: List[int] = field(default_factory=list)
+    shot_ids: List[int] = field(default_factory=list)
+    shot_codes: List[str] = field(default_factory=list)
+    asset_ids: List[int] = field(default_factory=list)
+    character_ids: List[int] = field(default_factory=list)
+    final_image_ids: List[int] = field(default_factory=list)
+    document_keys: List[str] = field(default_factory=list)
+    library_paths: List[str] = field(default_factory=list)
+    # 가져오기 벤치마크에 쓸 원본 이미지 폴더
+    image_dir: str = ""
+
+
+def sentence(rng: random.Random, n: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(n))
+
+
+def make_image(path: str, rng: random.Random, size=(96, 64)) -> None:
+    """rng로 정한 색 블록 몇 개를 그린 작은 PNG(압축이 거의 안 되는 실제 이미지)."""
+    img = Image.new("RGB", size, tuple(rng.randrange(256) for _ in range(3)))
+    pixels = img.load()
+    for _ in range(12):
+        x0, y0 = rng.randrange(size[0]), rng.randrange(size[1])
+        color = tuple(rng.randrange(256) for _ in range(3))
+        for x in range(x0, min(size[0], x0 + rng.randrange(4, 24))):
+            for y in range(y0, min(size[1], y0 + rng.randrange(4, 24))):
+                pixels[x, y] = color
+    img.save(path, "PNG")
+
+
+def board_json(rng: random.Random, codes: List[str], units: int, list_key: str) -> str:
+    items = [
+        {
+            "shot": rng.choice(codes) if codes else f"S{i}",
+            "type": rng.choice(("music", "sfx", "dialogue", "ambience")),
+            "start": round(rng.uniform(0, 600), 2),
+            "note": sentence(rng, 12),
+            "tags": [rng.choice(WORDS) for _ in range(3)],
+        }
+        for i in range(units)
+    ]
+    return json.dumps({"title": sentence(rng, 3), list_key: items}, ensure_ascii=False)
+
+
+def generate_project(out_dir: str, scale: Scale, seed: int = 0) -> SyntheticProject:
+    from cinescribe.repository.audio_repository import AudioRepository
+    from cinescribe.repository.character_repository import CharacterRepository
+    from cinescribe.repository.cinematic_repository import CinematicRepository
+    from cinescribe.repository.final_image_repository import FinalImageRepository
+    from cinescribe.repository.scene_shot_repository import SceneShotRepository
+    from cinescribe.service.asset_import_service import AssetImportService
+    from cinescribe.service.document_service import DocumentService
+    from cinescribe.service.project_init_service import ProjectInitService
+
+    rng = random.Random(seed)
+    os.makedirs(out_dir, exist_ok=True)
+    db_path = os.path.join(os.path.abspath(out_dir), f"bench_{scale.name}.sqlite")
+    ProjectInitService().create_new_project(db_path, title=f"Benchmark {scale.name}")
+    project = SyntheticProject(db_path=db_path, scale=scale, seed=seed)
+
+    # 에셋: 실제 PNG를 만들어 보통의 가져오기 경로로 등록
+    project.image_dir = os.path.join(os.path.abspath(out_dir), f"images_{scale.name}")
+    os.makedirs(project.image_dir, exist_ok=True)
+    sources = []
+    for i in range(scale.assets):
+        path = os.path.join(project.image_dir, f"img_{i:05d}.png")
+        make_image(path, rng)
+        sources.append(path)
+    imported = AssetImportService(db_path).import_many(sources)
+    project.asset_ids = [asset_id for asset_id, _, _ in imported]
+
+    # 장면/샷: 샷은 장면마다 한 번에 만들고 세부 항목은 한 트랜잭션으로 채운다
+    shots = SceneShotRepository(db_path)
+    details = []
+    for s in range(scale.scenes):
+        scene_id = shots.create_scene(number=s + 1, name=f"S{s + 1:02d} {sentence(rng, 2)}", notes=sentence(rng, 20))
+        project.scene_ids.append(scene_id)
+        asset_ids = [project.asset_ids[rng.randrange(len(project.asset_ids))] for _ in range(scale.shots_per_scene)]
+        for n, shot_id in enumerate(shots.create_shots(scene_id, asset_ids), start=1):
+            code = f"S{s + 1:02d}-{n:03d}"
+            project.shot_ids.append(shot_id)
+            project.shot_codes.append(code)
+            details.append(
+                (code, sentence(rng, 16), rng.choice(SHOT_TYPES), rng.choice(("eye", "low", "high")),
+                 rng.choice(MOVEMENTS), f"{rng.choice((24, 35, 50, 85))}mm", sentence(rng, 4),
+                 sentence(rng, 24), sentence(rng, 12), round(rng.uniform(0.5, 8.0), 1), shot_id)
+            )
+    with sqlite3.connect(db_path) as conn:
+        conn.executemany(
+            "UPDATE Shots SET code=?, description=?, shot_type=?, angle=?, movement=?, lens=?, lighting=?, "
+            "image_prompt=?, video_prompt=?, duration_sec=? WHERE id=?",
+            details,
+        )
+
+    final_images = FinalImageRepository(db_path)
+    for scene_id in project.scene_ids:
+        for _ in range(3):
+            asset_id = project.asset_ids[rng.randrange(len(project.asset_ids))]
+            project.final_image_ids.append(final_images.create_image(scene_id, sentence(rng, 8), asset_id))
+
+    characters = CharacterRepository(db_path)
+    for i in range(scale.characters):
+        char_id = characters.create(f"인물{i:03d}")
+        characters.update(char_id, age=str(rng.randrange(10, 80)), job=rng.choice(WORDS), personality=sentence(rng, 10))
+        characters.link_image(char_id, project.asset_ids[rng.randrange(len(project.asset_ids))])
+        project.character_ids.append(char_id)
+
+    # 보드와 문서는 리비전 비교 벤치마크를 위해 두 번씩 저장한다
+    for _ in range(2):
+        AudioRepository(db_path).upsert("json", board_json(rng, project.shot_codes, scale.board_units, "cues"))
+        CinematicRepository(db_path).upsert("json", board_json(rng, project.shot_codes, scale.board_units, "sequences"))
+    documents = DocumentService(db_path)
+    for i in range(scale.documents):
+        key = f"doc_{i:03d}"
+        for _ in range(2):
+            if i % 2:
+                documents.save_text(key, "\n".join(sentence(rng, 20) for _ in range(scale.board_units // 5 + 1)))
+            else:
+                documents.save_json(key, json.loads(board_json(rng, project.shot_codes, scale.board_units // 5 + 1, "items")))
+        project.document_keys.append(key)
+    return project
+
+
+def generate_library(out_dir: str, project: SyntheticProject) -> List[str]:
+    """라이브러리에 가짜 프로젝트 항목을 등록한다(파일은 만들지 않음, 검색/목록 벤치마크용)."""
+    from cinescribe.repository.library_repository import LibraryProject, LibraryRepository
+
+    rng = random.Random(project.seed + 1)
+    repo = LibraryRepository()
+    paths = []
+    for i in range(project.scale.library_projects):
+        path = os.path.join(os.path.abspath(out_dir), "library", f"film_{i:05d}.sqlite")
+        repo.upsert_project(
+            LibraryProject(
+                id=None,
+                title=f"{sentence(rng, 2)} {i}",
+                project_path=path,
+                tags=",".join(rng.choice(WORDS) for _ in range(3)),
+                thumbnail=None,
+                last_opened_at=None,
+                created_at=None,
+                db_version=1,
+            )
+        )
+        paths.append(path)
+    project.library_paths = paths
+    return paths
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="벤치마크용 합성 프로젝트 만들기")
+    parser.add_argument("out_dir")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    project = generate_project(args.out_dir, SCALES[args.scale], args.seed)
+    print(f"✓ {project.db_path}: 장면 {len(project.scene_ids)}, 샷 {len(project.shot_ids)}, 에셋 {len(project.asset_ids)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,6 +5,11 @@ ShotCanvas - AI 영상 제작 도구
 macOS/Windows 응용프로그램으로 패키징하기 위한 진입점
 """
 
+import time
+
+# 시작 프로파일러의 기준 시각(가능한 한 일찍 기록)
+_STARTED_AT = time.perf_counter()
+
 import sys
 import os
 import platform
@@ -83,7 +88,19 @@ def setup_paths_for_os():
     
     return True
 
-def run_shotcanvas():
+def start_profiler():
+    """--profile-startup 또는 CINESCRIBE_PROFILE_STARTUP이 있으면 시작 구간 측정을 켭니다."""
+    try:
+        from cinescribe.utils.startup_profiler import start_startup_profiler
+    except ImportError:
+        return None
+    profiler = start_startup_profiler(sys.argv, origin=_STARTED_AT)
+    if profiler.enabled:
+        print("⏱️ 시작 프로파일링 활성화")
+    profiler.mark("paths_ready")
+    return profiler
+
+def run_shotcanvas(profiler=None):
     """ShotCanvas 실행"""
     try:
         print("🚀 ShotCanvas 실행 중...")
@@ -91,6 +108,8 @@ def run_shotcanvas():
         # PySide6 import 시도
         try:
             from PySide6.QtWidgets import QApplication
+            if profiler:
+                profiler.mark("pyside6_imported")
             print("✅ PySide6.QtWidgets import 성공")
         except ImportError as e:
             print(f"❌ PySide6.QtWidgets import 실패: {e}")
@@ -100,6 +119,8 @@ def run_shotcanvas():
         # MainWindow import 시도
         try:
             from cinescribe.views.main_window import MainWindow
+            if profiler:
+                profiler.mark("main_window_imported")
             print("✅ MainWindow import 성공")
         except ImportError as e:
             print(f"❌ MainWindow import 실패: {e}")
@@ -110,11 +131,24 @@ def run_shotcanvas():
         
         # GUI 실행
         print("🎬 ShotCanvas GUI 시작...")
+        # --trace-sql 또는 CINESCRIBE_TRACE_SQL이 있으면 UI 액션별 SQL 추적
+        from cinescribe.utils.sql_trace import start_sql_tracer
+        tracer = start_sql_tracer(sys.argv)
         app = QApplication(sys.argv)
+        tracer.watch_ui_actions(app)
+        if profiler:
+            profiler.mark("qapplication_created")
         window = MainWindow()
+        if profiler:
+            profiler.mark("main_window_constructed")
+            profiler.watch_first_paint(window)
         window.show()
+        if profiler:
+            profiler.mark("window_shown")
         print("✅ ShotCanvas GUI 실행 성공!")
-        sys.exit(app.exec())
+        code = app.exec()
+        tracer.finish()
+        sys.exit(code)
         
     except Exception as e:
         print(f"💥 ShotCanvas 실행 실패: {e}")
@@ -133,6 +167,8 @@ def main():
             print("❌ 경로 설정에 실패했습니다.")
             return
         
+        profiler = start_profiler()
+        
         # 2. 현재 Python 경로 표시
         print(f"\n📁 현재 Python 경로 (처음 10개):")
         for i, path in enumerate(sys.path[:10]):
@@ -142,7 +178,7 @@ def main():
         
         # 3. ShotCanvas 실행
         print("\n" + "=" * 60)
-        if not run_shotcanvas():
+        if not run_shotcanvas(profiler):
             print("❌ ShotCanvas 실행에 실패했습니다.")
             return
         
@@ -161,6 +197,9 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
+    # 콘티 내보내기 등 프로세스 풀을 쓰는 작업이 빌드된 exe에서도 동작하도록
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
 
 
@@ -9,25 +9,26 @@ __version__ = "1.0.0"
 __author__ = "ShotCanvas Team"
 __description__ = "AI 영상 제작을 위한 시각적 스토리텔링 도구"
 
-# 주요 패키지들을 import하여 사용자 편의성 제공
-try:
-    from . import views
-    from . import service
-    from . import repository
-    from . import utils
-    from . import domain
-    from . import viewmodel
-    from . import widgets
-except ImportError:
-    # 개발 환경에서 상대 import가 실패할 경우를 대비
-    pass
+from importlib import import_module
 
+# 하위 패키지는 처음 접근할 때 import한다.
+# (cinescribe.repository만 쓰는 스크립트/작업 프로세스가 PySide6와 모든 뷰를 불러오지 않도록)
 __all__ = [
     'views',
     'service',
-    'repository', 
+    'repository',
     'utils',
     'domain',
     'viewmodel',
     'widgets'
 ]
+
+
+def __getattr__(name: str):
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return import_module(f".{name}", __name__)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
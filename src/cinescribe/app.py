@@ -1,16 +1,36 @@
 from __future__ import annotations
 
 import sys
-from PySide6.QtWidgets import QApplication
+import time
 
-from .views.main_window import MainWindow
+_STARTED_AT = time.perf_counter()
+# 같은 시점의 CPU 시간: 여기까지가 인터프리터 기동(+ 이 모듈 import) 비용
+_STARTED_CPU = time.process_time()
+
+from .utils.sql_trace import start_sql_tracer
+from .utils.startup_profiler import start_startup_profiler
 
 
 def main() -> None:
+    profiler = start_startup_profiler(sys.argv, origin=_STARTED_AT, origin_cpu=_STARTED_CPU)
+    tracer = start_sql_tracer(sys.argv)
+    from PySide6.QtWidgets import QApplication
+
+    profiler.mark("pyside6_imported")
+    from .views.main_window import MainWindow
+
+    profiler.mark("main_window_imported")
     app = QApplication(sys.argv)
+    tracer.watch_ui_actions(app)
+    profiler.mark("qapplication_created")
     window = MainWindow()
+    profiler.mark("main_window_constructed")
+    profiler.watch_first_paint(window)
     window.show()
-    sys.exit(app.exec())
+    profiler.mark("window_shown")
+    code = app.exec()
+    tracer.finish()
+    sys.exit(code)
 
 
 if __name__ == "__main__":
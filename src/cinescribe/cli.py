@@ -0,0 +1,752 @@
+"""
+ShotCanvas 명령줄 도구
+
+GUI 없이 프로젝트 파일을 일괄 처리한다(야간 정비, 대량 임포트 등).
+Qt를 import하지 않으므로 디스플레이가 없는 서버에서도 실행된다.
+
+    python -m cinescribe.cli create  my_film.sqlite --title "My Film"
+    python -m cinescribe.cli import  my_film.sqlite ./frames --recursive --new-scene "S01"
+    python -m cinescribe.cli export  my_film.sqlite ./out
+    python -m cinescribe.cli thumbnails --all --library
+    python -m cinescribe.cli vacuum --all
+    python -m cinescribe.cli verify --all --deep
+    python -m cinescribe.cli bundle-export my_film.sqlite my_film.csbundle
+    python -m cinescribe.cli bundle-import my_film.csbundle ./projects
+    python -m cinescribe.cli snapshot --all --prune
+    python -m cinescribe.cli snapshot-list my_film.sqlite
+    python -m cinescribe.cli snapshot-restore my_film.sqlite 20240101-120000 ./restored
+    python -m cinescribe.cli history my_film.sqlite cinematic --diff 3 5
+    python -m cinescribe.cli compress --all --method lzma --vacuum
+    python -m cinescribe.cli contact-sheet my_film.sqlite storyboard.pdf --columns 4 --rows 3
+    python -m cinescribe.cli animatic my_film.sqlite animatic.gif --width 960 --height 540
+    python -m cinescribe.cli shot-list my_film.sqlite shots.csv
+    python -m cinescribe.cli search "rooftop" --limit 20
+    python -m cinescribe.cli reindex --all
+    python -m cinescribe.cli library-scan --rediscover --root D:/Projects --apply
+    python -m cinescribe.cli fsck --all --time-limit 3600 --repair restore thumbnails
+    python -m cinescribe.cli --trace-sql export my_film.sqlite ./out
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional
+
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp", ".bmp"}
+
+
+def _print_progress(done: int, total: int, message: str) -> None:
+    print(f"[{done}/{total}] {message}", flush=True)
+
+
+def _collect_images(paths: Iterable[str], recursive: bool) -> List[str]:
+    # 폴더는 이미지 확장자만 골라 이름순으로 펼친다
+    files: List[str] = []
+    for path in paths:
+        if os.path.isdir(path):
+            if recursive:
+                found = [os.path.join(root, name) for root, _, names in os.walk(path) for name in names]
+            else:
+                found = [os.path.join(path, name) for name in os.listdir(path)]
+            files.extend(sorted(f for f in found if os.path.splitext(f)[1].lower() in IMAGE_EXTENSIONS))
+        elif os.path.isfile(path):
+            files.append(path)
+        else:
+            print(f"건너뜀(없는 경로): {path}", file=sys.stderr)
+    return files
+
+
+def _resolve_projects(args: argparse.Namespace) -> List[str]:
+    projects = [os.path.abspath(p) for p in args.projects]
+    if getattr(args, "all", False):
+        from .service.library_service import LibraryService
+
+        for project in LibraryService().search():
+            if project.project_path not in projects:
+                projects.append(project.project_path)
+    missing = [p for p in projects if not os.path.isfile(p)]
+    for p in missing:
+        print(f"건너뜀(프로젝트 파일 없음): {p}", file=sys.stderr)
+    return [p for p in projects if p not in missing]
+
+
+def _workers(args: argparse.Namespace) -> int:
+    return args.workers or os.cpu_count() or 1
+
+
+# --- 프로세스 풀 작업(최상위 함수여야 pickle 가능) ---
+
+def _vacuum_job(db_path: str):
+    from .service.maintenance_service import MaintenanceService
+
+    return MaintenanceService(db_path).vacuum()
+
+
+def _compress_job(db_path: str, method: str, vacuum: bool):
+    from .service.maintenance_service import MaintenanceService
+
+    service = MaintenanceService(db_path)
+    result = service.compress_content(method)
+    return result, (service.vacuum() if vacuum else None)
+
+
+def _reindex_job(db_path: str) -> int:
+    from .service.maintenance_service import MaintenanceService
+
+    return MaintenanceService(db_path).rebuild_search_index()
+
+
+def _verify_job(db_path: str, deep: bool):
+    from .service.maintenance_service import MaintenanceService
+
+    # 프로젝트 단위로 이미 병렬이므로 해시 계산은 프로세스당 스레드 하나면 충분
+    return MaintenanceService(db_path).verify(deep=deep, workers=1)
+
+
+# --- 하위 명령 ---
+
+def cmd_create(args: argparse.Namespace) -> int:
+    from .service.library_service import LibraryService
+    from .service.project_init_service import ProjectInitService
+
+    path = os.path.abspath(args.path)
+    if os.path.exists(path) and not args.force:
+        print(f"이미 존재하는 파일입니다: {path} (--force로 스키마만 보강)", file=sys.stderr)
+        return 1
+    ProjectInitService().create_new_project(path, title=args.title)
+    if not args.no_register:
+        LibraryService().register_project(path, title=args.title)
+    print(f"프로젝트 생성: {path}")
+    return 0
+
+
+def cmd_import(args: argparse.Namespace) -> int:
+    from .repository.scene_shot_repository import SceneShotRepository
+    from .service.asset_import_service import AssetImportService
+
+    db_path = os.path.abspath(args.project)
+    if not os.path.isfile(db_path):
+        print(f"프로젝트 파일이 없습니다: {db_path}", file=sys.stderr)
+        return 1
+    files = _collect_images(args.paths, args.recursive)
+    if not files:
+        print("임포트할 이미지가 없습니다.", file=sys.stderr)
+        return 1
+
+    scene_id: Optional[int] = None
+    repo = SceneShotRepository(db_path)
+    if not args.assets_only:
+        scenes = repo.list_scenes()
+        if args.new_scene:
+            number = max((s.number for s in scenes), default=0) + 1
+            scene_id = repo.create_scene(number=number, name=args.new_scene, notes="")
+        elif args.scene is not None:
+            if not any(s.id == args.scene for s in scenes):
+                print(f"장면 id={args.scene}가 없습니다.", file=sys.stderr)
+                return 1
+            scene_id = args.scene
+        elif scenes:
+            scene_id = scenes[0].id
+        else:
+            scene_id = repo.create_scene(number=1, name="기본 장면", notes="")
+
+    print(f"{len(files)}개 이미지 임포트 (작업 프로세스 {_workers(args)}개)")
+    results = AssetImportService(db_path).import_many(files, workers=_workers(args), progress=_print_progress)
+    if scene_id is not None:
+        repo.create_shots(scene_id, [asset_id for asset_id, _, _ in results])
+        print(f"장면 id={scene_id}에 샷 {len(results)}개 추가")
+    failed = len(files) - len(results)
+    print(f"완료: {len(results)}개 등록" + (f", {failed}개 실패" if failed else ""))
+    return 1 if failed else 0
+
+
+def cmd_export(args: argparse.Namespace) -> int:
+    from .repository.audio_repository import AudioRepository
+    from .repository.cinematic_repository import CinematicRepository
+    from .repository.document_repository import DocumentRepository
+
+    db_path = os.path.abspath(args.project)
+    if not os.path.isfile(db_path):
+        print(f"프로젝트 파일이 없습니다: {db_path}", file=sys.stderr)
+        return 1
+    os.makedirs(args.out_dir, exist_ok=True)
+    documents = DocumentRepository(db_path)
+    keys = args.keys or documents.list_keys()
+    for key in keys:
+        doc = documents.get(key)
+        if doc is None:
+            print(f"건너뜀(없는 문서): {key}", file=sys.stderr)
+            continue
+        ext = "json" if doc.format == "json" else "txt"
+        safe = "".join(c if c.isalnum() or c in "-_." else "_" for c in key)
+        out_path = os.path.join(args.out_dir, f"{safe}.{ext}")
+        documents.export_to_file(key, out_path)
+        print(f"문서 {key} -> {out_path}")
+    if not args.keys:
+        for name, repo in (("cinematic_board", CinematicRepository(db_path)), ("audio_board", AudioRepository(db_path))):
+            board = repo.get()
+            if board is None:
+                continue
+            out_path = os.path.join(args.out_dir, f"{name}.{'json' if board.format == 'json' else 'txt'}")
+            repo.export_to_file(out_path)
+            print(f"보드 {name} -> {out_path}")
+    return 0
+
+
+def cmd_shot_list(args: argparse.Namespace) -> int:
+    from .service.shot_list_service import ShotListService
+
+    if not os.path.isfile(args.project):
+        print(f"프로젝트 파일이 없습니다: {args.project}", file=sys.stderr)
+        return 1
+    try:
+        count = ShotListService(args.project).export(
+            args.out, args.format, progress=_print_progress if args.verbose else None
+        )
+    except ValueError as e:
+        print(f"✗ {e}", file=sys.stderr)
+        return 1
+    print(f"✓ {args.out} ({count}개 샷)")
+    return 0
+
+
+def cmd_thumbnails(args: argparse.Namespace) -> int:
+    from .service.maintenance_service import MaintenanceService
+
+    projects = _resolve_projects(args)
+    total = 0
+    for db_path in projects:
+        built = MaintenanceService(db_path).rebuild_thumbnails(
+            force=args.force, workers=_workers(args), progress=_print_progress if args.verbose else None
+        )
+        total += built
+        print(f"{db_path}: 썸네일 {built}개 생성")
+    if args.library:
+        from .service.library_service import LibraryService
+        from .service.project_thumbnail_service import ProjectThumbnailService
+
+        library = LibraryService().search(include_archived=True)
+        if args.force:
+            # 카드 썸네일 경로를 비워 두면 refresh_stale이 모두 다시 만든다
+            for project in library:
+                project.thumbnail = None
+        updated = ProjectThumbnailService().refresh_stale(library)
+        print(f"라이브러리 카드 썸네일 {len(updated)}개 갱신")
+    print(f"완료: 에셋 썸네일 {total}개")
+    return 0
+
+
+def cmd_vacuum(args: argparse.Namespace) -> int:
+    projects = _resolve_projects(args)
+    if not projects:
+        print("대상 프로젝트가 없습니다.", file=sys.stderr)
+        return 1
+    failed = 0
+    with ProcessPoolExecutor(max_workers=min(_workers(args), len(projects))) as pool:
+        for db_path, future in [(p, pool.submit(_vacuum_job, p)) for p in projects]:
+            try:
+                before, after = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"✗ {db_path}: {e}", file=sys.stderr)
+                continue
+            print(f"✓ {db_path}: {before / 1024:.0f}KB -> {after / 1024:.0f}KB")
+    return 1 if failed else 0
+
+
+def cmd_compress(args: argparse.Namespace) -> int:
+    projects = _resolve_projects(args)
+    if not projects:
+        print("대상 프로젝트가 없습니다.", file=sys.stderr)
+        return 1
+    failed = 0
+    with ProcessPoolExecutor(max_workers=min(_workers(args), len(projects))) as pool:
+        for db_path, future in [(p, pool.submit(_compress_job, p, args.method, args.vacuum)) for p in projects]:
+            try:
+                (rows, before, after), sizes = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"✗ {db_path}: {e}", file=sys.stderr)
+                continue
+            line = f"✓ {db_path}: {rows}행, 본문 {before / 1024:.0f}KB -> {after / 1024:.0f}KB"
+            if sizes:
+                line += f", 파일 {sizes[0] / 1024:.0f}KB -> {sizes[1] / 1024:.0f}KB"
+            print(line)
+    return 1 if failed else 0
+
+
+def cmd_reindex(args: argparse.Namespace) -> int:
+    projects = _resolve_projects(args)
+    if not projects:
+        print("대상 프로젝트가 없습니다.", file=sys.stderr)
+        return 1
+    failed = 0
+    with ProcessPoolExecutor(max_workers=min(_workers(args), len(projects))) as pool:
+        for db_path, future in [(p, pool.submit(_reindex_job, p)) for p in projects]:
+            try:
+                count = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"✗ {db_path}: {e}", file=sys.stderr)
+                continue
+            print(f"✓ {db_path}: {count}개 항목 색인")
+    return 1 if failed else 0
+
+
+def cmd_search(args: argparse.Namespace) -> int:
+    from .service.global_search_service import GlobalSearchService
+
+    result = GlobalSearchService().search(
+        " ".join(args.query), limit=args.limit, workers=args.threads, timeout=args.timeout
+    )
+    for hit in result.hits:
+        print(f"{hit.rank:8.2f}  {hit.project_title}  {hit.kind}#{hit.ref} {hit.title}  {hit.snippet}")
+    summary = f"{len(result.hits)}건 / 프로젝트 {result.searched}개, {result.elapsed * 1000:.0f}ms"
+    if result.cancelled:
+        summary += " (시간 초과로 일부만 검색)"
+    print(summary, file=sys.stderr)
+    if result.unindexed:
+        print(f"색인 없는 프로젝트 {len(result.unindexed)}개: 'reindex'로 색인을 만드세요.", file=sys.stderr)
+    for path, error in result.failed:
+        print(f"✗ {path}: {error}", file=sys.stderr)
+    return 0
+
+
+def cmd_library_scan(args: argparse.Namespace) -> int:
+    from .repository.library_repository import LibraryRepository
+    from .service.library_scan_service import STATES, LibraryScanService
+
+    repo = LibraryRepository()
+    for root in args.add_root or []:
+        repo.add_root(os.path.abspath(root))
+    service = LibraryScanService(repo)
+    checks = service.scan(timeout=args.timeout)
+    counts = {state: 0 for state in STATES}
+    for check in checks.values():
+        counts[check.state] += 1
+    print(", ".join(f"{state} {n}" for state, n in counts.items() if n))
+    projects = {p.project_path: p for p in repo.list_projects(include_archived=True)}
+    lost = [path for path, check in checks.items() if check.state in ("missing", "unreachable")]
+    for path in lost:
+        print(f"✗ {checks[path].state}: {path}")
+        if not args.rediscover or checks[path].state != "missing":
+            continue
+        roots = [os.path.abspath(r) for r in args.root] if args.root else None
+        candidates = service.rediscover(projects[path], roots=roots, registered=projects)
+        for candidate in candidates:
+            print(f"    후보: {candidate}")
+        if candidates and args.apply:
+            # 크기나 Project_Info가 맞는 후보만 자동으로 연결한다(이름만 같은 다른 프로젝트일 수 있음)
+            sure = [c for c in candidates if service.is_same_project(projects[path], c)]
+            if sure:
+                service.relocate(path, sure[0])
+                print(f"    → {sure[0]} 로 갱신")
+            else:
+                print("    크기/프로젝트 정보가 맞는 후보가 없어 건너뜀 (직접 확인 후 앱에서 위치를 지정하세요)")
+    return 1 if lost else 0
+
+
+def cmd_verify(args: argparse.Namespace) -> int:
+    projects = _resolve_projects(args)
+    if not projects:
+        print("대상 프로젝트가 없습니다.", file=sys.stderr)
+        return 1
+    bad = 0
+    with ProcessPoolExecutor(max_workers=min(_workers(args), len(projects))) as pool:
+        for db_path, future in [(p, pool.submit(_verify_job, p, args.deep)) for p in projects]:
+            try:
+                report = future.result()
+            except Exception as e:
+                bad += 1
+                print(f"✗ {db_path}: {e}")
+                continue
+            if report.ok:
+                print(f"✓ {db_path} (에셋 {report.checked_assets}개)")
+                continue
+            bad += 1
+            print(f"✗ {db_path}: 문제 {len(report.problems)}건")
+            for problem in report.problems:
+                print(f"    {problem}")
+    return 1 if bad else 0
+
+
+def cmd_fsck(args: argparse.Namespace) -> int:
+    from .service.asset_fsck_service import AssetFsckService
+
+    projects = _resolve_projects(args)
+    if not projects:
+        print("대상 프로젝트가 없습니다.", file=sys.stderr)
+        return 1
+    progress = _print_bytes_progress if args.verbose else None
+    bad = 0
+    # 프로젝트 안에서 이미 모든 코어로 해시하므로 프로젝트는 하나씩 처리하고, 시간 제한은 전체에 건다
+    deadline = time.monotonic() + args.time_limit if args.time_limit else None
+    for db_path in projects:
+        remaining = deadline - time.monotonic() if deadline is not None else None
+        if remaining is not None and remaining <= 0:
+            print(f"… {db_path}: 시간 제한으로 다음 실행에 검사")
+            continue
+        service = AssetFsckService(db_path)
+        report = service.verify(
+            workers=args.workers,
+            io_concurrency=args.io,
+            resume=not args.restart,
+            time_limit=remaining,
+            progress=progress,
+        )
+        state = "완료" if report.complete else "중단(다음 실행에서 이어서)"
+        summary = (
+            f"에셋 {report.assets}개, 이번에 {report.hashed}개 {report.hashed_bytes / 1024 ** 2:.0f}MB 해시, "
+            f"이어서 건너뜀 {report.resumed}개, {report.elapsed:.1f}s, {state}"
+        )
+        if report.ok:
+            print(f"✓ {db_path}: {summary}")
+            continue
+        if report.issues:
+            bad += 1
+        print(f"{'✗' if report.issues else '…'} {db_path}: {summary}")
+        for issue in report.issues:
+            ref = f" id={issue.asset_id}" if issue.asset_id is not None else ""
+            print(f"    {issue.kind}{ref}: {issue.path}{f' ({issue.detail})' if issue.detail else ''}")
+        if args.repair and report.issues:
+            result = service.repair(report.issues, args.repair)
+            print(f"    복구 {len(result.repaired)}건, 실패 {len(result.failed)}건")
+            for issue, error in result.failed:
+                print(f"    ✗ {issue.kind} {issue.path}: {error}")
+    return 1 if bad else 0
+
+
+def _print_bytes_progress(done: int, total: int, message: str) -> None:
+    percent = done * 100 // total if total else 100
+    print(f"[{percent:3d}%] {message}", flush=True)
+
+
+def cmd_bundle_export(args: argparse.Namespace) -> int:
+    from .service.bundle_service import BundleService
+
+    progress = _print_bytes_progress if args.verbose else None
+    out_path = BundleService().export_bundle(args.project, args.out, progress)
+    print(f"✓ {out_path} ({os.path.getsize(out_path) / 1024:.0f}KB)")
+    return 0
+
+
+def cmd_bundle_import(args: argparse.Namespace) -> int:
+    from .service.bundle_service import BundleError, BundleService
+
+    progress = _print_bytes_progress if args.verbose else None
+    try:
+        db_path = BundleService().import_bundle(args.bundle, args.dest_dir, progress, register=not args.no_register)
+    except BundleError as e:
+        print(f"✗ {args.bundle}: {e}", file=sys.stderr)
+        return 1
+    print(f"✓ {db_path}")
+    return 0
+
+
+def cmd_snapshot(args: argparse.Namespace) -> int:
+    from .service.snapshot_service import SnapshotService
+
+    projects = _resolve_projects(args)
+    if not projects:
+        print("대상 프로젝트가 없습니다.", file=sys.stderr)
+        return 1
+    service = SnapshotService()
+    failed = 0
+    # 스냅샷은 디스크 I/O가 대부분이라 프로젝트를 차례로 처리한다
+    for db_path in projects:
+        try:
+            info = service.create_snapshot(db_path, label=args.label, skip_unchanged=not args.force)
+            if args.prune:
+                removed, freed = service.prune(db_path, keep_last=args.keep_last, keep_daily=args.keep_daily)
+        except Exception as e:
+            failed += 1
+            print(f"✗ {db_path}: {e}", file=sys.stderr)
+            continue
+        if info is None:
+            print(f"= {db_path}: 변경 없음")
+        else:
+            print(f"✓ {db_path}: {info.id} (새로 저장 {info.new_bytes / 1024:.0f}KB / 전체 {info.total_bytes / 1024:.0f}KB)")
+        if args.prune and removed:
+            print(f"    정리: 스냅샷 {len(removed)}개, {freed / 1024:.0f}KB")
+    return 1 if failed else 0
+
+
+def cmd_snapshot_list(args: argparse.Namespace) -> int:
+    from .service.snapshot_service import SnapshotService
+
+    snapshots = SnapshotService().list_snapshots(args.project)
+    if not snapshots:
+        print("스냅샷이 없습니다.")
+    for info in snapshots:
+        label = f"  {info.label}" if info.label else ""
+        print(f"{info.id}  {info.created_at}  파일 {info.files}개  {info.total_bytes / 1024:.0f}KB{label}")
+    return 0
+
+
+def cmd_snapshot_restore(args: argparse.Namespace) -> int:
+    from .service.snapshot_service import SnapshotError, SnapshotService
+
+    try:
+        db_path = SnapshotService().restore(args.project, args.snapshot_id, args.dest_dir, register=not args.no_register)
+    except SnapshotError as e:
+        print(f"✗ {e}", file=sys.stderr)
+        return 1
+    print(f"✓ {db_path}")
+    return 0
+
+
+def cmd_history(args: argparse.Namespace) -> int:
+    from .repository.audio_repository import AudioRepository
+    from .repository.cinematic_repository import CinematicRepository
+    from .repository.document_repository import DocumentRepository
+
+    # audio/cinematic은 보드, 그 밖의 이름은 문서 키로 본다
+    if args.target in ("audio", "cinematic"):
+        repo = AudioRepository(args.project) if args.target == "audio" else CinematicRepository(args.project)
+        history, diff, restore = repo.history, repo.diff_revisions, repo.restore_revision
+    else:
+        documents = DocumentRepository(args.project)
+        history = lambda: documents.history(args.target)
+        diff = lambda a, b: documents.diff_revisions(args.target, a, b)
+        restore = lambda seq: documents.restore_revision(args.target, seq)
+
+    try:
+        if args.diff:
+            sys.stdout.write(diff(*args.diff))
+            return 0
+        if args.restore is not None:
+            restore(args.restore)
+            print(f"✓ {args.target}: 리비전 {args.restore}(으)로 되돌림")
+            return 0
+    except KeyError:
+        print(f"✗ 리비전을 찾을 수 없습니다: {args.target}", file=sys.stderr)
+        return 1
+    revisions = history()
+    if not revisions:
+        print("리비전이 없습니다.")
+    for rev in revisions:
+        print(f"{rev.seq:5d}  {rev.created_at}  {rev.kind:5s}  {rev.size}자 -> {rev.stored_bytes}B  {rev.content_hash[:10]}")
+    return 0
+
+
+def cmd_contact_sheet(args: argparse.Namespace) -> int:
+    from .service.contact_sheet_service import ContactSheetOptions, ContactSheetService
+
+    options = ContactSheetOptions(columns=args.columns, rows=args.rows, dpi=args.dpi)
+    if args.portrait:
+        options.page_width_mm, options.page_height_mm = options.page_height_mm, options.page_width_mm
+    try:
+        written = ContactSheetService(args.project).export(
+            args.out, options, workers=_workers(args), progress=_print_progress if args.verbose else None
+        )
+    except ValueError as e:
+        print(f"✗ {e}", file=sys.stderr)
+        return 1
+    print(f"✓ {written[0]}" + (f" 외 {len(written) - 1}개" if len(written) > 1 else ""))
+    return 0
+
+
+def cmd_animatic(args: argparse.Namespace) -> int:
+    from .service.animatic_service import AnimaticOptions, AnimaticService
+
+    options = AnimaticOptions(width=args.width, height=args.height, default_duration=args.default_duration)
+    try:
+        out = AnimaticService(args.project).export(
+            args.out, options, workers=_workers(args), progress=_print_progress if args.verbose else None
+        )
+    except ValueError as e:
+        print(f"✗ {e}", file=sys.stderr)
+        return 1
+    print(f"✓ {out}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="cinescribe", description="ShotCanvas 프로젝트 일괄 처리 도구")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add_workers(p: argparse.ArgumentParser) -> None:
+        p.add_argument("--workers", type=int, default=None, help="작업 프로세스 수(기본: CPU 코어 수)")
+
+    def add_targets(p: argparse.ArgumentParser) -> None:
+        p.add_argument("projects", nargs="*", help="프로젝트 .sqlite 파일")
+        p.add_argument("--all", action="store_true", help="라이브러리에 등록된 모든 프로젝트")
+        add_workers(p)
+
+    p = sub.add_parser("create", help="새 프로젝트 생성")
+    p.add_argument("path", help="만들 프로젝트 .sqlite 경로")
+    p.add_argument("--title", default=None)
+    p.add_argument("--no-register", action="store_true", help="라이브러리에 등록하지 않음")
+    p.add_argument("--force", action="store_true", help="파일이 있어도 스키마를 보강")
+    p.set_defaults(func=cmd_create)
+
+    p = sub.add_parser("import", help="이미지/폴더를 장면에 일괄 임포트")
+    p.add_argument("project")
+    p.add_argument("paths", nargs="+", help="이미지 파일 또는 폴더")
+    p.add_argument("--recursive", "-r", action="store_true", help="하위 폴더까지 포함")
+    group = p.add_mutually_exclusive_group()
+    group.add_argument("--scene", type=int, default=None, help="샷을 추가할 장면 id(기본: 첫 장면)")
+    group.add_argument("--new-scene", default=None, metavar="NAME", help="새 장면을 만들어 추가")
+    group.add_argument("--assets-only", action="store_true", help="에셋만 등록하고 샷은 만들지 않음")
+    add_workers(p)
+    p.set_defaults(func=cmd_import)
+
+    p = sub.add_parser("export", help="문서와 보드를 파일로 내보내기")
+    p.add_argument("project")
+    p.add_argument("out_dir")
+    p.add_argument("--key", dest="keys", action="append", help="내보낼 문서 키(반복 가능, 기본: 전체 + 보드)")
+    p.set_defaults(func=cmd_export)
+
+    p = sub.add_parser("shot-list", help="샷 리스트를 CSV/JSONL로 내보내기")
+    p.add_argument("project")
+    p.add_argument("out", help=".csv 또는 .jsonl")
+    p.add_argument("--format", choices=("csv", "jsonl"), default=None, help="기본: 확장자로 판단")
+    p.add_argument("--verbose", "-v", action="store_true")
+    p.set_defaults(func=cmd_shot_list)
+
+    p = sub.add_parser("contact-sheet", help="스토리보드 콘티 시트(PDF/PNG) 만들기")
+    p.add_argument("project")
+    p.add_argument("out", help=".pdf(한 파일) 또는 .png(페이지별 파일)")
+    p.add_argument("--columns", type=int, default=3)
+    p.add_argument("--rows", type=int, default=3)
+    p.add_argument("--dpi", type=int, default=150)
+    p.add_argument("--portrait", action="store_true", help="세로 페이지")
+    p.add_argument("--verbose", "-v", action="store_true")
+    add_workers(p)
+    p.set_defaults(func=cmd_contact_sheet)
+
+    p = sub.add_parser("animatic", help="샷 길이대로 애니매틱(GIF/APNG/이미지 시퀀스) 만들기")
+    p.add_argument("project")
+    p.add_argument("out", help=".gif, .png/.apng 또는 폴더(PNG 시퀀스 + manifest.json)")
+    p.add_argument("--width", type=int, default=1280)
+    p.add_argument("--height", type=int, default=720)
+    p.add_argument("--default-duration", type=float, default=2.0, help="길이가 없는 샷의 표시 시간(초)")
+    p.add_argument("--verbose", "-v", action="store_true")
+    add_workers(p)
+    p.set_defaults(func=cmd_animatic)
+
+    p = sub.add_parser("thumbnails", help="에셋/라이브러리 썸네일 재생성")
+    add_targets(p)
+    p.add_argument("--force", action="store_true", help="있는 썸네일도 다시 생성")
+    p.add_argument("--library", action="store_true", help="라이브러리 카드 썸네일도 갱신")
+    p.add_argument("--verbose", "-v", action="store_true")
+    p.set_defaults(func=cmd_thumbnails)
+
+    p = sub.add_parser("vacuum", help="VACUUM으로 프로젝트 파일 정리")
+    add_targets(p)
+    p.set_defaults(func=cmd_vacuum)
+
+    p = sub.add_parser("compress", help="문서/보드 본문 압축 방식 변경")
+    add_targets(p)
+    p.add_argument("--method", choices=("zlib", "lzma", "plain"), default="zlib", help="plain이면 압축 해제")
+    p.add_argument("--vacuum", action="store_true", help="끝난 뒤 VACUUM으로 파일 크기 줄이기")
+    p.set_defaults(func=cmd_compress)
+
+    p = sub.add_parser("search", help="라이브러리 전체 프로젝트 전문 검색")
+    p.add_argument("query", nargs="+")
+    p.add_argument("--limit", type=int, default=50)
+    p.add_argument("--threads", type=int, default=8, help="동시에 검색할 프로젝트 수")
+    p.add_argument("--timeout", type=float, default=None, help="초. 넘으면 그때까지의 결과만 출력")
+    p.set_defaults(func=cmd_search)
+
+    p = sub.add_parser("reindex", help="전문 검색 색인 다시 만들기")
+    add_targets(p)
+    p.set_defaults(func=cmd_reindex)
+
+    p = sub.add_parser("library-scan", help="라이브러리 프로젝트 파일 이동/삭제/변경 검사")
+    p.add_argument("--timeout", type=float, default=10.0, help="응답 없는 드라이브를 기다릴 최대 시간(초)")
+    p.add_argument("--rediscover", action="store_true", help="없어진 파일을 검색 폴더에서 다시 찾기")
+    p.add_argument("--root", action="append", help="이번에만 쓸 검색 폴더(반복 가능, 기본: 저장된 검색 폴더)")
+    p.add_argument("--add-root", action="append", help="검색 폴더로 저장(반복 가능)")
+    p.add_argument("--apply", action="store_true", help="찾은 첫 후보로 경로 갱신")
+    p.set_defaults(func=cmd_library_scan)
+
+    p = sub.add_parser("verify", help="무결성 및 에셋 파일 검사")
+    add_targets(p)
+    p.add_argument("--deep", action="store_true", help="전체 integrity_check와 에셋 해시 재계산")
+    p.set_defaults(func=cmd_verify)
+
+    p = sub.add_parser("fsck", help="에셋 파일 해시 전수 검사(중단 후 이어서 가능)와 복구")
+    add_targets(p)
+    p.add_argument("--io", type=int, default=4, help="동시에 읽는 파일 수")
+    p.add_argument("--time-limit", type=float, default=None, help="초. 넘으면 멈추고 다음 실행에서 이어서 검사")
+    p.add_argument("--restart", action="store_true", help="이어서 검사하지 않고 처음부터")
+    p.add_argument(
+        "--repair",
+        nargs="+",
+        choices=("restore", "thumbnails", "accept", "quarantine"),
+        help="restore: 스냅샷에서 원본 복원, thumbnails: 썸네일 재생성, "
+        "accept: 바뀐 내용으로 해시 갱신, quarantine: 미등록 파일을 .quarantine/로 이동",
+    )
+    p.add_argument("--verbose", "-v", action="store_true")
+    p.set_defaults(func=cmd_fsck)
+
+    p = sub.add_parser("bundle-export", help="프로젝트와 에셋을 번들 하나로 내보내기")
+    p.add_argument("project")
+    p.add_argument("out", help="만들 번들 파일(.csbundle)")
+    p.add_argument("--verbose", "-v", action="store_true")
+    p.set_defaults(func=cmd_bundle_export)
+
+    p = sub.add_parser("bundle-import", help="번들을 풀어 프로젝트로 가져오기")
+    p.add_argument("bundle")
+    p.add_argument("dest_dir", help="프로젝트 폴더를 만들 위치")
+    p.add_argument("--no-register", action="store_true", help="라이브러리에 등록하지 않음")
+    p.add_argument("--verbose", "-v", action="store_true")
+    p.set_defaults(func=cmd_bundle_import)
+
+    p = sub.add_parser("snapshot", help="증분 스냅샷 백업 만들기")
+    p.add_argument("projects", nargs="*", help="프로젝트 .sqlite 파일")
+    p.add_argument("--all", action="store_true", help="라이브러리에 등록된 모든 프로젝트")
+    p.add_argument("--label", default=None)
+    p.add_argument("--force", action="store_true", help="바뀐 내용이 없어도 스냅샷을 남김")
+    p.add_argument("--prune", action="store_true", help="보존 정책에 따라 오래된 스냅샷 정리")
+    p.add_argument("--keep-last", type=int, default=24, help="항상 남길 최근 스냅샷 수")
+    p.add_argument("--keep-daily", type=int, default=14, help="하루 하나씩 남길 일 수")
+    p.set_defaults(func=cmd_snapshot)
+
+    p = sub.add_parser("snapshot-list", help="프로젝트 스냅샷 목록")
+    p.add_argument("project")
+    p.set_defaults(func=cmd_snapshot_list)
+
+    p = sub.add_parser("snapshot-restore", help="스냅샷을 새 프로젝트 폴더로 복원")
+    p.add_argument("project")
+    p.add_argument("snapshot_id")
+    p.add_argument("dest_dir", help="복원한 프로젝트 폴더를 만들 위치")
+    p.add_argument("--no-register", action="store_true", help="라이브러리에 등록하지 않음")
+    p.set_defaults(func=cmd_snapshot_restore)
+
+    p = sub.add_parser("history", help="문서/보드 저장 이력 보기, 비교, 되돌리기")
+    p.add_argument("project")
+    p.add_argument("target", help="문서 키 또는 audio / cinematic")
+    group = p.add_mutually_exclusive_group()
+    group.add_argument("--diff", type=int, nargs=2, metavar=("FROM", "TO"), help="두 리비전 비교")
+    group.add_argument("--restore", type=int, default=None, metavar="SEQ", help="해당 리비전으로 되돌림")
+    p.set_defaults(func=cmd_history)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    # PyInstaller 빌드에서 프로세스 풀을 쓰기 위해 필요
+    multiprocessing.freeze_support()
+    from .utils.sql_trace import start_sql_tracer
+
+    argv = list(sys.argv[1:] if argv is None else argv)
+    # --trace-sql[=경로] 또는 CINESCRIBE_TRACE_SQL: 명령 하나를 한 액션으로 추적
+    tracer = start_sql_tracer(argv)
+    args = build_parser().parse_args(argv)
+    tracer.begin_action(f"cli {args.command}")
+    try:
+        return args.func(args)
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        tracer.finish()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,26 +1,41 @@
 """
 ShotCanvas - Repository 패키지
 데이터 접근 계층
+
+PySide6 없이 import할 수 있어야 한다(스크립트/작업 프로세스용).
 """
 
-from .project_repository import ProjectRepository
-from .library_repository import LibraryRepository
-from .character_repository import CharacterRepository
-from .scene_shot_repository import SceneShotRepository
-from .asset_repository import AssetRepository
-from .audio_repository import AudioRepository
-from .cinematic_repository import CinematicRepository
-from .document_repository import DocumentRepository
-from .final_image_repository import FinalImageRepository
-
-__all__ = [
-    'ProjectRepository',
-    'LibraryRepository',
-    'CharacterRepository',
-    'SceneShotRepository',
-    'AssetRepository',
-    'AudioRepository',
-    'CinematicRepository',
-    'DocumentRepository',
-    'FinalImageRepository'
-]
+from importlib import import_module
+
+# 공개 이름 -> 정의된 하위 모듈. 처음 접근할 때 import한다
+_LAZY = {
+    'ProjectRepository': '.project_repository',
+    'LibraryRepository': '.library_repository',
+    'CharacterRepository': '.character_repository',
+    'SceneShotRepository': '.scene_shot_repository',
+    'AssetRepository': '.asset_repository',
+    'AudioRepository': '.audio_repository',
+    'CinematicRepository': '.cinematic_repository',
+    'DocumentRepository': '.document_repository',
+    'FinalImageRepository': '.final_image_repository',
+    'RevisionRepository': '.revision_repository',
+    'BoardIndexRepository': '.board_index_repository',
+    'SearchIndexRepository': '.search_index_repository',
+    'AssetCheckRepository': '.asset_check_repository'
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    # 다음 접근부터는 모듈 __getattr__를 거치지 않도록 캐시
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
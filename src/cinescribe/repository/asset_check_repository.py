@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import sqlite3
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from ..utils import sql_trace
+
+
+class AssetCheckRepository:
+    """에셋 해시 검사(AssetFsckService)의 체크포인트.
+
+    AssetCheckRun(한 행)에 현재 검사 회차의 시작/종료 시각을, AssetChecks에 에셋별 마지막 검사 결과와
+    그때의 파일 크기/수정 시각을 둔다. 회차가 끝나기 전에 중단되면 다음 실행은 이번 회차에
+    이미 검사했고 그 뒤로 바뀌지 않은 에셋을 건너뛴다.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        self._db_path = db_path
+        self._ensure_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sql_trace.connect(self._db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _ensure_schema(self) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS AssetChecks (
+                  asset_id INTEGER PRIMARY KEY,
+                  file_size INTEGER,
+                  file_mtime REAL,
+                  status TEXT NOT NULL,
+                  checked_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS AssetCheckRun (
+                  id INTEGER PRIMARY KEY CHECK (id = 1),
+                  started_at REAL NOT NULL,
+                  finished_at REAL
+                )
+                """
+            )
+
+    def current_run(self) -> Optional[Tuple[float, Optional[float]]]:
+        """(시작 시각, 종료 시각). 검사한 적이 없으면 None."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT started_at, finished_at FROM AssetCheckRun WHERE id=1").fetchone()
+            return (row[0], row[1]) if row else None
+
+    def begin(self, resume: bool = True) -> float:
+        """끝나지 않은 회차가 있고 resume이면 그 시작 시각을, 아니면 새 회차를 시작해 돌려준다."""
+        run = self.current_run()
+        if resume and run is not None and run[1] is None:
+            return run[0]
+        started = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO AssetCheckRun(id, started_at, finished_at) VALUES(1, ?, NULL) "
+                "ON CONFLICT(id) DO UPDATE SET started_at=excluded.started_at, finished_at=NULL",
+                (started,),
+            )
+        return started
+
+    def finish(self) -> None:
+        with self._connect() as conn:
+            conn.execute("UPDATE AssetCheckRun SET finished_at=? WHERE id=1", (time.time(),))
+
+    def checked_since(self, started_at: float) -> Dict[int, Tuple[int, float, str]]:
+        """이번 회차에 검사한 에셋 {asset_id: (크기, 수정 시각, 상태)}."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT asset_id, file_size, file_mtime, status FROM AssetChecks WHERE checked_at >= ?",
+                (started_at,),
+            ).fetchall()
+            return {r[0]: (r[1], r[2], r[3]) for r in rows}
+
+    def record(self, items: Iterable[Tuple[int, Optional[int], Optional[float], str]]) -> None:
+        """(asset_id, 크기, 수정 시각, 상태) 묶음을 한 트랜잭션으로 기록한다."""
+        now = time.time()
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO AssetChecks(asset_id, file_size, file_mtime, status, checked_at) "
+                "VALUES(?,?,?,?,?)",
+                ((asset_id, size, mtime, status, now) for asset_id, size, mtime, status in items),
+            )
+
+    def forget(self, asset_ids: Iterable[int]) -> None:
+        # 복구한 에셋은 다음 검사에서 다시 본다
+        with self._connect() as conn:
+            conn.executemany("DELETE FROM AssetChecks WHERE asset_id=?", ((i,) for i in asset_ids))
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import sqlite3
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterable, List, Optional, Tuple
+
+from ..utils import sql_trace
 
 
 @dataclass
@@ -26,7 +28,7 @@ class AssetRepository:
         self._db_path = db_path
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self._db_path)
+        conn = sql_trace.connect(self._db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
@@ -42,6 +44,23 @@ class AssetRepository:
             row = conn.execute("SELECT * FROM Assets WHERE id=?", (asset_id,)).fetchone()
             return self._row_to_asset(row) if row else None
 
+    def search_images(self, query: str = "", before_id: int | None = None, limit: int = 200) -> List[Asset]:
+        # id 내림차순 keyset 페이지네이션: before_id보다 작은 id만 조회하므로 OFFSET 스캔이 없다
+        where = ["kind='image'"]
+        params: List[object] = []
+        if before_id is not None:
+            where.append("id < ?")
+            params.append(before_id)
+        if query:
+            where.append("(tags LIKE ? OR filename LIKE ?)")
+            like = f"%{query}%"
+            params.extend([like, like])
+        sql = f"SELECT * FROM Assets WHERE {' AND '.join(where)} ORDER BY id DESC LIMIT ?"
+        params.append(limit)
+        with self._connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+            return [self._row_to_asset(r) for r in rows]
+
     def upsert_image(self, *,
                      original_path: str | None,
                      project_path: str,
@@ -64,6 +83,37 @@ class AssetRepository:
             )
             return int(cur.lastrowid)
 
+    def upsert_images(self, items: List[dict]) -> List[int]:
+        """upsert_image의 일괄 버전: 한 트랜잭션으로 기록하고 입력 순서대로 id를 돌려준다.
+
+        items의 각 항목은 upsert_image의 키워드 인자와 같은 키를 가진다.
+        """
+        ids: List[int] = []
+        with self._connect() as conn:
+            for item in items:
+                conn.execute(
+                    """
+                    INSERT OR IGNORE INTO Assets(kind, original_path, project_path, filename, ext, width, height, duration_sec, hash_sha256, tags, thumbnail_path)
+                    VALUES('image',?,?,?,?,?,?,NULL,?,NULL,?)
+                    """,
+                    (
+                        item["original_path"], item["project_path"], item["filename"], item["ext"],
+                        item["width"], item["height"], item["hash_sha256"], item["thumbnail_path"],
+                    ),
+                )
+                row = conn.execute("SELECT id FROM Assets WHERE hash_sha256=?", (item["hash_sha256"],)).fetchone()
+                ids.append(int(row[0]))
+        return ids
+
+    def list_all(self) -> List[Asset]:
+        with self._connect() as conn:
+            rows = conn.execute("SELECT * FROM Assets ORDER BY id ASC").fetchall()
+            return [self._row_to_asset(r) for r in rows]
+
+    def set_thumbnail_path(self, asset_id: int, thumbnail_path: str | None) -> None:
+        with self._connect() as conn:
+            conn.execute("UPDATE Assets SET thumbnail_path=? WHERE id=?", (thumbnail_path, asset_id))
+
     def update_tags(self, asset_id: int, tags: str) -> None:
         with self._connect() as conn:
             conn.execute("UPDATE Assets SET tags=? WHERE id=?", (tags, asset_id))
@@ -84,6 +134,51 @@ class AssetRepository:
         with self._connect() as conn:
             conn.execute("DELETE FROM Assets WHERE id=?", (asset_id,))
 
+    # ---- 앱 밖에서 바뀐 파일 감지(AssetRefreshService) ----
+
+    def _ensure_file_stat_columns(self, conn: sqlite3.Connection) -> None:
+        # 스키마 자동 업그레이드: 마지막으로 확인한 원본 파일 크기/수정 시각
+        try:
+            conn.execute("SELECT file_size, file_mtime FROM Assets LIMIT 1")
+        except sqlite3.OperationalError:
+            conn.execute("ALTER TABLE Assets ADD COLUMN file_size INTEGER")
+            conn.execute("ALTER TABLE Assets ADD COLUMN file_mtime REAL")
+
+    def list_file_stats(self) -> List[Tuple[int, str, str | None, str, int | None, float | None]]:
+        """이미지 에셋의 (id, project_path, thumbnail_path, hash_sha256, file_size, file_mtime)."""
+        with self._connect() as conn:
+            self._ensure_file_stat_columns(conn)
+            rows = conn.execute(
+                "SELECT id, project_path, thumbnail_path, hash_sha256, file_size, file_mtime "
+                "FROM Assets WHERE kind='image' ORDER BY id"
+            ).fetchall()
+            return [tuple(r) for r in rows]
+
+    def update_file_stats(self, items: Iterable[Tuple[int, float, int]]) -> None:
+        """(file_size, file_mtime, asset_id) 묶음을 한 트랜잭션으로 기록한다."""
+        with self._connect() as conn:
+            self._ensure_file_stat_columns(conn)
+            conn.executemany("UPDATE Assets SET file_size=?, file_mtime=? WHERE id=?", items)
+
+    def update_content(
+        self, asset_id: int, hash_sha256: str, width: int | None, height: int | None, file_size: int, file_mtime: float
+    ) -> bool:
+        """내용이 바뀐 원본의 해시/크기를 갱신한다. 같은 해시의 다른 에셋이 있으면 해시는 두고 False."""
+        with self._connect() as conn:
+            self._ensure_file_stat_columns(conn)
+            try:
+                conn.execute(
+                    "UPDATE Assets SET hash_sha256=?, width=?, height=?, file_size=?, file_mtime=? WHERE id=?",
+                    (hash_sha256, width, height, file_size, file_mtime, asset_id),
+                )
+                return True
+            except sqlite3.IntegrityError:
+                conn.execute(
+                    "UPDATE Assets SET width=?, height=?, file_size=?, file_mtime=? WHERE id=?",
+                    (width, height, file_size, file_mtime, asset_id),
+                )
+                return False
+
     def _row_to_asset(self, row: sqlite3.Row) -> Asset:
         return Asset(
             id=row["id"],
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import sqlite3
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..utils import sql_trace
+from ..utils.json_text import content_hash
+
+_CONTAINERS = ("object", "array")
+
+
+@dataclass
+class BoardEntry:
+    board: str  # 'doc:<key>' | 'audio' | 'cinematic'
+    unit: str  # 항목이 속한 단위(보드 2단계 경로, 예: $.cues[3])
+    path: str  # 전체 JSON 경로(예: $.cues[3].shot)
+    key: Any
+    type: str  # json_tree type: object/array/text/integer/real/true/false/null
+    value: Any
+
+
+class BoardIndexRepository:
+    """JSON 보드 내부를 BoardEntries 사이드 테이블로 펼쳐 색인한다.
+
+    보드는 '단위'(최상위 값, 최상위가 객체/배열이면 그 자식) 별로 해시를 보관하고,
+    저장할 때 해시가 바뀐 단위만 json_tree로 다시 펼친다. 파싱은 SQLite JSON1이 하므로
+    항목 조회는 보드 전체를 Python에서 json.loads하지 않는다.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        self._db_path = db_path
+        self._ensure_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sql_trace.connect(self._db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _ensure_schema(self) -> None:
+        with self._connect() as conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS BoardIndexState (
+                  board TEXT PRIMARY KEY,
+                  content_hash TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS BoardUnits (
+                  board TEXT NOT NULL,
+                  unit TEXT NOT NULL,
+                  digest TEXT NOT NULL,
+                  PRIMARY KEY (board, unit)
+                );
+                CREATE TABLE IF NOT EXISTS BoardEntries (
+                  id INTEGER PRIMARY KEY AUTOINCREMENT,
+                  board TEXT NOT NULL,
+                  unit TEXT NOT NULL,
+                  path TEXT NOT NULL,
+                  parent TEXT,
+                  key,
+                  type TEXT NOT NULL,
+                  value,
+                  -- 대소문자/숫자 형식에 상관없이 값으로 찾기 위한 정규화 값
+                  norm_value TEXT GENERATED ALWAYS AS (lower(CAST(value AS TEXT))) VIRTUAL
+                );
+                CREATE INDEX IF NOT EXISTS idx_board_entries_unit ON BoardEntries(board, unit);
+                CREATE INDEX IF NOT EXISTS idx_board_entries_key_value ON BoardEntries(key, norm_value);
+                CREATE INDEX IF NOT EXISTS idx_board_entries_value ON BoardEntries(norm_value);
+                """
+            )
+
+    # ---- 갱신(소유 리포지토리의 트랜잭션 안에서 호출) ----
+
+    def is_indexed(self, conn: sqlite3.Connection, board: str) -> bool:
+        return conn.execute("SELECT 1 FROM BoardIndexState WHERE board=?", (board,)).fetchone() is not None
+
+    def refresh(
+        self,
+        conn: sqlite3.Connection,
+        board: str,
+        format: str,
+        content: str,
+        digest: Optional[str] = None,
+    ) -> int:
+        """board 색인을 content에 맞춘다. 다시 펼친 단위 수를 돌려준다(바뀐 게 없으면 0)."""
+        digest = digest or content_hash(content)
+        row = conn.execute("SELECT content_hash FROM BoardIndexState WHERE board=?", (board,)).fetchone()
+        if row and row[0] == digest:
+            return 0
+        valid = format == "json" and conn.execute("SELECT json_valid(?)", (content,)).fetchone()[0]
+        existing: Dict[str, str] = dict(
+            conn.execute("SELECT unit, digest FROM BoardUnits WHERE board=?", (board,)).fetchall()
+        )
+        units = self._units(conn, content) if valid else []
+        changed = 0
+        seen = set()
+        for unit, parent, key, type_, atom, text in units:
+            seen.add(unit)
+            unit_digest = content_hash(text)
+            if existing.get(unit) == unit_digest:
+                continue
+            conn.execute("DELETE FROM BoardEntries WHERE board=? AND unit=?", (board, unit))
+            if type_ in _CONTAINERS:
+                # json_tree는 단위 JSON을 '$' 기준으로 펼치므로 경로 앞부분을 단위 경로로 바꿔 넣는다
+                conn.execute(
+                    """
+                    INSERT INTO BoardEntries(board, unit, path, parent, key, type, value)
+                    SELECT ?, ?, ? || substr(fullkey, 2),
+                           CASE WHEN fullkey = '$' THEN ? ELSE ? || substr(path, 2) END,
+                           CASE WHEN fullkey = '$' THEN ? ELSE key END,
+                           type, atom
+                    FROM json_tree(?)
+                    """,
+                    (board, unit, unit, parent, unit, key, text),
+                )
+            else:
+                conn.execute(
+                    "INSERT INTO BoardEntries(board, unit, path, parent, key, type, value) VALUES(?,?,?,?,?,?,?)",
+                    (board, unit, unit, parent, key, type_, atom),
+                )
+            conn.execute(
+                "INSERT OR REPLACE INTO BoardUnits(board, unit, digest) VALUES(?,?,?)", (board, unit, unit_digest)
+            )
+            changed += 1
+        for unit in existing.keys() - seen:
+            conn.execute("DELETE FROM BoardEntries WHERE board=? AND unit=?", (board, unit))
+            conn.execute("DELETE FROM BoardUnits WHERE board=? AND unit=?", (board, unit))
+        conn.execute(
+            "INSERT OR REPLACE INTO BoardIndexState(board, content_hash) VALUES(?,?)", (board, digest)
+        )
+        return changed
+
+    def _units(self, conn: sqlite3.Connection, content: str) -> List[Tuple[str, str, Any, str, Any, str]]:
+        # (단위 경로, 부모 경로, 키, 타입, 스칼라 값, 해시용 텍스트)
+        units: List[Tuple[str, str, Any, str, Any, str]] = []
+        top = conn.execute("SELECT key, fullkey, type, atom, value FROM json_each(?)", (content,)).fetchall()
+        for row in top:
+            children = []
+            if row["type"] in _CONTAINERS:
+                children = conn.execute(
+                    "SELECT key, fullkey, type, atom, value FROM json_each(?, ?)", (content, row["fullkey"])
+                ).fetchall()
+            if not children:
+                children, parent = [row], "$"
+            else:
+                parent = row["fullkey"]
+            for child in children:
+                if child["type"] in _CONTAINERS:
+                    text = child["value"]
+                else:
+                    text = f"{child['type']}:{child['atom']}"
+                units.append((child["fullkey"], parent, child["key"], child["type"], child["atom"], text))
+        return units
+
+    # ---- 조회 ----
+
+    def find(
+        self,
+        board: Optional[str] = None,
+        key: Optional[str] = None,
+        value: Any = None,
+        key_like: Optional[str] = None,
+        value_like: Optional[str] = None,
+        limit: int = 200,
+    ) -> List[BoardEntry]:
+        """조건에 맞는 항목을 찾는다. value/value_like는 대소문자를 구분하지 않는다."""
+        clauses: List[str] = []
+        params: List[Any] = []
+        if board is not None:
+            clauses.append("board=?")
+            params.append(board)
+        if key is not None:
+            clauses.append("key=?")
+            params.append(key)
+        if key_like is not None:
+            clauses.append("key LIKE ?")
+            params.append(key_like)
+        if value is not None:
+            clauses.append("norm_value=?")
+            params.append(str(value).lower())
+        if value_like is not None:
+            clauses.append("norm_value LIKE ?")
+            params.append(value_like.lower())
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT board, unit, path, key, type, value FROM BoardEntries {where} ORDER BY id LIMIT ?",
+                (*params, limit),
+            ).fetchall()
+        return [BoardEntry(**dict(row)) for row in rows]
+
+    def find_references(self, value: Any, key_like: str = "%shot%", board: Optional[str] = None) -> List[Tuple[str, str]]:
+        """value를 참조하는 단위 (보드, 단위 경로) 목록. 예: 샷 3.2를 가리키는 오디오 큐."""
+        seen: List[Tuple[str, str]] = []
+        for entry in self.find(board=board, key_like=key_like, value=value, limit=10000):
+            if (entry.board, entry.unit) not in seen:
+                seen.append((entry.board, entry.unit))
+        return seen
+
+    def get_unit(self, board: str, unit: str) -> Any:
+        """단위 하나를 색인된 항목에서 다시 조립해 돌려준다(보드 전체를 읽지 않는다)."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT path, parent, key, type, value FROM BoardEntries WHERE board=? AND unit=? ORDER BY id",
+                (board, unit),
+            ).fetchall()
+        if not rows:
+            raise KeyError(f"{board} {unit}")
+        nodes: Dict[str, Any] = {}
+        root: Any = None
+        # json_tree는 부모를 자식보다 먼저 내보내므로 순서대로 붙이면 된다
+        for row in rows:
+            node = self._node(row["type"], row["value"])
+            nodes[row["path"]] = node
+            parent = nodes.get(row["parent"]) if row["path"] != unit else None
+            if parent is None:
+                root = node
+            elif isinstance(parent, list):
+                parent.append(node)
+            else:
+                parent[row["key"]] = node
+        return root
+
+    def _node(self, type_: str, value: Any) -> Any:
+        if type_ == "object":
+            return {}
+        if type_ == "array":
+            return []
+        if type_ == "true":
+            return True
+        if type_ == "false":
+            return False
+        return value
@@ -4,6 +4,8 @@ import sqlite3
 from dataclasses import dataclass
 from typing import List, Optional
 
+from ..utils import sql_trace
+
 
 @dataclass
 class Character:
@@ -16,6 +18,8 @@ class Character:
     conflict: str | None = None
     design_prompt: str | None = None
     image_asset_id: int | None = None
+    asset_thumbnail_path: str | None = None
+    asset_project_path: str | None = None
 
 
 class CharacterRepository:
@@ -23,7 +27,7 @@ class CharacterRepository:
         self._db_path = db_path
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self._db_path)
+        conn = sql_trace.connect(self._db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
@@ -38,6 +42,27 @@ class CharacterRepository:
             ).fetchall()
             return [self._row_to_model(r) for r in rows]
 
+    def list_characters_with_assets(self) -> List[Character]:
+        # 캐릭터 이미지 경로를 JOIN으로 함께 가져와 캐릭터별 에셋 조회(N+1)를 없앤다
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT c.id, c.name, c.age, c.job, c.personality, c.goal, c.conflict, c.design_prompt, c.image_asset_id,
+                       a.thumbnail_path AS asset_thumbnail_path,
+                       a.project_path AS asset_project_path
+                  FROM Characters c
+                  LEFT JOIN Assets a ON a.id = c.image_asset_id
+                 ORDER BY c.id ASC
+                """
+            ).fetchall()
+            characters: List[Character] = []
+            for r in rows:
+                c = self._row_to_model(r)
+                c.asset_thumbnail_path = r["asset_thumbnail_path"]
+                c.asset_project_path = r["asset_project_path"]
+                characters.append(c)
+            return characters
+
     def get(self, char_id: int) -> Optional[Character]:
         with self._connect() as conn:
             r = conn.execute(
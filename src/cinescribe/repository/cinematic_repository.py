@@ -3,7 +3,13 @@ from __future__ import annotations
 import json
 import sqlite3
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, List, Optional
+
+from ..utils import sql_trace
+from ..utils.json_text import content_hash
+from .board_index_repository import BoardEntry, BoardIndexRepository
+from .content_codec import decode_content, encode_content, ensure_encoding_column
+from .revision_repository import Revision, RevisionRepository
 
 
 @dataclass
@@ -18,9 +24,12 @@ class CinematicRepository:
     def __init__(self, db_path: str) -> None:
         self._db_path = db_path
         self._ensure_schema()
+        self._revisions = RevisionRepository(db_path)
+        self._board_index = BoardIndexRepository(db_path)
+        self._index_unindexed()
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self._db_path)
+        conn = sql_trace.connect(self._db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
@@ -32,29 +41,45 @@ class CinematicRepository:
                   id INTEGER PRIMARY KEY CHECK (id = 1),
                   format TEXT NOT NULL CHECK (format IN ('json','text')),
                   content TEXT NOT NULL,
+                  encoding TEXT NOT NULL DEFAULT 'plain',
                   updated_at TEXT DEFAULT (datetime('now'))
                 );
                 -- 보드는 항상 단일 행(id=1)
                 INSERT OR IGNORE INTO CinematicBoard(id, format, content) VALUES(1, 'json', '{}');
                 """
             )
+            ensure_encoding_column(conn, "CinematicBoard", "id")
 
     def upsert(self, format: str, content: str) -> int:
         print(f"CinematicRepository.upsert 호출: format='{format}', content='{content[:100]}...'")
+        digest = content_hash(content)
         with self._connect() as conn:
             try:
+                row = conn.execute("SELECT format FROM CinematicBoard WHERE id=1").fetchone()
+                # 직전 리비전과 해시가 같으면 보드를 다시 쓰지 않는다
+                if row and row["format"] == format and self._revisions.latest_hash(conn, "cinematic") == digest:
+                    return 1
+                stored = conn.execute("SELECT content, encoding FROM CinematicBoard WHERE id=1").fetchone()
+                previous = decode_content(stored["encoding"], stored["content"]) if stored else None
+                if previous == content and row["format"] == format:
+                    return 1
+                # 큰 보드는 압축해 저장(encoding 컬럼에 방식 기록)
+                encoding, stored_content = encode_content(content)
                 cur = conn.execute(
                     """
-                    INSERT INTO CinematicBoard(id, format, content)
-                    VALUES(1, ?, ?)
+                    INSERT INTO CinematicBoard(id, format, content, encoding)
+                    VALUES(1, ?, ?, ?)
                     ON CONFLICT(id) DO UPDATE SET
                       format=excluded.format,
                       content=excluded.content,
+                      encoding=excluded.encoding,
                       updated_at=datetime('now')
                     ;
                     """,
-                    (format, content),
+                    (format, stored_content, encoding),
                 )
+                self._revisions.record(conn, "cinematic", format, content, previous, digest)
+                self._board_index.refresh(conn, "cinematic", format, content, digest)
                 result_id = int(cur.lastrowid or 1)
                 print(f"CinematicRepository.upsert 성공: ID={result_id}")
                 return result_id
@@ -66,16 +91,44 @@ class CinematicRepository:
 
     def get(self) -> Optional[CinematicBoard]:
         with self._connect() as conn:
-            row = conn.execute("SELECT * FROM CinematicBoard WHERE id=1").fetchone()
+            row = conn.execute("SELECT id, format, content, encoding, updated_at FROM CinematicBoard WHERE id=1").fetchone()
             if not row:
                 return None
             return CinematicBoard(
                 id=row["id"],
                 format=row["format"],
-                content=row["content"],
+                content=decode_content(row["encoding"], row["content"]),
                 updated_at=row["updated_at"],
             )
 
+    def _index_unindexed(self) -> None:
+        # 색인 도입 이전에 저장된 보드는 처음 열 때 한 번 펼친다
+        with self._connect() as conn:
+            if self._board_index.is_indexed(conn, "cinematic"):
+                return
+        board = self.get()
+        if board is not None:
+            with self._connect() as conn:
+                self._board_index.refresh(conn, "cinematic", board.format, board.content)
+
+    def find_entries(self, **filters: Any) -> List[BoardEntry]:
+        # filters: key, value, key_like, value_like, limit (BoardIndexRepository.find 참고)
+        return self._board_index.find(board="cinematic", **filters)
+
+    def get_entry_unit(self, unit: str) -> Any:
+        return self._board_index.get_unit("cinematic", unit)
+
+    def history(self) -> List[Revision]:
+        return self._revisions.history("cinematic")
+
+    def diff_revisions(self, from_seq: int, to_seq: int) -> str:
+        return self._revisions.diff("cinematic", from_seq, to_seq)
+
+    def restore_revision(self, seq: int) -> int:
+        # 되돌리기도 새 리비전으로 남아 다시 앞으로 돌아갈 수 있다
+        format, content = self._revisions.content_at("cinematic", seq)
+        return self.upsert(format, content)
+
     def export_to_file(self, out_path: str) -> None:
         board = self.get()
         if not board:
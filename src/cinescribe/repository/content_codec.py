@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import lzma
+import sqlite3
+import zlib
+from typing import Tuple, Union
+
+# 이 크기(UTF-8 바이트) 이상인 본문만 압축한다. 작은 문서는 압축 이득보다 CPU 비용이 크다
+COMPRESS_THRESHOLD = 16 * 1024
+ENCODINGS = ("plain", "zlib", "lzma")
+
+StoredContent = Union[str, bytes]
+
+
+def encode_content(text: str, method: str = "zlib", threshold: int = COMPRESS_THRESHOLD) -> Tuple[str, StoredContent]:
+    """저장할 (encoding, 값)을 돌려준다. 'plain'이면 TEXT 그대로, 아니면 압축된 BLOB.
+
+    저장 경로는 빠른 zlib를 쓰고, lzma는 정비 작업(compress 명령)에서 보관용으로 고른다.
+    """
+    if method not in ENCODINGS:
+        raise ValueError(f"알 수 없는 압축 방식: {method}")
+    raw = text.encode("utf-8")
+    if method == "plain" or len(raw) < threshold:
+        return "plain", text
+    if method == "lzma":
+        return "lzma", lzma.compress(raw, preset=6)
+    return "zlib", zlib.compress(raw, 6)
+
+
+def decode_content(encoding: str | None, value: StoredContent) -> str:
+    if not encoding or encoding == "plain":
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+    if encoding == "zlib":
+        return zlib.decompress(value).decode("utf-8")
+    if encoding == "lzma":
+        return lzma.decompress(value).decode("utf-8")
+    raise ValueError(f"알 수 없는 본문 인코딩: {encoding}")
+
+
+def ensure_encoding_column(conn: sqlite3.Connection, table: str, key_column: str) -> None:
+    """스키마 자동 업그레이드: encoding 컬럼이 없으면 추가하고 기존 큰 본문을 압축한다."""
+    try:
+        conn.execute(f"SELECT encoding FROM {table} LIMIT 1")
+    except sqlite3.OperationalError:
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN encoding TEXT NOT NULL DEFAULT 'plain'")
+        recompress_table(conn, table, key_column)
+
+
+def recompress_table(
+    conn: sqlite3.Connection,
+    table: str,
+    key_column: str,
+    method: str = "zlib",
+    threshold: int = COMPRESS_THRESHOLD,
+) -> Tuple[int, int, int]:
+    """table의 본문을 method로 다시 저장한다. (바꾼 행 수, 이전 바이트, 이후 바이트)
+
+    행 하나씩 읽고 써서 큰 보드가 여러 개여도 메모리에 한 번에 올리지 않는다.
+    """
+    keys = [row[0] for row in conn.execute(f"SELECT {key_column} FROM {table}")]
+    changed = before = after = 0
+    for key in keys:
+        row = conn.execute(f"SELECT content, encoding FROM {table} WHERE {key_column}=?", (key,)).fetchone()
+        if row is None:
+            continue
+        value, encoding = row[0], row[1]
+        text = decode_content(encoding, value)
+        new_encoding, new_value = encode_content(text, method, threshold)
+        if new_encoding == encoding:
+            continue
+        before += len(value.encode("utf-8")) if isinstance(value, str) else len(value)
+        after += len(new_value.encode("utf-8")) if isinstance(new_value, str) else len(new_value)
+        # updated_at은 내용이 바뀐 것이 아니므로 건드리지 않는다
+        conn.execute(
+            f"UPDATE {table} SET content=?, encoding=? WHERE {key_column}=?",
+            (new_value, new_encoding, key),
+        )
+        changed += 1
+    return changed, before, after
@@ -3,7 +3,14 @@ from __future__ import annotations
 import json
 import sqlite3
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, List, Optional
+
+from ..utils import sql_trace
+from ..utils.json_text import content_hash
+from .board_index_repository import BoardEntry, BoardIndexRepository
+from .content_codec import decode_content, encode_content, ensure_encoding_column
+from .revision_repository import Revision, RevisionRepository
+from .search_index_repository import SearchHit, SearchIndexRepository
 
 
 @dataclass
@@ -19,9 +26,13 @@ class DocumentRepository:
     def __init__(self, db_path: str) -> None:
         self._db_path = db_path
         self._ensure_schema()
+        self._revisions = RevisionRepository(db_path)
+        self._board_index = BoardIndexRepository(db_path)
+        self._search_index = SearchIndexRepository(db_path)
+        self._index_unindexed()
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self._db_path)
+        conn = sql_trace.connect(self._db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
@@ -35,41 +46,106 @@ class DocumentRepository:
                   key TEXT NOT NULL UNIQUE,
                   format TEXT NOT NULL CHECK (format IN ('json','text')),
                   content TEXT NOT NULL,
+                  encoding TEXT NOT NULL DEFAULT 'plain',
                   updated_at TEXT DEFAULT (datetime('now'))
                 );
                 CREATE INDEX IF NOT EXISTS idx_documents_key ON Documents(key);
                 """
             )
+            ensure_encoding_column(conn, "Documents", "key")
 
     def upsert(self, doc: Document) -> int:
+        target = f"doc:{doc.key}"
+        digest = content_hash(doc.content)
         with self._connect() as conn:
+            row = conn.execute("SELECT id, format FROM Documents WHERE key=?", (doc.key,)).fetchone()
+            # 직전 리비전과 해시가 같으면 본문을 다시 쓰지 않는다
+            if row and row["format"] == doc.format and self._revisions.latest_hash(conn, target) == digest:
+                return int(row["id"])
+            previous = None
+            if row:
+                stored = conn.execute("SELECT content, encoding FROM Documents WHERE id=?", (row["id"],)).fetchone()
+                previous = decode_content(stored["encoding"], stored["content"])
+                if previous == doc.content and row["format"] == doc.format:
+                    return int(row["id"])
+            # 큰 본문은 압축해 저장(encoding 컬럼에 방식 기록)
+            encoding, stored_content = encode_content(doc.content)
             cur = conn.execute(
                 """
-                INSERT INTO Documents(key, format, content)
-                VALUES(?,?,?)
+                INSERT INTO Documents(key, format, content, encoding)
+                VALUES(?,?,?,?)
                 ON CONFLICT(key) DO UPDATE SET
                   format=excluded.format,
                   content=excluded.content,
+                  encoding=excluded.encoding,
                   updated_at=datetime('now')
                 ;
                 """,
-                (doc.key, doc.format, doc.content),
+                (doc.key, doc.format, stored_content, encoding),
             )
-            return int(cur.lastrowid or 0)
+            self._revisions.record(conn, target, doc.format, doc.content, previous, digest)
+            self._board_index.refresh(conn, target, doc.format, doc.content, digest)
+            doc_id = int(row["id"]) if row else int(cur.lastrowid)
+            self._search_index.index_document(conn, doc_id, doc.key, doc.content)
+            return doc_id
 
     def get(self, key: str) -> Optional[Document]:
         with self._connect() as conn:
-            row = conn.execute("SELECT * FROM Documents WHERE key=?", (key,)).fetchone()
+            row = conn.execute(
+                "SELECT id, key, format, content, encoding, updated_at FROM Documents WHERE key=?", (key,)
+            ).fetchone()
             if not row:
                 return None
             return Document(
                 id=row["id"],
                 key=row["key"],
                 format=row["format"],
-                content=row["content"],
+                content=decode_content(row["encoding"], row["content"]),
                 updated_at=row["updated_at"],
             )
 
+    def _index_unindexed(self) -> None:
+        # 색인 도입 이전에 저장된 JSON 문서는 처음 열 때 한 번 펼친다
+        with self._connect() as conn:
+            keys = [
+                row["key"]
+                for row in conn.execute(
+                    "SELECT key FROM Documents WHERE format='json' "
+                    "AND ('doc:' || key) NOT IN (SELECT board FROM BoardIndexState)"
+                )
+            ]
+        for key in keys:
+            doc = self.get(key)
+            if doc is not None:
+                with self._connect() as conn:
+                    self._board_index.refresh(conn, f"doc:{key}", doc.format, doc.content)
+
+    def find_entries(self, doc_key: str, **filters: Any) -> List[BoardEntry]:
+        # filters: key, value, key_like, value_like, limit (BoardIndexRepository.find 참고)
+        return self._board_index.find(board=f"doc:{doc_key}", **filters)
+
+    def get_entry_unit(self, doc_key: str, unit: str) -> Any:
+        return self._board_index.get_unit(f"doc:{doc_key}", unit)
+
+    def search(self, text: str, limit: int = 50) -> List[SearchHit]:
+        # 문서뿐 아니라 샷/장면/캐릭터까지 프로젝트 전체를 검색한다
+        return self._search_index.search(text, limit)
+
+    def list_keys(self) -> List[str]:
+        with self._connect() as conn:
+            return [row["key"] for row in conn.execute("SELECT key FROM Documents ORDER BY key ASC")]
+
+    def history(self, key: str) -> List[Revision]:
+        return self._revisions.history(f"doc:{key}")
+
+    def diff_revisions(self, key: str, from_seq: int, to_seq: int) -> str:
+        return self._revisions.diff(f"doc:{key}", from_seq, to_seq)
+
+    def restore_revision(self, key: str, seq: int) -> int:
+        # 되돌리기도 새 리비전으로 남아 다시 앞으로 돌아갈 수 있다
+        format, content = self._revisions.content_at(f"doc:{key}", seq)
+        return self.upsert(Document(id=None, key=key, format=format, content=content))
+
     def export_to_file(self, key: str, out_path: str) -> None:
         doc = self.get(key)
         if not doc:
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import sqlite3
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional
+
+from ..utils import sql_trace
 
 
 @dataclass
@@ -30,7 +32,7 @@ class FinalImageRepository:
         self._ensure_schema()
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self._db_path)
+        conn = sql_trace.connect(self._db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
@@ -68,6 +70,18 @@ class FinalImageRepository:
             )
             return int(cur.lastrowid)
 
+    def delete_scene(self, scene_id: int) -> None:
+        with self._connect() as conn:
+            # 외래 키는 연결마다 켜야 ON DELETE CASCADE로 이 장면의 이미지/샷이 함께 지워진다
+            conn.execute("PRAGMA foreign_keys=ON")
+            conn.execute("DELETE FROM Scenes WHERE id=?", (scene_id,))
+
+    def count_images_by_scene(self) -> Dict[int, int]:
+        # 장면 id -> 최종 이미지 수(장면 선택 목록용, 쿼리 하나)
+        with self._connect() as conn:
+            rows = conn.execute("SELECT scene_id, COUNT(*) FROM FinalImages GROUP BY scene_id").fetchall()
+            return {int(r[0]): int(r[1]) for r in rows}
+
     # FinalImages CRUD
     def list_images(self, scene_id: int) -> List[FinalImage]:
         with self._connect() as conn:
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import sqlite3
 from dataclasses import dataclass
-from typing import Iterable, List, Optional
+from typing import Iterable, List, Optional, Tuple
 
+from ..utils import sql_trace
 from ..utils.paths import get_library_db_path
 
 
@@ -18,6 +19,13 @@ class LibraryProject:
     created_at: Optional[str]
     db_version: Optional[int]
     archived: int = 0
+    # 마지막 무결성 검사 결과: 'unknown' | 'ok' | 'changed' | 'missing' | 'unreachable'
+    file_state: str = "unknown"
+    file_size: Optional[int] = None
+    file_mtime: Optional[float] = None
+    checked_at: Optional[str] = None
+    # 마지막으로 썸네일 생성을 시도했을 때의 프로젝트 파일 수정 시각(실패한 프로젝트를 매번 다시 열지 않도록)
+    thumbnail_probed_mtime: Optional[float] = None
 
 
 class LibraryRepository:
@@ -26,7 +34,7 @@ class LibraryRepository:
         self._ensure_schema()
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self._db_path)
+        conn = sql_trace.connect(self._db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
@@ -49,6 +57,21 @@ class LibraryRepository:
             )
             conn.execute("CREATE INDEX IF NOT EXISTS idx_projects_title ON projects(title);")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_projects_tags ON projects(tags);")
+            # 이동/삭제된 파일을 찾기 위한 폴더 목록
+            conn.execute("CREATE TABLE IF NOT EXISTS search_roots (path TEXT PRIMARY KEY)")
+            # 스키마 자동 업그레이드: 파일 상태 컬럼
+            try:
+                conn.execute("SELECT file_state FROM projects LIMIT 1")
+            except sqlite3.OperationalError:
+                conn.execute("ALTER TABLE projects ADD COLUMN file_state TEXT DEFAULT 'unknown'")
+                conn.execute("ALTER TABLE projects ADD COLUMN file_size INTEGER")
+                conn.execute("ALTER TABLE projects ADD COLUMN file_mtime REAL")
+                conn.execute("ALTER TABLE projects ADD COLUMN checked_at TEXT")
+            # 스키마 자동 업그레이드: 썸네일 시도 기록 컬럼
+            try:
+                conn.execute("SELECT thumbnail_probed_mtime FROM projects LIMIT 1")
+            except sqlite3.OperationalError:
+                conn.execute("ALTER TABLE projects ADD COLUMN thumbnail_probed_mtime REAL")
 
     def upsert_project(self, p: LibraryProject) -> int:
         with self._connect() as conn:
@@ -59,7 +82,7 @@ class LibraryRepository:
                 ON CONFLICT(project_path) DO UPDATE SET
                   title=excluded.title,
                   tags=excluded.tags,
-                  thumbnail=excluded.thumbnail,
+                  thumbnail=COALESCE(excluded.thumbnail, projects.thumbnail),
                   last_opened_at=excluded.last_opened_at,
                   db_version=excluded.db_version,
                   archived=excluded.archived
@@ -108,6 +131,54 @@ class LibraryRepository:
                 (project_path,),
             )
 
+    def set_thumbnail(self, project_path: str, thumbnail: str | None, probed_mtime: float | None = None) -> None:
+        # probed_mtime: 이번 시도에서 본 프로젝트 파일의 수정 시각(None이면 이전 값 유지)
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE projects SET thumbnail=?, thumbnail_probed_mtime=COALESCE(?, thumbnail_probed_mtime) WHERE project_path=?",
+                (thumbnail, probed_mtime, project_path),
+            )
+
+    def update_file_states(self, states: Iterable[Tuple[str, Optional[int], Optional[float], Optional[int], str]]) -> None:
+        # states: (file_state, file_size, file_mtime, db_version, project_path). 크기/시각/버전이 None이면 이전 값 유지
+        with self._connect() as conn:
+            conn.executemany(
+                """
+                UPDATE projects SET file_state=?, file_size=COALESCE(?, file_size), file_mtime=COALESCE(?, file_mtime),
+                       db_version=COALESCE(?, db_version), checked_at=datetime('now')
+                 WHERE project_path=?
+                """,
+                list(states),
+            )
+
+    def relocate(self, old_path: str, new_path: str) -> None:
+        """이동된 프로젝트의 경로를 바꾼다. 새 경로가 이미 등록돼 있으면 이전 항목을 지운다."""
+        with self._connect() as conn:
+            if conn.execute("SELECT 1 FROM projects WHERE project_path=?", (new_path,)).fetchone():
+                conn.execute("DELETE FROM projects WHERE project_path=?", (old_path,))
+            else:
+                # 크기/시각/버전은 이전 파일의 값이므로 비운다(남겨 두면 다음 검사가 새 파일을 'changed'로 본다)
+                conn.execute(
+                    """
+                    UPDATE projects SET project_path=?, file_state='unknown', file_size=NULL, file_mtime=NULL,
+                           db_version=NULL, checked_at=NULL, thumbnail_probed_mtime=NULL
+                     WHERE project_path=?
+                    """,
+                    (new_path, old_path),
+                )
+
+    def list_roots(self) -> List[str]:
+        with self._connect() as conn:
+            return [row["path"] for row in conn.execute("SELECT path FROM search_roots ORDER BY path")]
+
+    def add_root(self, path: str) -> None:
+        with self._connect() as conn:
+            conn.execute("INSERT OR IGNORE INTO search_roots(path) VALUES(?)", (path,))
+
+    def remove_root(self, path: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM search_roots WHERE path=?", (path,))
+
     def _row_to_model(self, row: sqlite3.Row) -> LibraryProject:
         return LibraryProject(
             id=row["id"],
@@ -119,6 +190,11 @@ class LibraryRepository:
             created_at=row["created_at"],
             db_version=row["db_version"],
             archived=int(row["archived"] or 0),
+            file_state=row["file_state"] or "unknown",
+            file_size=row["file_size"],
+            file_mtime=row["file_mtime"],
+            checked_at=row["checked_at"],
+            thumbnail_probed_mtime=row["thumbnail_probed_mtime"],
         )
 
 
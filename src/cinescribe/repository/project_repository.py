@@ -4,6 +4,8 @@ import sqlite3
 from dataclasses import dataclass
 from typing import Optional
 
+from ..utils import sql_trace
+
 
 @dataclass
 class ProjectInfo:
@@ -22,7 +24,7 @@ class ProjectRepository:
         self._ensure_schema()
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self._db_path)
+        conn = sql_trace.connect(self._db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import difflib
+import sqlite3
+import struct
+import zlib
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from ..utils import sql_trace
+from ..utils.json_text import content_hash, pretty_json
+
+# 마지막 전체본(keyframe) 이후 이만큼 델타가 쌓이면 다시 전체본을 저장(복원 시 적용할 델타 수 상한)
+KEYFRAME_EVERY = 32
+_DELTA_HEADER = struct.Struct("<II")
+
+
+@dataclass
+class Revision:
+    id: int
+    target: str  # 'doc:<key>' | 'audio' | 'cinematic'
+    seq: int
+    format: str
+    content_hash: str
+    kind: str  # 'full' | 'delta'
+    size: int  # 복원했을 때의 글자 수
+    stored_bytes: int  # 압축 후 실제 저장 크기
+    created_at: Optional[str] = None
+
+
+def _common_prefix(a: str, b: str) -> int:
+    # 문자열 비교는 C에서 처리되므로 슬라이스 이분 탐색이 글자 단위 루프보다 훨씬 빠르다
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _common_suffix(a: str, b: str, limit: int) -> int:
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len(a) - mid:] == b[len(b) - mid:]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def encode_delta(old: str, new: str) -> Tuple[int, int, str]:
+    """old -> new를 (앞 공통 길이, 뒤 공통 길이, 바뀐 가운데) 로 나타낸다.
+
+    보드 편집은 대부분 한 군데를 고치는 형태라 가운데 구간만 저장해도 충분히 작다.
+    """
+    prefix = _common_prefix(old, new)
+    suffix = _common_suffix(old, new, min(len(old), len(new)) - prefix)
+    return prefix, suffix, new[prefix:len(new) - suffix]
+
+
+def apply_delta(old: str, prefix: int, suffix: int, middle: str) -> str:
+    return old[:prefix] + middle + old[len(old) - suffix:]
+
+
+class RevisionRepository:
+    """문서/보드 저장 이력을 Revisions 테이블에 남긴다.
+
+    각 대상(target)의 리비전은 seq 순서로 쌓이며, 주기적인 전체본(zlib) 사이를
+    직전 리비전 대비 델타(zlib)로 채운다. 내용 해시가 직전과 같으면 기록하지 않는다.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        self._db_path = db_path
+        self._ensure_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sql_trace.connect(self._db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _ensure_schema(self) -> None:
+        with self._connect() as conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS Revisions (
+                  id INTEGER PRIMARY KEY AUTOINCREMENT,
+                  target TEXT NOT NULL,
+                  seq INTEGER NOT NULL,
+                  format TEXT NOT NULL,
+                  content_hash TEXT NOT NULL,
+                  kind TEXT NOT NULL CHECK (kind IN ('full','delta')),
+                  size INTEGER NOT NULL,
+                  data BLOB NOT NULL,
+                  created_at TEXT DEFAULT (datetime('now')),
+                  UNIQUE(target, seq)
+                );
+                """
+            )
+
+    # ---- 저장 경로(소유 리포지토리의 트랜잭션 안에서 호출) ----
+
+    def latest_hash(self, conn: sqlite3.Connection, target: str) -> Optional[str]:
+        row = conn.execute(
+            "SELECT content_hash FROM Revisions WHERE target=? ORDER BY seq DESC LIMIT 1", (target,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def record(
+        self,
+        conn: sqlite3.Connection,
+        target: str,
+        format: str,
+        content: str,
+        previous: Optional[str],
+        digest: Optional[str] = None,
+    ) -> Optional[int]:
+        """content를 새 리비전으로 기록하고 seq를 돌려준다. 직전과 같으면 None.
+
+        previous는 덮어쓰기 전 본문 행의 내용이다. 이력이 비어 있으면 이를 첫 전체본으로 먼저 남겨
+        기능 도입 이전 상태로도 되돌릴 수 있게 한다.
+        """
+        digest = digest or content_hash(content)
+        last = conn.execute(
+            """
+            SELECT seq, content_hash,
+                   seq - COALESCE((SELECT MAX(seq) FROM Revisions WHERE target=? AND kind='full'), 0) AS since_full
+            FROM Revisions WHERE target=? ORDER BY seq DESC LIMIT 1
+            """,
+            (target, target),
+        ).fetchone()
+        if last is not None and last["content_hash"] == digest:
+            return None
+        if last is None:
+            seq, base_hash, since_full = 1, None, 0
+            if previous is not None:
+                base_hash = content_hash(previous)
+                if base_hash == digest:
+                    return None
+                self._insert(conn, target, 1, format, base_hash, "full", previous, self._pack_full(previous))
+                seq = 2
+        else:
+            seq, base_hash, since_full = last["seq"] + 1, last["content_hash"], last["since_full"]
+
+        # 델타는 직전 리비전에 적용되므로, 본문이 이력 밖에서 바뀌었으면 전체본으로 다시 시작한다
+        kind, data = "full", None
+        if previous is not None and since_full + 1 < KEYFRAME_EVERY and content_hash(previous) == base_hash:
+            prefix, suffix, middle = encode_delta(previous, content)
+            # 대부분 바뀌었으면 델타보다 전체본이 낫다
+            if len(middle) * 2 <= len(content):
+                kind, data = "delta", zlib.compress(_DELTA_HEADER.pack(prefix, suffix) + middle.encode("utf-8"))
+        if data is None:
+            data = self._pack_full(content)
+        self._insert(conn, target, seq, format, digest, kind, content, data)
+        return seq
+
+    # ---- 조회/비교 ----
+
+    def history(self, target: str) -> List[Revision]:
+        # 최신 리비전이 먼저
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT id, target, seq, format, content_hash, kind, size, length(data) AS stored_bytes, created_at
+                FROM Revisions WHERE target=? ORDER BY seq DESC
+                """,
+                (target,),
+            ).fetchall()
+        return [Revision(**dict(row)) for row in rows]
+
+    def content_at(self, target: str, seq: int) -> Tuple[str, str]:
+        """seq 시점의 (format, 내용)을 가장 가까운 이전 전체본부터 델타를 적용해 복원한다."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT seq, format, kind, data FROM Revisions
+                WHERE target=? AND seq <= ?
+                  AND seq >= (SELECT MAX(seq) FROM Revisions WHERE target=? AND seq <= ? AND kind='full')
+                ORDER BY seq ASC
+                """,
+                (target, seq, target, seq),
+            ).fetchall()
+        if not rows or rows[-1]["seq"] != seq:
+            raise KeyError(f"{target}@{seq}")
+        content = ""
+        for row in rows:
+            raw = zlib.decompress(row["data"])
+            if row["kind"] == "full":
+                content = raw.decode("utf-8")
+            else:
+                prefix, suffix = _DELTA_HEADER.unpack_from(raw)
+                content = apply_delta(content, prefix, suffix, raw[_DELTA_HEADER.size:].decode("utf-8"))
+        return rows[-1]["format"], content
+
+    def diff(self, target: str, from_seq: int, to_seq: int) -> str:
+        """두 리비전의 unified diff. JSON은 들여쓰기 정렬 후 비교해 줄 단위 차이가 보이게 한다."""
+        texts = []
+        for seq in (from_seq, to_seq):
+            format, content = self.content_at(target, seq)
+            text = pretty_json(content) if format == "json" else content
+            # 마지막 줄에 개행이 없어도 줄 단위 diff가 깨지지 않게 맞춘다
+            texts.append(text if text.endswith("\n") else text + "\n")
+        return "".join(
+            difflib.unified_diff(
+                texts[0].splitlines(keepends=True),
+                texts[1].splitlines(keepends=True),
+                fromfile=f"{target}@{from_seq}",
+                tofile=f"{target}@{to_seq}",
+            )
+        )
+
+    def _pack_full(self, content: str) -> bytes:
+        return zlib.compress(content.encode("utf-8"))
+
+    def _insert(
+        self,
+        conn: sqlite3.Connection,
+        target: str,
+        seq: int,
+        format: str,
+        digest: str,
+        kind: str,
+        content: str,
+        data: bytes,
+    ) -> None:
+        conn.execute(
+            "INSERT INTO Revisions(target, seq, format, content_hash, kind, size, data) VALUES(?,?,?,?,?,?,?)",
+            (target, seq, format, digest, kind, len(content), data),
+        )
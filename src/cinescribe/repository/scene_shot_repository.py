@@ -2,7 +2,27 @@ from __future__ import annotations
 
 import sqlite3
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ..utils import sql_trace
+
+# 샷 리스트 내보내기 열 순서(iter_shot_list가 돌려주는 튜플 순서)
+SHOT_LIST_COLUMNS = (
+    "scene_number",
+    "scene_name",
+    "shot_id",
+    "code",
+    "description",
+    "shot_type",
+    "angle",
+    "movement",
+    "lens",
+    "lighting",
+    "image_prompt",
+    "video_prompt",
+    "duration_sec",
+    "asset_path",
+)
 
 
 @dataclass
@@ -30,17 +50,35 @@ class Shot:
     lighting: str | None = None
     image_prompt: str | None = None
     video_prompt: str | None = None
+    duration_sec: float | None = None
+
+
+@dataclass
+class AudioCue:
+    id: int
+    shot_id: int
+    cue_type: str | None
+    start_offset_sec: float | None
+    duration_sec: float | None
+    asset_id: int | None
+    asset_project_path: str | None = None
 
 
 class SceneShotRepository:
     def __init__(self, db_path: str) -> None:
         self._db_path = db_path
+        self._ensure_schema()
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self._db_path)
+        conn = sql_trace.connect(self._db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
+    def _ensure_schema(self) -> None:
+        # 장면 전환마다 list_shots/장면별 개수가 Shots 전체를 훑지 않도록
+        with self._connect() as conn:
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_shots_scene ON Shots(scene_id, sort_index)")
+
     def list_scenes(self) -> List[Scene]:
         with self._connect() as conn:
             rows = conn.execute(
@@ -77,6 +115,7 @@ class SceneShotRepository:
                        s.lighting,
                        s.image_prompt,
                        s.video_prompt,
+                       s.duration_sec,
                        a.thumbnail_path AS asset_thumbnail_path,
                        a.project_path AS asset_project_path
                   FROM Shots s
@@ -86,28 +125,107 @@ class SceneShotRepository:
                 """,
                 (scene_id,),
             ).fetchall()
-            shots: List[Shot] = []
-            for r in rows:
-                shots.append(
-                    Shot(
-                        id=r["id"],
-                        scene_id=r["scene_id"],
-                        code=r["code"],
-                        description=r["description"],
-                        storyboard_asset_id=r["storyboard_asset_id"],
-                        sort_index=r["sort_index"],
-                        asset_thumbnail_path=r["asset_thumbnail_path"],
-                        asset_project_path=r["asset_project_path"],
-                        shot_type=r["shot_type"],
-                        angle=r["angle"],
-                        movement=r["movement"],
-                        lens=r["lens"],
-                        lighting=r["lighting"],
-                        image_prompt=r["image_prompt"],
-                        video_prompt=r["video_prompt"],
-                    )
-                )
-            return shots
+            return [self._shot_from_row(r) for r in rows]
+
+    def list_timeline(self) -> List[Shot]:
+        """모든 장면의 샷을 장면 순서(list_scenes와 같은 정렬) → 샷 순서로 한 번에 읽는다."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT s.id,
+                       s.scene_id,
+                       COALESCE(s.code,'') AS code,
+                       COALESCE(s.description,'') AS description,
+                       s.storyboard_asset_id,
+                       s.sort_index,
+                       s.shot_type,
+                       s.angle,
+                       s.movement,
+                       s.lens,
+                       s.lighting,
+                       s.image_prompt,
+                       s.video_prompt,
+                       s.duration_sec,
+                       a.thumbnail_path AS asset_thumbnail_path,
+                       a.project_path AS asset_project_path
+                  FROM Shots s
+                  JOIN Scenes sc ON sc.id = s.scene_id
+                  LEFT JOIN Assets a ON a.id = s.storyboard_asset_id
+                 ORDER BY COALESCE(sc.number, sc.id) ASC, sc.id ASC, s.sort_index ASC, s.id ASC
+                """
+            ).fetchall()
+            return [self._shot_from_row(r) for r in rows]
+
+    def iter_shot_list(self) -> Iterator[Tuple[Any, ...]]:
+        """SHOT_LIST_COLUMNS 순서의 튜플을 커서에서 한 행씩 내보낸다.
+
+        전체 목록을 만들지 않으므로 샷 수와 상관없이 메모리 사용량이 일정하다.
+        생성기를 끝까지 돌리거나 close()해야 연결이 닫힌다.
+        """
+        conn = sql_trace.connect(self._db_path)
+        try:
+            cur = conn.execute(
+                """
+                SELECT COALESCE(sc.number, sc.id), COALESCE(sc.name,''), s.id, COALESCE(s.code,''),
+                       COALESCE(s.description,''), s.shot_type, s.angle, s.movement, s.lens, s.lighting,
+                       s.image_prompt, s.video_prompt, s.duration_sec, a.project_path
+                  FROM Shots s
+                  JOIN Scenes sc ON sc.id = s.scene_id
+                  LEFT JOIN Assets a ON a.id = s.storyboard_asset_id
+                 ORDER BY COALESCE(sc.number, sc.id) ASC, sc.id ASC, s.sort_index ASC, s.id ASC
+                """
+            )
+            cur.arraysize = 1000
+            while True:
+                rows = cur.fetchmany()
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            conn.close()
+
+    def count_shots(self) -> int:
+        with self._connect() as conn:
+            return int(conn.execute("SELECT COUNT(*) FROM Shots s JOIN Scenes sc ON sc.id = s.scene_id").fetchone()[0])
+
+    def count_shots_by_scene(self) -> Dict[int, int]:
+        """장면 id -> 샷 수. 장면 선택 목록의 개수 표시를 쿼리 하나로 채운다(샷이 없는 장면은 빠짐)."""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT scene_id, COUNT(*) FROM Shots GROUP BY scene_id").fetchall()
+            return {int(r[0]): int(r[1]) for r in rows if r[0] is not None}
+
+    def list_audio_cues(self) -> List[AudioCue]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT c.id, c.shot_id, c.cue_type, c.start_offset_sec, c.duration_sec, c.asset_id,
+                       a.project_path AS asset_project_path
+                  FROM Audio_Cues c
+                  LEFT JOIN Assets a ON a.id = c.asset_id
+                 ORDER BY c.shot_id ASC, COALESCE(c.start_offset_sec, 0) ASC, c.id ASC
+                """
+            ).fetchall()
+            return [AudioCue(**dict(r)) for r in rows]
+
+    def _shot_from_row(self, r: sqlite3.Row) -> Shot:
+        return Shot(
+            id=r["id"],
+            scene_id=r["scene_id"],
+            code=r["code"],
+            description=r["description"],
+            storyboard_asset_id=r["storyboard_asset_id"],
+            sort_index=r["sort_index"],
+            asset_thumbnail_path=r["asset_thumbnail_path"],
+            asset_project_path=r["asset_project_path"],
+            shot_type=r["shot_type"],
+            angle=r["angle"],
+            movement=r["movement"],
+            lens=r["lens"],
+            lighting=r["lighting"],
+            image_prompt=r["image_prompt"],
+            video_prompt=r["video_prompt"],
+            duration_sec=r["duration_sec"],
+        )
 
     def create_shot(self, scene_id: int, code: str = "", description: str = "", asset_id: int | None = None) -> int:
         with self._connect() as conn:
@@ -117,6 +235,19 @@ class SceneShotRepository:
             )
             return int(cur.lastrowid)
 
+    def create_shots(self, scene_id: int, asset_ids: List[int]) -> List[int]:
+        # 일괄 임포트용: 장면 끝에 에셋마다 샷을 하나씩 한 트랜잭션으로 추가
+        ids: List[int] = []
+        with self._connect() as conn:
+            start = conn.execute("SELECT COALESCE(MAX(sort_index),0) FROM Shots WHERE scene_id=?", (scene_id,)).fetchone()[0]
+            for offset, asset_id in enumerate(asset_ids, start=1):
+                cur = conn.execute(
+                    "INSERT INTO Shots(scene_id, code, description, storyboard_asset_id, sort_index) VALUES(?,?,?,?,?)",
+                    (scene_id, "", "", asset_id, start + offset),
+                )
+                ids.append(int(cur.lastrowid))
+        return ids
+
     def link_shot_asset(self, shot_id: int, asset_id: int | None) -> None:
         with self._connect() as conn:
             conn.execute("UPDATE Shots SET storyboard_asset_id=? WHERE id=?", (asset_id, shot_id))
@@ -148,7 +279,7 @@ class SceneShotRepository:
                 """
                 SELECT s.id, s.scene_id, COALESCE(s.code,'') AS code, COALESCE(s.description,'') AS description,
                        s.storyboard_asset_id, s.sort_index, s.shot_type, s.angle, s.movement, s.lens, s.lighting,
-                       s.image_prompt, s.video_prompt
+                       s.image_prompt, s.video_prompt, s.duration_sec
                   FROM Shots s WHERE s.id=?
                 """,
                 (shot_id,),
@@ -169,6 +300,7 @@ class SceneShotRepository:
                 lighting=r["lighting"],
                 image_prompt=r["image_prompt"],
                 video_prompt=r["video_prompt"],
+                duration_sec=r["duration_sec"],
             )
 
     def delete_shot(self, shot_id: int) -> None:
@@ -182,8 +314,8 @@ class SceneShotRepository:
         with self._connect() as conn:
             cur = conn.execute(
                 """
-                INSERT INTO Shots(scene_id, code, description, storyboard_asset_id, sort_index, shot_type, angle, movement, lens, lighting, image_prompt, video_prompt)
-                VALUES(?,?,?,?, (SELECT COALESCE(MAX(sort_index),0)+1 FROM Shots WHERE scene_id=?), ?,?,?,?,?,?,?)
+                INSERT INTO Shots(scene_id, code, description, storyboard_asset_id, sort_index, shot_type, angle, movement, lens, lighting, image_prompt, video_prompt, duration_sec)
+                VALUES(?,?,?,?, (SELECT COALESCE(MAX(sort_index),0)+1 FROM Shots WHERE scene_id=?), ?,?,?,?,?,?,?,?)
                 """,
                 (
                     sh.scene_id,
@@ -198,6 +330,7 @@ class SceneShotRepository:
                     sh.lighting,
                     sh.image_prompt,
                     sh.video_prompt,
+                    sh.duration_sec,
                 ),
             )
             return int(cur.lastrowid)
@@ -213,6 +346,7 @@ class SceneShotRepository:
         lighting: str | None = None,
         image_prompt: str | None = None,
         video_prompt: str | None = None,
+        duration_sec: float | None = None,
     ) -> None:
         sets = []
         params: list = []
@@ -237,6 +371,9 @@ class SceneShotRepository:
         if video_prompt is not None:
             sets.append("video_prompt=?")
             params.append(video_prompt)
+        if duration_sec is not None:
+            sets.append("duration_sec=?")
+            params.append(duration_sec)
         if not sets:
             return
         sql = f"UPDATE Shots SET {' , '.join(sets)} WHERE id=?"
@@ -246,6 +383,8 @@ class SceneShotRepository:
 
     def delete_scene(self, scene_id: int) -> None:
         with self._connect() as conn:
+            # 외래 키는 연결마다 켜야 한다. 켜 두어야 샷/오디오 큐/최종 이미지가 ON DELETE CASCADE로 함께 지워진다
+            conn.execute("PRAGMA foreign_keys=ON")
             conn.execute("DELETE FROM Scenes WHERE id=?", (scene_id,))
 
     def move_scene(self, scene_id: int, direction: int) -> None:
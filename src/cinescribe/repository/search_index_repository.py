@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import sqlite3
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+from ..utils import sql_trace
+
+from .content_codec import decode_content
+
+# rowid = 원본 id * 8 + 종류 코드. 트리거가 rowid로 바로 지우고 다시 넣을 수 있게 한다
+KIND_CODES: Dict[str, int] = {"shot": 1, "scene": 2, "character": 3, "document": 4}
+_KINDS_BY_CODE = {code: kind for kind, code in KIND_CODES.items()}
+
+
+def _joined(prefix: str, columns: Tuple[str, ...]) -> str:
+    return " || ' ' || ".join(f"COALESCE({prefix}.{c},'')" for c in columns)
+
+
+# 종류별 (테이블, 제목 컬럼, 본문 컬럼)
+_SOURCES = {
+    "shot": ("Shots", "code", ("description", "shot_type", "angle", "movement", "lens", "lighting", "image_prompt", "video_prompt")),
+    "scene": ("Scenes", "name", ("location", "time_of_day", "summary")),
+    "character": ("Characters", "name", ("age", "job", "personality", "goal", "conflict", "design_prompt")),
+}
+
+
+@dataclass
+class SearchHit:
+    kind: str  # 'shot' | 'scene' | 'character' | 'document'
+    ref: int  # 원본 행 id
+    title: str
+    snippet: str
+    rank: float  # bm25, 작을수록 관련도가 높다
+
+
+def to_match_query(text: str) -> str:
+    """사용자 입력을 FTS5 MATCH 식으로 바꾼다. 낱말마다 접두어 검색, 모두 포함(AND).
+
+    한국어는 조사가 붙어 있으므로('옥상에서') 접두어 검색이어야 '옥상'으로 찾을 수 있다.
+    """
+    terms = ['"' + term.replace('"', '""') + '"*' for term in text.split()]
+    return " ".join(terms)
+
+
+def search(conn: sqlite3.Connection, text: str, limit: int = 50) -> List[SearchHit]:
+    """열린 연결(읽기 전용 가능)에서 검색한다. 교차 프로젝트 검색도 이 함수를 쓴다."""
+    query = to_match_query(text)
+    if not query:
+        return []
+    rows = conn.execute(
+        """
+        SELECT rowid, title, snippet(SearchIndex, 1, '[', ']', '…', 12), bm25(SearchIndex, 4.0, 1.0) AS rank
+          FROM SearchIndex
+         WHERE SearchIndex MATCH ?
+         ORDER BY rank
+         LIMIT ?
+        """,
+        (query, limit),
+    ).fetchall()
+    return [
+        SearchHit(kind=_KINDS_BY_CODE.get(rowid % 8, "?"), ref=rowid // 8, title=title, snippet=snippet, rank=rank)
+        for rowid, title, snippet, rank in rows
+    ]
+
+
+def has_index(conn: sqlite3.Connection) -> bool:
+    return conn.execute("SELECT 1 FROM sqlite_master WHERE name='SearchIndex'").fetchone() is not None
+
+
+class SearchIndexRepository:
+    """프로젝트 안의 샷/장면/캐릭터/문서를 FTS5 SearchIndex 하나로 색인한다.
+
+    샷/장면/캐릭터는 트리거로 자동 갱신되고, 문서는 압축 저장될 수 있어서
+    DocumentRepository가 저장할 때 index_document()로 직접 넣는다.
+    색인 테이블과 트리거는 함께 만들어지고, 만들 때 기존 행을 한 번 채운다.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        self._db_path = db_path
+        self._ensure_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sql_trace.connect(self._db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _ensure_schema(self) -> None:
+        with self._connect() as conn:
+            if has_index(conn):
+                return
+            # DDL은 자동 트랜잭션이 시작되지 않으므로 명시적으로 묶어 색인/트리거/초기 채우기를 한 번에 반영
+            conn.execute("BEGIN")
+            conn.execute(
+                "CREATE VIRTUAL TABLE SearchIndex USING fts5(title, body, tokenize='unicode61 remove_diacritics 2')"
+            )
+            for kind, (table, title, body) in _SOURCES.items():
+                if not self._table_exists(conn, table):
+                    # 프로젝트 스키마가 아닌 파일(문서 테이블만 있는 경우 등)
+                    continue
+                code = KIND_CODES[kind]
+                new_row = f"NEW.id * 8 + {code}, COALESCE(NEW.{title},''), {_joined('NEW', body)}"
+                # executescript는 먼저 커밋해 버리므로 구문마다 execute로 같은 트랜잭션에서 만든다.
+                # 순서 변경(sort_index) 같은 갱신은 색인을 건드리지 않도록 색인 컬럼 갱신에만 반응한다
+                conn.execute(
+                    f"CREATE TRIGGER IF NOT EXISTS trg_search_{table}_ai AFTER INSERT ON {table} BEGIN "
+                    f"INSERT INTO SearchIndex(rowid, title, body) VALUES({new_row}); END"
+                )
+                conn.execute(
+                    f"CREATE TRIGGER IF NOT EXISTS trg_search_{table}_au AFTER UPDATE OF {', '.join((title, *body))} "
+                    f"ON {table} BEGIN "
+                    f"DELETE FROM SearchIndex WHERE rowid = OLD.id * 8 + {code}; "
+                    f"INSERT INTO SearchIndex(rowid, title, body) VALUES({new_row}); END"
+                )
+                conn.execute(
+                    f"CREATE TRIGGER IF NOT EXISTS trg_search_{table}_ad AFTER DELETE ON {table} BEGIN "
+                    f"DELETE FROM SearchIndex WHERE rowid = OLD.id * 8 + {code}; END"
+                )
+                conn.execute(
+                    f"INSERT INTO SearchIndex(rowid, title, body) "
+                    f"SELECT t.id * 8 + {code}, COALESCE(t.{title},''), {_joined('t', body)} FROM {table} t"
+                )
+            if self._table_exists(conn, "Documents"):
+                for row in conn.execute("SELECT id, key, content, encoding FROM Documents").fetchall():
+                    self.index_document(conn, row["id"], row["key"], decode_content(row["encoding"], row["content"]))
+
+    def _table_exists(self, conn: sqlite3.Connection, table: str) -> bool:
+        return conn.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (table,)).fetchone() is not None
+
+    def index_document(self, conn: sqlite3.Connection, doc_id: int, key: str, content: str) -> None:
+        rowid = doc_id * 8 + KIND_CODES["document"]
+        conn.execute("DELETE FROM SearchIndex WHERE rowid=?", (rowid,))
+        conn.execute("INSERT INTO SearchIndex(rowid, title, body) VALUES(?,?,?)", (rowid, key, content))
+
+    def rebuild(self) -> int:
+        """색인을 지우고 처음부터 다시 만든다. 색인한 행 수를 돌려준다."""
+        with self._connect() as conn:
+            conn.execute("DROP TABLE IF EXISTS SearchIndex")
+            for table, _, _ in _SOURCES.values():
+                for suffix in ("ai", "au", "ad"):
+                    conn.execute(f"DROP TRIGGER IF EXISTS trg_search_{table}_{suffix}")
+        self._ensure_schema()
+        with self._connect() as conn:
+            return int(conn.execute("SELECT COUNT(*) FROM SearchIndex").fetchone()[0])
+
+    def search(self, text: str, limit: int = 50) -> List[SearchHit]:
+        with self._connect() as conn:
+            return search(conn, text, limit)
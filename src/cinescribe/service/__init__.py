@@ -1,18 +1,46 @@
 """
 ShotCanvas - Service 패키지
 비즈니스 로직 서비스들
+
+PySide6 없이 import할 수 있어야 한다(스크립트/작업 프로세스용).
 """
 
-from .project_init_service import ProjectInitService
-from .project_service import ProjectService
-from .library_service import LibraryService
-from .document_service import DocumentService
-from .asset_import_service import AssetImportService
-
-__all__ = [
-    'ProjectInitService',
-    'ProjectService',
-    'LibraryService',
-    'DocumentService',
-    'AssetImportService'
-]
+from importlib import import_module
+
+# 공개 이름 -> 정의된 하위 모듈. 처음 접근할 때 import한다
+_LAZY = {
+    'ProjectInitService': '.project_init_service',
+    'ProjectService': '.project_service',
+    'LibraryService': '.library_service',
+    'DocumentService': '.document_service',
+    'AssetImportService': '.asset_import_service',
+    'ProjectThumbnailService': '.project_thumbnail_service',
+    'AutosaveService': '.autosave_service',
+    'MaintenanceService': '.maintenance_service',
+    'SessionService': '.session_service',
+    'BundleService': '.bundle_service',
+    'SnapshotService': '.snapshot_service',
+    'ContactSheetService': '.contact_sheet_service',
+    'AnimaticService': '.animatic_service',
+    'ShotListService': '.shot_list_service',
+    'GlobalSearchService': '.global_search_service',
+    'LibraryScanService': '.library_scan_service',
+    'AssetRefreshService': '.asset_refresh_service',
+    'AssetFsckService': '.asset_fsck_service'
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    # 다음 접근부터는 모듈 __getattr__를 거치지 않도록 캐시
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tempfile
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from PIL import Image, ImageDraw
+
+from ..repository.scene_shot_repository import SceneShotRepository
+from ..utils.animation_writer import ApngStreamWriter, GifStreamWriter
+from ..utils.process_pool import new_process_pool
+from .contact_sheet_service import _font
+
+ProgressCallback = Callable[[int, int, str], None]
+
+FORMATS = ("gif", "apng", "sequence")
+
+
+@dataclass
+class AnimaticOptions:
+    width: int = 1280
+    height: int = 720
+    # duration_sec가 비어 있는 샷의 표시 시간
+    default_duration: float = 2.0
+    loops: int = 0
+
+
+@dataclass
+class AnimaticFrame:
+    shot_id: int
+    code: str
+    start_sec: float
+    duration_sec: float
+    source: Optional[str]  # 원본 이미지 절대 경로(없으면 자리표시 프레임)
+    file: Optional[str] = None  # 이미지 시퀀스에서 출력 파일 이름
+
+
+def render_frame(source: Optional[str], label: str, width: int, height: int, out_path: str, fmt: str) -> str:
+    """원본 하나를 출력 크기로 레터박스해 out_path에 저장한다(작업 프로세스에서 호출).
+
+    원본이 없거나 읽을 수 없으면 샷 코드를 적은 자리표시 프레임을 만든다.
+    """
+    frame = Image.new("RGB", (width, height), "black")
+    image_ok = False
+    if source and os.path.exists(source):
+        try:
+            with Image.open(source) as img:
+                img.draft("RGB", (width, height))
+                img = img.convert("RGB")
+                img.thumbnail((width, height), Image.Resampling.LANCZOS)
+                frame.paste(img, ((width - img.width) // 2, (height - img.height) // 2))
+                image_ok = True
+        except OSError:
+            pass
+    if not image_ok:
+        draw = ImageDraw.Draw(frame)
+        draw.rectangle((0, 0, width - 1, height - 1), fill=(40, 40, 40))
+        draw.text((width // 2, height // 2), label, font=_font(max(12, height // 12)), fill=(220, 220, 220), anchor="mm")
+    if fmt == "gif":
+        # 프레임별 적응 팔레트. 디더링은 프레임마다 달라 깜빡여 보이므로 끈다
+        frame.quantize(256, dither=Image.Dither.NONE).save(out_path, "GIF")
+    else:
+        frame.save(out_path, "PNG", compress_level=6)
+    return out_path
+
+
+def _render_job(args: Tuple[Optional[str], str, int, int, str, str]) -> str:
+    return render_frame(*args)
+
+
+class AnimaticService:
+    """샷 길이(Shots.duration_sec)대로 스토리보드 이미지를 이어 붙여 애니매틱을 만든다.
+
+    같은 원본 이미지는 한 번만 디코딩/축소하고(처음 쓰이는 순서대로 프로세스 풀에서 병렬 처리),
+    축소된 프레임은 임시 폴더에 두었다가 타임라인 순서대로 출력 스트림에 이어 쓴다.
+    마지막으로 쓰인 프레임은 바로 지우므로 메모리/임시 공간은 프레임 몇 장 수준이다.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        self._db_path = os.path.abspath(db_path)
+        self._base_dir = os.path.dirname(self._db_path)
+
+    @staticmethod
+    def format_for(out_path: str) -> str:
+        ext = os.path.splitext(out_path)[1].lower()
+        if ext == ".gif":
+            return "gif"
+        if ext in (".png", ".apng"):
+            return "apng"
+        if ext:
+            raise ValueError("출력은 .gif, .png/.apng 또는 폴더(이미지 시퀀스)여야 합니다.")
+        return "sequence"
+
+    def build_timeline(self, options: AnimaticOptions) -> List[AnimaticFrame]:
+        frames: List[AnimaticFrame] = []
+        start = 0.0
+        for shot in SceneShotRepository(self._db_path).list_timeline():
+            duration = shot.duration_sec if shot.duration_sec and shot.duration_sec > 0 else options.default_duration
+            source = shot.asset_project_path or shot.asset_thumbnail_path
+            frames.append(
+                AnimaticFrame(
+                    shot_id=shot.id,
+                    code=shot.code or f"#{shot.id}",
+                    start_sec=round(start, 3),
+                    duration_sec=duration,
+                    source=os.path.join(self._base_dir, source) if source else None,
+                )
+            )
+            start += duration
+        return frames
+
+    def export(
+        self,
+        out_path: str,
+        options: Optional[AnimaticOptions] = None,
+        workers: Optional[int] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> str:
+        """out_path 확장자로 형식을 고른다: .gif, .png/.apng, 확장자가 없으면 PNG 시퀀스 폴더.
+
+        시퀀스 폴더에는 frame_00001.png… 와 타이밍/오디오 큐를 담은 manifest.json을 만든다.
+        만든 파일(또는 폴더) 경로를 돌려준다.
+        """
+        options = options or AnimaticOptions()
+        fmt = self.format_for(out_path)
+        frames = self.build_timeline(options)
+        if not frames:
+            raise ValueError("내보낼 샷이 없습니다.")
+
+        # 원본별 작업(처음 쓰이는 순서)과 마지막 사용 위치
+        keys: List[Tuple[Optional[str], str]] = []
+        index_of: Dict[Tuple[Optional[str], str], int] = {}
+        frame_keys: List[int] = []
+        for frame in frames:
+            # 자리표시 프레임은 샷 코드가 들어가므로 샷마다 따로 만든다
+            key = (frame.source, "") if frame.source and os.path.exists(frame.source) else (None, frame.code)
+            if key not in index_of:
+                index_of[key] = len(keys)
+                keys.append(key)
+            frame_keys.append(index_of[key])
+        last_use = {k: i for i, k in enumerate(frame_keys)}
+
+        out_abs = os.path.abspath(out_path)
+        work_parent = out_abs if fmt == "sequence" else os.path.dirname(out_abs)
+        os.makedirs(work_parent, exist_ok=True)
+        work_dir = tempfile.mkdtemp(prefix="animatic_", dir=work_parent)
+        ext = "gif" if fmt == "gif" else "png"
+        jobs = [
+            (source, label, options.width, options.height, os.path.join(work_dir, f"{i:05d}.{ext}"), fmt)
+            for i, (source, label) in enumerate(keys)
+        ]
+        try:
+            rendered = self._render(jobs, workers)
+            ready: List[str] = []
+            if fmt == "gif":
+                writer = GifStreamWriter(out_abs, options.width, options.height, options.loops)
+            elif fmt == "apng":
+                writer = ApngStreamWriter(out_abs, len(frames), options.loops)
+            else:
+                writer = None
+            try:
+                for n, (frame, key) in enumerate(zip(frames, frame_keys)):
+                    while len(ready) <= key:
+                        ready.append(next(rendered))
+                    path = ready[key]
+                    duration_ms = round(frame.duration_sec * 1000)
+                    if isinstance(writer, GifStreamWriter):
+                        writer.add_gif(path, duration_ms)
+                    elif isinstance(writer, ApngStreamWriter):
+                        writer.add_png(path, duration_ms)
+                    else:
+                        frame.file = f"frame_{n + 1:05d}.png"
+                        self._place(path, os.path.join(out_abs, frame.file))
+                    if last_use[key] == n:
+                        os.remove(path)
+                    if progress:
+                        progress(n + 1, len(frames), frame.code)
+            except BaseException:
+                if writer is not None:
+                    writer.abort()
+                raise
+            if writer is not None:
+                writer.close()
+            else:
+                self._write_manifest(out_abs, frames, options)
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+        return out_abs
+
+    def _render(self, jobs: List[Tuple], workers: Optional[int]) -> Iterator[str]:
+        workers = min(workers or os.cpu_count() or 1, len(jobs))
+        if workers <= 1:
+            yield from map(_render_job, jobs)
+            return
+        pool = new_process_pool(workers)
+        try:
+            # map은 미리 모든 작업을 제출하지만 결과 파일은 디스크에 있으므로 메모리는 늘지 않는다
+            yield from pool.map(_render_job, jobs)
+        finally:
+            pool.shutdown(cancel_futures=True)
+
+    def _place(self, cached: str, target: str) -> None:
+        # 반복되는 원본은 같은 캐시 파일을 하드 링크로 공유하고, 안 되면 복사한다
+        try:
+            os.link(cached, target)
+        except OSError:
+            shutil.copyfile(cached, target)
+
+    def _write_manifest(self, out_dir: str, frames: List[AnimaticFrame], options: AnimaticOptions) -> None:
+        starts = {frame.shot_id: frame.start_sec for frame in frames}
+        cues = []
+        for cue in SceneShotRepository(self._db_path).list_audio_cues():
+            if cue.shot_id not in starts:
+                continue
+            offset = cue.start_offset_sec or 0.0
+            cues.append(
+                {
+                    "id": cue.id,
+                    "shot_id": cue.shot_id,
+                    "cue_type": cue.cue_type,
+                    "start_sec": round(starts[cue.shot_id] + offset, 3),
+                    "duration_sec": cue.duration_sec,
+                    "asset": cue.asset_project_path,
+                }
+            )
+        last = frames[-1]
+        manifest = {
+            "width": options.width,
+            "height": options.height,
+            "total_duration_sec": round(last.start_sec + last.duration_sec, 3),
+            "frames": [
+                {k: v for k, v in asdict(frame).items() if k != "source"} for frame in frames
+            ],
+            "audio_cues": cues,
+        }
+        tmp = os.path.join(out_dir, "manifest.json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, os.path.join(out_dir, "manifest.json"))
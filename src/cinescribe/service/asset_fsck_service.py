@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from PIL import Image
+
+from ..repository.asset_check_repository import AssetCheckRepository
+from ..repository.asset_repository import Asset, AssetRepository
+from ..utils.project_paths import get_project_dirs
+from .asset_import_service import file_sha256, make_thumbnail
+from .snapshot_service import SnapshotService
+
+# (처리한 바이트, 전체 바이트, 현재 파일)
+ProgressCallback = Callable[[int, int, str], None]
+
+ISSUE_KINDS = ("corrupted", "missing", "unreadable", "thumbnail_missing", "unregistered", "orphan_thumbnail")
+# restore: 스냅샷에서 원본 복원, thumbnails: 썸네일 재생성,
+# accept: 지금 파일 내용을 맞는 것으로 보고 해시 갱신, quarantine: 등록되지 않은 파일을 .quarantine/로 이동
+REPAIR_ACTIONS = ("restore", "thumbnails", "accept", "quarantine")
+DEFAULT_REPAIR = ("restore", "thumbnails")
+
+QUARANTINE_DIR = ".quarantine"
+_CHUNK = 1024 * 1024
+# 체크포인트를 기록하는 간격(파일 수/초)
+_CHECKPOINT_FILES = 256
+_CHECKPOINT_SEC = 5.0
+# 가져오기 중에는 파일이 DB 등록보다 먼저 쓰이므로, 최근 파일은 미등록으로 보지 않는다
+_UNREGISTERED_GRACE_SEC = 600
+
+
+@dataclass
+class AssetIssue:
+    kind: str  # ISSUE_KINDS 중 하나
+    path: str  # 프로젝트 폴더 기준 상대 경로
+    asset_id: Optional[int] = None
+    detail: str = ""
+
+
+@dataclass
+class FsckReport:
+    db_path: str
+    issues: List[AssetIssue] = field(default_factory=list)
+    assets: int = 0
+    # 이번 실행에서 해시한 에셋 수/바이트, 체크포인트 덕분에 건너뛴 에셋 수
+    hashed: int = 0
+    hashed_bytes: int = 0
+    resumed: int = 0
+    # 회차를 끝까지 마쳤는지. False면 다음 verify()가 이어서 검사한다
+    complete: bool = False
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.complete and not self.issues
+
+
+@dataclass
+class RepairResult:
+    repaired: List[AssetIssue] = field(default_factory=list)
+    failed: List[Tuple[AssetIssue, str]] = field(default_factory=list)
+
+
+def _hash_file(path: str, io_slots: threading.Semaphore, should_stop: Callable[[], bool]) -> Optional[str]:
+    # 읽기만 io_slots로 제한하고 해시 계산은 밖에서 한다(hashlib은 GIL을 놓으므로 스레드마다 코어 하나).
+    # 중단되면 None
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while True:
+            with io_slots:
+                chunk = f.read(_CHUNK)
+            if not chunk:
+                return digest.hexdigest()
+            digest.update(chunk)
+            if should_stop():
+                return None
+
+
+class AssetFsckService:
+    """에셋 저장소 전체를 검사한다: 원본 해시가 Assets.hash_sha256과 같은지, 원본/썸네일이 있는지,
+    에셋 폴더에 등록되지 않은 파일이 있는지.
+
+    해시는 스레드 풀에서 파일을 나눠 계산하고(동시에 제출하는 작업 수와 동시에 읽는 파일 수를 제한),
+    결과를 AssetCheckRepository에 체크포인트로 남긴다. cancel이나 time_limit으로 멈추면
+    다음 verify()가 같은 회차를 이어서 검사하므로 큰 저장소도 여러 번에 나눠 끝낼 수 있다.
+    """
+
+    def __init__(self, db_path: str, snapshots: SnapshotService | None = None) -> None:
+        self._db_path = os.path.abspath(db_path)
+        self._base_dir = os.path.dirname(self._db_path)
+        self._assets = AssetRepository(self._db_path)
+        self._checks = AssetCheckRepository(self._db_path)
+        self._snapshots = snapshots
+
+    def verify(
+        self,
+        workers: Optional[int] = None,
+        io_concurrency: int = 4,
+        resume: bool = True,
+        cancel: Optional[threading.Event] = None,
+        time_limit: Optional[float] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> FsckReport:
+        started = time.perf_counter()
+        report = FsckReport(self._db_path)
+        assets = self._assets.list_all()
+        report.assets = len(assets)
+        to_hash = self._check_layout(assets, report)
+
+        run_started = self._checks.begin(resume)
+        done = self._checks.checked_since(run_started)
+        pending: List[Tuple[Asset, str, int, float]] = []
+        for asset, path, size, mtime in to_hash:
+            previous = done.get(int(asset.id or 0))
+            if previous is not None and previous[0] == size and previous[1] == mtime:
+                # 이번 회차에 이미 검사했고 그 뒤로 바뀌지 않았다
+                report.resumed += 1
+                if previous[2] != "ok":
+                    report.issues.append(AssetIssue(previous[2], asset.project_path, asset.id, "이전 실행에서 발견"))
+                continue
+            pending.append((asset, path, size, mtime))
+
+        deadline = started + time_limit if time_limit else None
+
+        def should_stop() -> bool:
+            return (cancel is not None and cancel.is_set()) or (deadline is not None and time.perf_counter() > deadline)
+
+        finished = self._hash_all(pending, report, workers, io_concurrency, should_stop, progress)
+        if finished:
+            self._checks.finish()
+            report.complete = True
+        report.elapsed = time.perf_counter() - started
+        return report
+
+    def _check_layout(self, assets: List[Asset], report: FsckReport) -> List[Tuple[Asset, str, int, float]]:
+        """파일 존재/미등록 여부를 확인하고 해시할 (에셋, 절대 경로, 크기, 수정 시각)을 돌려준다."""
+        assets_dir, thumbs_dir = get_project_dirs(self._db_path)
+        registered: Set[str] = set()
+        thumbnails: Set[str] = set()
+        to_hash: List[Tuple[Asset, str, int, float]] = []
+        for asset in assets:
+            path = os.path.join(self._base_dir, asset.project_path or "")
+            registered.add(os.path.normcase(path))
+            thumb = os.path.join(self._base_dir, asset.thumbnail_path) if asset.thumbnail_path else None
+            if thumb:
+                thumbnails.add(os.path.normcase(thumb))
+            try:
+                st = os.stat(path) if asset.project_path else None
+            except OSError:
+                st = None
+            if st is None:
+                report.issues.append(AssetIssue("missing", asset.project_path or "", asset.id))
+                continue
+            if thumb and asset.kind == "image" and not os.path.isfile(thumb):
+                report.issues.append(AssetIssue("thumbnail_missing", asset.thumbnail_path or "", asset.id))
+            if asset.hash_sha256:
+                to_hash.append((asset, path, st.st_size, st.st_mtime))
+        cutoff = time.time() - _UNREGISTERED_GRACE_SEC
+        for folder, known, kind in ((assets_dir, registered, "unregistered"), (thumbs_dir, thumbnails, "orphan_thumbnail")):
+            try:
+                entries = list(os.scandir(folder))
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    if not entry.is_file() or os.path.normcase(entry.path) in known or entry.stat().st_mtime > cutoff:
+                        continue
+                except OSError:
+                    continue
+                detail = "남은 임시 파일" if entry.name.endswith((".tmp", ".part")) else ""
+                report.issues.append(AssetIssue(kind, os.path.relpath(entry.path, self._base_dir), None, detail))
+        return to_hash
+
+    def _hash_all(
+        self,
+        pending: List[Tuple[Asset, str, int, float]],
+        report: FsckReport,
+        workers: Optional[int],
+        io_concurrency: int,
+        should_stop: Callable[[], bool],
+        progress: Optional[ProgressCallback],
+    ) -> bool:
+        """모두 검사했으면 True, 중간에 멈췄으면 False."""
+        workers = max(1, workers or os.cpu_count() or 1)
+        io_slots = threading.Semaphore(max(1, io_concurrency))
+        total_bytes = sum(size for _, _, size, _ in pending)
+        queue = iter(pending)
+        in_flight: Dict[Future, Tuple[Asset, str, int, float]] = {}
+        batch: List[Tuple[int, Optional[int], Optional[float], str]] = []
+        last_flush = time.monotonic()
+
+        def flush() -> None:
+            nonlocal last_flush
+            if batch:
+                self._checks.record(batch)
+                batch.clear()
+            last_flush = time.monotonic()
+
+        stopped = False
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="asset-fsck") as pool:
+            # 작업은 스레드 수의 두 배까지만 제출해 두고 끝나는 대로 채운다(수십만 개의 Future를 만들지 않음)
+            def fill() -> None:
+                while len(in_flight) < workers * 2 and not should_stop():
+                    item = next(queue, None)
+                    if item is None:
+                        return
+                    in_flight[pool.submit(_hash_file, item[1], io_slots, should_stop)] = item
+
+            try:
+                fill()
+                while in_flight:
+                    finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        asset, path, size, mtime = in_flight.pop(future)
+                        status = self._status(asset, future, report)
+                        if status is None:
+                            stopped = True
+                            continue
+                        batch.append((int(asset.id or 0), size, mtime, status))
+                        report.hashed += 1
+                        report.hashed_bytes += size
+                        if progress:
+                            progress(report.hashed_bytes, total_bytes, asset.project_path)
+                    if len(batch) >= _CHECKPOINT_FILES or time.monotonic() - last_flush > _CHECKPOINT_SEC:
+                        flush()
+                    fill()
+            finally:
+                flush()
+        return not stopped and report.hashed == len(pending)
+
+    def _status(self, asset: Asset, future: Future, report: FsckReport) -> Optional[str]:
+        try:
+            digest = future.result()
+        except OSError as e:
+            report.issues.append(AssetIssue("unreadable", asset.project_path, asset.id, str(e)))
+            return "unreadable"
+        if digest is None:
+            return None
+        if digest != asset.hash_sha256:
+            report.issues.append(AssetIssue("corrupted", asset.project_path, asset.id, f"실제 sha256 {digest[:12]}…"))
+            return "corrupted"
+        return "ok"
+
+    # ---- 복구 ----
+
+    def repair(self, issues: Sequence[AssetIssue], actions: Sequence[str] = DEFAULT_REPAIR) -> RepairResult:
+        """검사에서 나온 문제를 actions 범위 안에서 고친다. 해당 동작이 없는 문제는 건너뛴다."""
+        unknown = set(actions) - set(REPAIR_ACTIONS)
+        if unknown:
+            raise ValueError(f"알 수 없는 복구 동작: {', '.join(sorted(unknown))}")
+        result = RepairResult()
+        touched: List[int] = []
+        for issue in issues:
+            try:
+                fixed = self._repair_one(issue, actions)
+            except Exception as e:
+                result.failed.append((issue, str(e)))
+                continue
+            if fixed:
+                result.repaired.append(issue)
+                if issue.asset_id is not None:
+                    touched.append(issue.asset_id)
+        if touched:
+            self._checks.forget(touched)
+        return result
+
+    def _repair_one(self, issue: AssetIssue, actions: Sequence[str]) -> bool:
+        path = os.path.join(self._base_dir, issue.path)
+        if issue.kind in ("unregistered", "orphan_thumbnail"):
+            if "quarantine" not in actions:
+                return False
+            self._quarantine(path)
+            return True
+        asset = self._assets.get_by_id(issue.asset_id) if issue.asset_id is not None else None
+        if asset is None:
+            raise ValueError("DB에 없는 에셋")
+        src = os.path.join(self._base_dir, asset.project_path)
+        if issue.kind in ("missing", "corrupted", "unreadable"):
+            snapshots = self._snapshots or SnapshotService()
+            if "restore" in actions and snapshots.restore_blob(self._db_path, asset.hash_sha256, src):
+                return True
+            if issue.kind == "corrupted" and "accept" in actions:
+                self._accept(asset, src)
+                return True
+            if "restore" in actions:
+                raise FileNotFoundError("스냅샷에 원래 내용이 없습니다")
+            return False
+        if issue.kind == "thumbnail_missing" and "thumbnails" in actions:
+            make_thumbnail(src, path)
+            return True
+        return False
+
+    def _accept(self, asset: Asset, src: str) -> None:
+        # 밖에서 의도적으로 고친 파일: 지금 내용을 기준으로 해시/크기/썸네일을 맞춘다
+        st = os.stat(src)
+        sha = file_sha256(src)
+        width, height = asset.width, asset.height
+        if asset.kind == "image":
+            with Image.open(src) as im:
+                width, height = im.size
+            if asset.thumbnail_path:
+                make_thumbnail(src, os.path.join(self._base_dir, asset.thumbnail_path))
+        if not self._assets.update_content(int(asset.id or 0), sha, width, height, st.st_size, st.st_mtime):
+            raise ValueError("같은 내용의 에셋이 이미 있습니다")
+
+    def _quarantine(self, path: str) -> None:
+        assets_dir, _ = get_project_dirs(self._db_path)
+        target_dir = os.path.join(assets_dir, QUARANTINE_DIR)
+        os.makedirs(target_dir, exist_ok=True)
+        name = os.path.basename(path)
+        target = os.path.join(target_dir, name)
+        n = 1
+        while os.path.exists(target):
+            stem, ext = os.path.splitext(name)
+            target = os.path.join(target_dir, f"{stem}-{n}{ext}")
+            n += 1
+        shutil.move(path, target)
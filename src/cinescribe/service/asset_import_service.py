@@ -3,14 +3,84 @@ from __future__ import annotations
 import hashlib
 import os
 import shutil
-from pathlib import Path
-from typing import Optional, Tuple
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Optional, Tuple
 
 from PIL import Image
 
+from ..utils.process_pool import new_process_pool
 from ..utils.project_paths import get_project_dirs
 from ..repository.asset_repository import AssetRepository
 
+THUMBNAIL_SIZE = (512, 512)
+_HASH_CHUNK = 1024 * 1024
+
+
+@dataclass
+class PreparedImage:
+    # 작업 프로세스가 파일 복사/썸네일 생성까지 끝낸 결과(DB 기록 전)
+    original_path: str
+    dest_path: str
+    thumb_path: str
+    filename: str
+    ext: str
+    sha256: str
+    width: int | None
+    height: int | None
+
+
+def file_sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def make_thumbnail(src_path: str, thumb_path: str) -> None:
+    with Image.open(src_path) as img:
+        img.draft("RGB", THUMBNAIL_SIZE)
+        img.thumbnail(THUMBNAIL_SIZE)
+        tmp_path = f"{thumb_path}.{os.getpid()}.tmp"
+        img.convert("RGB").save(tmp_path, "JPEG", quality=85)
+    os.replace(tmp_path, thumb_path)
+
+
+def prepare_image(src_path: str, assets_dir: str, thumbs_dir: str) -> PreparedImage:
+    """해시 계산, 에셋 폴더로 복사, 썸네일 생성까지 수행한다.
+
+    DB를 건드리지 않는 최상위 함수라 프로세스 풀에서 병렬로 실행할 수 있다.
+    같은 내용의 파일이 동시에 들어와도 임시 파일 + os.replace로 기록하므로 안전하다.
+    """
+    src_path = os.path.abspath(src_path)
+    sha = file_sha256(src_path)
+    ext = os.path.splitext(src_path)[1].lower()
+    filename = f"{sha}{ext}"
+    dest_path = os.path.join(assets_dir, filename)
+    if not os.path.exists(dest_path):
+        tmp_path = f"{dest_path}.{os.getpid()}.tmp"
+        shutil.copy2(src_path, tmp_path)
+        os.replace(tmp_path, dest_path)
+    thumb_path = os.path.join(thumbs_dir, f"{sha}_thumb.jpg")
+    if not os.path.exists(thumb_path):
+        make_thumbnail(dest_path, thumb_path)
+    width = height = None
+    try:
+        with Image.open(dest_path) as im:
+            width, height = im.size
+    except Exception:
+        pass
+    return PreparedImage(
+        original_path=src_path,
+        dest_path=dest_path,
+        thumb_path=thumb_path,
+        filename=filename,
+        ext=ext,
+        sha256=sha,
+        width=width,
+        height=height,
+    )
+
 
 class AssetImportService:
     def __init__(self, db_path: str) -> None:
@@ -20,42 +90,56 @@ class AssetImportService:
 
     def import_image(self, src_path: str) -> Tuple[int, str, str]:
         # Returns (asset_id, project_relative_path, thumbnail_relative_path)
-        src_path = os.path.abspath(src_path)
-        with open(src_path, "rb") as f:
-            content = f.read()
-        sha = hashlib.sha256(content).hexdigest()
-        ext = os.path.splitext(src_path)[1].lower()
-        filename = f"{sha}{ext}"
-        dest_path = os.path.join(self._assets_dir, filename)
-        if not os.path.exists(dest_path):
-            shutil.copy2(src_path, dest_path)
-        # thumbnail
-        thumb_name = f"{sha}_thumb.jpg"
-        thumb_path = os.path.join(self._thumbs_dir, thumb_name)
-        if not os.path.exists(thumb_path):
-            img = Image.open(dest_path)
-            img.thumbnail((512, 512))
-            img.convert("RGB").save(thumb_path, quality=85)
-        # Return relative paths (relative to assets dir base)
-        proj_rel = os.path.relpath(dest_path, os.path.dirname(self._db_path))
-        thumb_rel = os.path.relpath(thumb_path, os.path.dirname(self._db_path))
-        # Record in Assets table
-        width = height = None
-        try:
-            with Image.open(dest_path) as im:
-                width, height = im.size
-        except Exception:
-            pass
-        asset_id = self._asset_repo.upsert_image(
-            original_path=src_path,
-            project_path=proj_rel,
-            filename=filename,
-            ext=ext,
-            width=width,
-            height=height,
-            hash_sha256=sha,
-            thumbnail_path=thumb_rel,
-        )
-        return asset_id, proj_rel, thumb_rel
+        prepared = prepare_image(src_path, self._assets_dir, self._thumbs_dir)
+        return self.register([prepared])[0]
+
+    def import_many(
+        self,
+        paths: Iterable[str],
+        workers: Optional[int] = None,
+        progress: Optional[Callable[[int, int, str], None]] = None,
+    ) -> List[Tuple[int, str, str]]:
+        """여러 이미지를 프로세스 풀에서 준비한 뒤 한 트랜잭션으로 등록한다.
 
+        입력 순서대로 (asset_id, 프로젝트 상대 경로, 썸네일 상대 경로)를 돌려준다.
+        준비에 실패한 파일은 건너뛰고 progress에 오류 메시지와 함께 알린다.
+        """
+        paths = list(paths)
+        if not paths:
+            return []
+        total = len(paths)
+        prepared: List[Optional[PreparedImage]] = [None] * total
+        workers = workers or os.cpu_count() or 1
+        with new_process_pool(min(workers, total)) as pool:
+            futures = [pool.submit(prepare_image, p, self._assets_dir, self._thumbs_dir) for p in paths]
+            for done, (path, future) in enumerate(zip(paths, futures), start=1):
+                try:
+                    prepared[done - 1] = future.result()
+                    message = path
+                except Exception as e:
+                    message = f"{path}: {e}"
+                if progress:
+                    progress(done, total, message)
+        return self.register([p for p in prepared if p is not None])
 
+    def register(self, items: List[PreparedImage]) -> List[Tuple[int, str, str]]:
+        # 준비된 이미지를 Assets 테이블에 기록(이미 있는 해시는 기존 id 재사용)
+        base_dir = os.path.dirname(self._db_path)
+        rows = []
+        results = []
+        for item in items:
+            proj_rel = os.path.relpath(item.dest_path, base_dir)
+            thumb_rel = os.path.relpath(item.thumb_path, base_dir)
+            rows.append(dict(
+                original_path=item.original_path,
+                project_path=proj_rel,
+                filename=item.filename,
+                ext=item.ext,
+                width=item.width,
+                height=item.height,
+                hash_sha256=item.sha256,
+                thumbnail_path=thumb_rel,
+            ))
+            results.append((proj_rel, thumb_rel))
+        ids = self._asset_repo.upsert_images(rows)
+        return [(asset_id, proj_rel, thumb_rel) for asset_id, (proj_rel, thumb_rel) in zip(ids, results)]
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+from PIL import Image
+
+from ..repository.asset_repository import AssetRepository
+from ..utils.project_paths import get_project_dirs
+from .asset_import_service import file_sha256, make_thumbnail
+
+CHANGE_KINDS = ("modified", "missing", "thumbnail")
+# 바뀐 원본을 동시에 다시 해시/축소할 스레드 수(hashlib/Pillow는 GIL을 놓는다)
+_REHASH_WORKERS = 4
+
+_Stat = Tuple[int, float]
+
+
+@dataclass
+class AssetChange:
+    asset_id: int
+    kind: str  # 'modified' | 'missing' | 'thumbnail'
+    source_path: str  # 원본 절대 경로
+    thumbnail_path: Optional[str] = None  # 썸네일 절대 경로(없으면 None)
+
+
+def _stat_dir(folder: str) -> Dict[str, _Stat]:
+    # 폴더 하나를 scandir로 훑어 파일마다 stat을 따로 부르지 않는다
+    stats: Dict[str, _Stat] = {}
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        st = entry.stat()
+                        stats[entry.path] = (st.st_size, st.st_mtime)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return stats
+
+
+def _stat(path: str) -> Optional[_Stat]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime
+
+
+def _rehash(src: str, thumb: Optional[str], old_sha: Optional[str]) -> Tuple[Optional[str], Optional[int], Optional[int]]:
+    """(새 해시, 너비, 높이). 해시가 같으면 이미지를 열지 않는다. old_sha가 None이면 썸네일만 다시 만든다."""
+    sha = file_sha256(src) if old_sha is not None else None
+    if sha is not None and sha == old_sha:
+        return sha, None, None
+    width = height = None
+    try:
+        with Image.open(src) as im:
+            width, height = im.size
+        if thumb:
+            # 썸네일은 같은 경로에 덮어써서 DB와 다른 뷰의 참조를 그대로 둔다
+            make_thumbnail(src, thumb)
+    except Exception:
+        # 이미지가 아니거나 깨진 파일: 해시는 갱신하고 썸네일은 이전 것을 둔다
+        pass
+    return sha, width, height
+
+
+class AssetRefreshService:
+    """앱 밖에서 바뀐 에셋 원본/썸네일을 찾아 DB와 썸네일을 맞춘다(AssetWatcher가 이벤트마다 호출).
+
+    원본마다 마지막으로 확인한 크기/수정 시각(Assets.file_size/file_mtime)을 기록해 두고,
+    둘 중 하나라도 달라진 파일만 다시 해시한다. 처음 보는 파일은 기준값만 기록한다(가져올 때 해시했으므로).
+    내용이 바뀌었으면 해시/크기를 갱신하고 썸네일을 제자리에서 다시 만든다.
+    없어진 원본과 밖에서 바뀐 썸네일은 상태를 메모리에 두어 한 번만 알린다.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        self._db_path = os.path.abspath(db_path)
+        self._base_dir = os.path.dirname(self._db_path)
+        self._repo = AssetRepository(self._db_path)
+        self._missing: Set[int] = set()
+        self._thumb_stats: Optional[Dict[str, _Stat]] = None
+
+    @property
+    def db_path(self) -> str:
+        return self._db_path
+
+    def watch_dirs(self) -> Tuple[str, str]:
+        return get_project_dirs(self._db_path)
+
+    def scan(self) -> List[AssetChange]:
+        assets_dir, thumbs_dir = self.watch_dirs()
+        stats = _stat_dir(assets_dir)
+        thumb_stats = _stat_dir(thumbs_dir)
+        first_scan = self._thumb_stats is None
+        previous_thumbs = self._thumb_stats or {}
+
+        changes: List[AssetChange] = []
+        baseline: List[Tuple[int, float, int]] = []
+        to_rehash: List[Tuple[int, str, Optional[str], Optional[str], _Stat]] = []
+        for asset_id, project_path, thumbnail_path, sha, size, mtime in self._repo.list_file_stats():
+            src = os.path.join(self._base_dir, project_path)
+            thumb = os.path.join(self._base_dir, thumbnail_path) if thumbnail_path else None
+            # 에셋 폴더 밖에 있는 원본(예전 프로젝트)은 따로 stat
+            st = stats.get(src) if os.path.dirname(src) == assets_dir else _stat(src)
+            if st is None:
+                if asset_id not in self._missing:
+                    self._missing.add(asset_id)
+                    changes.append(AssetChange(asset_id, "missing", src, thumb))
+                continue
+            self._missing.discard(asset_id)
+            if size is None:
+                baseline.append((st[0], st[1], asset_id))
+            elif st != (size, mtime):
+                to_rehash.append((asset_id, src, thumb, sha, st))
+                continue
+            if thumb is None:
+                continue
+            if thumb not in thumb_stats:
+                to_rehash.append((asset_id, src, thumb, None, st))
+            elif not first_scan and previous_thumbs.get(thumb) != thumb_stats[thumb]:
+                changes.append(AssetChange(asset_id, "thumbnail", src, thumb))
+
+        if baseline:
+            self._repo.update_file_stats(baseline)
+        changes.extend(self._rehash_all(to_rehash, thumb_stats))
+        self._thumb_stats = thumb_stats
+        return changes
+
+    def _rehash_all(
+        self, items: List[Tuple[int, str, Optional[str], Optional[str], _Stat]], thumb_stats: Dict[str, _Stat]
+    ) -> List[AssetChange]:
+        if not items:
+            return []
+        changes: List[AssetChange] = []
+        with ThreadPoolExecutor(max_workers=min(_REHASH_WORKERS, len(items))) as pool:
+            futures = [pool.submit(_rehash, src, thumb, sha) for _, src, thumb, sha, _ in items]
+            for (asset_id, src, thumb, old_sha, st), future in zip(items, futures):
+                try:
+                    sha, width, height = future.result()
+                except OSError:
+                    # 아직 쓰는 중이거나 읽을 수 없는 파일: 기준값을 그대로 두어 다음 이벤트에서 다시 본다
+                    continue
+                if _stat(src) != st:
+                    # 해시하는 동안 또 바뀌었다. 쓰기가 끝나면 새 이벤트가 온다
+                    continue
+                if thumb and (old_sha is None or sha != old_sha):
+                    # 방금 다시 만든 썸네일을 밖에서 바뀐 것으로 다시 알리지 않도록
+                    thumb_stats[thumb] = _stat(thumb) or (0, 0.0)
+                if old_sha is None:
+                    changes.append(AssetChange(asset_id, "thumbnail", src, thumb))
+                elif sha == old_sha:
+                    # 내용은 같고 수정 시각만 바뀜(복사/touch)
+                    self._repo.update_file_stats([(st[0], st[1], asset_id)])
+                else:
+                    self._repo.update_content(asset_id, sha, width, height, st[0], st[1])
+                    changes.append(AssetChange(asset_id, "modified", src, thumb))
+        return changes
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, List, Tuple
+
+from ..utils import sql_trace
+
+
+class AutosaveService:
+    """자동 저장용 write-behind 큐.
+
+    편집 내용은 stage()로 (종류, id)별로 합쳐 두었다가 flush() 한 번에
+    하나의 연결/트랜잭션으로 기록한다. 같은 필드를 여러 번 고치면 마지막 값만 남는다.
+    """
+
+    # 종류 -> (테이블, 자동 저장을 허용하는 컬럼)
+    _TABLES: Dict[str, Tuple[str, frozenset]] = {
+        "shot": (
+            "Shots",
+            frozenset({"code", "description", "shot_type", "angle", "movement", "lens", "lighting", "image_prompt", "video_prompt", "duration_sec"}),
+        ),
+        "final_image": ("FinalImages", frozenset({"description"})),
+        "character": (
+            "Characters",
+            frozenset({"name", "age", "job", "personality", "goal", "conflict", "design_prompt"}),
+        ),
+    }
+
+    def __init__(self, db_path: str) -> None:
+        self._db_path = db_path
+        self._pending: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        # flush는 한 번에 하나만: 늦게 시작한 flush가 먼저 끝나 오래된 값을 덮어쓰지 않도록
+        self._flush_lock = threading.Lock()
+
+    def stage(self, kind: str, entity_id: int, **fields: Any) -> None:
+        table = self._TABLES.get(kind)
+        if table is None:
+            raise ValueError(f"알 수 없는 자동 저장 종류: {kind}")
+        unknown = set(fields) - table[1]
+        if unknown:
+            raise ValueError(f"{kind}에 허용되지 않은 필드: {', '.join(sorted(unknown))}")
+        with self._lock:
+            self._pending.setdefault((kind, int(entity_id)), {}).update(fields)
+
+    def has_pending(self) -> bool:
+        with self._lock:
+            return bool(self._pending)
+
+    def discard(self, kind: str, entity_id: int) -> None:
+        # 삭제된 엔티티의 대기 중 변경은 버린다
+        with self._lock:
+            self._pending.pop((kind, int(entity_id)), None)
+
+    def flush(self) -> int:
+        """대기 중인 변경을 한 트랜잭션으로 기록하고 기록한 엔티티 수를 돌려준다."""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return 0
+            # 같은 테이블/컬럼 조합끼리 묶어 executemany 한 번으로 처리
+            groups: Dict[Tuple[str, Tuple[str, ...]], List[tuple]] = {}
+            for (kind, entity_id), fields in batch.items():
+                cols = tuple(sorted(fields))
+                groups.setdefault((kind, cols), []).append(tuple(fields[c] for c in cols) + (entity_id,))
+            try:
+                conn = sql_trace.connect(self._db_path)
+                try:
+                    with conn:
+                        for (kind, cols), rows in groups.items():
+                            table = self._TABLES[kind][0]
+                            sets = ", ".join(f"{c}=?" for c in cols)
+                            conn.executemany(f"UPDATE {table} SET {sets}, updated_at=datetime('now') WHERE id=?", rows)
+                finally:
+                    conn.close()
+            except Exception:
+                # 실패하면 되돌려 놓되, 그 사이 새로 들어온 값이 우선한다
+                with self._lock:
+                    for key, fields in batch.items():
+                        merged = dict(fields)
+                        merged.update(self._pending.get(key, {}))
+                        self._pending[key] = merged
+                raise
+            return len(batch)
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import sqlite3
+import time
+import zipfile
+from pathlib import Path, PurePosixPath
+from typing import Callable, List, Optional, Tuple
+
+from ..utils.project_paths import get_project_dirs
+from .library_service import LibraryService
+
+# (처리한 바이트, 전체 바이트, 현재 항목 이름)
+ProgressCallback = Callable[[int, int, str], None]
+
+BUNDLE_EXT = ".csbundle"
+MANIFEST_NAME = "manifest.json"
+BUNDLE_VERSION = 1
+_CHUNK = 1024 * 1024
+# DB 스냅샷을 한 번에 복사할 페이지 수
+_BACKUP_PAGES = 1024
+# 이미 압축된 형식은 다시 deflate해도 이득이 없으므로 그대로 저장
+_STORED_EXTS = {
+    ".jpg", ".jpeg", ".png", ".webp", ".gif", ".heic", ".avif",
+    ".mp4", ".mov", ".m4v", ".webm", ".mp3", ".m4a", ".aac", ".ogg", ".opus", ".flac",
+    ".zip", ".gz", ".7z",
+}
+
+
+class BundleError(Exception):
+    pass
+
+
+class BundleService:
+    """프로젝트(.sqlite + <stem>_assets/)를 하나의 zip 번들로 내보내고 가져온다.
+
+    DB는 backup API로 번들 옆 임시 파일에 일관된 스냅샷을 뜬 뒤 청크 단위로 압축 스트림에 쓰고
+    (스냅샷/리비전 이력으로 수 GB가 될 수 있어 메모리에 올리지 않는다), 에셋은 파일마다 청크 단위로
+    스트리밍하므로 임시 복사본을 만들지 않는다.
+    """
+
+    def __init__(self, library: LibraryService | None = None) -> None:
+        self._library = library
+
+    def export_bundle(self, db_path: str, out_path: str, progress: Optional[ProgressCallback] = None) -> str:
+        db_path = os.path.abspath(db_path)
+        if not os.path.isfile(db_path):
+            raise BundleError(f"프로젝트 파일이 없습니다: {db_path}")
+        base_dir = os.path.dirname(db_path)
+        assets_dir, _ = get_project_dirs(db_path)
+        files = self._asset_files(assets_dir, base_dir)
+
+        # 편집 중인 DB도 일관된 시점으로 복사(backup API). 번들과 같은 디스크에 두어 이름만 바꾸는 것과 같은 비용
+        db_snapshot = f"{out_path}.db.part"
+        self._snapshot_to_file(db_path, db_snapshot)
+        db_size = os.path.getsize(db_snapshot)
+        total = db_size + sum(size for _, _, size in files)
+        done = 0
+        db_name = os.path.basename(db_path)
+        manifest = {
+            "version": BUNDLE_VERSION,
+            "db_name": db_name,
+            "assets_dir": os.path.basename(assets_dir),
+            "title": self._read_title(db_path),
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "files": len(files) + 1,
+            "total_bytes": total,
+        }
+
+        tmp_path = f"{out_path}.part"
+        try:
+            with zipfile.ZipFile(tmp_path, "w", allowZip64=True) as zf:
+                zf.writestr(MANIFEST_NAME, json.dumps(manifest, ensure_ascii=False, indent=2), zipfile.ZIP_DEFLATED)
+                info = self._member_info(db_name, zipfile.ZIP_DEFLATED)
+                with open(db_snapshot, "rb") as src, zf.open(info, "w", force_zip64=True) as dst:
+                    for chunk in iter(lambda: src.read(_CHUNK), b""):
+                        dst.write(chunk)
+                        done += len(chunk)
+                if progress:
+                    progress(done, total, db_name)
+                for abs_path, arcname, size in files:
+                    ext = os.path.splitext(arcname)[1].lower()
+                    compress = zipfile.ZIP_STORED if ext in _STORED_EXTS else zipfile.ZIP_DEFLATED
+                    info = self._member_info(arcname, compress, os.path.getmtime(abs_path))
+                    with open(abs_path, "rb") as src, zf.open(info, "w", force_zip64=True) as dst:
+                        for chunk in iter(lambda: src.read(_CHUNK), b""):
+                            dst.write(chunk)
+                            done += len(chunk)
+                    if progress:
+                        progress(done, total, arcname)
+            os.replace(tmp_path, out_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        finally:
+            try:
+                os.remove(db_snapshot)
+            except OSError:
+                pass
+        return out_path
+
+    def import_bundle(
+        self,
+        bundle_path: str,
+        dest_dir: str,
+        progress: Optional[ProgressCallback] = None,
+        register: bool = True,
+    ) -> str:
+        """번들을 dest_dir/<프로젝트 이름>/ 아래에 풀고 라이브러리에 등록한 뒤 DB 경로를 돌려준다.
+
+        에셋 경로는 DB 파일 이름(stem)에 묶여 있으므로 이름을 바꾸지 않고,
+        같은 이름의 폴더가 있으면 새 폴더 이름을 고른다.
+        """
+        with zipfile.ZipFile(bundle_path, "r") as zf:
+            manifest = self._read_manifest(zf)
+            db_name = manifest["db_name"]
+            assets_prefix = manifest["assets_dir"].rstrip("/") + "/"
+            members = [i for i in zf.infolist() if not i.is_dir() and i.filename != MANIFEST_NAME]
+            for info in members:
+                # zip-slip 방지: DB 파일과 에셋 폴더 아래의 상대 경로만 허용
+                self._check_member_name(info.filename)
+                if info.filename != db_name and not info.filename.startswith(assets_prefix):
+                    raise BundleError(f"번들에 예상하지 못한 항목이 있습니다: {info.filename}")
+            if not any(i.filename == db_name for i in members):
+                raise BundleError("번들에 프로젝트 DB가 없습니다.")
+
+            target_dir = self._unique_dir(Path(dest_dir) / Path(db_name).stem)
+            target_dir.mkdir(parents=True)
+            try:
+                db_path = self._extract(zf, members, db_name, target_dir.resolve(), progress)
+            except BaseException:
+                # 실패하면 풀던 폴더를 지워 반쯤 풀린 프로젝트가 남지 않게 한다
+                shutil.rmtree(target_dir, ignore_errors=True)
+                raise
+
+        if register:
+            library = self._library or LibraryService()
+            library.register_project(str(db_path), title=manifest.get("title") or None)
+        return str(db_path)
+
+    def read_manifest(self, bundle_path: str) -> dict:
+        with zipfile.ZipFile(bundle_path, "r") as zf:
+            return self._read_manifest(zf)
+
+    def _extract(
+        self,
+        zf: zipfile.ZipFile,
+        members: List[zipfile.ZipInfo],
+        db_name: str,
+        root: Path,
+        progress: Optional[ProgressCallback],
+    ) -> Path:
+        total = sum(i.file_size for i in members)
+        done = 0
+        # DB는 마지막에 이름을 바꿔 넣어, 중간에 실패하면 불완전한 프로젝트가 열리지 않도록 한다
+        db_tmp = root / f"{db_name}.part"
+        for info in members:
+            out = db_tmp if info.filename == db_name else (root / PurePosixPath(info.filename))
+            if root not in out.resolve().parents:
+                raise BundleError(f"잘못된 경로: {info.filename}")
+            out.parent.mkdir(parents=True, exist_ok=True)
+            with zf.open(info, "r") as src, open(out, "wb") as dst:
+                for chunk in iter(lambda: src.read(_CHUNK), b""):
+                    dst.write(chunk)
+                    done += len(chunk)
+            if progress:
+                progress(done, total, info.filename)
+        db_path = root / db_name
+        os.replace(db_tmp, db_path)
+        return db_path
+
+    def _snapshot_to_file(self, db_path: str, out_path: str) -> None:
+        # 페이지 단위로 나눠 복사하므로 메모리 사용량이 DB 크기와 상관없이 일정하다
+        if os.path.exists(out_path):
+            os.remove(out_path)
+        src = sqlite3.connect(db_path)
+        dst = sqlite3.connect(out_path)
+        try:
+            src.backup(dst, pages=_BACKUP_PAGES)
+        except BaseException:
+            dst.close()
+            os.remove(out_path)
+            raise
+        finally:
+            dst.close()
+            src.close()
+
+    def _asset_files(self, assets_dir: str, base_dir: str) -> List[Tuple[str, str, int]]:
+        files: List[Tuple[str, str, int]] = []
+        for root, _, names in os.walk(assets_dir):
+            for name in sorted(names):
+                if name.endswith(".tmp"):
+                    continue
+                abs_path = os.path.join(root, name)
+                arcname = os.path.relpath(abs_path, base_dir).replace(os.sep, "/")
+                files.append((abs_path, arcname, os.path.getsize(abs_path)))
+        return files
+
+    def _member_info(self, arcname: str, compress: int, mtime: float | None = None) -> zipfile.ZipInfo:
+        info = zipfile.ZipInfo(arcname, date_time=time.localtime(mtime if mtime is not None else time.time())[:6])
+        info.compress_type = compress
+        return info
+
+    def _read_title(self, db_path: str) -> Optional[str]:
+        try:
+            conn = sqlite3.connect(Path(db_path).as_uri() + "?mode=ro", uri=True)
+            try:
+                row = conn.execute("SELECT title FROM Project_Info WHERE id=1").fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+
+    def _read_manifest(self, zf: zipfile.ZipFile) -> dict:
+        try:
+            manifest = json.loads(zf.read(MANIFEST_NAME).decode("utf-8"))
+        except (KeyError, ValueError) as e:
+            raise BundleError(f"번들 매니페스트를 읽을 수 없습니다: {e}")
+        if manifest.get("version") != BUNDLE_VERSION:
+            raise BundleError(f"지원하지 않는 번들 버전: {manifest.get('version')}")
+        for key in ("db_name", "assets_dir"):
+            name = manifest.get(key)
+            if not isinstance(name, str) or not name or "/" in name or "\\" in name or name in (".", ".."):
+                raise BundleError(f"잘못된 매니페스트 값: {key}")
+        return manifest
+
+    def _check_member_name(self, name: str) -> None:
+        path = PurePosixPath(name)
+        if "\\" in name or path.is_absolute() or ".." in path.parts or (path.parts and ":" in path.parts[0]):
+            raise BundleError(f"잘못된 경로: {name}")
+
+    def _unique_dir(self, path: Path) -> Path:
+        if not path.exists():
+            return path
+        n = 2
+        while True:
+            candidate = path.with_name(f"{path.name} ({n})")
+            if not candidate.exists():
+                return candidate
+            n += 1
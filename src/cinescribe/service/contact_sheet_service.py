@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from PIL import Image, ImageDraw, ImageFont
+
+from ..repository.project_repository import ProjectRepository
+from ..repository.scene_shot_repository import SceneShotRepository
+from ..utils.pdf_writer import PdfImageWriter
+from ..utils.process_pool import new_process_pool
+
+ProgressCallback = Callable[[int, int, str], None]
+
+# 한글이 들어가므로 CJK 글꼴을 우선 찾고, 없으면 Pillow 기본 글꼴로 대체
+_FONT_CANDIDATES = (
+    "C:/Windows/Fonts/malgun.ttf",
+    "/System/Library/Fonts/AppleSDGothicNeo.ttc",
+    "/Library/Fonts/AppleGothic.ttf",
+    "/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc",
+    "/usr/share/fonts/noto-cjk/NotoSansCJK-Regular.ttc",
+    "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+)
+_font_cache: Dict[int, ImageFont.ImageFont] = {}
+
+
+@dataclass
+class ContactSheetOptions:
+    # 기본값: A4 가로, 150dpi, 페이지당 3x3 샷
+    page_width_mm: float = 297.0
+    page_height_mm: float = 210.0
+    dpi: int = 150
+    columns: int = 3
+    rows: int = 3
+    jpeg_quality: int = 85
+    # 장면이 바뀌면 새 페이지에서 시작
+    scene_per_page: bool = True
+
+
+@dataclass
+class PageSpec:
+    # 작업 프로세스로 넘기는 페이지 정보(pickle 가능한 값만)
+    number: int
+    title: str
+    scene_label: str
+    cells: List[Dict[str, Optional[str]]] = field(default_factory=list)
+    page_count: int = 0
+
+
+def _font(size: int) -> ImageFont.ImageFont:
+    font = _font_cache.get(size)
+    if font is None:
+        for path in _FONT_CANDIDATES:
+            if os.path.exists(path):
+                try:
+                    font = ImageFont.truetype(path, size)
+                    break
+                except OSError:
+                    continue
+        if font is None:
+            font = ImageFont.load_default(size)
+        _font_cache[size] = font
+    return font
+
+
+def _wrap(draw: ImageDraw.ImageDraw, text: str, font: ImageFont.ImageFont, width: int, max_lines: int) -> List[str]:
+    # 띄어쓰기가 없는 문장도 있으므로 글자 단위로 채우고, 넘치면 마지막 줄을 말줄임표로 끝낸다
+    lines: List[str] = []
+    for paragraph in text.splitlines():
+        current = ""
+        for ch in paragraph:
+            if draw.textlength(current + ch, font=font) <= width:
+                current += ch
+                continue
+            lines.append(current)
+            current = ch
+            if len(lines) > max_lines:
+                break
+        lines.append(current)
+        if len(lines) > max_lines:
+            break
+    if len(lines) > max_lines:
+        lines = lines[:max_lines]
+        last = lines[-1]
+        while last and draw.textlength(last + "…", font=font) > width:
+            last = last[:-1]
+        lines[-1] = last + "…"
+    return lines
+
+
+def _paste_thumbnail(page: Image.Image, path: Optional[str], box: Tuple[int, int, int, int]) -> None:
+    x0, y0, x1, y1 = box
+    draw = ImageDraw.Draw(page)
+    draw.rectangle(box, fill=(232, 232, 232), outline=(180, 180, 180))
+    if not path or not os.path.exists(path):
+        return
+    try:
+        with Image.open(path) as img:
+            # JPEG는 draft로 축소 디코딩해 큰 원본도 빠르고 적은 메모리로 읽는다
+            img.draft("RGB", (x1 - x0, y1 - y0))
+            img = img.convert("RGB")
+            img.thumbnail((x1 - x0, y1 - y0))
+            page.paste(img, (x0 + (x1 - x0 - img.width) // 2, y0 + (y1 - y0 - img.height) // 2))
+    except OSError:
+        pass
+
+
+def render_page(spec: PageSpec, options: ContactSheetOptions, out_path: str) -> Tuple[str, int, int]:
+    """페이지 하나를 그려 out_path(.png 또는 .jpg)에 저장하고 (경로, 너비, 높이)를 돌려준다.
+
+    작업 프로세스에서 호출되며, 한 번에 페이지 하나만 메모리에 둔다.
+    """
+    width = round(options.page_width_mm / 25.4 * options.dpi)
+    height = round(options.page_height_mm / 25.4 * options.dpi)
+    unit = options.dpi / 150
+    margin = int(40 * unit)
+    header_h = int(56 * unit)
+    footer_h = int(32 * unit)
+    gap = int(20 * unit)
+
+    page = Image.new("RGB", (width, height), "white")
+    draw = ImageDraw.Draw(page)
+    title_font, label_font, code_font, body_font, small_font = (
+        _font(int(s * unit)) for s in (26, 20, 18, 15, 13)
+    )
+    draw.text((margin, margin), spec.title, font=title_font, fill=(20, 20, 20))
+    draw.text((width - margin, margin + int(6 * unit)), spec.scene_label, font=label_font, fill=(70, 70, 70), anchor="ra")
+    draw.line((margin, margin + header_h - int(10 * unit), width - margin, margin + header_h - int(10 * unit)), fill=(200, 200, 200))
+
+    grid_top = margin + header_h
+    grid_h = height - grid_top - margin - footer_h
+    cell_w = (width - 2 * margin - (options.columns - 1) * gap) // options.columns
+    cell_h = (grid_h - (options.rows - 1) * gap) // options.rows
+    thumb_h = min(cell_w * 9 // 16, cell_h - int(70 * unit))
+    line_h = int(20 * unit)
+    for index, cell in enumerate(spec.cells):
+        col, row = index % options.columns, index // options.columns
+        x = margin + col * (cell_w + gap)
+        y = grid_top + row * (cell_h + gap)
+        _paste_thumbnail(page, cell.get("thumb"), (x, y, x + cell_w, y + thumb_h))
+        ty = y + thumb_h + int(6 * unit)
+        draw.text((x, ty), cell.get("code") or "", font=code_font, fill=(20, 20, 20))
+        camera = cell.get("camera") or ""
+        if camera:
+            draw.text((x + cell_w, ty + int(2 * unit)), camera, font=small_font, fill=(90, 90, 90), anchor="ra")
+        ty += line_h + int(4 * unit)
+        max_lines = max(1, (y + cell_h - ty) // line_h)
+        for line in _wrap(draw, cell.get("description") or "", body_font, cell_w, max_lines):
+            draw.text((x, ty), line, font=body_font, fill=(40, 40, 40))
+            ty += line_h
+
+    footer = f"{spec.number} / {spec.page_count}"
+    draw.text((width // 2, height - margin), footer, font=small_font, fill=(120, 120, 120), anchor="md")
+    if out_path.lower().endswith(".png"):
+        page.save(out_path, "PNG", optimize=False)
+    else:
+        page.save(out_path, "JPEG", quality=options.jpeg_quality)
+    return out_path, width, height
+
+
+def _render_job(args: Tuple[PageSpec, ContactSheetOptions, str]) -> Tuple[str, int, int]:
+    return render_page(*args)
+
+
+class ContactSheetService:
+    """스토리보드 장면/샷을 썸네일 + 코드 + 설명 + 카메라 정보 격자로 배치한 콘티 시트를 만든다.
+
+    페이지는 프로세스 풀에서 병렬로 그리고, 끝난 순서대로 바로 디스크(PNG 파일 또는 PDF 스트림)에
+    기록하므로 샷이 수천 개여도 메모리 사용량은 페이지 몇 장 수준으로 유지된다.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        self._db_path = os.path.abspath(db_path)
+        self._base_dir = os.path.dirname(self._db_path)
+
+    def build_pages(self, options: ContactSheetOptions) -> List[PageSpec]:
+        repo = SceneShotRepository(self._db_path)
+        info = ProjectRepository(self._db_path).get_info()
+        title = (info.title if info else "") or os.path.splitext(os.path.basename(self._db_path))[0]
+        per_page = options.columns * options.rows
+        pages: List[PageSpec] = []
+        for scene in repo.list_scenes():
+            label = f"S{scene.number:02d} {scene.name}".strip()
+            for shot in repo.list_shots(scene.id):
+                if not pages or len(pages[-1].cells) >= per_page or (
+                    options.scene_per_page and pages[-1].scene_label != label
+                ):
+                    pages.append(PageSpec(number=len(pages) + 1, title=title, scene_label=label))
+                pages[-1].cells.append(self._cell(shot))
+        for page in pages:
+            page.page_count = len(pages)
+        return pages
+
+    def export(
+        self,
+        out_path: str,
+        options: Optional[ContactSheetOptions] = None,
+        workers: Optional[int] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> List[str]:
+        """out_path가 .pdf면 PDF 한 파일, .png면 <이름>_001.png 형식의 페이지 파일들을 만든다.
+
+        만든 파일 경로 목록을 돌려준다.
+        """
+        options = options or ContactSheetOptions()
+        pages = self.build_pages(options)
+        if not pages:
+            raise ValueError("내보낼 샷이 없습니다.")
+        as_pdf = out_path.lower().endswith(".pdf")
+        if not as_pdf and not out_path.lower().endswith(".png"):
+            raise ValueError("출력 파일은 .pdf 또는 .png여야 합니다.")
+
+        stem = os.path.splitext(out_path)[0]
+        work_dir = tempfile.mkdtemp(prefix="contact_sheet_", dir=os.path.dirname(os.path.abspath(out_path))) if as_pdf else None
+        jobs = [
+            (page, options, os.path.join(work_dir, f"{page.number:05d}.jpg") if as_pdf else f"{stem}_{page.number:03d}.png")
+            for page in pages
+        ]
+        written: List[str] = []
+        try:
+            if as_pdf:
+                with PdfImageWriter(out_path) as pdf:
+                    for path, width, height in self._render(jobs, workers, progress):
+                        pdf.add_jpeg(path, width, height, options.dpi)
+                        os.remove(path)
+                written.append(out_path)
+            else:
+                written.extend(path for path, _, _ in self._render(jobs, workers, progress))
+        finally:
+            if work_dir:
+                shutil.rmtree(work_dir, ignore_errors=True)
+        return written
+
+    def _render(
+        self,
+        jobs: List[Tuple[PageSpec, ContactSheetOptions, str]],
+        workers: Optional[int],
+        progress: Optional[ProgressCallback],
+    ) -> Iterator[Tuple[str, int, int]]:
+        total = len(jobs)
+        workers = min(workers or os.cpu_count() or 1, total)
+        if workers <= 1:
+            results = map(_render_job, jobs)
+            pool = None
+        else:
+            pool = new_process_pool(workers)
+            # 결과는 페이지 순서대로 나오므로 PDF에 바로 이어 쓸 수 있다
+            results = pool.map(_render_job, jobs)
+        try:
+            for done, result in enumerate(results, start=1):
+                if progress:
+                    progress(done, total, f"{done}/{total} 페이지")
+                yield result
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+    def _cell(self, shot) -> Dict[str, Optional[str]]:
+        thumb = shot.asset_thumbnail_path or shot.asset_project_path
+        camera = " · ".join(v for v in (shot.shot_type, shot.angle, shot.movement, shot.lens) if v)
+        description = shot.description or ""
+        if shot.lighting:
+            description = f"{description}\n조명: {shot.lighting}" if description else f"조명: {shot.lighting}"
+        return {
+            "code": shot.code or f"#{shot.id}",
+            "description": description,
+            "camera": camera,
+            "thumb": os.path.join(self._base_dir, thumb) if thumb else None,
+        }
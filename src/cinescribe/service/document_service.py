@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 from ..repository.document_repository import DocumentRepository, Document
+from ..repository.revision_repository import Revision
 
 
 class DocumentService:
@@ -32,6 +33,15 @@ class DocumentService:
         except Exception:
             return None
 
+    def history(self, key: str) -> List[Revision]:
+        return self._repo.history(key)
+
+    def diff(self, key: str, from_seq: int, to_seq: int) -> str:
+        return self._repo.diff_revisions(key, from_seq, to_seq)
+
+    def restore(self, key: str, seq: int) -> int:
+        return self._repo.restore_revision(key, seq)
+
     def export(self, key: str, out_path: str) -> None:
         self._repo.export_to_file(key, out_path)
 
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import heapq
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..repository.library_repository import LibraryRepository
+from ..repository.search_index_repository import SearchHit, has_index, search
+
+ProgressCallback = Callable[[int, int, str], None]
+
+# 취소 여부를 확인하는 간격(SQLite 가상 머신 명령 수)
+_PROGRESS_OPS = 2000
+
+
+@dataclass
+class GlobalHit:
+    project_path: str
+    project_title: str
+    kind: str
+    ref: int
+    title: str
+    snippet: str
+    rank: float
+
+
+@dataclass
+class GlobalSearchResult:
+    hits: List[GlobalHit] = field(default_factory=list)
+    searched: int = 0
+    # 색인이 아직 없는 프로젝트(한 번 열거나 'cli reindex'로 만든다)
+    unindexed: List[str] = field(default_factory=list)
+    failed: List[Tuple[str, str]] = field(default_factory=list)
+    cancelled: bool = False
+    elapsed: float = 0.0
+
+
+def _search_project(path: str, text: str, limit: int, should_stop: Callable[[], bool]) -> Optional[List[SearchHit]]:
+    # 색인이 없으면 None. 읽기 전용으로 열어 작업 중인 프로젝트 파일을 바꾸거나 잠그지 않는다
+    conn = sqlite3.connect(f"{Path(path).as_uri()}?mode=ro", uri=True, timeout=1.0)
+    try:
+        # 취소되면 실행 중인 쿼리도 바로 중단(sqlite3.OperationalError: interrupted)
+        conn.set_progress_handler(lambda: 1 if should_stop() else 0, _PROGRESS_OPS)
+        if not has_index(conn):
+            return None
+        return search(conn, text, limit)
+    finally:
+        conn.close()
+
+
+class GlobalSearchService:
+    """라이브러리의 모든(보관되지 않은) 프로젝트를 스레드 풀로 동시에 검색해 순위대로 합친다.
+
+    각 프로젝트의 FTS5 SearchIndex를 읽기 전용 연결로 조회하고, 동시에 열린 연결 수는 workers로 제한한다.
+    cancel 이벤트나 timeout이 오면 남은 프로젝트는 건너뛰고 진행 중인 쿼리도 중단한 뒤
+    그때까지의 결과를 돌려준다(cancelled=True).
+    """
+
+    def __init__(self, library: LibraryRepository | None = None) -> None:
+        self._library = library or LibraryRepository()
+
+    def search(
+        self,
+        text: str,
+        limit: int = 100,
+        per_project: int = 20,
+        workers: int = 8,
+        cancel: Optional[threading.Event] = None,
+        timeout: Optional[float] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> GlobalSearchResult:
+        started = time.perf_counter()
+        result = GlobalSearchResult()
+        if not text.strip():
+            return result
+        projects = {p.project_path: p.title for p in self._library.list_projects()}
+        deadline = started + timeout if timeout else None
+
+        def should_stop() -> bool:
+            return (cancel is not None and cancel.is_set()) or (deadline is not None and time.perf_counter() > deadline)
+
+        pending = iter(projects)
+        per_project_hits: List[List[GlobalHit]] = []
+        in_flight: Dict[Future, str] = {}
+        total = len(projects)
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="global-search") as pool:
+            # 한 번에 workers개만 제출해 두고 끝나는 대로 채운다. 취소 시 대기열을 비울 필요가 없다
+            def fill() -> None:
+                while len(in_flight) < workers and not should_stop():
+                    path = next(pending, None)
+                    if path is None:
+                        return
+                    in_flight[pool.submit(_search_project, path, text, per_project, should_stop)] = path
+
+            fill()
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path = in_flight.pop(future)
+                    self._collect(result, per_project_hits, path, projects[path], future, should_stop)
+                    if progress:
+                        progress(result.searched + len(result.unindexed) + len(result.failed), total, path)
+                fill()
+        result.cancelled = should_stop() or result.cancelled
+        # 프로젝트별 결과는 이미 순위순이므로 k-way 병합으로 상위 limit개만 뽑는다
+        result.hits = list(islice(heapq.merge(*per_project_hits, key=lambda h: h.rank), limit))
+        result.elapsed = time.perf_counter() - started
+        return result
+
+    def _collect(
+        self,
+        result: GlobalSearchResult,
+        per_project_hits: List[List[GlobalHit]],
+        path: str,
+        title: str,
+        future: Future,
+        should_stop: Callable[[], bool],
+    ) -> None:
+        try:
+            hits = future.result()
+        except sqlite3.OperationalError as e:
+            if should_stop():
+                result.cancelled = True
+            else:
+                result.failed.append((path, str(e)))
+            return
+        except Exception as e:
+            result.failed.append((path, str(e)))
+            return
+        if hits is None:
+            result.unindexed.append(path)
+            return
+        result.searched += 1
+        if hits:
+            per_project_hits.append(
+                [
+                    GlobalHit(
+                        project_path=path,
+                        project_title=title or os.path.splitext(os.path.basename(path))[0],
+                        kind=h.kind,
+                        ref=h.ref,
+                        title=h.title,
+                        snippet=h.snippet,
+                        rank=h.rank,
+                    )
+                    for h in hits
+                ]
+            )
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..repository.library_repository import LibraryProject, LibraryRepository
+
+ProgressCallback = Callable[[int, int, str], None]
+
+STATES = ("unknown", "ok", "changed", "missing", "unreachable")
+# 이 시간 동안 응답이 없는 stat은 느린/끊긴 드라이브로 보고 다른 파일을 위해 작업 스레드를 더 띄운다
+_STALL_SEC = 0.5
+_MAX_THREADS = 64
+_SKIP_DIRS = {"node_modules", "__pycache__", "$RECYCLE.BIN", "System Volume Information"}
+
+
+@dataclass
+class FileCheck:
+    project_path: str
+    state: str
+    size: Optional[int] = None
+    mtime: Optional[float] = None
+    db_version: Optional[int] = None
+
+
+def _read_db_version(path: str) -> Optional[int]:
+    # 프로젝트 파일은 user_version을 쓰지 않는다. schema_version은 테이블/인덱스/컬럼이 바뀔 때마다
+    # SQLite가 올리므로 앱 밖의 도구나 다른 버전의 앱이 스키마를 고쳤는지 알 수 있다
+    try:
+        conn = sqlite3.connect(f"{Path(path).as_uri()}?mode=ro", uri=True, timeout=0.5)
+        try:
+            return int(conn.execute("PRAGMA schema_version").fetchone()[0])
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return None
+
+
+def _read_project_info(path: str) -> Optional[Tuple[str, Optional[str]]]:
+    # (title, created_at). 프로젝트 파일이 아니거나 읽을 수 없으면 None
+    try:
+        conn = sqlite3.connect(f"{Path(path).as_uri()}?mode=ro", uri=True, timeout=0.5)
+        try:
+            row = conn.execute("SELECT title, created_at FROM Project_Info WHERE id=1").fetchone()
+            return (row[0] or "", row[1]) if row else None
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return None
+
+
+def _is_project_file(path: str) -> bool:
+    try:
+        conn = sqlite3.connect(f"{Path(path).as_uri()}?mode=ro", uri=True, timeout=0.5)
+        try:
+            return conn.execute("SELECT 1 FROM sqlite_master WHERE name='Project_Info'").fetchone() is not None
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return False
+
+
+def check_file(project: LibraryProject) -> FileCheck:
+    """프로젝트 파일 하나의 상태. 앱 밖에서 크기/수정 시각/스키마 버전이 바뀌었으면 'changed'."""
+    path = project.project_path
+    try:
+        st = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return FileCheck(path, "missing")
+    except OSError:
+        # 권한 없음, 네트워크 오류 등: 파일이 없다고 단정하지 않는다
+        return FileCheck(path, "unreachable")
+    touched = project.file_size is not None and (
+        st.st_size != project.file_size or abs(st.st_mtime - (project.file_mtime or 0.0)) > 1e-3
+    )
+    # 파일을 열어 보는 것은 크기/시각이 바뀌었거나 아직 버전을 모를 때만(느린 드라이브에서 매번 열지 않도록)
+    db_version = _read_db_version(path) if touched or project.db_version is None else None
+    schema_changed = db_version is not None and project.db_version is not None and db_version != project.db_version
+    changed = touched or schema_changed
+    # 지난 검사 뒤 앱에서 연 적이 있으면 바뀐 것은 우리 편집/스키마 업그레이드다(둘 다 SQLite datetime 문자열)
+    if changed and project.last_opened_at and project.checked_at and project.last_opened_at >= project.checked_at:
+        changed = False
+    return FileCheck(path, "changed" if changed else "ok", st.st_size, st.st_mtime, db_version)
+
+
+class LibraryScanService:
+    """라이브러리에 등록된 프로젝트 파일을 동시에 stat해 이동/삭제/변경 여부를 library.sqlite에 기록한다.
+
+    끊긴 네트워크 드라이브의 stat은 몇 분씩 멈출 수 있으므로 데몬 스레드에서 돌리고,
+    timeout 안에 답이 없는 항목은 'unreachable'로 두고 바로 돌아온다(멈춘 스레드는 앱 종료를 막지 않는다).
+    """
+
+    def __init__(self, repo: LibraryRepository | None = None, workers: int = 16) -> None:
+        self._repo = repo or LibraryRepository()
+        self._workers = max(1, workers)
+
+    def scan(
+        self,
+        projects: Optional[Iterable[LibraryProject]] = None,
+        timeout: float = 3.0,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Dict[str, FileCheck]:
+        """검사 결과 {project_path: FileCheck}를 돌려주고 라이브러리 DB에 기록한다."""
+        projects = list(projects if projects is not None else self._repo.list_projects(include_archived=True))
+        checks = self._check_all(projects, timeout, progress)
+        self._repo.update_file_states(
+            (c.state, c.size, c.mtime, c.db_version, c.project_path) for c in checks.values()
+        )
+        return checks
+
+    def _check_all(
+        self, projects: List[LibraryProject], timeout: float, progress: Optional[ProgressCallback]
+    ) -> Dict[str, FileCheck]:
+        jobs: "queue.Queue[LibraryProject]" = queue.Queue()
+        for p in projects:
+            jobs.put(p)
+        results: "queue.Queue[FileCheck]" = queue.Queue()
+        busy: Dict[int, float] = {}
+        lock = threading.Lock()
+
+        def worker() -> None:
+            me = threading.get_ident()
+            while True:
+                try:
+                    project = jobs.get_nowait()
+                except queue.Empty:
+                    return
+                with lock:
+                    busy[me] = time.monotonic()
+                try:
+                    results.put(check_file(project))
+                finally:
+                    with lock:
+                        busy.pop(me, None)
+
+        threads = 0
+
+        def spawn() -> None:
+            nonlocal threads
+            threading.Thread(target=worker, name=f"library-scan-{threads}", daemon=True).start()
+            threads += 1
+
+        for _ in range(min(self._workers, len(projects))):
+            spawn()
+        checks: Dict[str, FileCheck] = {}
+        deadline = time.monotonic() + timeout
+        while len(checks) < len(projects):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                check = results.get(timeout=min(remaining, _STALL_SEC))
+            except queue.Empty:
+                # 모든 작업 스레드가 응답 없는 파일에 묶였으면 남은 파일을 위해 하나 더 띄운다
+                now = time.monotonic()
+                with lock:
+                    stalled = sum(1 for started in busy.values() if now - started > _STALL_SEC)
+                if not jobs.empty() and stalled >= threads and threads < _MAX_THREADS:
+                    spawn()
+                continue
+            checks[check.project_path] = check
+            if progress:
+                progress(len(checks), len(projects), check.project_path)
+        # 시간 안에 못 끝낸 항목: 대기열을 비워 스레드가 더 가져가지 않게 하고 'unreachable'로 둔다
+        while True:
+            try:
+                jobs.get_nowait()
+            except queue.Empty:
+                break
+        for p in projects:
+            checks.setdefault(p.project_path, FileCheck(p.project_path, "unreachable"))
+        return checks
+
+    # ---- 이동된 파일 다시 찾기 ----
+
+    def search_roots(self, project_path: str) -> List[str]:
+        # 설정된 폴더 + 원래 위치에서 가장 가까운 남아 있는 상위 폴더와 그 부모
+        roots = list(self._repo.list_roots())
+        parent = Path(project_path).parent
+        while parent != parent.parent and not parent.is_dir():
+            parent = parent.parent
+        for candidate in (parent, parent.parent):
+            if str(candidate) not in roots and candidate.is_dir():
+                roots.append(str(candidate))
+        return roots
+
+    def rediscover(
+        self,
+        project: LibraryProject,
+        roots: Optional[List[str]] = None,
+        max_depth: int = 4,
+        timeout: float = 10.0,
+        registered: Optional[Iterable[str]] = None,
+    ) -> List[str]:
+        """같은 파일 이름의 프로젝트 파일을 roots 아래에서 찾는다. 확실한 후보(is_same_project)가 앞에 온다.
+
+        이미 라이브러리에 등록된 경로(registered, 생략하면 라이브러리에서 읽음)는 다른 프로젝트이므로 뺀다.
+        """
+        name = os.path.basename(project.project_path)
+        if registered is None:
+            registered = (p.project_path for p in self._repo.list_projects(include_archived=True))
+        skip = set(registered) | {project.project_path}
+        deadline = time.monotonic() + timeout
+        found: List[str] = []
+        seen = set()
+        for root in roots or self.search_roots(project.project_path):
+            pending = deque([(root, 0)])
+            while pending and time.monotonic() < deadline:
+                folder, depth = pending.popleft()
+                try:
+                    with os.scandir(folder) as entries:
+                        for entry in entries:
+                            if entry.name.startswith(".") or entry.name in _SKIP_DIRS:
+                                continue
+                            if entry.is_dir(follow_symlinks=False):
+                                if depth < max_depth:
+                                    pending.append((entry.path, depth + 1))
+                            elif entry.name == name and entry.path not in seen:
+                                seen.add(entry.path)
+                                path = os.path.abspath(entry.path)
+                                if path not in skip and _is_project_file(path):
+                                    found.append(path)
+                except OSError:
+                    continue
+        return sorted(found, key=lambda path: not self.is_same_project(project, path))
+
+    def is_same_project(self, project: LibraryProject, candidate: str) -> bool:
+        """후보 파일이 옮겨진 그 프로젝트라고 볼 근거가 있는지: 크기가 같거나 Project_Info(제목/생성 시각)가 같다.
+
+        이름만 같은 후보는 자동으로 다시 연결하지 않는다.
+        """
+        try:
+            if project.file_size is not None and os.path.getsize(candidate) == project.file_size:
+                return True
+        except OSError:
+            return False
+        info = _read_project_info(candidate)
+        if info is None:
+            return False
+        title, created_at = info
+        return (bool(title) and title == project.title) or (bool(created_at) and created_at == project.created_at)
+
+    def relocate(self, old_path: str, new_path: str) -> None:
+        new_path = os.path.abspath(new_path)
+        self._repo.relocate(old_path, new_path)
+        # 다음에 비슷하게 옮겨진 프로젝트도 찾을 수 있도록 새 위치의 상위 폴더를 검색 폴더로 기억
+        self._repo.add_root(os.path.dirname(os.path.dirname(new_path)))
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+from ..repository.asset_repository import AssetRepository
+from ..repository.content_codec import COMPRESS_THRESHOLD, recompress_table
+from ..utils import sql_trace
+from ..utils.process_pool import new_process_pool
+from ..utils.project_paths import get_project_dirs
+from .asset_import_service import file_sha256, make_thumbnail
+
+
+@dataclass
+class VerifyReport:
+    db_path: str
+    problems: List[str] = field(default_factory=list)
+    checked_assets: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return not self.problems
+
+
+class MaintenanceService:
+    """프로젝트 파일 정비: VACUUM, 무결성 검사, 에셋 썸네일 재생성, 본문 압축, 검색 색인.
+
+    GUI 없이(CLI, 야간 작업) 쓰는 용도라 Qt에 의존하지 않는다.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        self._db_path = os.path.abspath(db_path)
+        self._base_dir = os.path.dirname(self._db_path)
+
+    def vacuum(self) -> Tuple[int, int]:
+        # 반환: (이전 크기, 이후 크기) 바이트
+        before = os.path.getsize(self._db_path)
+        conn = sql_trace.connect(self._db_path)
+        try:
+            conn.execute("PRAGMA optimize")
+            conn.execute("VACUUM")
+        finally:
+            conn.close()
+        return before, os.path.getsize(self._db_path)
+
+    def compress_content(self, method: str = "zlib", threshold: int = COMPRESS_THRESHOLD) -> Tuple[int, int, int]:
+        """문서/보드 본문을 method로 다시 저장한다. (바꾼 행 수, 이전 바이트, 이후 바이트)
+
+        'plain'을 주면 압축을 모두 푼다. 줄어든 페이지를 파일에서 돌려받으려면 이후 vacuum()을 호출한다.
+        """
+        from ..repository.audio_repository import AudioRepository
+        from ..repository.cinematic_repository import CinematicRepository
+        from ..repository.document_repository import DocumentRepository
+
+        # 리포지토리 생성 시 테이블/encoding 컬럼 업그레이드가 먼저 끝난다
+        for repo_cls in (DocumentRepository, AudioRepository, CinematicRepository):
+            repo_cls(self._db_path)
+        totals = [0, 0, 0]
+        conn = sql_trace.connect(self._db_path)
+        try:
+            with conn:
+                for table, key_column in (("Documents", "key"), ("AudioBoard", "id"), ("CinematicBoard", "id")):
+                    for i, value in enumerate(recompress_table(conn, table, key_column, method, threshold)):
+                        totals[i] += value
+        finally:
+            conn.close()
+        return totals[0], totals[1], totals[2]
+
+    def rebuild_search_index(self) -> int:
+        """전문 검색 색인을 처음부터 다시 만든다. 색인한 항목 수를 돌려준다."""
+        from ..repository.document_repository import DocumentRepository
+        from ..repository.search_index_repository import SearchIndexRepository
+
+        # 문서 테이블 업그레이드(encoding 컬럼)가 끝난 뒤에 색인해야 본문을 풀 수 있다
+        DocumentRepository(self._db_path)
+        return SearchIndexRepository(self._db_path).rebuild()
+
+    def verify(self, deep: bool = False, workers: Optional[int] = None) -> VerifyReport:
+        """DB 무결성, 참조 무결성, 에셋 파일 존재 여부를 확인한다.
+
+        deep=True면 전체 integrity_check와 에셋 sha256 재계산까지 한다(스레드 풀, hashlib은 GIL을 놓는다).
+        """
+        report = VerifyReport(self._db_path)
+        uri = Path(self._db_path).as_uri() + "?mode=ro"
+        try:
+            conn = sql_trace.connect(uri, uri=True)
+        except sqlite3.Error as e:
+            report.problems.append(f"열 수 없음: {e}")
+            return report
+        try:
+            pragma = "integrity_check" if deep else "quick_check"
+            rows = conn.execute(f"PRAGMA {pragma}").fetchall()
+            if [r[0] for r in rows] != ["ok"]:
+                report.problems.extend(f"{pragma}: {r[0]}" for r in rows)
+            for table, rowid, parent, _ in conn.execute("PRAGMA foreign_key_check").fetchall():
+                report.problems.append(f"외래 키 위반: {table} rowid={rowid} -> {parent}")
+            for table, column in (("Shots", "storyboard_asset_id"), ("Characters", "image_asset_id")):
+                missing = conn.execute(
+                    f"SELECT t.id, t.{column} FROM {table} t LEFT JOIN Assets a ON a.id = t.{column} "
+                    f"WHERE t.{column} IS NOT NULL AND a.id IS NULL"
+                ).fetchall()
+                for row_id, asset_id in missing:
+                    report.problems.append(f"{table} id={row_id}: 없는 에셋 id={asset_id}")
+            assets = conn.execute("SELECT id, project_path, thumbnail_path, hash_sha256 FROM Assets").fetchall()
+        except sqlite3.Error as e:
+            report.problems.append(f"검사 실패: {e}")
+            return report
+        finally:
+            conn.close()
+
+        report.checked_assets = len(assets)
+        to_hash = []
+        for asset_id, project_path, thumbnail_path, sha in assets:
+            path = os.path.join(self._base_dir, project_path or "")
+            if not project_path or not os.path.isfile(path):
+                report.problems.append(f"에셋 id={asset_id}: 파일 없음 ({project_path})")
+                continue
+            if thumbnail_path and not os.path.isfile(os.path.join(self._base_dir, thumbnail_path)):
+                report.problems.append(f"에셋 id={asset_id}: 썸네일 없음 ({thumbnail_path})")
+            if deep and sha:
+                to_hash.append((asset_id, path, sha))
+        if to_hash:
+            with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+                digests = pool.map(lambda item: file_sha256(item[1]), to_hash)
+                for (asset_id, path, sha), digest in zip(to_hash, digests):
+                    if digest != sha:
+                        report.problems.append(f"에셋 id={asset_id}: 해시 불일치 ({os.path.basename(path)})")
+        return report
+
+    def rebuild_thumbnails(
+        self,
+        force: bool = False,
+        workers: Optional[int] = None,
+        progress: Optional[Callable[[int, int, str], None]] = None,
+    ) -> int:
+        """없는(force=True면 모든) 에셋 썸네일을 프로세스 풀에서 다시 만든다. 만든 개수를 돌려준다."""
+        repo = AssetRepository(self._db_path)
+        _, thumbs_dir = get_project_dirs(self._db_path)
+        jobs = []
+        for asset in repo.list_all():
+            if asset.kind != "image" or not asset.project_path:
+                continue
+            src = os.path.join(self._base_dir, asset.project_path)
+            if not os.path.isfile(src):
+                continue
+            current = os.path.join(self._base_dir, asset.thumbnail_path) if asset.thumbnail_path else None
+            if not force and current and os.path.isfile(current):
+                continue
+            thumb = os.path.join(thumbs_dir, f"{asset.hash_sha256}_thumb.jpg")
+            jobs.append((asset, src, thumb))
+        if not jobs:
+            return 0
+        built = 0
+        with new_process_pool(min(workers or os.cpu_count() or 1, len(jobs))) as pool:
+            futures = [pool.submit(make_thumbnail, src, thumb) for _, src, thumb in jobs]
+            for done, ((asset, src, thumb), future) in enumerate(zip(jobs, futures), start=1):
+                try:
+                    future.result()
+                except Exception as e:
+                    message = f"{asset.filename}: {e}"
+                else:
+                    built += 1
+                    message = asset.filename
+                    rel = os.path.relpath(thumb, self._base_dir)
+                    if rel != asset.thumbnail_path:
+                        repo.set_thumbnail_path(int(asset.id or 0), rel)
+                if progress:
+                    progress(done, len(jobs), message)
+        return built
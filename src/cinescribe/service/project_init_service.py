@@ -4,6 +4,8 @@ import os
 import sqlite3
 from typing import Optional
 
+from ..repository.search_index_repository import SearchIndexRepository
+
 
 class ProjectInitService:
     def create_new_project(self, db_path: str, title: Optional[str] = None) -> None:
@@ -108,6 +110,7 @@ class ProjectInitService:
                   key TEXT NOT NULL UNIQUE,
                   format TEXT NOT NULL CHECK (format IN ('json','text')),
                   content TEXT NOT NULL,
+                  encoding TEXT NOT NULL DEFAULT 'plain',
                   updated_at TEXT DEFAULT (datetime('now'))
                 );
                 CREATE INDEX IF NOT EXISTS idx_documents_key ON Documents(key);
@@ -121,5 +124,7 @@ class ProjectInitService:
                 (title,),
             )
             conn.commit()
+        # 전문 검색 색인과 갱신 트리거(이후 샷/장면/캐릭터 변경은 자동 반영)
+        SearchIndexRepository(db_path)
 
 
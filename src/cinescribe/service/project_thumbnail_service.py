@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from PIL import Image
+
+from ..repository.library_repository import LibraryProject, LibraryRepository
+from ..utils.paths import get_library_thumbnails_dir
+
+
+class ProjectThumbnailService:
+    """라이브러리 카드용 프로젝트 썸네일을 만든다.
+
+    각 프로젝트의 앞쪽 스토리보드 프레임(에셋 썸네일)을 2x2로 합성한 JPEG를 앱 데이터 폴더에 저장하고,
+    그 경로를 library.sqlite의 projects.thumbnail에 기록한다.
+    """
+
+    SIZE = (320, 180)
+    FRAMES = 4
+
+    def __init__(self, repo: LibraryRepository | None = None) -> None:
+        self._repo = repo or LibraryRepository()
+        self._out_dir = get_library_thumbnails_dir()
+
+    def refresh_stale(self, projects: Iterable[LibraryProject]) -> Dict[str, Optional[str]]:
+        # 썸네일이 없거나 프로젝트 파일보다 오래된 항목만 다시 만든다. 프레임이 없어 실패한 프로젝트는
+        # 파일이 바뀔 때까지 건너뛴다. 반환: 변경된 {project_path: thumbnail}
+        updated: Dict[str, Optional[str]] = {}
+        for p in projects:
+            try:
+                project_mtime = os.path.getmtime(p.project_path)
+            except OSError:
+                continue
+            out_path = self.thumbnail_path_for(p.project_path)
+            if p.thumbnail == out_path and os.path.exists(out_path) and os.path.getmtime(out_path) >= project_mtime:
+                continue
+            if p.thumbnail is None and p.thumbnail_probed_mtime == project_mtime:
+                # 지난번에 만들 프레임이 없었고 그 뒤로 파일이 바뀌지 않았다
+                continue
+            thumb = out_path if self.render(p.project_path, out_path) else None
+            self._repo.set_thumbnail(p.project_path, thumb, project_mtime)
+            updated[p.project_path] = thumb
+        return updated
+
+    def thumbnail_path_for(self, project_path: str) -> str:
+        digest = hashlib.sha1(os.path.abspath(project_path).encode("utf-8")).hexdigest()
+        return os.path.join(self._out_dir, f"{digest}.jpg")
+
+    def render(self, project_path: str, out_path: str) -> bool:
+        frames = self._first_frames(project_path)
+        if not frames:
+            return False
+        w, h = self.SIZE
+        canvas = Image.new("RGB", (w, h), (32, 32, 32))
+        # 프레임 수에 따라 1칸 또는 2x2 그리드
+        cols, rows = (1, 1) if len(frames) == 1 else (2, 2)
+        cell_w, cell_h = w // cols, h // rows
+        pasted = 0
+        for i, frame_path in enumerate(frames[: cols * rows]):
+            try:
+                with Image.open(frame_path) as im:
+                    im.draft("RGB", (cell_w, cell_h))
+                    im = im.convert("RGB")
+                    im.thumbnail((cell_w, cell_h))
+                    x = (i % cols) * cell_w + (cell_w - im.width) // 2
+                    y = (i // cols) * cell_h + (cell_h - im.height) // 2
+                    canvas.paste(im, (x, y))
+                    pasted += 1
+            except Exception:
+                continue
+        if not pasted:
+            # 프레임을 하나도 읽지 못했으면 빈 합성 이미지를 썸네일로 저장하지 않는다
+            return False
+        canvas.save(out_path, "JPEG", quality=80)
+        return True
+
+    def _first_frames(self, project_path: str) -> List[str]:
+        project_dir = os.path.dirname(os.path.abspath(project_path))
+        # 읽기 전용으로 열어 라이브러리 스캔이 프로젝트 파일을 수정하지 않도록 한다
+        uri = Path(os.path.abspath(project_path)).as_uri() + "?mode=ro"
+        try:
+            conn = sqlite3.connect(uri, uri=True)
+        except sqlite3.Error:
+            return []
+        try:
+            rows = conn.execute(
+                """
+                SELECT COALESCE(a.thumbnail_path, a.project_path)
+                  FROM Shots s
+                  JOIN Scenes sc ON sc.id = s.scene_id
+                  JOIN Assets a ON a.id = s.storyboard_asset_id
+                 ORDER BY sc.sort_index ASC, sc.id ASC, s.sort_index ASC, s.id ASC
+                 LIMIT ?
+                """,
+                (self.FRAMES,),
+            ).fetchall()
+        except sqlite3.Error:
+            return []
+        finally:
+            conn.close()
+        frames = []
+        for (rel,) in rows:
+            if rel:
+                path = os.path.join(project_dir, rel)
+                if os.path.exists(path):
+                    frames.append(path)
+        return frames
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..utils.paths import get_session_path
+
+
+@dataclass
+class SessionState:
+    project_path: Optional[str] = None
+    tab: Optional[str] = None
+    # 뷰 키 -> 뷰가 돌려준 상태(장면, 스크롤 위치, 보이던 썸네일 에셋 id 등)
+    views: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    saved_at: Optional[str] = None
+    # 저메모리 모드(이미지 예산 축소)를 켜 두었는지
+    low_memory: bool = False
+
+
+class SessionService:
+    """마지막 작업 상태를 JSON 파일로 저장/복원하고, 복원 전에 프로젝트 파일을 예열한다."""
+
+    VERSION = 1
+    # 예열 시 페이지를 미리 읽어 둘 테이블(없는 테이블은 건너뜀)
+    _WARM_TABLES = ("Project_Info", "Scenes", "Shots", "FinalImages", "Characters", "Assets", "Documents")
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self._path = path or get_session_path()
+
+    def load(self) -> Optional[SessionState]:
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != self.VERSION:
+            return None
+        views = data.get("views")
+        return SessionState(
+            project_path=data.get("project_path"),
+            tab=data.get("tab"),
+            views=views if isinstance(views, dict) else {},
+            saved_at=data.get("saved_at"),
+            low_memory=bool(data.get("low_memory")),
+        )
+
+    def save(self, state: SessionState) -> None:
+        state.saved_at = time.strftime("%Y-%m-%dT%H:%M:%S")
+        data = {"version": self.VERSION, **asdict(state)}
+        # 저장 중 종료되어도 이전 스냅샷이 깨지지 않도록 임시 파일에 쓴 뒤 교체
+        tmp_path = f"{self._path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, self._path)
+
+    def clear(self) -> None:
+        try:
+            os.remove(self._path)
+        except FileNotFoundError:
+            pass
+
+    def is_project_file(self, db_path: str) -> bool:
+        """읽기 전용으로 열리고 Project_Info 테이블이 있는 SQLite 파일인지(세션 복원 전 확인)."""
+        if not os.path.isfile(db_path):
+            return False
+        try:
+            conn = self._connect_ro(db_path)
+            try:
+                return conn.execute("SELECT 1 FROM sqlite_master WHERE name='Project_Info'").fetchone() is not None
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return False
+
+    def prewarm(self, db_path: str) -> None:
+        """프로젝트 DB의 스키마와 주요 테이블 페이지를 OS 캐시에 올린다. 백그라운드 스레드에서 호출한다."""
+        conn = self._connect_ro(db_path)
+        try:
+            tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+            for table in self._WARM_TABLES:
+                if table in tables:
+                    conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()
+        finally:
+            conn.close()
+
+    def thumbnail_paths(self, db_path: str, asset_ids: Iterable[int]) -> List[Tuple[str, Optional[str]]]:
+        """asset_ids의 (썸네일, 원본 폴백) 절대 경로를 입력 순서대로 돌려준다(기본 키 조회라 빠르다)."""
+        ids = [int(i) for i in asset_ids]
+        if not ids:
+            return []
+        conn = self._connect_ro(db_path)
+        try:
+            placeholders = ",".join("?" * len(ids))
+            rows = conn.execute(
+                f"SELECT id, thumbnail_path, project_path FROM Assets WHERE id IN ({placeholders})", ids
+            ).fetchall()
+        except sqlite3.Error:
+            return []
+        finally:
+            conn.close()
+        project_dir = os.path.dirname(os.path.abspath(db_path))
+        by_id = {row[0]: row for row in rows}
+        paths: List[Tuple[str, Optional[str]]] = []
+        # 화면에 보이던 순서대로 디코딩하도록 입력 순서를 유지
+        for asset_id in ids:
+            row = by_id.get(asset_id)
+            if not row:
+                continue
+            thumb = os.path.join(project_dir, row[1]) if row[1] else None
+            original = os.path.join(project_dir, row[2]) if row[2] else None
+            if thumb:
+                paths.append((thumb, original))
+            elif original:
+                paths.append((original, None))
+        return paths
+
+    def _connect_ro(self, db_path: str) -> sqlite3.Connection:
+        uri = Path(os.path.abspath(db_path)).as_uri() + "?mode=ro"
+        return sqlite3.connect(uri, uri=True)
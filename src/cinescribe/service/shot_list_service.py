@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import csv
+import json
+import os
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+
+from ..repository.scene_shot_repository import SHOT_LIST_COLUMNS, SceneShotRepository
+
+ProgressCallback = Callable[[int, int, str], None]
+
+FORMATS = ("csv", "jsonl")
+# 진행 콜백 간격(행)
+_PROGRESS_EVERY = 5000
+
+
+class ShotListService:
+    """장면/샷/에셋을 제작용 샷 리스트(CSV 또는 JSONL)로 내보낸다.
+
+    리포지토리 커서 → 생성기 → 파일로 한 행씩 흘려 쓰므로 샷이 십만 개여도 메모리는 일정하다.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        self._repo = SceneShotRepository(db_path)
+
+    @staticmethod
+    def format_for(out_path: str) -> str:
+        ext = os.path.splitext(out_path)[1].lower().lstrip(".")
+        if ext in FORMATS:
+            return ext
+        raise ValueError("출력 파일은 .csv 또는 .jsonl이어야 합니다.")
+
+    def export(self, out_path: str, format: Optional[str] = None, progress: Optional[ProgressCallback] = None) -> int:
+        """out_path에 샷 리스트를 쓰고 행 수를 돌려준다. 형식은 지정하지 않으면 확장자로 고른다."""
+        format = format or self.format_for(out_path)
+        if format not in FORMATS:
+            raise ValueError(f"알 수 없는 형식: {format}")
+        total = self._repo.count_shots() if progress else 0
+        self._written = 0
+        rows = self._counted(self._repo.iter_shot_list(), total, progress)
+        tmp_path = f"{out_path}.part"
+        try:
+            # CSV는 엑셀에서 한글이 깨지지 않도록 BOM을 붙인다
+            with open(tmp_path, "w", encoding="utf-8-sig" if format == "csv" else "utf-8", newline="") as f:
+                if format == "csv":
+                    writer = csv.writer(f)
+                    writer.writerow(SHOT_LIST_COLUMNS)
+                    writer.writerows(rows)
+                else:
+                    f.writelines(self.iter_jsonl(rows))
+            os.replace(tmp_path, out_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        return self._written
+
+    @staticmethod
+    def iter_jsonl(rows: Iterable[Tuple[Any, ...]]) -> Iterator[str]:
+        dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+        for row in rows:
+            yield dumps(dict(zip(SHOT_LIST_COLUMNS, row))) + "\n"
+
+    def _counted(
+        self, rows: Iterable[Tuple[Any, ...]], total: int, progress: Optional[ProgressCallback]
+    ) -> Iterator[Tuple[Any, ...]]:
+        for row in rows:
+            self._written += 1
+            if progress and self._written % _PROGRESS_EVERY == 0:
+                progress(self._written, total, f"{self._written}/{total} 샷")
+            yield row
+        if progress:
+            progress(self._written, total, f"{self._written}/{total} 샷")
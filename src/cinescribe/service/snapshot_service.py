@@ -0,0 +1,386 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..utils.paths import get_snapshots_dir
+from ..utils.project_paths import get_project_dirs
+from .library_service import LibraryService
+
+# (처리한 바이트, 전체 바이트, 현재 항목 이름)
+ProgressCallback = Callable[[int, int, str], None]
+
+SNAPSHOT_VERSION = 1
+_CHUNK = 1024 * 1024
+# 방금 쓴 blob이 아직 매니페스트에 오르기 전일 수 있으므로, 이보다 새 blob은 정리하지 않는다
+_GC_GRACE_SEC = 3600
+
+
+class SnapshotError(Exception):
+    pass
+
+
+@dataclass
+class SnapshotInfo:
+    id: str
+    created_at: str
+    label: Optional[str]
+    db_name: str
+    files: int
+    total_bytes: int
+    # 이 스냅샷에서 새로 저장소에 쓴 바이트(중복 제거 후)
+    new_bytes: int
+
+
+class SnapshotService:
+    """프로젝트의 증분 스냅샷을 만들고 보존 정책에 따라 정리하며, 원하는 시점으로 복원한다.
+
+    저장소 구조(~/.cinescribe/snapshots/<stem>-<경로 해시>/):
+      blobs/ab/<sha256>      DB 스냅샷과 에셋 파일 내용(내용 주소, 한 번만 저장)
+      manifests/<id>.json    스냅샷별 DB blob + 에셋 상대 경로 -> sha256 목록
+      index.json             (크기, mtime) 캐시 - 바뀌지 않은 파일은 다시 해시하지 않는다
+    """
+
+    def __init__(self, root: Optional[str] = None, library: LibraryService | None = None) -> None:
+        self._root = Path(root or get_snapshots_dir())
+        self._library = library
+        self._lock = threading.Lock()
+
+    def store_dir(self, db_path: str) -> Path:
+        abs_path = os.path.abspath(db_path)
+        key = hashlib.sha1(os.path.normcase(abs_path).encode("utf-8")).hexdigest()[:12]
+        return self._root / f"{Path(abs_path).stem}-{key}"
+
+    def create_snapshot(
+        self,
+        db_path: str,
+        label: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+        pages: int = 256,
+        sleep: float = 0.005,
+        skip_unchanged: bool = True,
+    ) -> Optional[SnapshotInfo]:
+        """스냅샷을 만들고 정보를 돌려준다. 직전 스냅샷과 내용이 같으면 None.
+
+        DB는 backup API로 pages 단위씩 복사하고 단계 사이에 sleep만큼 쉬어,
+        편집 중인 앱의 쓰기가 오래 막히지 않게 한다. 백그라운드 스레드에서 호출한다.
+        """
+        db_path = os.path.abspath(db_path)
+        if not os.path.isfile(db_path):
+            raise SnapshotError(f"프로젝트 파일이 없습니다: {db_path}")
+        with self._lock:
+            store = self.store_dir(db_path)
+            (store / "manifests").mkdir(parents=True, exist_ok=True)
+            base_dir = os.path.dirname(db_path)
+            assets_dir, _ = get_project_dirs(db_path)
+
+            db_sha, db_size, new_bytes = self._backup_db(store, db_path, pages, sleep, progress)
+            index = self._load_index(store)
+            files: Dict[str, List] = {}
+            entries = self._asset_entries(assets_dir, base_dir)
+            total = sum(size for _, _, size, _ in entries)
+            done = 0
+            for abs_path, rel, size, mtime_ns in entries:
+                cached = index.get(rel)
+                sha = cached[2] if cached and cached[0] == size and cached[1] == mtime_ns else None
+                if sha is None or not self._blob_path(store, sha).exists():
+                    # 새 파일/바뀐 파일만 읽는다(해시와 복사를 한 번에)
+                    try:
+                        sha, written = self._put_file(store, abs_path)
+                    except FileNotFoundError:
+                        continue
+                    new_bytes += written
+                    index[rel] = [size, mtime_ns, sha]
+                files[rel] = [sha, size]
+                done += size
+                if progress:
+                    progress(done, total, rel)
+            # 사라진 파일의 캐시 항목은 버린다
+            self._save_index(store, {rel: index[rel] for rel in files})
+
+            latest = self._latest_manifest(store)
+            if skip_unchanged and latest and latest.get("db_blob") == db_sha and latest.get("files") == files:
+                return None
+
+            snapshot_id = self._new_id(store)
+            manifest = {
+                "version": SNAPSHOT_VERSION,
+                "id": snapshot_id,
+                "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "label": label,
+                "source_path": db_path,
+                "db_name": os.path.basename(db_path),
+                "assets_dir": os.path.basename(assets_dir),
+                "db_blob": db_sha,
+                "db_size": db_size,
+                "files": files,
+                "new_bytes": new_bytes,
+            }
+            self._write_json(store / "manifests" / f"{snapshot_id}.json", manifest)
+            return self._info(manifest)
+
+    def list_snapshots(self, db_path: str) -> List[SnapshotInfo]:
+        # 최신 스냅샷이 먼저
+        return [self._info(m) for m in self._manifests(self.store_dir(db_path))]
+
+    def restore(self, db_path: str, snapshot_id: str, dest_dir: str, register: bool = True) -> str:
+        """스냅샷을 dest_dir/<프로젝트 이름>/ 아래 새 프로젝트로 풀고 DB 경로를 돌려준다.
+
+        현재 프로젝트를 덮어쓰지 않으므로 복원 결과를 확인한 뒤 옮겨 쓰면 된다.
+        """
+        store = self.store_dir(db_path)
+        manifest = self._read_manifest(store, snapshot_id)
+        target_dir = self._unique_dir(Path(dest_dir) / Path(manifest["db_name"]).stem)
+        target_dir.mkdir(parents=True)
+        try:
+            assets_root = (target_dir / manifest["assets_dir"]).resolve()
+            for rel, (sha, _) in manifest["files"].items():
+                out = assets_root / Path(rel)
+                if assets_root not in out.resolve().parents:
+                    raise SnapshotError(f"잘못된 경로: {rel}")
+                out.parent.mkdir(parents=True, exist_ok=True)
+                self._copy_blob(store, sha, out)
+            # DB는 마지막에 넣어, 복원이 중간에 실패하면 열 수 있는 프로젝트가 남지 않게 한다
+            db_path_out = target_dir / manifest["db_name"]
+            self._copy_blob(store, manifest["db_blob"], db_path_out)
+        except BaseException:
+            shutil.rmtree(target_dir, ignore_errors=True)
+            raise
+        if register:
+            library = self._library or LibraryService()
+            library.register_project(str(db_path_out))
+        return str(db_path_out)
+
+    def restore_blob(self, db_path: str, sha: str, out_path: str) -> bool:
+        """스냅샷에 저장된 내용 sha256을 out_path에 복원한다(에셋 하나 복구용). 스냅샷에 없으면 False.
+
+        임시 파일에 풀며 해시를 확인한 뒤 교체하므로 실패해도 기존 파일은 그대로다.
+        """
+        store = self.store_dir(db_path)
+        if not self._blob_path(store, sha).exists():
+            return False
+        tmp_path = Path(f"{out_path}.{uuid.uuid4().hex}.tmp")
+        try:
+            self._copy_blob(store, sha, tmp_path)
+            os.replace(tmp_path, out_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        return True
+
+    def prune(self, db_path: str, keep_last: int = 24, keep_daily: int = 14) -> Tuple[List[str], int]:
+        """보존 정책 밖의 스냅샷과 더 이상 참조되지 않는 blob을 지운다.
+
+        최근 keep_last개는 모두, 그 이전은 최근 keep_daily일 동안 하루 마지막 스냅샷만 남긴다.
+        (지운 스냅샷 id 목록, 확보한 바이트)를 돌려준다.
+        """
+        store = self.store_dir(db_path)
+        with self._lock:
+            manifests = self._manifests(store)
+            keep = {m["id"] for m in manifests[:keep_last]}
+            days: List[str] = []
+            for m in manifests:
+                day = m["created_at"][:10]
+                if day in days:
+                    continue
+                days.append(day)
+                if len(days) > keep_daily:
+                    break
+                keep.add(m["id"])
+            removed = [m["id"] for m in manifests if m["id"] not in keep]
+            for snapshot_id in removed:
+                os.remove(store / "manifests" / f"{snapshot_id}.json")
+            return removed, self._collect_garbage(store)
+
+    # ---- 내부 구현 ----
+
+    def _backup_db(
+        self,
+        store: Path,
+        db_path: str,
+        pages: int,
+        sleep: float,
+        progress: Optional[ProgressCallback],
+    ) -> Tuple[str, int, int]:
+        tmp_path = store / f"db-{uuid.uuid4().hex}.part"
+        src = sqlite3.connect(db_path, timeout=30)
+        dst = sqlite3.connect(str(tmp_path))
+        try:
+            def on_step(status: int, remaining: int, total: int) -> None:
+                if progress:
+                    progress(total - remaining, total, "DB")
+
+            src.backup(dst, pages=pages, progress=on_step, sleep=sleep)
+        finally:
+            dst.close()
+            src.close()
+        try:
+            sha = self._file_sha256(str(tmp_path))
+            size = tmp_path.stat().st_size
+            written = self._adopt_blob(store, sha, tmp_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        return sha, size, written
+
+    def _put_file(self, store: Path, src_path: str) -> Tuple[str, int]:
+        # 저장소로 복사하면서 해시를 계산하고, 이미 있는 내용이면 임시 파일을 버린다
+        tmp_path = store / f"blob-{uuid.uuid4().hex}.part"
+        digest = hashlib.sha256()
+        try:
+            with open(src_path, "rb") as src, open(tmp_path, "wb") as dst:
+                for chunk in iter(lambda: src.read(_CHUNK), b""):
+                    digest.update(chunk)
+                    dst.write(chunk)
+            sha = digest.hexdigest()
+            return sha, self._adopt_blob(store, sha, tmp_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def _adopt_blob(self, store: Path, sha: str, tmp_path: Path) -> int:
+        blob = self._blob_path(store, sha)
+        if blob.exists():
+            return 0
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        size = tmp_path.stat().st_size
+        os.replace(tmp_path, blob)
+        return size
+
+    def _copy_blob(self, store: Path, sha: str, out: Path) -> None:
+        blob = self._blob_path(store, sha)
+        if not blob.exists():
+            raise SnapshotError(f"스냅샷 데이터가 없습니다: {sha}")
+        digest = hashlib.sha256()
+        with open(blob, "rb") as src, open(out, "wb") as dst:
+            for chunk in iter(lambda: src.read(_CHUNK), b""):
+                digest.update(chunk)
+                dst.write(chunk)
+        if digest.hexdigest() != sha:
+            raise SnapshotError(f"스냅샷 데이터가 손상되었습니다: {sha}")
+
+    def _collect_garbage(self, store: Path) -> int:
+        referenced = set()
+        for m in self._manifests(store):
+            referenced.add(m["db_blob"])
+            referenced.update(sha for sha, _ in m["files"].values())
+        freed = 0
+        cutoff = time.time() - _GC_GRACE_SEC
+        blobs_dir = store / "blobs"
+        if not blobs_dir.is_dir():
+            return 0
+        for blob in blobs_dir.glob("*/*"):
+            if blob.name in referenced:
+                continue
+            stat = blob.stat()
+            if stat.st_mtime > cutoff:
+                continue
+            blob.unlink()
+            freed += stat.st_size
+        return freed
+
+    def _asset_entries(self, assets_dir: str, base_dir: str) -> List[Tuple[str, str, int, int]]:
+        entries: List[Tuple[str, str, int, int]] = []
+        for root, _, names in os.walk(assets_dir):
+            for name in sorted(names):
+                if name.endswith(".tmp"):
+                    continue
+                abs_path = os.path.join(root, name)
+                try:
+                    stat = os.stat(abs_path)
+                except FileNotFoundError:
+                    continue
+                rel = os.path.relpath(abs_path, assets_dir).replace(os.sep, "/")
+                entries.append((abs_path, rel, stat.st_size, stat.st_mtime_ns))
+        return entries
+
+    def _manifests(self, store: Path) -> List[dict]:
+        manifests: List[dict] = []
+        for path in (store / "manifests").glob("*.json"):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if data.get("version") == SNAPSHOT_VERSION:
+                manifests.append(data)
+        manifests.sort(key=lambda m: m["id"], reverse=True)
+        return manifests
+
+    def _latest_manifest(self, store: Path) -> Optional[dict]:
+        manifests = self._manifests(store)
+        return manifests[0] if manifests else None
+
+    def _read_manifest(self, store: Path, snapshot_id: str) -> dict:
+        if not snapshot_id or "/" in snapshot_id or "\\" in snapshot_id or snapshot_id.startswith("."):
+            raise SnapshotError(f"잘못된 스냅샷 id: {snapshot_id}")
+        try:
+            with open(store / "manifests" / f"{snapshot_id}.json", "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            raise SnapshotError(f"스냅샷을 찾을 수 없습니다: {snapshot_id}")
+
+    def _load_index(self, store: Path) -> Dict[str, List]:
+        try:
+            with open(store / "index.json", "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _save_index(self, store: Path, index: Dict[str, List]) -> None:
+        self._write_json(store / "index.json", index)
+
+    def _write_json(self, path: Path, data) -> None:
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def _new_id(self, store: Path) -> str:
+        # 사전순 = 시간순이 되도록 타임스탬프 기반 id
+        base = time.strftime("%Y%m%d-%H%M%S")
+        snapshot_id = base
+        n = 1
+        while (store / "manifests" / f"{snapshot_id}.json").exists():
+            snapshot_id = f"{base}-{n:02d}"
+            n += 1
+        return snapshot_id
+
+    def _info(self, manifest: dict) -> SnapshotInfo:
+        files = manifest.get("files") or {}
+        return SnapshotInfo(
+            id=manifest["id"],
+            created_at=manifest.get("created_at", ""),
+            label=manifest.get("label"),
+            db_name=manifest.get("db_name", ""),
+            files=len(files),
+            total_bytes=int(manifest.get("db_size", 0)) + sum(size for _, size in files.values()),
+            new_bytes=int(manifest.get("new_bytes", 0)),
+        )
+
+    def _blob_path(self, store: Path, sha: str) -> Path:
+        return store / "blobs" / sha[:2] / sha
+
+    def _file_sha256(self, path: str) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(_CHUNK), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _unique_dir(self, path: Path) -> Path:
+        if not path.exists():
+            return path
+        n = 2
+        while True:
+            candidate = path.with_name(f"{path.name} ({n})")
+            if not candidate.exists():
+                return candidate
+            n += 1
@@ -3,16 +3,47 @@ ShotCanvas - Utils 패키지
 유틸리티 함수들
 """
 
-from .paths import *
-from .project_paths import *
-from .app_state import *
+from importlib import import_module
 
-__all__ = [
-    'get_app_dir',
-    'get_projects_dir',
-    'get_assets_dir',
-    'mkdir',
-    'get_project_paths',
-    'get_app_state'
-]
+# 공개 이름 -> 정의된 하위 모듈. 처음 접근할 때 import한다
+_LAZY = {
+    'get_app_data_dir': '.paths',
+    'get_library_db_path': '.paths',
+    'get_library_thumbnails_dir': '.paths',
+    'get_session_path': '.paths',
+    'get_snapshots_dir': '.paths',
+    'ensure_dir': '.paths',
+    'get_project_dirs': '.project_paths',
+    'new_process_pool': '.process_pool',
+    'set_current_project_path': '.app_state',
+    'get_current_project_path': '.app_state',
+    'require_current_project_path': '.app_state',
+    'content_hash': '.json_text',
+    'pretty_json': '.json_text',
+    'validate_json': '.json_text',
+    'StartupProfiler': '.startup_profiler',
+    'start_startup_profiler': '.startup_profiler',
+    'get_startup_profiler': '.startup_profiler',
+    'SqlTracer': '.sql_trace',
+    'start_sql_tracer': '.sql_trace',
+    'get_sql_tracer': '.sql_trace',
+    'PdfImageWriter': '.pdf_writer',
+    'ApngStreamWriter': '.animation_writer',
+    'GifStreamWriter': '.animation_writer'
+}
 
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    # 다음 접근부터는 모듈 __getattr__를 거치지 않도록 캐시
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import os
+import struct
+import zlib
+from abc import ABC, abstractmethod
+from typing import BinaryIO, List, Tuple
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _png_chunks(data: bytes) -> List[Tuple[bytes, bytes]]:
+    if not data.startswith(_PNG_SIGNATURE):
+        raise ValueError("PNG 파일이 아닙니다.")
+    chunks: List[Tuple[bytes, bytes]] = []
+    pos = len(_PNG_SIGNATURE)
+    while pos < len(data):
+        (length,) = struct.unpack(">I", data[pos:pos + 4])
+        kind = data[pos + 4:pos + 8]
+        chunks.append((kind, data[pos + 8:pos + 8 + length]))
+        pos += 12 + length
+        if kind == b"IEND":
+            break
+    return chunks
+
+
+class _StreamWriter(ABC):
+    # 임시 파일에 쓰다가 close()에서 교체하므로 중간에 실패해도 결과 파일이 깨지지 않는다
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._tmp_path = f"{path}.part"
+        self._f: BinaryIO = open(self._tmp_path, "wb")
+        self.frame_count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def close(self) -> None:
+        self._finish()
+        self._f.close()
+        os.replace(self._tmp_path, self._path)
+
+    def abort(self) -> None:
+        self._f.close()
+        try:
+            os.remove(self._tmp_path)
+        except OSError:
+            pass
+
+    @abstractmethod
+    def _finish(self) -> None:
+        # 형식별 마무리(트레일러 등)를 임시 파일에 쓴다. 파일은 close()가 닫는다
+        ...
+
+
+class ApngStreamWriter(_StreamWriter):
+    """이미 인코딩된 PNG 프레임을 이어 붙여 APNG를 만든다.
+
+    프레임 PNG의 IDAT 압축 데이터를 fdAT로 그대로 옮기므로 다시 압축하지 않고,
+    한 번에 프레임 하나만 읽는다. APNG는 acTL에 프레임 수를 먼저 적어야 하므로 미리 알려 준다.
+    모든 프레임은 같은 크기/색 형식이어야 한다.
+    """
+
+    def __init__(self, path: str, frame_count: int, loops: int = 0) -> None:
+        super().__init__(path)
+        self._total = frame_count
+        self._loops = loops
+        self._seq = 0
+        self._ihdr: bytes | None = None
+
+    def add_png(self, png_path: str, duration_ms: int) -> None:
+        with open(png_path, "rb") as f:
+            chunks = _png_chunks(f.read())
+        ihdr = next(data for kind, data in chunks if kind == b"IHDR")
+        idat = [data for kind, data in chunks if kind == b"IDAT"]
+        if self._ihdr is None:
+            self._ihdr = ihdr
+            self._f.write(_PNG_SIGNATURE)
+            self._chunk(b"IHDR", ihdr)
+            self._chunk(b"acTL", struct.pack(">II", self._total, self._loops))
+        elif ihdr != self._ihdr:
+            raise ValueError(f"프레임 형식이 첫 프레임과 다릅니다: {png_path}")
+        width, height = struct.unpack(">II", ihdr[:8])
+        # 지연은 u16 분자/분모: 65초까지는 ms 단위, 그 이상은 1/100초 단위
+        if duration_ms <= 0xFFFF:
+            delay = (max(duration_ms, 1), 1000)
+        else:
+            delay = (min(round(duration_ms / 10), 0xFFFF), 100)
+        self._chunk(b"fcTL", struct.pack(">IIIIIHHBB", self._next_seq(), width, height, 0, 0, delay[0], delay[1], 0, 0))
+        for data in idat:
+            if self.frame_count == 0:
+                self._chunk(b"IDAT", data)
+            else:
+                self._chunk(b"fdAT", struct.pack(">I", self._next_seq()) + data)
+        self.frame_count += 1
+
+    def _finish(self) -> None:
+        if self.frame_count != self._total:
+            raise ValueError(f"프레임 수가 맞지 않습니다: {self.frame_count}/{self._total}")
+        self._chunk(b"IEND", b"")
+
+    def _next_seq(self) -> int:
+        seq = self._seq
+        self._seq += 1
+        return seq
+
+    def _chunk(self, kind: bytes, data: bytes) -> None:
+        self._f.write(struct.pack(">I", len(data)) + kind + data)
+        self._f.write(struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF))
+
+
+class GifStreamWriter(_StreamWriter):
+    """이미 인코딩된 단일 프레임 GIF들을 이어 붙여 애니메이션 GIF를 만든다.
+
+    프레임마다 팔레트가 다를 수 있으므로 각 프레임의 색상표를 로컬 색상표로 옮기고,
+    LZW 데이터는 그대로 복사한다(재양자화/재압축 없음).
+    """
+
+    def __init__(self, path: str, width: int, height: int, loops: int = 0) -> None:
+        super().__init__(path)
+        self._f.write(b"GIF89a" + struct.pack("<HHBBB", width, height, 0, 0, 0))
+        # NETSCAPE2.0 반복 확장(0 = 무한 반복)
+        self._f.write(b"\x21\xff\x0bNETSCAPE2.0\x03\x01" + struct.pack("<H", loops) + b"\x00")
+
+    def add_gif(self, gif_path: str, duration_ms: int) -> None:
+        with open(gif_path, "rb") as f:
+            data = f.read()
+        if data[:3] != b"GIF":
+            raise ValueError(f"GIF 파일이 아닙니다: {gif_path}")
+        packed = data[10]
+        pos = 13
+        global_table = b""
+        if packed & 0x80:
+            size = 3 * (2 ** ((packed & 0x07) + 1))
+            global_table = data[pos:pos + size]
+            pos += size
+        # 기존 확장 블록(그래픽 제어 등)은 건너뛰고 첫 이미지 블록을 찾는다
+        while data[pos] == 0x21:
+            pos += 2
+            pos = self._skip_sub_blocks(data, pos)
+        if data[pos] != 0x2C:
+            raise ValueError(f"이미지 블록을 찾을 수 없습니다: {gif_path}")
+        descriptor = bytearray(data[pos:pos + 10])
+        pos += 10
+        local_table = b""
+        if descriptor[9] & 0x80:
+            size = 3 * (2 ** ((descriptor[9] & 0x07) + 1))
+            local_table = data[pos:pos + size]
+            pos += size
+        elif global_table:
+            descriptor[9] = (descriptor[9] & 0x40) | 0x80 | (packed & 0x07)
+            local_table = global_table
+        start = pos
+        pos = self._skip_sub_blocks(data, pos + 1)  # LZW 최소 코드 크기 1바이트 뒤부터 데이터 블록
+
+        delay_cs = min(max(round(duration_ms / 10), 1), 0xFFFF)
+        self._f.write(b"\x21\xf9\x04" + struct.pack("<BHB", 0, delay_cs, 0) + b"\x00")
+        self._f.write(bytes(descriptor) + local_table + data[start:pos])
+        self.frame_count += 1
+
+    def _finish(self) -> None:
+        self._f.write(b"\x3b")
+
+    @staticmethod
+    def _skip_sub_blocks(data: bytes, pos: int) -> int:
+        while data[pos]:
+            pos += data[pos] + 1
+        return pos + 1
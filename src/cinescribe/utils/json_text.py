@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+# 최근 렌더링 결과 캐시: (내용 해시, unwrap_text) -> 보기 좋게 정렬된 텍스트
+_PRETTY_CACHE_SIZE = 16
+_pretty_cache: "OrderedDict[Tuple[str, bool], str]" = OrderedDict()
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def pretty_json(content: str, *, unwrap_text: bool = False, digest: str | None = None) -> str:
+    """저장된 JSON 문자열을 편집기 표시용 텍스트(indent=2)로 바꾼다.
+
+    같은 내용은 해시로 캐시하므로 바뀌지 않은 보드는 다시 파싱/직렬화하지 않는다.
+    unwrap_text=True면 {"type": "text", "content": ...} 형태는 content만 돌려준다.
+    JSON이 아니면 원문을 그대로 돌려준다.
+    """
+    key = (digest or content_hash(content), unwrap_text)
+    cached = _pretty_cache.get(key)
+    if cached is not None:
+        _pretty_cache.move_to_end(key)
+        return cached
+    try:
+        data = json.loads(content)
+    except (json.JSONDecodeError, TypeError):
+        text = content
+    else:
+        if unwrap_text and isinstance(data, dict) and data.get("type") == "text":
+            text = data.get("content", "")
+        else:
+            text = json.dumps(data, ensure_ascii=False, indent=2)
+    _pretty_cache[key] = text
+    while len(_pretty_cache) > _PRETTY_CACHE_SIZE:
+        _pretty_cache.popitem(last=False)
+    return text
+
+
+def validate_json(text: str) -> Optional[Tuple[int, int, str]]:
+    """유효하면 None, 아니면 (줄, 열, 메시지)를 돌려준다. 빈 문서는 유효한 것으로 본다."""
+    if not text.strip():
+        return None
+    try:
+        json.loads(text)
+    except json.JSONDecodeError as e:
+        return e.lineno, e.colno, e.msg
+    return None
@@ -16,6 +16,25 @@ def get_library_db_path() -> str:
     return str(Path(app_dir) / "library.sqlite")
 
 
+def get_library_thumbnails_dir() -> str:
+    # 라이브러리 카드용 프로젝트 합성 썸네일 캐시
+    thumbs_dir = Path(get_app_data_dir()) / "thumbnails"
+    thumbs_dir.mkdir(parents=True, exist_ok=True)
+    return str(thumbs_dir)
+
+
+def get_session_path() -> str:
+    # 마지막 작업 상태(열린 프로젝트, 탭, 스크롤 위치 등) 스냅샷
+    return str(Path(get_app_data_dir()) / "session.json")
+
+
+def get_snapshots_dir() -> str:
+    # 프로젝트별 스냅샷 저장소(에셋 blob은 SHA-256 주소로 공유)
+    snapshots_dir = Path(get_app_data_dir()) / "snapshots"
+    snapshots_dir.mkdir(parents=True, exist_ok=True)
+    return str(snapshots_dir)
+
+
 def ensure_dir(path: str) -> None:
     Path(path).mkdir(parents=True, exist_ok=True)
 
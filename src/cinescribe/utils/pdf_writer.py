@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import os
+from typing import BinaryIO, List
+
+_CHUNK = 1024 * 1024
+
+
+class PdfImageWriter:
+    """JPEG 페이지를 한 장씩 PDF에 이어 쓰는 최소 구현.
+
+    각 페이지 이미지를 DCTDecode 스트림으로 그대로 복사하므로 다시 인코딩하지 않고,
+    메모리에는 페이지 오프셋 목록만 남는다(수천 페이지도 일정한 메모리로 기록).
+
+        with PdfImageWriter(path) as pdf:
+            pdf.add_jpeg(jpeg_path, width_px, height_px, dpi=150)
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._tmp_path = f"{path}.part"
+        self._f: BinaryIO = open(self._tmp_path, "wb")
+        self._offsets: List[int] = []
+        self._pages: List[int] = []
+        self._f.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        # 1: Catalog, 2: Pages(페이지 목록은 마지막에 기록)
+        self._reserve()
+        self._reserve()
+        self._write_object(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+
+    def __enter__(self) -> "PdfImageWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def add_jpeg(self, jpeg_path: str, width: int, height: int, dpi: int = 150) -> None:
+        # 페이지 크기(pt) = 픽셀 * 72 / dpi
+        page_w = width * 72.0 / dpi
+        page_h = height * 72.0 / dpi
+        image_id = self._reserve()
+        size = os.path.getsize(jpeg_path)
+        self._begin_object(image_id)
+        self._f.write(
+            f"<< /Type /XObject /Subtype /Image /Width {width} /Height {height} "
+            f"/ColorSpace /DeviceRGB /BitsPerComponent 8 /Filter /DCTDecode /Length {size} >>\nstream\n".encode("ascii")
+        )
+        with open(jpeg_path, "rb") as src:
+            for chunk in iter(lambda: src.read(_CHUNK), b""):
+                self._f.write(chunk)
+        self._f.write(b"\nendstream\nendobj\n")
+
+        content = f"q {page_w:.2f} 0 0 {page_h:.2f} 0 0 cm /Im0 Do Q".encode("ascii")
+        content_id = self._reserve()
+        self._write_object(content_id, b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream")
+        page_id = self._reserve()
+        self._write_object(
+            page_id,
+            (
+                f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {page_w:.2f} {page_h:.2f}] "
+                f"/Resources << /XObject << /Im0 {image_id} 0 R >> >> /Contents {content_id} 0 R >>"
+            ).encode("ascii"),
+        )
+        self._pages.append(page_id)
+
+    @property
+    def page_count(self) -> int:
+        return len(self._pages)
+
+    def close(self) -> None:
+        kids = " ".join(f"{page_id} 0 R" for page_id in self._pages)
+        self._write_object(2, f"<< /Type /Pages /Kids [{kids}] /Count {len(self._pages)} >>".encode("ascii"))
+        xref_at = self._f.tell()
+        self._f.write(f"xref\n0 {len(self._offsets) + 1}\n0000000000 65535 f \n".encode("ascii"))
+        for offset in self._offsets:
+            self._f.write(f"{offset:010d} 00000 n \n".encode("ascii"))
+        self._f.write(
+            f"trailer\n<< /Size {len(self._offsets) + 1} /Root 1 0 R >>\nstartxref\n{xref_at}\n%%EOF\n".encode("ascii")
+        )
+        self._f.close()
+        os.replace(self._tmp_path, self._path)
+
+    def abort(self) -> None:
+        self._f.close()
+        try:
+            os.remove(self._tmp_path)
+        except OSError:
+            pass
+
+    def _reserve(self) -> int:
+        self._offsets.append(0)
+        return len(self._offsets)
+
+    def _begin_object(self, obj_id: int) -> None:
+        self._offsets[obj_id - 1] = self._f.tell()
+        self._f.write(f"{obj_id} 0 obj\n".encode("ascii"))
+
+    def _write_object(self, obj_id: int, body: bytes) -> None:
+        self._begin_object(obj_id)
+        self._f.write(body + b"\nendobj\n")
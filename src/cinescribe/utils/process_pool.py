@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+
+def new_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """spawn 방식의 프로세스 풀.
+
+    GUI에서는 서비스가 QThreadPool 워커 안에서 돌기 때문에, Linux 기본값인 fork로 자식을 만들면
+    Qt/로더 스레드가 잡고 있던 락까지 복사되어 자식이 멈출 수 있다. 작업 함수는 모듈 최상위에 있어야 한다.
+    """
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
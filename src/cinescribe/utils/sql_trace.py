@@ -0,0 +1,453 @@
+from __future__ import annotations
+
+import atexit
+import heapq
+import itertools
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .paths import get_app_data_dir
+
+# 환경 변수: "1"이면 기본 경로, 그 외 값은 출력 JSON 경로로 사용
+ENV_VAR = "CINESCRIBE_TRACE_SQL"
+FLAG = "--trace-sql"
+DEFAULT_FILENAME = "sql_trace.json"
+
+# 한 액션 안에서 같은 구문이 값만 바꿔 이만큼(서로 다른 값 기준) 실행되면 N+1로 본다
+N_PLUS_ONE_THRESHOLD = 5
+# 완전히 같은 구문(값까지 같음)이 이만큼 반복되면 중복 조회로 본다
+DUPLICATE_THRESHOLD = 3
+SLOWEST_PER_ACTION = 5
+MAX_ACTIONS = 1000
+# 구문별로 구분해 세는 값 조합 수 상한(대량 작업에서 메모리가 늘지 않도록)
+_MAX_DISTINCT = 10000
+_SAMPLE_CHARS = 400
+
+_STRING = re.compile(r"[xX]?'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?\b")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_SPACES = re.compile(r"\s+")
+# 트랜잭션 제어/설정 구문은 연결마다 반복되므로 N+1/중복 판정에서 뺀다
+_CONTROL = ("BEGIN", "COMMIT", "ROLLBACK", "END", "SAVEPOINT", "RELEASE", "PRAGMA")
+
+
+def normalize_sql(sql: str) -> str:
+    """리터럴을 ?로 바꾼 구문 형태. 추적 콜백이 받는 SQL에는 바인딩 값이 채워져 있다."""
+    text = _STRING.sub("?", sql)
+    text = _NUMBER.sub("?", text)
+    text = _VALUE_LIST.sub("(?, …)", text)
+    return _SPACES.sub(" ", text).strip()
+
+
+@dataclass
+class _StatementStats:
+    sample: str
+    count: int = 0
+    # executemany/executescript 안에서 실행된 횟수(의도된 일괄 처리라 N+1 판정에서 뺀다)
+    batched: int = 0
+    seconds: float = 0.0
+    # hash(값이 채워진 SQL) -> 한 번씩 실행된 횟수
+    values: Dict[int, int] = field(default_factory=dict)
+
+
+@dataclass
+class _Action:
+    name: str
+    started_at: float
+    statements: Dict[str, _StatementStats] = field(default_factory=dict)
+    count: int = 0
+    seconds: float = 0.0
+    connections: int = 0
+    # (초, 순번, SQL) 최소 힙. 가장 느린 구문 몇 개만 남긴다
+    slowest: List[Tuple[float, int, str]] = field(default_factory=list)
+    warned: set = field(default_factory=set)
+
+
+class SqlTracer:
+    """SQL 구문을 UI 액션별로 모아 개수/시간/N+1 패턴을 보고한다.
+
+    리포지토리는 connect()로 연결을 열고, 추적이 켜져 있으면 set_trace_callback으로 실행된 구문을,
+    연결의 execute 계열 호출 시간으로 소요 시간을 기록한다(첫 행까지의 시간, 이후 fetch는 제외).
+    액션은 사용자 입력(클릭/키)마다 새로 시작되고 다음 입력까지 이어지므로, 클릭 뒤의 지연 갱신과
+    백그라운드 작업도 그 클릭에 묶인다. 비활성 상태에서는 모든 호출이 아무 일도 하지 않는다.
+    """
+
+    def __init__(self, enabled: bool = False, output_path: Optional[str] = None) -> None:
+        self.enabled = enabled
+        self.output_path = output_path
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._seq = itertools.count()
+        self._actions: List[_Action] = []
+        self._current: Optional[_Action] = None
+        self._dropped = 0
+        self._finished = False
+        self._event_filter = None
+        if enabled:
+            self.begin_action("startup")
+
+    # ---- 액션 ----
+
+    def begin_action(self, name: str) -> None:
+        """다음 begin_action까지 모든 스레드의 구문을 name 액션으로 모은다."""
+        if not self.enabled:
+            return
+        action = self._new_action(name)
+        with self._lock:
+            self._current = action
+
+    def _new_action(self, name: str) -> _Action:
+        action = _Action(name, time.perf_counter())
+        with self._lock:
+            self._actions.append(action)
+            if len(self._actions) > MAX_ACTIONS:
+                del self._actions[0]
+                self._dropped += 1
+        return action
+
+    def current_action(self) -> Optional[_Action]:
+        if not self.enabled:
+            return None
+        return getattr(self._local, "action", None) or self._current
+
+    @contextmanager
+    def action(self, name_or_action: Any) -> Iterator[None]:
+        """with 블록 동안 이 스레드의 구문을 주어진 액션(이름이면 새 액션)으로 모은다.
+
+        current_action()으로 받아 둔 액션을 넘기면 워커 스레드의 작업을 시작한 클릭에 묶을 수 있다.
+        """
+        if not self.enabled or name_or_action is None:
+            yield
+            return
+        action = name_or_action
+        if isinstance(name_or_action, str):
+            action = self._new_action(name_or_action)
+        previous = getattr(self._local, "action", None)
+        self._local.action = action
+        try:
+            yield
+        finally:
+            self._local.action = previous
+
+    # ---- 연결/기록 ----
+
+    def connect(self, db_path: str, **kwargs: Any) -> sqlite3.Connection:
+        if not self.enabled:
+            return sqlite3.connect(db_path, **kwargs)
+        kwargs.setdefault("factory", _TracedConnection)
+        conn = sqlite3.connect(db_path, **kwargs)
+        conn.set_trace_callback(self._on_statement)
+        action = self.current_action()
+        if action is not None:
+            with self._lock:
+                action.connections += 1
+        return conn
+
+    @contextmanager
+    def _timed(self, batched: bool = False) -> Iterator[None]:
+        outer = getattr(self._local, "pending", None)
+        pending: List[Tuple[Optional[_Action], str]] = []
+        self._local.pending = pending
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self._local.pending = outer
+            if pending:
+                # 한 호출에서 여러 구문(executemany, 트리거 등)이 실행되면 시간을 나눠 붙인다
+                share = elapsed / len(pending)
+                for action, sql in pending:
+                    self._record(action, sql, share, batched or len(pending) > 1)
+
+    def _on_statement(self, sql: str) -> None:
+        action = self.current_action()
+        pending = getattr(self._local, "pending", None)
+        if pending is not None:
+            pending.append((action, sql))
+        else:
+            # cursor()로 실행한 구문 등 시간을 잴 수 없는 구문은 개수만 센다
+            self._record(action, sql, 0.0, False)
+
+    def _record(self, action: Optional[_Action], sql: str, seconds: float, batched: bool) -> None:
+        if action is None:
+            return
+        template = normalize_sql(sql)
+        warn = None
+        with self._lock:
+            stats = action.statements.get(template)
+            if stats is None:
+                stats = action.statements[template] = _StatementStats(sample=sql[:_SAMPLE_CHARS])
+            stats.count += 1
+            stats.seconds += seconds
+            action.count += 1
+            action.seconds += seconds
+            if batched:
+                stats.batched += 1
+            else:
+                key = hash(sql)
+                if key in stats.values or len(stats.values) < _MAX_DISTINCT:
+                    stats.values[key] = stats.values.get(key, 0) + 1
+            entry = (seconds, next(self._seq), sql[:_SAMPLE_CHARS])
+            if len(action.slowest) < SLOWEST_PER_ACTION:
+                heapq.heappush(action.slowest, entry)
+            elif seconds > action.slowest[0][0]:
+                heapq.heapreplace(action.slowest, entry)
+            if template not in action.warned and _is_n_plus_one(template, stats):
+                action.warned.add(template)
+                warn = f"N+1 의심 [{action.name}] x{len(stats.values)}: {template[:200]}"
+        if warn:
+            print(warn)
+
+    # ---- Qt 입력 감시 ----
+
+    def watch_ui_actions(self, app) -> None:
+        """QApplication의 클릭/키 입력마다 새 액션을 시작한다(이름: 입력 종류, 위젯, 위젯이 속한 화면)."""
+        if not self.enabled or self._event_filter is not None:
+            return
+        from PySide6.QtCore import QEvent, QObject, Qt
+
+        tracer = self
+
+        class _ActionFilter(QObject):
+            def __init__(self, parent=None) -> None:
+                super().__init__(parent)
+                self._last = None
+
+            def eventFilter(self, obj, event):  # type: ignore[override]
+                kind = event.type()
+                if kind not in (QEvent.MouseButtonRelease, QEvent.KeyPress) or not obj.isWidgetType():
+                    return False
+                # 부모로 전파되는 같은 입력은 한 번만 본다
+                stamp = (kind, event.timestamp())
+                if stamp == self._last:
+                    return False
+                self._last = stamp
+                if kind == QEvent.MouseButtonRelease:
+                    if event.button() != Qt.LeftButton:
+                        return False
+                    name = f"click {_describe_widget(obj)}"
+                else:
+                    # 입력란에서 글자를 칠 때마다 액션이 나뉘지 않도록 같은 위젯의 연속 입력은 합친다
+                    name = f"key {_describe_widget(obj, with_text=False)}"
+                    current = tracer._current
+                    if current is not None and current.name == name:
+                        return False
+                tracer.begin_action(name)
+                return False
+
+        self._event_filter = _ActionFilter(app)
+        app.installEventFilter(self._event_filter)
+
+    # ---- 보고서 ----
+
+    def report(self) -> Dict[str, Any]:
+        import platform
+
+        with self._lock:
+            actions = [a for a in self._actions if a.count]
+            items = [_action_report(a, self._origin) for a in actions]
+            dropped = self._dropped
+        return {
+            "version": 1,
+            "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": sys.version.split()[0],
+            "sqlite": sqlite3.sqlite_version,
+            "platform": f"{platform.system()} {platform.release()}",
+            "n_plus_one_threshold": N_PLUS_ONE_THRESHOLD,
+            "duplicate_threshold": DUPLICATE_THRESHOLD,
+            "dropped_actions": dropped,
+            "statements": sum(item["statements"] for item in items),
+            "total_ms": round(sum(item["total_ms"] for item in items), 3),
+            "actions": items,
+        }
+
+    def format_report(self, limit: int = 15) -> str:
+        """가장 오래 걸린 액션부터 사람이 읽을 요약."""
+        data = self.report()
+        lines = [f"SQL 추적: 액션 {len(data['actions'])}개, 구문 {data['statements']}개, {data['total_ms']:.1f} ms"]
+        ranked = sorted(
+            data["actions"], key=lambda a: (bool(a["n_plus_one"] or a["duplicates"]), a["total_ms"]), reverse=True
+        )
+        for item in ranked[:limit]:
+            lines.append(
+                f"[{item['total_ms']:8.1f} ms / 구문 {item['statements']:4d} / 연결 {item['connections']:3d}] {item['action']}"
+            )
+            for n in item["n_plus_one"]:
+                lines.append(f"    N+1 의심 x{n['count']} (값 {n['distinct']}가지, {n['total_ms']:.1f} ms): {n['sql'][:160]}")
+            for d in item["duplicates"]:
+                lines.append(f"    중복 x{d['repeats']}: {d['sql'][:160]}")
+            if item["slowest"]:
+                s = item["slowest"][0]
+                lines.append(f"    가장 느린 구문 {s['ms']:.2f} ms: {s['sql'][:160]}")
+        return "\n".join(lines)
+
+    def finish(self) -> Optional[str]:
+        """결과를 JSON으로 쓰고 요약을 출력한다. 쓴 경로를 돌려준다."""
+        if not self.enabled or self._finished:
+            return None
+        self._finished = True
+        path = self.output_path or str(Path(get_app_data_dir()) / DEFAULT_FILENAME)
+        try:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self.report(), f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            print(f"SQL 추적 저장 실패: {e}")
+            return None
+        print(self.format_report())
+        print(f"SQL 추적 저장: {path}")
+        return path
+
+
+class _TracedConnection(sqlite3.Connection):
+    """execute 계열 호출 시간을 재는 연결. 구문 자체는 추적 콜백이 기록한다."""
+
+    def execute(self, *args, **kwargs):
+        with get_sql_tracer()._timed():
+            return super().execute(*args, **kwargs)
+
+    def executemany(self, *args, **kwargs):
+        with get_sql_tracer()._timed(batched=True):
+            return super().executemany(*args, **kwargs)
+
+    def executescript(self, *args, **kwargs):
+        with get_sql_tracer()._timed(batched=True):
+            return super().executescript(*args, **kwargs)
+
+    def commit(self):
+        with get_sql_tracer()._timed():
+            return super().commit()
+
+    def __exit__(self, *exc):
+        # with conn: 블록의 COMMIT(디스크 동기화 포함) 시간
+        with get_sql_tracer()._timed():
+            return super().__exit__(*exc)
+
+
+def _is_control(template: str) -> bool:
+    return template.split(" ", 1)[0].upper() in _CONTROL
+
+
+def _is_n_plus_one(template: str, stats: _StatementStats) -> bool:
+    return len(stats.values) >= N_PLUS_ONE_THRESHOLD and not _is_control(template)
+
+
+def _action_report(action: _Action, origin: float) -> Dict[str, Any]:
+    n_plus_one = []
+    duplicates = []
+    for template, stats in action.statements.items():
+        if _is_control(template):
+            continue
+        if _is_n_plus_one(template, stats):
+            n_plus_one.append({
+                "sql": template,
+                "count": stats.count - stats.batched,
+                "distinct": len(stats.values),
+                "total_ms": round(stats.seconds * 1000, 3),
+                "sample": stats.sample,
+            })
+        repeats = max(stats.values.values(), default=0)
+        if repeats >= DUPLICATE_THRESHOLD:
+            duplicates.append({"sql": template, "repeats": repeats, "total_ms": round(stats.seconds * 1000, 3)})
+    by_time = sorted(action.statements.items(), key=lambda kv: kv[1].seconds, reverse=True)
+    return {
+        "action": action.name,
+        "started_at_ms": round((action.started_at - origin) * 1000, 3),
+        "statements": action.count,
+        "total_ms": round(action.seconds * 1000, 3),
+        "connections": action.connections,
+        "n_plus_one": sorted(n_plus_one, key=lambda n: n["count"], reverse=True),
+        "duplicates": sorted(duplicates, key=lambda d: d["repeats"], reverse=True),
+        "slowest": [
+            {"ms": round(seconds * 1000, 3), "sql": sql}
+            for seconds, _, sql in sorted(action.slowest, reverse=True)
+        ],
+        "by_statement": [
+            {"sql": template, "count": stats.count, "total_ms": round(stats.seconds * 1000, 3)}
+            for template, stats in by_time[:10]
+        ],
+    }
+
+
+def _describe_widget(widget, with_text: bool = True) -> str:
+    """'QPushButton '저장' @ StoryboardView' 형태의 위젯 설명."""
+    label = type(widget).__name__
+    text = ""
+    if with_text:
+        active = getattr(widget, "activeAction", None)
+        if callable(active) and active() is not None:
+            text = active().text()
+        elif callable(getattr(widget, "text", None)):
+            try:
+                value = widget.text()
+            except TypeError:
+                value = None
+            if isinstance(value, str):
+                text = value
+    if text:
+        label += f" '{text[:40]}'"
+    owner = widget.parentWidget()
+    while owner is not None:
+        owner_name = type(owner).__name__
+        if owner_name.endswith(("View", "Window", "Dialog")):
+            return f"{label} @ {owner_name}"
+        owner = owner.parentWidget()
+    return label
+
+
+_tracer: Optional[SqlTracer] = None
+
+
+def start_sql_tracer(argv: Optional[List[str]] = None) -> SqlTracer:
+    """환경 변수나 --trace-sql[=경로] 플래그를 보고 추적기를 만든다.
+
+    플래그는 argv에서 제거한다(QApplication/argparse에 넘기지 않도록). 켜져 있으면 종료 시 보고서를 쓴다.
+    """
+    global _tracer
+    if _tracer is not None:
+        return _tracer
+    enabled = False
+    output: Optional[str] = None
+    env_value = os.environ.get(ENV_VAR, "").strip()
+    if env_value and env_value not in ("0", "false", "False"):
+        enabled = True
+        if env_value not in ("1", "true", "True"):
+            output = env_value
+    if argv is not None:
+        for arg in list(argv):
+            if arg == FLAG or arg.startswith(FLAG + "="):
+                argv.remove(arg)
+                enabled = True
+                if "=" in arg:
+                    output = arg.split("=", 1)[1] or output
+    _tracer = SqlTracer(enabled, output)
+    if enabled:
+        atexit.register(_tracer.finish)
+    return _tracer
+
+
+def get_sql_tracer() -> SqlTracer:
+    # 시작되지 않았으면 비활성 추적기(모든 호출이 no-op)를 돌려준다
+    global _tracer
+    if _tracer is None:
+        _tracer = SqlTracer(False)
+    return _tracer
+
+
+def connect(db_path: str, **kwargs: Any) -> sqlite3.Connection:
+    """sqlite3.connect 대신 쓰는 연결 함수. 추적이 꺼져 있으면 sqlite3.connect와 같다."""
+    tracer = _tracer
+    if tracer is None or not tracer.enabled:
+        return sqlite3.connect(db_path, **kwargs)
+    return tracer.connect(db_path, **kwargs)
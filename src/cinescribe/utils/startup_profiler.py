@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import importlib.abc
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .paths import get_app_data_dir
+
+# 환경 변수: "1"이면 기본 경로, 그 외 값은 출력 JSON 경로로 사용
+ENV_VAR = "CINESCRIBE_PROFILE_STARTUP"
+FLAG = "--profile-startup"
+DEFAULT_FILENAME = "startup_profile.json"
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """원래 로더를 감싸 exec_module 시간을 재는 프록시."""
+
+    def __init__(self, loader, recorder: "_ImportRecorder", name: str) -> None:
+        self._loader = loader
+        self._recorder = recorder
+        self._name = name
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        self._recorder.enter(self._name)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._recorder.leave(self._name)
+
+    def __getattr__(self, name: str):
+        # get_resource_reader, get_data 등은 원래 로더로 넘긴다
+        return getattr(self._loader, name)
+
+
+class _ImportRecorder(importlib.abc.MetaPathFinder):
+    """-X importtime처럼 모듈별 self/누적 import 시간을 기록하는 meta path finder."""
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # 모듈 -> (self 초, 누적 초)
+        self.timings: Dict[str, Tuple[float, float]] = {}
+
+    def find_spec(self, fullname, path=None, target=None):
+        if getattr(self._local, "finding", False):
+            return None
+        self._local.finding = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._local.finding = False
+        loader = spec.loader
+        if loader is None or not hasattr(loader, "exec_module") or spec.origin in ("built-in", "frozen"):
+            return spec
+        spec.loader = _TimedLoader(loader, self, fullname)
+        return spec
+
+    def enter(self, name: str) -> None:
+        stack = self._stack()
+        stack.append([name, time.perf_counter(), 0.0])
+
+    def leave(self, name: str) -> None:
+        stack = self._stack()
+        _, started, children = stack.pop()
+        total = time.perf_counter() - started
+        if stack:
+            stack[-1][2] += total
+        with self._lock:
+            self.timings[name] = (total - children, total)
+
+    def _stack(self) -> List[list]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+
+class StartupProfiler:
+    """콜드 스타트 구간별 시각을 기록해 JSON으로 남긴다.
+
+    mark()로 단조 시계 기준 구간을 기록하고, 첫 화면이 그려지면 finish()로 파일을 쓴다.
+    비활성 상태에서는 모든 호출이 아무 일도 하지 않는다.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        output_path: Optional[str] = None,
+        origin: Optional[float] = None,
+        origin_cpu: Optional[float] = None,
+    ) -> None:
+        self.enabled = enabled
+        self.output_path = output_path
+        self._origin = time.perf_counter() if origin is None else origin
+        self._marks: List[Tuple[str, float]] = []
+        self._recorder: Optional[_ImportRecorder] = None
+        self._finished = False
+        self._paint_filter = None
+        # 인터프리터 시작부터 origin까지 쓴 CPU 시간(인터프리터 기동 비용의 근사치).
+        # origin과 같은 시점에 잰 값을 받아야 하며, 없으면 지금 잰다(origin도 지금인 경우)
+        self._cpu_before_origin = time.process_time() if origin_cpu is None else origin_cpu
+
+    def install_import_hook(self) -> None:
+        if not self.enabled or self._recorder is not None:
+            return
+        self._recorder = _ImportRecorder()
+        sys.meta_path.insert(0, self._recorder)
+
+    def mark(self, phase: str) -> None:
+        # 같은 구간 이름은 처음 기록만 남긴다(첫 화면 전 여러 번 호출되는 새로고침 등)
+        if not self.enabled or self._finished:
+            return
+        if any(name == phase for name, _ in self._marks):
+            return
+        self._marks.append((phase, time.perf_counter()))
+
+    def watch_first_paint(self, widget) -> None:
+        """widget이 처음 그려진 직후 first_paint를 기록하고 결과를 쓴다."""
+        if not self.enabled:
+            return
+        from PySide6.QtCore import QEvent, QObject, QTimer
+
+        profiler = self
+
+        class _FirstPaintFilter(QObject):
+            def eventFilter(self, obj, event):  # type: ignore[override]
+                if event.type() == QEvent.Paint:
+                    obj.removeEventFilter(self)
+                    # 이 페인트 이벤트 처리가 끝난 뒤의 시점을 첫 프레임으로 본다
+                    QTimer.singleShot(0, profiler._on_first_paint)
+                return False
+
+        self._paint_filter = _FirstPaintFilter(widget)
+        widget.installEventFilter(self._paint_filter)
+
+    def _on_first_paint(self) -> None:
+        self.mark("first_paint")
+        path = self.finish()
+        if path:
+            print(f"시작 프로파일 저장: {path}")
+
+    def report(self) -> Dict[str, Any]:
+        phases = []
+        prev = self._origin
+        for name, t in self._marks:
+            phases.append({
+                "phase": name,
+                "at_ms": round((t - self._origin) * 1000, 3),
+                "delta_ms": round((t - prev) * 1000, 3),
+            })
+            prev = t
+        imports = []
+        packages: Dict[str, List[float]] = {}
+        if self._recorder is not None:
+            with self._recorder._lock:
+                timings = dict(self._recorder.timings)
+            for module, (self_s, total_s) in timings.items():
+                top = module.split(".", 1)[0]
+                agg = packages.setdefault(top, [0.0, 0])
+                agg[0] += self_s
+                agg[1] += 1
+                if top == "cinescribe":
+                    imports.append({
+                        "module": module,
+                        "self_ms": round(self_s * 1000, 3),
+                        "cumulative_ms": round(total_s * 1000, 3),
+                    })
+            imports.sort(key=lambda item: item["cumulative_ms"], reverse=True)
+        return {
+            "version": 1,
+            "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": sys.version.split()[0],
+            "platform": f"{platform.system()} {platform.release()}",
+            "interpreter_cpu_ms": round(self._cpu_before_origin * 1000, 3),
+            "total_ms": phases[-1]["at_ms"] if phases else 0.0,
+            "phases": phases,
+            "cinescribe_imports": imports,
+            # 최상위 패키지별 self 시간 합계(PySide6, PIL 등 외부 의존성 비용 확인용)
+            "packages": sorted(
+                ({"package": name, "self_ms": round(v[0] * 1000, 3), "modules": v[1]} for name, v in packages.items()),
+                key=lambda item: item["self_ms"],
+                reverse=True,
+            ),
+        }
+
+    def finish(self) -> Optional[str]:
+        """결과를 JSON으로 쓰고 import 훅을 제거한다. 쓴 경로를 돌려준다."""
+        if not self.enabled or self._finished:
+            return None
+        self._finished = True
+        if self._recorder is not None and self._recorder in sys.meta_path:
+            sys.meta_path.remove(self._recorder)
+        path = self.output_path or str(Path(get_app_data_dir()) / DEFAULT_FILENAME)
+        try:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self.report(), f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            print(f"시작 프로파일 저장 실패: {e}")
+            return None
+        return path
+
+
+_profiler: Optional[StartupProfiler] = None
+
+
+def start_startup_profiler(
+    argv: Optional[List[str]] = None, origin: Optional[float] = None, origin_cpu: Optional[float] = None
+) -> StartupProfiler:
+    """환경 변수나 --profile-startup[=경로] 플래그를 보고 프로파일러를 만든다.
+
+    플래그는 argv에서 제거한다(QApplication에 넘기지 않도록).
+    """
+    global _profiler
+    if _profiler is not None:
+        return _profiler
+    enabled = False
+    output: Optional[str] = None
+    env_value = os.environ.get(ENV_VAR, "").strip()
+    if env_value and env_value not in ("0", "false", "False"):
+        enabled = True
+        if env_value not in ("1", "true", "True"):
+            output = env_value
+    if argv is not None:
+        for arg in list(argv[1:]):
+            if arg == FLAG or arg.startswith(FLAG + "="):
+                argv.remove(arg)
+                enabled = True
+                if "=" in arg:
+                    output = arg.split("=", 1)[1] or output
+    _profiler = StartupProfiler(enabled, output, origin, origin_cpu)
+    _profiler.install_import_hook()
+    return _profiler
+
+
+def get_startup_profiler() -> StartupProfiler:
+    # 시작되지 않았으면 비활성 프로파일러(모든 호출이 no-op)를 돌려준다
+    global _profiler
+    if _profiler is None:
+        _profiler = StartupProfiler(False)
+    return _profiler
@@ -3,6 +3,38 @@ ShotCanvas - ViewModel 패키지
 뷰와 모델 간의 중재자
 """
 
-# ViewModel 클래스들이 정의될 예정
-__all__ = []
+from importlib import import_module
 
+# 공개 이름 -> 정의된 하위 모듈. 처음 접근할 때 import한다
+_LAZY = {
+    'run_in_background': '.background',
+    'ProgressRelay': '.background',
+    'ThumbnailLoader': '.thumbnail_loader',
+    'get_thumbnail_loader': '.thumbnail_loader',
+    'ImageBudget': '.image_budget',
+    'get_image_budget': '.image_budget',
+    'TileImages': '.tile_images',
+    'ScenePrefetcher': '.scene_prefetch',
+    'AssetListModel': '.asset_list_model',
+    'LibraryListModel': '.library_model',
+    'AutosaveController': '.autosave',
+    'get_autosave': '.autosave',
+    'AssetWatcher': '.asset_watcher',
+    'get_asset_watcher': '.asset_watcher'
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    # 다음 접근부터는 모듈 __getattr__를 거치지 않도록 캐시
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
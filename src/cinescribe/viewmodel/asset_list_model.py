@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import os
+from typing import Any, Dict, List, Optional
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QObject, QSize, Qt
+
+from ..repository.asset_repository import Asset, AssetRepository
+from .background import run_in_background
+from .thumbnail_loader import ThumbnailLoader, get_thumbnail_loader
+
+
+def _query_page(db_path: str, query: str, before_id: int | None, limit: int) -> List[Asset]:
+    # 워커 스레드에서 실행된다
+    return AssetRepository(db_path).search_images(query, before_id=before_id, limit=limit)
+
+
+class AssetListModel(QAbstractListModel):
+    """이미지 에셋 목록 모델.
+
+    검색 결과를 id 기준 keyset 페이지로 나눠 백그라운드에서 가져오고(canFetchMore/fetchMore),
+    아이콘은 공용 ThumbnailLoader로 화면에 보이는 항목만 지연 로딩한다.
+    """
+
+    AssetIdRole = Qt.UserRole
+    PAGE_SIZE = 200
+
+    def __init__(self, icon_size: QSize, loader: ThumbnailLoader | None = None, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._icon_size = icon_size
+        self._loader = loader or get_thumbnail_loader()
+        self._loader.thumbnailReady.connect(self._on_thumbnail_ready)
+        self._db_path: str | None = None
+        self._project_dir: str | None = None
+        self._query = ""
+        self._rows: List[Asset] = []
+        self._rows_by_thumb: Dict[str, List[int]] = {}
+        self._generation = 0
+        self._loading = False
+        self._exhausted = True
+
+    def set_source(self, db_path: str | None, query: str = "") -> None:
+        # 세대 번호를 올려 이전 검색의 늦게 도착한 결과는 버린다
+        self._generation += 1
+        self.beginResetModel()
+        self._db_path = db_path
+        self._project_dir = os.path.dirname(db_path) if db_path else None
+        self._query = query
+        self._rows = []
+        self._rows_by_thumb = {}
+        self._loading = False
+        self._exhausted = db_path is None
+        self.endResetModel()
+        self._request_page()
+
+    def asset_at(self, row: int) -> Optional[Asset]:
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def update_tags(self, row: int, tags: str) -> None:
+        asset = self.asset_at(row)
+        if asset is None:
+            return
+        asset.tags = tags
+        idx = self.index(row)
+        self.dataChanged.emit(idx, idx, [Qt.ToolTipRole])
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:  # type: ignore[override]
+        if not index.isValid():
+            return None
+        asset = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return asset.filename
+        if role == Qt.ToolTipRole:
+            return asset.tags or asset.filename
+        if role == self.AssetIdRole:
+            return asset.id
+        if role == Qt.DecorationRole:
+            thumb = self._thumb_path(asset)
+            if thumb:
+                return self._loader.pixmap(thumb, self._icon_size)
+        return None
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:  # type: ignore[override]
+        return not parent.isValid() and not self._exhausted and not self._loading
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:  # type: ignore[override]
+        if parent.isValid():
+            return
+        self._request_page()
+
+    def _request_page(self) -> None:
+        if self._loading or self._exhausted or not self._db_path:
+            return
+        self._loading = True
+        gen = self._generation
+        before_id = self._rows[-1].id if self._rows else None
+        run_in_background(
+            _query_page,
+            self._db_path,
+            self._query,
+            before_id,
+            self.PAGE_SIZE,
+            on_done=lambda page, g=gen: self._on_page(g, page),
+            on_error=lambda e, g=gen: self._on_page_failed(g, e),
+        )
+
+    def _on_page(self, gen: int, page: List[Asset]) -> None:
+        if gen != self._generation:
+            return
+        self._loading = False
+        if len(page) < self.PAGE_SIZE:
+            self._exhausted = True
+        if not page:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+        for offset, asset in enumerate(page):
+            self._rows.append(asset)
+            thumb = self._thumb_path(asset)
+            if thumb:
+                self._rows_by_thumb.setdefault(thumb, []).append(first + offset)
+        self.endInsertRows()
+
+    def _on_page_failed(self, gen: int, error: BaseException) -> None:
+        if gen != self._generation:
+            return
+        self._loading = False
+        self._exhausted = True
+        print(f"에셋 목록 조회 실패: {error}")
+
+    def _thumb_path(self, asset: Asset) -> str | None:
+        if not self._project_dir or not asset.thumbnail_path:
+            return None
+        return os.path.join(self._project_dir, asset.thumbnail_path)
+
+    def _on_thumbnail_ready(self, path: str) -> None:
+        for row in self._rows_by_thumb.get(path, ()):
+            idx = self.index(row)
+            self.dataChanged.emit(idx, idx, [Qt.DecorationRole])
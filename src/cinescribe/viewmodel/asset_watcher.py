@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+from PySide6.QtCore import QFileSystemWatcher, QObject, QTimer, Signal
+
+from ..service.asset_refresh_service import AssetChange, AssetRefreshService
+from .background import run_in_background
+from .thumbnail_loader import get_thumbnail_loader
+
+
+class AssetWatcher(QObject):
+    """열린 프로젝트의 에셋/썸네일 폴더를 감시해 앱 밖에서 바뀐 파일을 반영한다.
+
+    QFileSystemWatcher(리눅스는 inotify)의 폴더 이벤트를 DEBOUNCE_MS 동안 모았다가
+    AssetRefreshService.scan()을 백그라운드에서 한 번 돌린다(실행 중 온 이벤트는 끝난 뒤 한 번 더).
+    폴더 감시는 제자리 덮어쓰기를 놓칠 수 있어 SAFETY_POLL_MS마다 훑고,
+    감시를 등록하지 못하면(네트워크 드라이브, inotify 한도 초과 등) POLL_MS 폴링으로 대신한다.
+    바뀐 썸네일은 공용 ThumbnailLoader에서 다시 읽히므로 썸네일을 보여 주는 뷰는 따로 할 일이 없다.
+    """
+
+    # 바뀐 에셋 목록(List[AssetChange])
+    assetsChanged = Signal(object)
+
+    DEBOUNCE_MS = 500
+    POLL_MS = 5000
+    SAFETY_POLL_MS = 60 * 1000
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._service: AssetRefreshService | None = None
+        self._db_path: str | None = None
+        self._enabled = True
+        self._running = False
+        self._dirty = False
+        self._polling = False
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._schedule)
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(self.DEBOUNCE_MS)
+        self._debounce.timeout.connect(self._start_scan)
+        self._poll = QTimer(self)
+        self._poll.timeout.connect(self._start_scan)
+
+    def is_enabled(self) -> bool:
+        return self._enabled
+
+    def is_polling(self) -> bool:
+        # inotify 대신 주기적 폴링으로 감시 중인지
+        return self._polling
+
+    def set_enabled(self, enabled: bool) -> None:
+        if enabled == self._enabled:
+            return
+        self._enabled = enabled
+        self._restart()
+
+    def set_project(self, db_path: Optional[str]) -> None:
+        if db_path == self._db_path:
+            return
+        self._db_path = db_path
+        self._service = None
+        self._restart()
+
+    def rescan(self) -> None:
+        self._schedule()
+
+    def _restart(self) -> None:
+        self._debounce.stop()
+        self._poll.stop()
+        paths = self._watcher.directories()
+        if paths:
+            self._watcher.removePaths(paths)
+        if not self._enabled or not self._db_path:
+            return
+        if self._service is None:
+            self._service = AssetRefreshService(self._db_path)
+        failed = self._watcher.addPaths(list(self._service.watch_dirs()))
+        self._polling = bool(failed)
+        self._poll.setInterval(self.POLL_MS if self._polling else self.SAFETY_POLL_MS)
+        self._poll.start()
+        # 처음 한 번 훑어 기준값을 잡고, 앱이 꺼져 있는 동안 바뀐 파일을 반영한다
+        self._schedule()
+
+    def _schedule(self, _path: str = "") -> None:
+        if self._enabled and self._service is not None:
+            self._debounce.start()
+
+    def _start_scan(self) -> None:
+        service = self._service
+        if service is None or not self._enabled:
+            return
+        if self._running:
+            self._dirty = True
+            return
+        self._running = True
+        run_in_background(
+            service.scan,
+            on_done=lambda changes: self._on_scanned(service, changes),
+            on_error=self._on_failed,
+        )
+
+    def _on_scanned(self, service: AssetRefreshService, changes: List[AssetChange]) -> None:
+        self._finish()
+        if service is not self._service or not changes:
+            return
+        loader = get_thumbnail_loader()
+        for change in changes:
+            if change.kind in ("modified", "thumbnail"):
+                # 썸네일이 없을 때 원본으로 그리는 뷰도 있으므로 둘 다 다시 읽힌다
+                if change.thumbnail_path:
+                    loader.reload(change.thumbnail_path)
+                loader.reload(change.source_path)
+        self.assetsChanged.emit(changes)
+
+    def _on_failed(self, error: BaseException) -> None:
+        self._finish()
+        print(f"에셋 폴더 검사 실패: {error}")
+
+    def _finish(self) -> None:
+        self._running = False
+        if self._dirty:
+            self._dirty = False
+            self._schedule()
+
+
+_watcher: Optional[AssetWatcher] = None
+
+
+def get_asset_watcher() -> AssetWatcher:
+    global _watcher
+    if _watcher is None:
+        _watcher = AssetWatcher()
+    return _watcher
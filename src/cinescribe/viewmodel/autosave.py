@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from ..service.autosave_service import AutosaveService
+from ..utils.app_state import get_current_project_path
+from .background import run_in_background
+
+
+class AutosaveController(QObject):
+    """AutosaveService에 타이머를 붙여 입력이 멈추면(또는 최대 지연 후) 백그라운드에서 flush한다.
+
+    탭 전환/창 닫기처럼 반드시 기록되어야 하는 시점에는 flush_now()로 동기 flush한다.
+    """
+
+    flushed = Signal(int)
+    flushFailed = Signal(str)
+
+    IDLE_MS = 800
+    MAX_DELAY_MS = 3000
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._service: AutosaveService | None = None
+        self._flushing = False
+
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.setInterval(self.IDLE_MS)
+        self._idle_timer.timeout.connect(self._flush_in_background)
+        # 계속 입력 중이어도 MAX_DELAY_MS마다는 기록되도록
+        self._max_timer = QTimer(self)
+        self._max_timer.setSingleShot(True)
+        self._max_timer.setInterval(self.MAX_DELAY_MS)
+        self._max_timer.timeout.connect(self._flush_in_background)
+
+    def stage(self, kind: str, entity_id: int, **fields: Any) -> None:
+        service = self._ensure_service()
+        if service is None:
+            return
+        service.stage(kind, entity_id, **fields)
+        self._idle_timer.start()
+        if not self._max_timer.isActive():
+            self._max_timer.start()
+
+    def discard(self, kind: str, entity_id: int) -> None:
+        if self._service is not None:
+            self._service.discard(kind, entity_id)
+
+    def flush_now(self) -> int:
+        self._idle_timer.stop()
+        self._max_timer.stop()
+        if self._service is None:
+            return 0
+        # has_pending()로 미리 돌아가지 않는다: 백그라운드 flush가 이미 큐를 가져가 기록 중이면 큐는 비어 있지만
+        # 아직 커밋 전이다. flush()는 먼저 _flush_lock을 잡으므로 그 기록이 끝날 때까지 기다린다
+        try:
+            count = self._service.flush()
+        except Exception as e:
+            self.flushFailed.emit(str(e))
+            return 0
+        if count:
+            self.flushed.emit(count)
+        return count
+
+    def _ensure_service(self) -> AutosaveService | None:
+        db_path = get_current_project_path()
+        if not db_path:
+            return None
+        if self._service is None or self._service._db_path != db_path:
+            # 프로젝트가 바뀌면 이전 프로젝트의 남은 변경부터 기록
+            self.flush_now()
+            self._service = AutosaveService(db_path)
+        return self._service
+
+    def _flush_in_background(self) -> None:
+        self._idle_timer.stop()
+        self._max_timer.stop()
+        service = self._service
+        if service is None or not service.has_pending():
+            return
+        if self._flushing:
+            # 진행 중인 flush가 끝난 뒤 다시 시도
+            self._idle_timer.start()
+            return
+        self._flushing = True
+        run_in_background(service.flush, on_done=self._on_flushed, on_error=self._on_flush_failed)
+
+    def _on_flushed(self, count: int) -> None:
+        self._flushing = False
+        self.flushed.emit(count)
+
+    def _on_flush_failed(self, error: BaseException) -> None:
+        self._flushing = False
+        self.flushFailed.emit(str(error))
+        # 변경은 큐로 되돌려졌으므로 잠시 후 재시도
+        self._idle_timer.start()
+
+
+_autosave: Optional[AutosaveController] = None
+
+
+def get_autosave() -> AutosaveController:
+    global _autosave
+    if _autosave is None:
+        _autosave = AutosaveController()
+    return _autosave
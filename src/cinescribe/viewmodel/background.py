@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Optional
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+
+from ..utils.sql_trace import get_sql_tracer
+
+
+# 결과 전달 전까지 시그널 객체가 GC되지 않도록 보관
+_live: set["_TaskSignals"] = set()
+
+
+class _TaskSignals(QObject):
+    """작업 결과를 GUI 스레드로 전달한다.
+
+    GUI 스레드에서 생성되므로 워커 스레드에서 emit하면 큐 연결로 전달되고,
+    콜백은 항상 GUI 스레드에서 호출된다.
+    """
+
+    done = Signal(object)
+    failed = Signal(object)
+
+    def __init__(
+        self,
+        on_done: Optional[Callable[[Any], None]],
+        on_error: Optional[Callable[[BaseException], None]],
+    ) -> None:
+        super().__init__()
+        self._on_done = on_done
+        self._on_error = on_error
+        self.done.connect(self._deliver_done)
+        self.failed.connect(self._deliver_failed)
+
+    @Slot(object)
+    def _deliver_done(self, result: Any) -> None:
+        _live.discard(self)
+        if self._on_done:
+            self._on_done(result)
+
+    @Slot(object)
+    def _deliver_failed(self, error: BaseException) -> None:
+        _live.discard(self)
+        if self._on_error:
+            self._on_error(error)
+        else:
+            print(f"백그라운드 작업 실패: {error}")
+
+
+class ProgressRelay(QObject):
+    """워커 스레드에서 호출하는 진행 콜백을 GUI 스레드 시그널로 바꿔 준다.
+
+    GUI 스레드에서 만든 뒤 서비스의 progress 인자로 그대로 넘기면 된다.
+    바이트 수가 32비트를 넘을 수 있으므로 object로 전달한다.
+    """
+
+    progressed = Signal(object, object, str)
+
+    def __call__(self, done: int, total: int, message: str = "") -> None:
+        self.progressed.emit(done, total, message)
+
+
+class BackgroundTask(QRunnable):
+    def __init__(self, fn: Callable[..., Any], signals: _TaskSignals, *args: Any, **kwargs: Any) -> None:
+        super().__init__()
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+        self._signals = signals
+        # SQL 추적 시 워커에서 실행된 구문을 작업을 시작한 UI 액션에 묶는다
+        self._action = get_sql_tracer().current_action()
+
+    def run(self) -> None:
+        try:
+            with get_sql_tracer().action(self._action):
+                result = self._fn(*self._args, **self._kwargs)
+        except BaseException as e:  # noqa: BLE001 - 오류는 GUI 스레드에서 처리
+            self._signals.failed.emit(e)
+            return
+        self._signals.done.emit(result)
+
+
+def run_in_background(
+    fn: Callable[..., Any],
+    *args: Any,
+    on_done: Optional[Callable[[Any], None]] = None,
+    on_error: Optional[Callable[[BaseException], None]] = None,
+    pool: Optional[QThreadPool] = None,
+    **kwargs: Any,
+) -> None:
+    """fn(*args, **kwargs)를 스레드 풀에서 실행하고 결과를 GUI 스레드 콜백으로 돌려준다.
+
+    fn은 Qt 위젯에 접근하면 안 된다. 저장소(repository)는 호출마다 새 연결을 열기 때문에
+    워커 스레드에서 그대로 사용할 수 있다.
+    """
+    signals = _TaskSignals(on_done, on_error)
+    _live.add(signals)
+    (pool or QThreadPool.globalInstance()).start(BackgroundTask(fn, signals, *args, **kwargs))
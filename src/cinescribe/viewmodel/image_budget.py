@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtGui import QPixmap
+
+MB = 1024 * 1024
+# 환경 변수가 "1"이면 저메모리 모드로 시작
+ENV_VAR = "CINESCRIBE_LOW_MEMORY"
+
+_EntryKey = Tuple[int, Hashable]
+
+
+@dataclass
+class _Entry:
+    owner: Any
+    key: Hashable
+    nbytes: int
+
+
+def pixmap_bytes(pixmap: QPixmap) -> int:
+    # 디코딩된 픽셀 버퍼 크기(압축 파일 크기가 아님)
+    return pixmap.width() * pixmap.height() * max(1, pixmap.depth()) // 8
+
+
+class ImageBudget(QObject):
+    """프로세스 전체의 디코딩 이미지 메모리 예산.
+
+    이미지를 캐시하는 쪽(ThumbnailLoader)은 만든 QPixmap을 charge()로 바이트 단위로 등록하고,
+    예산을 넘으면 가장 오래 보이지 않은 항목부터 소유자의 _evict_image(key)로 버려진다.
+    타일을 라벨에 직접 그리는 뷰는 set_visible()로 지금 보이는 항목을 알려 주며, 보이는 항목은
+    다른 항목을 모두 버린 뒤에도 넘칠 때까지 남는다(라벨이 들고 있어 버려도 메모리가 줄지 않음).
+    저메모리 모드에서는 예산을 줄이고, 보이지 않게 된 항목을 바로 버리며, 숨겨진 뷰는 타일 위젯을 해제한다.
+    """
+
+    lowMemoryChanged = Signal(bool)
+
+    DEFAULT_BUDGET_BYTES = 256 * MB
+    LOW_MEMORY_BUDGET_BYTES = 48 * MB
+
+    def __init__(
+        self,
+        budget_bytes: int = DEFAULT_BUDGET_BYTES,
+        low_memory_budget_bytes: int = LOW_MEMORY_BUDGET_BYTES,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self._normal_budget = budget_bytes
+        self._low_budget = low_memory_budget_bytes
+        self._low_memory = os.environ.get(ENV_VAR, "").strip() not in ("", "0", "false", "False")
+        # LRU 순서(앞쪽이 가장 오래 보이지 않은 항목)
+        self._entries: "OrderedDict[_EntryKey, _Entry]" = OrderedDict()
+        self._used = 0
+        # 뷰 id -> 그 뷰에 지금 보이는 항목
+        self._visible: Dict[int, Set[_EntryKey]] = {}
+        self._pins: Dict[_EntryKey, int] = {}
+
+    # ---- 상태 ----
+
+    def budget_bytes(self) -> int:
+        return self._low_budget if self._low_memory else self._normal_budget
+
+    def used_bytes(self) -> int:
+        return self._used
+
+    def count(self) -> int:
+        return len(self._entries)
+
+    def is_low_memory(self) -> bool:
+        return self._low_memory
+
+    def set_low_memory(self, enabled: bool) -> None:
+        if enabled == self._low_memory:
+            return
+        self._low_memory = enabled
+        if enabled:
+            # 화면 밖 이미지는 지금 버린다(모델 뷰의 항목은 다시 그릴 때 필요한 것만 다시 읽힌다)
+            self._evict_where(lambda entry_key: entry_key not in self._pins)
+        self._trim()
+        self.lowMemoryChanged.emit(enabled)
+
+    def set_budget(self, budget_bytes: int, low_memory_budget_bytes: Optional[int] = None) -> None:
+        self._normal_budget = budget_bytes
+        if low_memory_budget_bytes is not None:
+            self._low_budget = low_memory_budget_bytes
+        self._trim()
+
+    # ---- 캐시 소유자용 ----
+
+    def charge(self, owner: Any, key: Hashable, pixmap: QPixmap) -> None:
+        """owner가 key로 캐시한 pixmap을 예산에 등록한다. 넘치면 오래된 항목을 버린다."""
+        entry_key = (id(owner), key)
+        old = self._entries.pop(entry_key, None)
+        if old is not None:
+            self._used -= old.nbytes
+        entry = _Entry(owner, key, pixmap_bytes(pixmap))
+        self._entries[entry_key] = entry
+        self._used += entry.nbytes
+        self._trim(keep=entry_key)
+
+    def touch(self, owner: Any, key: Hashable) -> None:
+        # 캐시에서 꺼내 그릴 때마다 최근 항목으로 옮긴다(모델 뷰는 보이는 항목만 그리므로 곧 '최근에 보인' 순서)
+        entry_key = (id(owner), key)
+        if entry_key in self._entries:
+            self._entries.move_to_end(entry_key)
+
+    def release(self, owner: Any, key: Hashable) -> None:
+        # 소유자가 스스로 버린 항목(무효화 등)
+        entry = self._entries.pop((id(owner), key), None)
+        if entry is not None:
+            self._used -= entry.nbytes
+
+    # ---- 뷰용 ----
+
+    def set_visible(self, viewer: QObject, items: Iterable[Tuple[Any, Hashable]]) -> None:
+        """viewer에 지금 보이는 (소유자, key) 목록을 바꾼다. 아직 디코딩 중인 항목도 넘겨도 된다."""
+        viewer_id = id(viewer)
+        if viewer_id not in self._visible:
+            viewer.destroyed.connect(lambda _=None, vid=viewer_id: self._drop_viewer(vid))
+        new = {(id(owner), key) for owner, key in items}
+        old = self._visible.get(viewer_id, set())
+        self._visible[viewer_id] = new
+        for entry_key in new - old:
+            self._pins[entry_key] = self._pins.get(entry_key, 0) + 1
+        hidden = self._unpin(old - new)
+        for entry_key in new:
+            if entry_key in self._entries:
+                self._entries.move_to_end(entry_key)
+        if self._low_memory and hidden:
+            self._evict_where(lambda entry_key: entry_key in hidden)
+
+    def clear_visible(self, viewer: QObject) -> None:
+        # 뷰가 숨겨질 때
+        if id(viewer) in self._visible:
+            self.set_visible(viewer, ())
+
+    def _drop_viewer(self, viewer_id: int) -> None:
+        self._unpin(self._visible.pop(viewer_id, set()))
+
+    def _unpin(self, entry_keys: Iterable[_EntryKey]) -> Set[_EntryKey]:
+        # 더 이상 어느 뷰에도 보이지 않게 된 항목을 돌려준다
+        hidden = set()
+        for entry_key in entry_keys:
+            left = self._pins.get(entry_key, 0) - 1
+            if left > 0:
+                self._pins[entry_key] = left
+            else:
+                self._pins.pop(entry_key, None)
+                hidden.add(entry_key)
+        return hidden
+
+    # ---- 내보내기 ----
+
+    def _trim(self, keep: Optional[_EntryKey] = None) -> None:
+        budget = self.budget_bytes()
+        if self._used <= budget:
+            return
+        # 보이지 않는 항목을 오래된 순으로, 그래도 넘치면 보이는 항목도 오래된 순으로 버린다
+        for pinned in (False, True):
+            for entry_key in list(self._entries):
+                if self._used <= budget:
+                    return
+                if entry_key == keep or (entry_key in self._pins) != pinned:
+                    continue
+                self._evict(entry_key)
+
+    def _evict_where(self, predicate) -> None:
+        for entry_key in [k for k in self._entries if predicate(k)]:
+            self._evict(entry_key)
+
+    def _evict(self, entry_key: _EntryKey) -> None:
+        entry = self._entries.pop(entry_key)
+        self._used -= entry.nbytes
+        entry.owner._evict_image(entry.key)
+
+
+_budget: Optional[ImageBudget] = None
+
+
+def get_image_budget() -> ImageBudget:
+    global _budget
+    if _budget is None:
+        _budget = ImageBudget()
+    return _budget
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QObject, Qt
+
+from ..repository.library_repository import LibraryProject
+from .thumbnail_loader import ThumbnailLoader, get_thumbnail_loader
+
+
+class LibraryListModel(QAbstractListModel):
+    """프로젝트 라이브러리 목록 모델. 카드 그리기는 ProjectCardDelegate가 담당한다."""
+
+    PathRole = Qt.UserRole
+    ProjectRole = Qt.UserRole + 1
+
+    def __init__(self, loader: ThumbnailLoader | None = None, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._projects: List[LibraryProject] = []
+        self._rows_by_path: Dict[str, int] = {}
+        # 썸네일 경로 -> 행. 공용 로더의 thumbnailReady(에셋/스토리보드 썸네일 포함)마다 전체를 훑지 않도록
+        self._rows_by_thumb: Dict[str, List[int]] = {}
+        self._loader = loader or get_thumbnail_loader()
+        self._loader.thumbnailReady.connect(self._on_thumbnail_ready)
+
+    @property
+    def loader(self) -> ThumbnailLoader:
+        return self._loader
+
+    def set_projects(self, projects: List[LibraryProject]) -> None:
+        self.beginResetModel()
+        self._projects = list(projects)
+        self._rows_by_path = {p.project_path: i for i, p in enumerate(self._projects)}
+        self._rows_by_thumb = {}
+        for i, p in enumerate(self._projects):
+            if p.thumbnail:
+                self._rows_by_thumb.setdefault(p.thumbnail, []).append(i)
+        self.endResetModel()
+
+    def projects(self) -> List[LibraryProject]:
+        return list(self._projects)
+
+    def update_thumbnails(self, thumbnails: Dict[str, Optional[str]]) -> None:
+        # 백그라운드 썸네일 작업 결과 반영: 같은 파일 경로에 다시 쓰므로 캐시도 무효화한다
+        for path, thumb in thumbnails.items():
+            row = self._rows_by_path.get(path)
+            if row is None:
+                continue
+            project = self._projects[row]
+            if project.thumbnail:
+                self._loader.invalidate(project.thumbnail)
+                rows = self._rows_by_thumb.get(project.thumbnail, [])
+                if row in rows:
+                    rows.remove(row)
+            project.thumbnail = thumb
+            if thumb:
+                self._rows_by_thumb.setdefault(thumb, []).append(row)
+            idx = self.index(row)
+            self.dataChanged.emit(idx, idx, [Qt.DecorationRole])
+
+    def update_file_states(self, checks: Dict[str, Any]) -> None:
+        # 라이브러리 무결성 검사(LibraryScanService) 결과 반영. 값은 FileCheck
+        for path, check in checks.items():
+            row = self._rows_by_path.get(path)
+            if row is None:
+                continue
+            project = self._projects[row]
+            if project.file_state == check.state:
+                continue
+            project.file_state = check.state
+            if check.size is not None:
+                project.file_size, project.file_mtime = check.size, check.mtime
+            idx = self.index(row)
+            self.dataChanged.emit(idx, idx, [self.ProjectRole])
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else len(self._projects)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:  # type: ignore[override]
+        if not index.isValid():
+            return None
+        p = self._projects[index.row()]
+        if role == Qt.DisplayRole:
+            return p.title
+        if role == Qt.ToolTipRole:
+            return p.project_path
+        if role == self.PathRole:
+            return p.project_path
+        if role == self.ProjectRole:
+            return p
+        return None
+
+    def _on_thumbnail_ready(self, path: str) -> None:
+        for row in self._rows_by_thumb.get(path, ()):
+            idx = self.index(row)
+            self.dataChanged.emit(idx, idx, [Qt.DecorationRole])
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import os
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from PySide6.QtCore import QObject, QSize
+
+from .background import run_in_background
+from .image_budget import get_image_budget
+from .thumbnail_loader import ThumbnailLoader, get_thumbnail_loader
+
+# 행 하나의 (썸네일 경로, 원본 폴백). 썸네일이 없으면 원본을 첫 후보로 쓴다
+ImagePaths = Tuple[Optional[str], Optional[str]]
+
+
+def row_image_paths(project_dir: Optional[str], thumbnail_path: Optional[str], project_path: Optional[str]) -> ImagePaths:
+    """저장소 행의 상대 경로를 타일에 넘길 절대 경로 (썸네일, 원본 폴백)으로 바꾼다."""
+    if not project_dir:
+        return None, None
+    thumb = os.path.join(project_dir, thumbnail_path) if thumbnail_path else None
+    fallback = os.path.join(project_dir, project_path) if project_path else None
+    if not thumb:
+        return fallback, None
+    return thumb, fallback
+
+
+class ScenePrefetcher(QObject):
+    """장면 단위로 나뉜 목록(스토리보드 샷, 최종 이미지)의 이웃 장면 미리 읽기.
+
+    뷰는 현재 장면의 행만 읽어 타일을 만들고, prefetch()로 이전/다음 장면을 넘긴다. 이웃 장면의 행은
+    워커 스레드에서 읽어 두고 썸네일은 공용 로더로 미리 디코딩한다(저메모리 모드에서는 행만).
+    장면을 바꿀 때 take()가 미리 읽은 행을 내주면 GUI 스레드에서 DB를 읽지 않고 바로 그린다.
+    캐시는 마지막으로 요청한 이웃 장면만 들고 있으며, 프로젝트가 바뀌거나 편집이 생기면 invalidate()한다.
+    """
+
+    def __init__(
+        self,
+        image_paths: Callable[[Any], ImagePaths],
+        size: QSize,
+        loader: ThumbnailLoader | None = None,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self._image_paths = image_paths
+        self._size = size
+        self._loader = loader or get_thumbnail_loader()
+        self._rows: Dict[int, List[Any]] = {}
+        self._in_flight: set[int] = set()
+        self._wanted: set[int] = set()
+        # invalidate()마다 올려서 그 전에 시작한 읽기 결과를 버린다
+        self._generation = 0
+
+    def take(self, scene_id: int) -> Optional[List[Any]]:
+        # 미리 읽어 둔 행을 한 번만 내준다(이후 편집은 현재 장면에서 일어나므로 다시 쓰지 않는다)
+        return self._rows.pop(scene_id, None)
+
+    def prefetch(self, load_rows: Callable[[int], List[Any]], scene_ids: Iterable[int]) -> None:
+        """load_rows(scene_id)로 scene_ids의 행을 백그라운드에서 읽어 둔다. 다른 장면의 캐시는 버린다."""
+        self._wanted = set(scene_ids)
+        for scene_id in [sid for sid in self._rows if sid not in self._wanted]:
+            del self._rows[scene_id]
+        generation = self._generation
+        for scene_id in self._wanted:
+            if scene_id in self._rows or scene_id in self._in_flight:
+                continue
+            self._in_flight.add(scene_id)
+            run_in_background(
+                load_rows,
+                scene_id,
+                on_done=lambda rows, sid=scene_id, gen=generation: self._on_loaded(gen, sid, rows),
+                on_error=lambda _e, sid=scene_id: self._in_flight.discard(sid),
+            )
+
+    def invalidate(self) -> None:
+        self._generation += 1
+        self._rows.clear()
+        self._in_flight.clear()
+        self._wanted = set()
+
+    def _on_loaded(self, generation: int, scene_id: int, rows: List[Any]) -> None:
+        if generation != self._generation:
+            return
+        self._in_flight.discard(scene_id)
+        if scene_id not in self._wanted:
+            return
+        self._rows[scene_id] = rows
+        if not get_image_budget().is_low_memory():
+            self._loader.prefetch(self._paths(rows), self._size)
+
+    def _paths(self, rows: Sequence[Any]) -> List[Tuple[str, Optional[str]]]:
+        paths = []
+        for row in rows:
+            thumb, fallback = self._image_paths(row)
+            if thumb:
+                paths.append((thumb, fallback))
+        return paths
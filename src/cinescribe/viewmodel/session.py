@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from typing import List
+
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QAbstractItemView, QScrollBar
+
+
+def restore_scroll_later(bar: QScrollBar, value: int, attempts: int = 30, interval_ms: int = 30) -> None:
+    """레이아웃/페이지 로딩이 끝나 스크롤 범위가 충분해지면 value로 옮긴다.
+
+    목록이 비동기로 채워지는 뷰도 있으므로 범위가 모자라면 잠시 뒤 다시 시도한다.
+    """
+    if value <= 0:
+        return
+
+    def apply(remaining: int) -> None:
+        try:
+            if bar.maximum() >= value or remaining <= 0:
+                bar.setValue(min(value, bar.maximum()))
+                return
+        except RuntimeError:
+            # 위젯이 이미 삭제됨
+            return
+        QTimer.singleShot(interval_ms, lambda: apply(remaining - 1))
+
+    QTimer.singleShot(0, lambda: apply(attempts))
+
+
+def visible_ids(view: QAbstractItemView, role: int) -> List[int]:
+    # 뷰포트에 보이는 행의 role 값(엔티티/에셋 id)을 위에서부터 순서대로 모은다
+    model = view.model()
+    if model is None:
+        return []
+    viewport = view.viewport().rect()
+    ids: List[int] = []
+    for row in range(model.rowCount()):
+        index = model.index(row, 0)
+        if not view.visualRect(index).intersects(viewport):
+            continue
+        value = index.data(role)
+        if value is not None:
+            ids.append(int(value))
+    return ids
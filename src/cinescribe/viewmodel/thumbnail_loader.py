@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import os
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+from PySide6.QtCore import QObject, QRunnable, QSize, QThreadPool, Qt, Signal, Slot
+from PySide6.QtGui import QImage, QImageReader, QPixmap
+
+from .image_budget import ImageBudget, get_image_budget
+
+_Key = Tuple[str, int, int]
+
+
+class _DecodeTask(QRunnable):
+    def __init__(self, loader: "ThumbnailLoader", key: _Key, candidates: Sequence[str]) -> None:
+        super().__init__()
+        self._loader = loader
+        self._key = key
+        self._candidates = candidates
+
+    def run(self) -> None:
+        # 워커 스레드: 파일 존재 확인과 디코딩을 모두 여기서 처리 (QImage는 스레드 안전)
+        _, w, h = self._key
+        image = QImage()
+        for path in self._candidates:
+            if not path or not os.path.exists(path):
+                continue
+            reader = QImageReader(path)
+            reader.setAutoTransform(True)
+            src = reader.size()
+            if src.isValid() and (src.width() > w or src.height() > h):
+                # 디코더 단계에서 축소하므로 원본 해상도 버퍼를 만들지 않는다
+                reader.setScaledSize(src.scaled(QSize(w, h), Qt.KeepAspectRatio))
+            image = reader.read()
+            if not image.isNull():
+                break
+        self._loader._decoded.emit(self._key, image)
+
+
+class ThumbnailLoader(QObject):
+    """썸네일을 백그라운드에서 디코딩하고 캐시하는 공용 로더.
+
+    pixmap()은 캐시에 있으면 즉시 반환하고, 없으면 디코딩을 예약한 뒤 None을 반환한다.
+    디코딩이 끝나면 thumbnailReady(path)가 발생하므로 뷰/모델은 해당 항목만 다시 그리면 된다.
+    캐시 크기는 항목 수가 아니라 ImageBudget의 바이트 예산으로 제한되고, 버리는 순서도 예산이 정한다.
+    """
+
+    thumbnailReady = Signal(str)
+    _decoded = Signal(object, QImage)
+
+    def __init__(self, budget: ImageBudget | None = None, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._budget = budget or get_image_budget()
+        self._cache: Dict[_Key, QPixmap] = {}
+        self._missing: set[_Key] = set()
+        self._pending: set[_Key] = set()
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max(2, QThreadPool.globalInstance().maxThreadCount()))
+        self._decoded.connect(self._on_decoded)
+
+    def pixmap(self, path: str, size: QSize, fallback: str | None = None) -> Optional[QPixmap]:
+        key: _Key = (path, size.width(), size.height())
+        pix = self._cache.get(key)
+        if pix is not None:
+            self._budget.touch(self, key)
+            return pix
+        if key not in self._missing and key not in self._pending:
+            self._pending.add(key)
+            self._pool.start(_DecodeTask(self, key, (path, fallback) if fallback else (path,)))
+        return None
+
+    def prefetch(self, paths: Iterable[Tuple[str, str | None]], size: QSize) -> None:
+        # (path, fallback) 목록을 미리 디코딩해 둔다
+        for path, fallback in paths:
+            self.pixmap(path, size, fallback)
+
+    def set_visible(self, viewer: QObject, paths: Iterable[str], size: QSize) -> None:
+        # viewer 화면에 지금 보이는 썸네일(예산에서 가장 늦게 버려진다)
+        w, h = size.width(), size.height()
+        self._budget.set_visible(viewer, ((self, (path, w, h)) for path in paths))
+
+    def invalidate(self, path: str) -> None:
+        for key in [k for k in self._cache if k[0] == path]:
+            del self._cache[key]
+            self._budget.release(self, key)
+        self._missing = {k for k in self._missing if k[0] != path}
+
+    def reload(self, path: str) -> None:
+        # 파일 내용이 바뀐 경우: 캐시에 있던 크기들을 다시 디코딩하고, 끝나면 thumbnailReady(path)로 뷰가 갱신된다
+        keys = [k for k in (*self._cache, *self._missing) if k[0] == path]
+        self.invalidate(path)
+        for key in keys:
+            if key not in self._pending:
+                self._pending.add(key)
+                self._pool.start(_DecodeTask(self, key, (path,)))
+
+    def clear(self) -> None:
+        for key in self._cache:
+            self._budget.release(self, key)
+        self._cache.clear()
+        self._missing.clear()
+
+    def _evict_image(self, key: _Key) -> None:
+        # ImageBudget이 예산을 맞추려고 버리는 항목
+        self._cache.pop(key, None)
+
+    @Slot(object, QImage)
+    def _on_decoded(self, key: _Key, image: QImage) -> None:
+        self._pending.discard(key)
+        if image.isNull():
+            self._missing.add(key)
+            return
+        # QPixmap 변환은 GUI 스레드에서만 가능
+        pix = QPixmap.fromImage(image)
+        self._cache[key] = pix
+        self._budget.charge(self, key, pix)
+        self.thumbnailReady.emit(key[0])
+
+
+_loader: Optional[ThumbnailLoader] = None
+
+
+def get_thumbnail_loader() -> ThumbnailLoader:
+    global _loader
+    if _loader is None:
+        _loader = ThumbnailLoader()
+    return _loader
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QEvent, QObject, QSize, QTimer
+from PySide6.QtWidgets import QLabel, QListWidget, QListWidgetItem
+
+from .image_budget import get_image_budget
+from .thumbnail_loader import ThumbnailLoader, get_thumbnail_loader
+
+
+class TileImages(QObject):
+    """QListWidget 항목 위젯 안의 QLabel 썸네일을 공용 로더/이미지 예산과 이어 주는 도우미.
+
+    스토리보드/최종 이미지처럼 라벨이 QPixmap을 직접 들고 있는 목록용. 스크롤/크기 변경 때마다
+    보이는 타일을 ImageBudget에 알리고, 저메모리 모드에서는 화면에 보이는 타일만 디코딩하며
+    화면 밖 라벨의 이미지는 비운다.
+    """
+
+    UPDATE_DELAY_MS = 50
+
+    def __init__(self, view: QListWidget, size: QSize, loader: ThumbnailLoader | None = None) -> None:
+        super().__init__(view)
+        self._view = view
+        self._size = size
+        self._loader = loader or get_thumbnail_loader()
+        self._budget = get_image_budget()
+        # (항목, 라벨, 경로, 원본 폴백)
+        self._tiles: List[Tuple[QListWidgetItem, QLabel, str, Optional[str]]] = []
+        self._labels_by_path: Dict[str, List[QLabel]] = {}
+        self._visible_paths: set[str] = set()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.UPDATE_DELAY_MS)
+        self._timer.timeout.connect(self.update)
+        view.verticalScrollBar().valueChanged.connect(self.schedule)
+        view.horizontalScrollBar().valueChanged.connect(self.schedule)
+        view.viewport().installEventFilter(self)
+        self._loader.thumbnailReady.connect(self._on_thumbnail_ready)
+        self._budget.lowMemoryChanged.connect(self._on_low_memory_changed)
+
+    def eventFilter(self, obj, event):  # type: ignore[override]
+        if event.type() == QEvent.Resize:
+            self.schedule()
+        return False
+
+    def clear(self) -> None:
+        # 목록을 다시 만들기 전에 호출
+        self._tiles = []
+        self._labels_by_path = {}
+        self._visible_paths = set()
+
+    def add(self, item: QListWidgetItem, label: QLabel, path: str, fallback: Optional[str] = None) -> None:
+        self._tiles.append((item, label, path, fallback))
+        self._labels_by_path.setdefault(path, []).append(label)
+        # 평소에는 장면 전체를 미리 디코딩하고, 저메모리 모드에서는 보이는 타일만(update에서) 읽는다
+        if not self._budget.is_low_memory():
+            self._show(label, path, fallback)
+        self.schedule()
+
+    def schedule(self) -> None:
+        self._timer.start()
+
+    def update(self) -> None:
+        if not self._view.isVisible():
+            return
+        viewport = self._view.viewport().rect()
+        low_memory = self._budget.is_low_memory()
+        visible: set[str] = set()
+        for item, label, path, fallback in self._tiles:
+            try:
+                shown = self._view.visualItemRect(item).intersects(viewport)
+                if shown:
+                    visible.add(path)
+                    if label.pixmap().isNull():
+                        self._show(label, path, fallback)
+                elif low_memory and not label.pixmap().isNull():
+                    label.clear()
+            except RuntimeError:
+                # 목록을 다시 만드는 중 삭제된 항목/라벨
+                continue
+        self._visible_paths = visible
+        self._loader.set_visible(self._view, visible, self._size)
+
+    def release(self) -> None:
+        # 뷰가 숨겨질 때: 이 목록의 이미지가 예산에서 먼저 버려질 수 있게 한다
+        self._timer.stop()
+        self._visible_paths = set()
+        self._budget.clear_visible(self._view)
+
+    def _on_low_memory_changed(self, _low_memory: bool) -> None:
+        self.update()
+
+    def _show(self, label: QLabel, path: str, fallback: Optional[str]) -> None:
+        pix = self._loader.pixmap(path, self._size, fallback)
+        if pix is not None:
+            label.setPixmap(pix)
+
+    def _on_thumbnail_ready(self, path: str) -> None:
+        labels = self._labels_by_path.get(path)
+        if not labels:
+            return
+        if self._budget.is_low_memory() and path not in self._visible_paths:
+            return
+        pix = self._loader.pixmap(path, self._size)
+        if pix is None:
+            return
+        for label in labels:
+            try:
+                label.setPixmap(pix)
+            except RuntimeError:
+                # 목록을 다시 그리는 중 삭제된 라벨
+                pass
@@ -3,26 +3,35 @@ ShotCanvas - Views 패키지
 GUI 뷰 컴포넌트들
 """
 
-from .main_window import MainWindow
-from .project_hub_view import ProjectHubView
-from .project_library_view import ProjectLibraryView
-from .storyboard_view import StoryboardView
-from .characters_view import CharactersView
-from .assets_view import AssetsView
-from .audio_view import AudioView
-from .cinematic_view import CinematicView
-from .visual_prompt_view import VisualPromptView
-from .final_images_view import FinalImagesView
+from importlib import import_module
 
-__all__ = [
-    'MainWindow',
-    'ProjectHubView',
-    'ProjectLibraryView',
-    'StoryboardView',
-    'CharactersView',
-    'AssetsView',
-    'AudioView',
-    'CinematicView',
-    'VisualPromptView',
-    'FinalImagesView'
-]
+# 공개 이름 -> 정의된 하위 모듈. 처음 접근할 때 import한다
+_LAZY = {
+    'MainWindow': '.main_window',
+    'ProjectHubView': '.project_hub_view',
+    'ProjectLibraryView': '.project_library_view',
+    'StoryboardView': '.storyboard_view',
+    'CharactersView': '.characters_view',
+    'AssetsView': '.assets_view',
+    'AudioView': '.audio_view',
+    'CinematicView': '.cinematic_view',
+    'VisualPromptView': '.visual_prompt_view',
+    'FinalImagesView': '.final_images_view',
+    'GlobalSearchDialog': '.global_search_dialog'
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    # 다음 접근부터는 모듈 __getattr__를 거치지 않도록 캐시
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
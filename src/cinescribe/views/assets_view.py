@@ -1,42 +1,96 @@
 from __future__ import annotations
 
-from PySide6.QtCore import Qt
+import threading
+from collections import Counter
+
+from PySide6.QtCore import Qt, QSize, QTimer
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QLabel,
     QHBoxLayout,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QLineEdit,
     QPushButton,
+    QCheckBox,
+    QMessageBox,
 )
 
 from ..utils.app_state import get_current_project_path
 from ..repository.asset_repository import AssetRepository
+from ..service.asset_fsck_service import AssetFsckService, FsckReport
+from ..viewmodel.asset_list_model import AssetListModel
+from ..viewmodel.asset_watcher import get_asset_watcher
+from ..viewmodel.background import ProgressRelay, run_in_background
+from ..viewmodel.session import restore_scroll_later, visible_ids
+
+
+_ISSUE_LABELS = {
+    "corrupted": "내용이 바뀐 파일",
+    "missing": "없는 파일",
+    "unreadable": "읽을 수 없는 파일",
+    "thumbnail_missing": "없는 썸네일",
+    "unregistered": "등록되지 않은 파일",
+    "orphan_thumbnail": "쓰이지 않는 썸네일",
+}
 
 
 class AssetsView(QWidget):
+    # 입력이 멈춘 뒤 검색을 실행하기까지의 지연(ms)
+    SEARCH_DEBOUNCE_MS = 250
+    THUMB_SIZE = QSize(128, 128)
+
     def __init__(self) -> None:
         super().__init__()
         self._repo: AssetRepository | None = None
+        self._pending_scroll: int | None = None
+        self._fsck_cancel: threading.Event | None = None
 
         root = QVBoxLayout(self)
         toolbar = QHBoxLayout()
         self._search = QLineEdit()
         self._search.setPlaceholderText("검색(tags/filename)")
         btn_refresh = QPushButton("새로고침")
+        # 에셋 파일 해시 전수 검사. 중단하면 다음에 누를 때 이어서 검사한다
+        self._btn_fsck = QPushButton("에셋 검사")
+        # 앱 밖에서 에셋 파일을 고치거나 바꾸면 해시/썸네일을 자동으로 갱신
+        self._watch = QCheckBox("폴더 변경 감시")
+        self._watcher = get_asset_watcher()
+        self._watch.setChecked(self._watcher.is_enabled())
         toolbar.addWidget(self._search)
         toolbar.addWidget(btn_refresh)
-
-        self._list = QListWidget()
-
+        toolbar.addWidget(self._btn_fsck)
+        toolbar.addWidget(self._watch)
+
+        # 아이콘 그리드: 보이는 항목만 썸네일을 요청하고, 스크롤 끝에서 다음 페이지를 가져온다
+        icon_size = self.THUMB_SIZE
+        self._model = AssetListModel(icon_size, parent=self)
+        self._list = QListView()
+        self._list.setViewMode(QListView.IconMode)
+        self._list.setIconSize(icon_size)
+        self._list.setGridSize(QSize(150, 170))
+        self._list.setResizeMode(QListView.Adjust)
+        self._list.setMovement(QListView.Static)
+        self._list.setUniformItemSizes(True)
+        self._list.setWordWrap(True)
+        self._list.setModel(self._model)
+
+        self._status = QLabel("")
         root.addLayout(toolbar)
         root.addWidget(self._list)
+        root.addWidget(self._status)
 
-        self._search.textChanged.connect(self._refresh_assets)
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._refresh_assets)
+
+        self._search.textChanged.connect(self._search_timer.start)
         btn_refresh.clicked.connect(self._refresh_assets)
-        self._list.itemDoubleClicked.connect(self._on_edit_tags)
+        self._btn_fsck.clicked.connect(self._on_fsck)
+        self._list.doubleClicked.connect(self._on_edit_tags)
+        self._watch.toggled.connect(self._watcher.set_enabled)
+        self._watcher.assetsChanged.connect(self._on_assets_changed)
         self._refresh_assets()
 
     def showEvent(self, event) -> None:  # type: ignore[override]
@@ -57,54 +111,129 @@ class AssetsView(QWidget):
         if not db_path:
             return
         if self._repo is None or self._repo._db_path != db_path:
+            # 다른 프로젝트로 바뀌면 이전 프로젝트 검사는 멈춘다(체크포인트가 남아 다음에 이어짐)
+            self.cancel_fsck()
             self._repo = AssetRepository(db_path)
 
     def _refresh_assets(self) -> None:  # 메서드명 변경
+        self._search_timer.stop()
         self._ensure()
         if not self._repo:
             return
-        # 간단 구현: 모든 이미지 에셋 리스트업
-        from PySide6.QtGui import QIcon, QPixmap
-        import os
-        db_path = get_current_project_path()
-        project_dir = os.path.dirname(db_path) if db_path else None
-        self._list.clear()
-        with self._repo._connect() as conn:
-            q = self._search.text().strip()
-            if q:
-                rows = conn.execute(
-                    "SELECT id, filename, project_path, thumbnail_path, tags FROM Assets WHERE kind='image' AND (tags LIKE ? OR filename LIKE ?) ORDER BY id DESC",
-                    (f"%{q}%", f"%{q}%"),
-                ).fetchall()
-            else:
-                rows = conn.execute("SELECT id, filename, project_path, thumbnail_path, tags FROM Assets WHERE kind='image' ORDER BY id DESC").fetchall()
-            for r in rows:
-                text = r["filename"]
-                it = QListWidgetItem(text)
-                it.setData(Qt.UserRole, r["id"])
-                if project_dir and r["thumbnail_path"]:
-                    p = os.path.join(project_dir, r["thumbnail_path"])
-                    if os.path.exists(p):
-                        it.setIcon(QIcon(QPixmap(p)))
-                self._list.addItem(it)
+        # 조회는 모델이 백그라운드에서 페이지 단위로 수행한다
+        self._model.set_source(self._repo._db_path, self._search.text().strip())
+        if self._pending_scroll is not None and self.isVisible():
+            # 첫 페이지가 비동기로 채워지므로 범위가 생길 때까지 재시도하며 맞춘다
+            restore_scroll_later(self._list.verticalScrollBar(), self._pending_scroll)
+            self._pending_scroll = None
+
+    def session_state(self) -> dict:
+        return {
+            "query": self._search.text(),
+            "scroll": self._list.verticalScrollBar().value(),
+            "visible_asset_ids": visible_ids(self._list, AssetListModel.AssetIdRole),
+            "watch": self._watch.isChecked(),
+        }
+
+    def restore_session_state(self, state: dict) -> None:
+        # 검색어는 디바운스 없이 다음 갱신에 바로 적용하고, 스크롤은 페이지가 로드되는 대로 맞춘다
+        self._search.blockSignals(True)
+        self._search.setText(state.get("query") or "")
+        self._search.blockSignals(False)
+        self._pending_scroll = int(state.get("scroll") or 0)
+        self._watch.setChecked(bool(state.get("watch", True)))
+
+    def _on_assets_changed(self, changes: list) -> None:
+        # 썸네일은 ThumbnailLoader가 다시 읽어 목록에 반영되므로 여기서는 알림만 한다
+        modified = sum(1 for c in changes if c.kind == "modified")
+        missing = sum(1 for c in changes if c.kind == "missing")
+        parts = []
+        if modified:
+            parts.append(f"밖에서 바뀐 파일 {modified}개 반영")
+        if missing:
+            parts.append(f"없어진 파일 {missing}개")
+        if parts:
+            self._status.setText(" · ".join(parts))
+
+    def cancel_fsck(self) -> None:
+        if self._fsck_cancel is not None:
+            self._fsck_cancel.set()
+
+    def _on_fsck(self) -> None:
+        if self._fsck_cancel is not None:
+            self.cancel_fsck()
+            return
+        self._ensure()
+        if not self._repo:
+            return
+        service = AssetFsckService(self._repo._db_path)
+        cancel = threading.Event()
+        self._fsck_cancel = cancel
+        self._btn_fsck.setText("검사 중지")
+        relay = ProgressRelay(self)
+        relay.progressed.connect(
+            lambda done, total, msg: self._status.setText(f"에셋 검사 중… {done * 100 // total if total else 100}%")
+        )
+
+        def finished(report: FsckReport) -> None:
+            self._fsck_finished(cancel)
+            self._on_fsck_done(service, report)
+
+        def failed(e: BaseException) -> None:
+            self._fsck_finished(cancel)
+            self._status.setText(f"에셋 검사 실패: {e}")
+
+        self._status.setText("에셋 검사 중…")
+        run_in_background(service.verify, cancel=cancel, progress=relay, on_done=finished, on_error=failed)
+
+    def _fsck_finished(self, cancel: threading.Event) -> None:
+        if self._fsck_cancel is cancel:
+            self._fsck_cancel = None
+            self._btn_fsck.setText("에셋 검사")
+
+    def _on_fsck_done(self, service: AssetFsckService, report: FsckReport) -> None:
+        counts = Counter(issue.kind for issue in report.issues)
+        found = ", ".join(f"{_ISSUE_LABELS.get(kind, kind)} {n}개" for kind, n in counts.items())
+        if not report.complete:
+            self._status.setText("에셋 검사 중단 · 다음에 이어서 검사" + (f" · 지금까지 {found}" if found else ""))
+            return
+        if not report.issues:
+            self._status.setText(f"에셋 {report.assets}개 모두 정상")
+            return
+        self._status.setText(f"에셋 검사 완료 · {found}")
+        reply = QMessageBox.question(
+            self,
+            "에셋 검사",
+            f"{found}\n\n스냅샷에서 원본을 복원하고 없는 썸네일을 다시 만들까요?\n"
+            "(등록되지 않은 파일은 그대로 둡니다. 명령줄 fsck --repair quarantine으로 옮길 수 있습니다.)",
+        )
+        if reply != QMessageBox.Yes:
+            return
+
+        def repaired(result) -> None:
+            self._status.setText(f"복구 {len(result.repaired)}건, 실패 {len(result.failed)}건")
+            self._refresh_assets()
+
+        run_in_background(
+            service.repair,
+            report.issues,
+            on_done=repaired,
+            on_error=lambda e: self._status.setText(f"복구 실패: {e}"),
+        )
 
     def _on_edit_tags(self) -> None:
         if not self._repo:
             return
-        it = self._list.currentItem()
-        if not it:
+        idx = self._list.currentIndex()
+        if not idx.isValid():
+            return
+        asset = self._model.asset_at(idx.row())
+        if asset is None or asset.id is None:
             return
-        asset_id = int(it.data(Qt.UserRole))
         from PySide6.QtWidgets import QInputDialog
 
-        ok = False
-        with self._repo._connect() as conn:
-            row = conn.execute("SELECT tags FROM Assets WHERE id=?", (asset_id,)).fetchone()
-            current = row["tags"] if row else ""
-        text, ok = QInputDialog.getText(self, "태그 편집", "태그(쉼표 구분)", text=current or "")
+        text, ok = QInputDialog.getText(self, "태그 편집", "태그(쉼표 구분)", text=asset.tags or "")
         if not ok:
             return
-        self._repo.update_tags(asset_id, text)
-        self._refresh_assets()
-
-
+        self._repo.update_tags(asset.id, text)
+        self._model.update_tags(idx.row(), text)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QSize
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -14,17 +14,38 @@ from PySide6.QtWidgets import (
     QFileDialog,
 )
 
+from PySide6.QtGui import QIcon
+
 from ..utils.app_state import get_current_project_path
-from ..repository.character_repository import CharacterRepository
+from ..repository.character_repository import Character, CharacterRepository
 from ..service.asset_import_service import AssetImportService
 from ..repository.asset_repository import AssetRepository
+from ..viewmodel.autosave import get_autosave
+from ..viewmodel.session import restore_scroll_later, visible_ids
+from ..viewmodel.image_budget import get_image_budget
+from ..viewmodel.thumbnail_loader import get_thumbnail_loader
 
 
 class CharactersView(QWidget):
+    THUMB_SIZE = QSize(48, 48)
+    # 항목에 저장하는 캐릭터 이미지 에셋 id (세션 복원 시 보이던 썸네일 예열용)
+    AssetIdRole = Qt.UserRole + 1
+
     def __init__(self) -> None:
         super().__init__()
         self._repo: CharacterRepository | None = None
         self._asset_service: AssetImportService | None = None
+        self._characters: dict[int, Character] = {}
+        self._items_by_thumb: dict[str, list[QListWidgetItem]] = {}
+        self._preview_path: str | None = None
+        self._preview_fallback: str | None = None
+        self._thumbs = get_thumbnail_loader()
+        self._autosave = get_autosave()
+        # 선택 변경으로 폼을 채우는 동안에는 자동 저장하지 않는다
+        self._filling_form = False
+        self._pending_session: dict | None = None
+        self._thumbs.thumbnailReady.connect(self._on_thumbnail_ready)
+        get_image_budget().lowMemoryChanged.connect(self._drop_hidden_images)
 
         root = QVBoxLayout(self)
 
@@ -37,6 +58,7 @@ class CharactersView(QWidget):
         content = QHBoxLayout()
         self._list = QListWidget()
         self._list.setMinimumWidth(260)
+        self._list.setIconSize(self.THUMB_SIZE)
 
         right = QVBoxLayout()
         # 섹션 1: 캐릭터 이름
@@ -79,6 +101,8 @@ class CharactersView(QWidget):
         btn_new.clicked.connect(self._on_new)
         btn_del.clicked.connect(self._on_delete)
         btn_save.clicked.connect(self._on_save)
+        self._name.textEdited.connect(self._on_fields_edited)
+        self._design_prompt.textChanged.connect(self._on_fields_edited)
         btn_img.clicked.connect(self._on_set_image)
         btn_img_remove.clicked.connect(self._on_remove_image)
 
@@ -91,6 +115,18 @@ class CharactersView(QWidget):
             pass
         self._refresh()
 
+    def hideEvent(self, event) -> None:  # type: ignore[override]
+        super().hideEvent(event)
+        get_image_budget().clear_visible(self._img_label)
+        self._drop_hidden_images()
+
+    def _drop_hidden_images(self, _low_memory: bool = True) -> None:
+        if get_image_budget().is_low_memory() and not self.isVisible():
+            # 저메모리 모드: 아이콘/미리보기 이미지를 놓아 예산에서 버릴 수 있게 한다(다시 보일 때 _refresh가 채움)
+            self._img_label.clear()
+            for i in range(self._list.count()):
+                self._list.item(i).setIcon(QIcon())
+
     def refresh(self) -> None:
         # 외부에서 호출 가능한 갱신 API
         self._ensure()
@@ -108,29 +144,74 @@ class CharactersView(QWidget):
         self._ensure()
         if not self._repo:
             return
+        # 목록을 다시 읽기 전에 대기 중인 편집을 기록
+        self._autosave.flush_now()
         self._list.clear()
-        from PySide6.QtGui import QIcon, QPixmap
+        self._items_by_thumb = {}
+        self._characters = {}
         import os
         db_path = get_current_project_path()
         project_dir = os.path.dirname(db_path) if db_path else None
-        for c in self._repo.list_characters():
+        # 단일 JOIN 쿼리로 캐릭터와 이미지 경로를 함께 조회, 아이콘은 공용 로더가 비동기로 채운다
+        for c in self._repo.list_characters_with_assets():
+            self._characters[c.id] = c
             it = QListWidgetItem(c.name)
             it.setData(Qt.UserRole, c.id)
-            if c.image_asset_id and project_dir:
-                from ..repository.asset_repository import AssetRepository
-                a = AssetRepository(db_path).get_by_id(c.image_asset_id)
-                p: str | None = None
-                if a and a.thumbnail_path:
-                    t = os.path.join(project_dir, a.thumbnail_path)
-                    if os.path.exists(t):
-                        p = t
-                if not p and a and a.project_path:
-                    t2 = os.path.join(project_dir, a.project_path)
-                    if os.path.exists(t2):
-                        p = t2
-                if p:
-                    it.setIcon(QIcon(QPixmap(p)))
+            it.setData(self.AssetIdRole, c.image_asset_id)
+            paths = self._image_paths(c, project_dir)
+            if paths:
+                self._items_by_thumb.setdefault(paths[0], []).append(it)
+                pix = self._thumbs.pixmap(paths[0], self._list.iconSize(), paths[1])
+                if pix is not None:
+                    it.setIcon(QIcon(pix))
             self._list.addItem(it)
+        # 화면에 보일 때의 마지막 갱신에서 복원해야 이후 showEvent 갱신에 덮이지 않는다
+        if self._pending_session is not None and self.isVisible():
+            self._apply_session_state()
+
+    def session_state(self) -> dict:
+        current = self._list.currentItem()
+        return {
+            "current_id": int(current.data(Qt.UserRole)) if current else None,
+            "scroll": self._list.verticalScrollBar().value(),
+            "visible_asset_ids": visible_ids(self._list, self.AssetIdRole),
+        }
+
+    def restore_session_state(self, state: dict) -> None:
+        self._pending_session = dict(state)
+
+    def _apply_session_state(self) -> None:
+        state, self._pending_session = self._pending_session or {}, None
+        current_id = state.get("current_id")
+        if current_id is not None:
+            for i in range(self._list.count()):
+                if self._list.item(i).data(Qt.UserRole) == current_id:
+                    self._list.setCurrentRow(i)
+                    break
+        restore_scroll_later(self._list.verticalScrollBar(), int(state.get("scroll") or 0))
+
+    def _image_paths(self, c: Character, project_dir: str | None) -> tuple[str, str | None] | None:
+        # (썸네일, 원본 폴백) 절대 경로. 파일 존재 확인은 로더의 워커 스레드에서 수행한다
+        import os
+        if not project_dir:
+            return None
+        thumb = os.path.join(project_dir, c.asset_thumbnail_path) if c.asset_thumbnail_path else None
+        original = os.path.join(project_dir, c.asset_project_path) if c.asset_project_path else None
+        if thumb:
+            return thumb, original
+        if original:
+            return original, None
+        return None
+
+    def _on_thumbnail_ready(self, path: str) -> None:
+        items = self._items_by_thumb.get(path)
+        if items:
+            pix = self._thumbs.pixmap(path, self._list.iconSize())
+            if pix is not None:
+                for it in items:
+                    it.setIcon(QIcon(pix))
+        if self._preview_path == path:
+            self._show_preview()
 
     def _on_select(self) -> None:
         if not self._repo:
@@ -138,32 +219,31 @@ class CharactersView(QWidget):
         it = self._list.currentItem()
         if not it:
             return
-        c = self._repo.get(int(it.data(Qt.UserRole)))
+        c = self._characters.get(int(it.data(Qt.UserRole)))
         if not c:
             return
-        self._name.setText(c.name)
-        self._design_prompt.setPlainText(c.design_prompt or "")
+        self._filling_form = True
+        try:
+            self._name.setText(c.name)
+            self._design_prompt.setPlainText(c.design_prompt or "")
+        finally:
+            self._filling_form = False
         # 이미지 미리보기 업데이트
-        from PySide6.QtGui import QPixmap
         import os
         self._img_label.setText("이미지 미리보기 없음")
         db_path = get_current_project_path()
-        if db_path and c.image_asset_id:
-            from ..repository.asset_repository import AssetRepository
-            a = AssetRepository(db_path).get_by_id(c.image_asset_id)
-            p: str | None = None
-            if a and a.thumbnail_path:
-                t = os.path.join(os.path.dirname(db_path), a.thumbnail_path)
-                if os.path.exists(t):
-                    p = t
-            if not p and a and a.project_path:
-                t2 = os.path.join(os.path.dirname(db_path), a.project_path)
-                if os.path.exists(t2):
-                    p = t2
-            if p:
-                pix = QPixmap(p)
-                if not pix.isNull():
-                    self._img_label.setPixmap(pix.scaled(self._img_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        paths = self._image_paths(c, os.path.dirname(db_path) if db_path else None) if c.image_asset_id else None
+        self._preview_path, self._preview_fallback = paths if paths else (None, None)
+        self._show_preview()
+
+    def _show_preview(self) -> None:
+        if not self._preview_path:
+            return
+        # 미리보기는 라벨 크기로 디코딩하므로 크기가 커도 보이는 동안에는 예산에서 가장 늦게 버려진다
+        self._thumbs.set_visible(self._img_label, (self._preview_path,), self._img_label.size())
+        pix = self._thumbs.pixmap(self._preview_path, self._img_label.size(), self._preview_fallback)
+        if pix is not None:
+            self._img_label.setPixmap(pix)
 
     def _on_new(self) -> None:
         self._ensure()
@@ -183,24 +263,34 @@ class CharactersView(QWidget):
         it = self._list.currentItem()
         if not it:
             return
-        self._repo.delete(int(it.data(Qt.UserRole)))
+        cid = int(it.data(Qt.UserRole))
+        self._autosave.discard("character", cid)
+        self._repo.delete(cid)
         self._refresh()
 
-    def _on_save(self) -> None:
-        if not self._repo:
+    def _on_fields_edited(self) -> None:
+        # 입력은 write-behind 큐에 쌓기만 하고, 기록은 유휴 시점/탭 전환/종료 때 일괄 처리된다
+        if self._filling_form or not self._repo:
             return
         it = self._list.currentItem()
         if not it:
             return
         cid = int(it.data(Qt.UserRole))
-        self._repo.update(
-            cid,
-            name=self._name.text().strip(),
-            design_prompt=self._design_prompt.toPlainText().strip(),
-        )
+        name = self._name.text().strip()
+        design_prompt = self._design_prompt.toPlainText().strip()
+        self._autosave.stage("character", cid, name=name, design_prompt=design_prompt)
+        c = self._characters.get(cid)
+        if c:
+            c.name = name
+            c.design_prompt = design_prompt
         # 목록 표시 이름 즉시 갱신
-        new_name = self._name.text().strip() or "(이름 없음)"
-        it.setText(new_name)
+        it.setText(name or "(이름 없음)")
+
+    def _on_save(self) -> None:
+        # 대기 중인 자동 저장을 즉시 기록
+        self._on_fields_edited()
+        self._autosave.flush_now()
+        self._status.setText("저장 완료")
 
     def _on_set_image(self) -> None:
         if not self._asset_service or not self._repo:
@@ -217,8 +307,7 @@ class CharactersView(QWidget):
             cid = int(it.data(Qt.UserRole))
             asset_id, proj_rel, thumb_rel = self._asset_service.import_image(path)
             self._repo.link_image(cid, asset_id)
-            # 우측 미리보기 & 좌측 아이콘 갱신, 선택 유지
-            self._on_select()
+            # 좌측 아이콘 갱신 후 선택 복원(선택 시 우측 미리보기도 갱신됨)
             self._refresh()
             # restore selection
             for i in range(self._list.count()):
@@ -6,7 +6,6 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QLabel,
     QHBoxLayout,
-    QTextEdit,
     QPushButton,
     QFileDialog,
     QSizePolicy,
@@ -14,6 +13,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtGui import QPalette, QColor
 
 from ..utils.app_state import get_current_project_path
+from ..widgets.json_editor import JsonEditor
 from ..repository.cinematic_repository import CinematicRepository
 import json as _json
 
@@ -43,13 +43,9 @@ class CinematicView(QWidget):
         toolbar.addWidget(self._btn_save)
         toolbar.addWidget(self._btn_export)
 
-        self._editor = QTextEdit()
+        self._editor = JsonEditor()
         self._editor.setPlaceholderText("시네마틱 보드용 JSON 코드를 입력하세요…")
         self._editor.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        try:
-            self._editor.setLineWrapMode(QTextEdit.NoWrap)
-        except Exception:
-            pass
         self._apply_text_contrast()
 
         self._status = QLabel("")
@@ -59,9 +55,10 @@ class CinematicView(QWidget):
         root.addWidget(self._editor)
         root.addWidget(self._status)
 
-        self._btn_load.clicked.connect(self._on_load)
+        self._btn_load.clicked.connect(self._on_reload)
         self._btn_save.clicked.connect(self._on_save)
         self._btn_export.clicked.connect(self._on_export)
+        self._editor.validationMessage.connect(self._status.setText)
 
     def showEvent(self, event) -> None:  # type: ignore[override]
         super().showEvent(event)
@@ -98,24 +95,28 @@ class CinematicView(QWidget):
         self._status.setText(f"현재 프로젝트: {db_path}")
         self._apply_text_contrast()
 
-    def _on_load(self) -> None:
+    def session_state(self) -> dict:
+        return {"editor": self._editor.view_state()}
+
+    def restore_session_state(self, state: dict) -> None:
+        self._editor.restore_view_state(state.get("editor") or {})
+
+    def _on_load(self, force: bool = False) -> None:
         self._ensure_repo()
         if not self._repo:
             return
         board = self._repo.get()
+        # 저장된 원문이 이전과 같으면 편집기를 다시 채우지 않는다(파싱/렌더링 생략, 편집 중 내용 유지)
         if board is None:
-            self._editor.setPlainText("")
+            self._editor.set_source("", pretty=False, force=force)
         else:
-            if board.format == "json":
-                try:
-                    data = _json.loads(board.content)
-                    self._editor.setPlainText(_json.dumps(data, ensure_ascii=False, indent=2))
-                except Exception:
-                    self._editor.setPlainText(board.content)
-            else:
-                self._editor.setPlainText(board.content)
+            self._editor.set_source(board.content, pretty=board.format == "json", force=force)
         self._status.setText("불러오기 완료: 시네마틱 보드")
 
+    def _on_reload(self) -> None:
+        # 불러오기 버튼: 편집 중 내용을 버리고 저장된 내용으로 되돌린다
+        self._on_load(force=True)
+
     def _on_save(self) -> None:
         self._ensure_repo()
         if not self._repo:
@@ -131,6 +132,7 @@ class CinematicView(QWidget):
             print(f"CinematicView JSON 변환 성공: {json_content[:100]}...")
             
             result_id = self._repo.upsert("json", json_content)
+            self._editor.mark_source(json_content)
             print(f"CinematicView 저장 성공: ID={result_id}")
             self._status.setText("저장 완료: 시네마틱 보드(JSON)")
             
@@ -139,6 +141,7 @@ class CinematicView(QWidget):
             print(f"CinematicView JSON 파싱 실패, text로 저장: {e}")
             try:
                 result_id = self._repo.upsert("text", content)
+                self._editor.mark_source(content, pretty=False)
                 print(f"CinematicView text 저장 성공: ID={result_id}")
                 self._status.setText("저장 완료: 시네마틱 보드(Text)")
             except Exception as text_e:
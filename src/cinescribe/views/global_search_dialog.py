@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import threading
+
+from PySide6.QtCore import Qt, QTimer, Signal
+from PySide6.QtWidgets import (
+    QDialog,
+    QVBoxLayout,
+    QLineEdit,
+    QListWidget,
+    QListWidgetItem,
+    QLabel,
+)
+
+from ..service.global_search_service import GlobalSearchResult, GlobalSearchService
+from ..viewmodel.background import run_in_background
+
+_KIND_LABELS = {"shot": "샷", "scene": "장면", "character": "캐릭터", "document": "문서"}
+
+
+class GlobalSearchDialog(QDialog):
+    """라이브러리 전체 프로젝트 검색. 결과를 두 번 클릭하면 projectRequested(경로)를 보낸다."""
+
+    SEARCH_DEBOUNCE_MS = 300
+    # 입력 중 한 번의 검색이 UI 반응을 오래 붙잡지 않도록 제한
+    SEARCH_TIMEOUT_SEC = 5.0
+
+    projectRequested = Signal(str)
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("전체 프로젝트 검색")
+        self.resize(720, 480)
+        self._service = GlobalSearchService()
+        self._cancel: threading.Event | None = None
+        self._generation = 0
+
+        root = QVBoxLayout(self)
+        self._query = QLineEdit()
+        self._query.setPlaceholderText("샷/장면/캐릭터/문서 내용 검색")
+        self._results = QListWidget()
+        self._status = QLabel("")
+        root.addWidget(self._query)
+        root.addWidget(self._results, 1)
+        root.addWidget(self._status)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self._timer.timeout.connect(self._start_search)
+        self._query.textChanged.connect(self._timer.start)
+        self._query.returnPressed.connect(self._start_search)
+        self._results.itemDoubleClicked.connect(self._on_item_activated)
+
+    def _start_search(self) -> None:
+        self._timer.stop()
+        # 이전 검색은 진행 중인 쿼리까지 중단시키고, 늦게 도착한 결과는 세대 번호로 버린다
+        if self._cancel is not None:
+            self._cancel.set()
+        text = self._query.text().strip()
+        self._generation += 1
+        if not text:
+            self._results.clear()
+            self._status.setText("")
+            return
+        generation = self._generation
+        self._cancel = threading.Event()
+        self._status.setText("검색 중…")
+        run_in_background(
+            self._service.search,
+            text,
+            cancel=self._cancel,
+            timeout=self.SEARCH_TIMEOUT_SEC,
+            on_done=lambda result: self._on_results(generation, result),
+            on_error=lambda e: self._on_failed(generation, e),
+        )
+
+    def _on_results(self, generation: int, result: GlobalSearchResult) -> None:
+        if generation != self._generation:
+            return
+        self._results.clear()
+        for hit in result.hits:
+            kind = _KIND_LABELS.get(hit.kind, hit.kind)
+            item = QListWidgetItem(f"{hit.project_title} · {kind} {hit.title}\n    {hit.snippet}")
+            item.setData(Qt.UserRole, hit.project_path)
+            item.setToolTip(hit.project_path)
+            self._results.addItem(item)
+        status = f"{len(result.hits)}건 · 프로젝트 {result.searched}개 · {result.elapsed * 1000:.0f}ms"
+        if result.cancelled:
+            status += " · 시간 초과로 일부만 검색"
+        if result.unindexed:
+            status += f" · 색인 없는 프로젝트 {len(result.unindexed)}개(한 번 열면 색인됨)"
+        if result.failed:
+            status += f" · 실패 {len(result.failed)}개"
+        self._status.setText(status)
+
+    def _on_failed(self, generation: int, error: BaseException) -> None:
+        if generation == self._generation:
+            self._status.setText(f"검색 실패: {error}")
+
+    def _on_item_activated(self, item: QListWidgetItem) -> None:
+        path = item.data(Qt.UserRole)
+        if path:
+            self.projectRequested.emit(path)
+            self.accept()
+
+    def done(self, result: int) -> None:  # type: ignore[override]
+        if self._cancel is not None:
+            self._cancel.set()
+        super().done(result)
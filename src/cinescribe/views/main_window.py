@@ -1,8 +1,12 @@
 from __future__ import annotations
 
-from PySide6.QtCore import Qt
+import os
+
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import (
     QMainWindow,
+    QMessageBox,
+    QToolButton,
     QWidget,
     QTabWidget,
 )
@@ -16,8 +20,20 @@ from .final_images_view import FinalImagesView
 from .audio_view import AudioView
 from .characters_view import CharactersView
 from .assets_view import AssetsView
-from ..utils.app_state import get_current_project_path
+from ..utils.app_state import get_current_project_path, set_current_project_path
+from ..utils.startup_profiler import get_startup_profiler
 from ..service.library_service import LibraryService
+from ..service.session_service import SessionService, SessionState
+from ..service.snapshot_service import SnapshotService
+from ..viewmodel.asset_watcher import get_asset_watcher
+from ..viewmodel.autosave import get_autosave
+from ..viewmodel.background import run_in_background
+from ..viewmodel.image_budget import MB, get_image_budget
+from ..viewmodel.thumbnail_loader import get_thumbnail_loader
+
+
+# 프로젝트가 열려 있는 동안 자동 스냅샷 간격
+SNAPSHOT_INTERVAL_MS = 60 * 60 * 1000
 
 
 class MainWindow(QMainWindow):
@@ -35,6 +51,18 @@ class MainWindow(QMainWindow):
         self._audio_view = AudioView()
         self._characters_view = CharactersView()
         self._assets_view = AssetsView()
+        # 세션 스냅샷에 쓰는 탭 키 -> 뷰
+        self._session_views = {
+            "logline": self._project_hub_view,
+            "visual": self._visual_prompt_view,
+            "cinematic": self._cinematic_view,
+            "storyboard": self._storyboard_view,
+            "final_images": self._final_images_view,
+            "audio": self._audio_view,
+            "characters": self._characters_view,
+            "assets": self._assets_view,
+        }
+        self._session = SessionService()
 
         # Left tab bar (West) + content handled by QTabWidget
         self._tabs = QTabWidget()
@@ -49,11 +77,153 @@ class MainWindow(QMainWindow):
 
         # 창 제목을 현재 프로젝트에 맞춰 동기화하는 타이머/훅은 단순화를 위해 focus 이벤트에서 처리
         self._library_service = LibraryService()
+        self._autosave = get_autosave()
+        self._autosave.flushFailed.connect(lambda msg: print(f"자동 저장 실패: {msg}"))
+        # 열린 프로젝트의 에셋 폴더를 감시해 앱 밖에서 바뀐 이미지를 반영
+        self._asset_watcher = get_asset_watcher()
+
+        # 저메모리 모드: 이미지 메모리 예산을 줄이고 숨겨진 탭의 타일/이미지를 해제한다
+        self._image_budget = get_image_budget()
+        self._low_memory_button = QToolButton()
+        self._low_memory_button.setText("저메모리")
+        self._low_memory_button.setCheckable(True)
+        self._low_memory_button.setChecked(self._image_budget.is_low_memory())
+        self._low_memory_button.toggled.connect(self._on_low_memory_toggled)
+        self._image_budget.lowMemoryChanged.connect(self._on_low_memory_changed)
+        self._tabs.setCornerWidget(self._low_memory_button, Qt.TopRightCorner)
+        self._update_memory_tooltip()
 
         self.setCentralWidget(self._tabs)
 
+        # 매시간 열린 프로젝트의 증분 스냅샷(바뀐 내용만 저장)
+        self._snapshots = SnapshotService()
+        self._snapshot_running = False
+        self._snapshot_timer = QTimer(self)
+        self._snapshot_timer.setInterval(SNAPSHOT_INTERVAL_MS)
+        self._snapshot_timer.timeout.connect(self._take_snapshot)
+        self._snapshot_timer.start()
+
         # Start in library-only mode
         self.enter_library_mode()
+        # 마지막 세션이 있으면 그 프로젝트/탭으로 바로 들어간다
+        self._restore_session()
+
+    def closeEvent(self, event) -> None:  # type: ignore[override]
+        # 종료 전에 대기 중인 자동 저장을 모두 기록
+        self._autosave.flush_now()
+        self._save_session()
+        # 진행 중인 에셋 검사는 체크포인트까지 기록하고 멈춘다
+        self._assets_view.cancel_fsck()
+        super().closeEvent(event)
+
+    def _restore_session(self) -> None:
+        state = self._session.load()
+        if state is not None and state.low_memory:
+            self._image_budget.set_low_memory(True)
+        if state is None or not state.project_path:
+            return
+        if not self._session.is_project_file(state.project_path):
+            self._abandon_session_project(state, "프로젝트 파일이 없거나 열 수 없습니다.")
+            return
+        try:
+            self._enter_session_project(state)
+        except Exception as e:
+            # 깨진 프로젝트로 매번 시작이 실패하지 않도록 라이브러리 화면으로 돌아간다
+            self._abandon_session_project(state, str(e))
+            return
+        get_startup_profiler().mark("session_restored")
+
+    def _enter_session_project(self, state: SessionState) -> None:
+        set_current_project_path(state.project_path)
+        # 보이던 썸네일은 탭 구성과 동시에 워커 스레드에서 디코딩을 시작하고, DB 페이지는 백그라운드에서 예열
+        view = self._session_views.get(state.tab or "")
+        view_state = state.views.get(state.tab or "") or {}
+        size = getattr(view, "THUMB_SIZE", None)
+        if size is not None and view_state.get("visible_asset_ids"):
+            paths = self._session.thumbnail_paths(state.project_path, view_state["visible_asset_ids"])
+            get_thumbnail_loader().prefetch(paths, size)
+        run_in_background(self._session.prewarm, state.project_path, on_error=lambda e: None)
+        for key, v in self._session_views.items():
+            if isinstance(state.views.get(key), dict):
+                v.restore_session_state(state.views[key])
+        self.enter_project_mode(tab=state.tab)
+
+    def _abandon_session_project(self, state: SessionState, reason: str) -> None:
+        path = state.project_path
+        if self._tabs.indexOf(self._project_library_view) < 0:
+            # 프로젝트 탭까지 만든 뒤 실패한 경우
+            try:
+                self._tabs.currentChanged.disconnect(self._on_tabs_changed)
+            except Exception:
+                pass
+        set_current_project_path(None)
+        self.enter_library_mode()
+        try:
+            self._session.save(SessionState(low_memory=state.low_memory))
+        except OSError as e:
+            print(f"세션 저장 실패: {e}")
+        print(f"마지막 프로젝트를 열지 못했습니다: {path}: {reason}")
+        # 시작을 막지 않도록 이벤트 루프가 돈 뒤 비모달로 알린다
+        box = QMessageBox(
+            QMessageBox.Warning, "세션 복원", f"마지막 프로젝트를 열지 못했습니다.\n{path}\n\n{reason}", QMessageBox.Ok, self
+        )
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        QTimer.singleShot(0, box.open)
+
+    def _save_session(self) -> None:
+        state = SessionState(low_memory=self._image_budget.is_low_memory())
+        if self._tabs.indexOf(self._project_library_view) < 0:
+            state.project_path = get_current_project_path()
+            current = self._tabs.currentWidget()
+            state.tab = next((k for k, v in self._session_views.items() if v is current), None)
+            for key, v in self._session_views.items():
+                try:
+                    state.views[key] = v.session_state()
+                except Exception:
+                    pass
+        try:
+            self._session.save(state)
+        except OSError as e:
+            print(f"세션 저장 실패: {e}")
+
+    def _on_low_memory_toggled(self, enabled: bool) -> None:
+        self._image_budget.set_low_memory(enabled)
+        self._save_session()
+
+    def _on_low_memory_changed(self, enabled: bool) -> None:
+        # 세션 복원/환경 변수로 바뀐 경우에도 버튼을 맞춘다(저장은 사용자가 누른 경우만)
+        self._low_memory_button.blockSignals(True)
+        self._low_memory_button.setChecked(enabled)
+        self._low_memory_button.blockSignals(False)
+        self._update_memory_tooltip()
+
+    def _update_memory_tooltip(self) -> None:
+        budget = self._image_budget
+        self._low_memory_button.setToolTip(
+            f"저메모리 모드: 이미지 예산을 줄이고 숨겨진 탭의 이미지를 해제합니다.\n"
+            f"이미지 메모리 {budget.used_bytes() / MB:.0f} / {budget.budget_bytes() / MB:.0f} MB"
+        )
+
+    def _take_snapshot(self) -> None:
+        path = get_current_project_path()
+        if self._snapshot_running or not path or self._tabs.indexOf(self._project_library_view) >= 0:
+            return
+        # 스냅샷에 최신 편집이 들어가도록 대기 중인 자동 저장을 먼저 기록
+        self._autosave.flush_now()
+        self._snapshot_running = True
+
+        def job() -> None:
+            self._snapshots.create_snapshot(path)
+            self._snapshots.prune(path)
+
+        def finished(_=None) -> None:
+            self._snapshot_running = False
+
+        def failed(e: Exception) -> None:
+            finished()
+            print(f"자동 스냅샷 실패: {e}")
+
+        run_in_background(job, on_done=finished, on_error=failed)
 
     def focusInEvent(self, event) -> None:  # type: ignore[override]
         super().focusInEvent(event)
@@ -74,8 +244,9 @@ class MainWindow(QMainWindow):
         self._tabs.clear()
         self._tabs.addTab(self._project_library_view, "프로젝트 관리")
         self.setWindowTitle("ShotCanvas")
+        self._asset_watcher.set_project(None)
 
-    def enter_project_mode(self) -> None:
+    def enter_project_mode(self, tab: str | None = None) -> None:
         # Build project tabs: Back + modules
         self._tabs.clear()
         self._tabs.addTab(QWidget(), "뒤로가기")
@@ -87,7 +258,8 @@ class MainWindow(QMainWindow):
         self._tabs.addTab(self._audio_view, "오디오")
         self._tabs.addTab(self._characters_view, "캐릭터")
         self._tabs.addTab(self._assets_view, "에셋")
-        self._tabs.setCurrentIndex(1)
+        view = self._session_views.get(tab or "")
+        self._tabs.setCurrentIndex(self._tabs.indexOf(view) if view is not None else 1)
         # Hook tab change for back behavior + 데이터 새로고침
         self._tabs.currentChanged.connect(self._on_tabs_changed)
         # 진입 즉시 현재 탭 데이터 갱신 시도
@@ -95,11 +267,15 @@ class MainWindow(QMainWindow):
             self._refresh_current_tab()
         except Exception:
             pass
+        self._asset_watcher.set_project(get_current_project_path())
         # mark opened and update title
         self.mark_project_opened()
         self.focusInEvent(None)  # refresh title
+        self._save_session()
 
     def _on_tabs_changed(self, index: int) -> None:
+        # 탭을 떠날 때 편집 중이던 내용을 기록
+        self._autosave.flush_now()
         if index == 0:
             # Back to project library
             try:
@@ -107,9 +283,12 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
             self.enter_library_mode()
+            self._save_session()
             return
         # 다른 탭으로 전환하면 해당 탭이 refresh를 지원할 경우 호출
         self._refresh_current_tab()
+        self._save_session()
+        self._update_memory_tooltip()
 
     def _refresh_current_tab(self) -> None:
         idx = self._tabs.currentIndex()
@@ -6,7 +6,6 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QLabel,
     QHBoxLayout,
-    QTextEdit,
     QPushButton,
     QFileDialog,
     QSizePolicy,
@@ -15,6 +14,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtGui import QPalette, QColor
 
 from ..utils.app_state import get_current_project_path
+from ..widgets.json_editor import JsonEditor
 from ..service.document_service import DocumentService
 from ..service.project_service import ProjectService
 
@@ -74,13 +74,9 @@ class ProjectHubView(QWidget):
         toolbar.addWidget(self._btn_export)
         logline_section.addLayout(toolbar)
 
-        self._editor = QTextEdit()
+        self._editor = JsonEditor()
         self._editor.setPlaceholderText("여기에 JSON을 입력하세요…")
         self._editor.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        try:
-            self._editor.setLineWrapMode(QTextEdit.NoWrap)
-        except Exception:
-            pass
         self._apply_text_contrast()
         logline_section.addWidget(self._editor)
         
@@ -93,9 +89,10 @@ class ProjectHubView(QWidget):
         # 이벤트 연결
         btn_title_save.clicked.connect(self._on_save_title)
         btn_tags_save.clicked.connect(self._on_save_tags)
-        self._btn_load.clicked.connect(self._on_load)
+        self._btn_load.clicked.connect(self._on_reload)
         self._btn_save.clicked.connect(self._on_save)
         self._btn_export.clicked.connect(self._on_export)
+        self._editor.validationMessage.connect(self._status.setText)
 
     def showEvent(self, event) -> None:  # type: ignore[override]
         super().showEvent(event)
@@ -174,25 +171,25 @@ class ProjectHubView(QWidget):
         except Exception as e:
             self._status.setText(f"태그 저장 실패: {e}")
 
-    def _on_load(self) -> None:
+    def session_state(self) -> dict:
+        return {"editor": self._editor.view_state()}
+
+    def restore_session_state(self, state: dict) -> None:
+        self._editor.restore_view_state(state.get("editor") or {})
+
+    def _on_load(self, force: bool = False) -> None:
         self._ensure_service()
         if not self._doc_service:
             return
-        # Always use 'logline' JSON
-        data = self._doc_service.load_json("logline")
-        import json as _json
-        if data is None:
-            self._editor.setPlainText("")
-        else:
-            # 데이터 타입에 따라 다르게 표시
-            if isinstance(data, dict) and "type" in data and data["type"] == "text":
-                # 텍스트 형식이면 content만 표시
-                self._editor.setPlainText(data.get("content", ""))
-            else:
-                # JSON 형식이면 포맷팅해서 표시
-                self._editor.setPlainText(_json.dumps(data, ensure_ascii=False, indent=2))
+        raw = self._doc_service.load_text("logline")
+        # 원문 해시가 이전과 같으면 다시 파싱/렌더링하지 않는다. 텍스트 형식은 content만 표시
+        self._editor.set_source(raw or "", unwrap_text=True, force=force)
         self._status.setText("불러오기 완료: 로그라인")
 
+    def _on_reload(self) -> None:
+        # 불러오기 버튼: 편집 중 내용을 버리고 저장된 내용으로 되돌린다
+        self._on_load(force=True)
+
     def _on_save(self) -> None:
         self._ensure_service()
         if not self._doc_service:
@@ -215,6 +212,8 @@ class ProjectHubView(QWidget):
                     print("텍스트 형식으로 저장됨")
             
             self._doc_service.save_json("logline", data)
+            # 저장된 원문(DocumentService.save_json과 같은 직렬화)을 기록해 다음 표시 때 재렌더링 방지
+            self._editor.mark_source(_json.dumps(data, ensure_ascii=False), unwrap_text=True)
             self._status.setText("저장 완료: 로그라인")
         except Exception as e:
             self._status.setText(f"저장 실패: {e}")
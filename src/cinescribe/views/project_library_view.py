@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -8,25 +8,41 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QHBoxLayout,
     QPushButton,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QFileDialog,
     QMenu,
     QMessageBox,
+    QProgressDialog,
 )
 
+from ..service.bundle_service import BUNDLE_EXT, BundleService
+from ..service.library_scan_service import LibraryScanService
 from ..service.library_service import LibraryService
 from ..service.project_init_service import ProjectInitService
+from ..service.project_thumbnail_service import ProjectThumbnailService
 from ..utils.app_state import set_current_project_path
-from .project_hub_view import ProjectHubView
-from ..widgets.project_card import ProjectCard
+from ..utils.startup_profiler import get_startup_profiler
+from ..viewmodel.background import ProgressRelay, run_in_background
+from ..viewmodel.library_model import LibraryListModel
+from ..widgets.project_card_delegate import ProjectCardDelegate
 
 
 class ProjectLibraryView(QWidget):
+    SEARCH_DEBOUNCE_MS = 200
+    # 검색어 입력마다 다시 검사하지 않도록 최소 간격을 둔다
+    SCAN_INTERVAL_SEC = 30.0
+
     def __init__(self) -> None:
         super().__init__()
         self._service = LibraryService()
         self._project_init = ProjectInitService()
+        self._thumbnail_service = ProjectThumbnailService()
+        self._thumbnail_job_running = False
+        self._bundle_service = BundleService(self._service)
+        self._progress: QProgressDialog | None = None
+        self._scan_service = LibraryScanService()
+        self._scan_running = False
+        self._last_scan = 0.0
 
         root = QVBoxLayout(self)
 
@@ -36,12 +52,24 @@ class ProjectLibraryView(QWidget):
         self._search.setPlaceholderText("검색: 제목/태그")
         btn_new = QPushButton("새 프로젝트")
         btn_add = QPushButton("기존 추가")
+        btn_import_bundle = QPushButton("번들 가져오기")
+        btn_global_search = QPushButton("전체 검색")
         toolbar.addWidget(self._search)
+        toolbar.addWidget(btn_global_search)
         toolbar.addWidget(btn_new)
         toolbar.addWidget(btn_add)
+        toolbar.addWidget(btn_import_bundle)
 
-        # List
-        self._list = QListWidget()
+        # Card grid: 카드는 델리게이트가 그리므로 행마다 위젯을 만들지 않는다
+        self._model = LibraryListModel(parent=self)
+        self._list = QListView()
+        self._list.setViewMode(QListView.IconMode)
+        self._list.setResizeMode(QListView.Adjust)
+        self._list.setMovement(QListView.Static)
+        self._list.setUniformItemSizes(True)
+        self._list.setSpacing(6)
+        self._list.setItemDelegate(ProjectCardDelegate(self._model.loader, self._list))
+        self._list.setModel(self._model)
         self._list.setContextMenuPolicy(Qt.CustomContextMenu)
         self._empty_label = QLabel("등록된 프로젝트가 없습니다.")
         self._empty_label.setAlignment(Qt.AlignCenter)
@@ -50,33 +78,83 @@ class ProjectLibraryView(QWidget):
         root.addWidget(self._list)
         root.addWidget(self._empty_label)
 
-        self._search.textChanged.connect(self._refresh)
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._refresh)
+
+        self._search.textChanged.connect(self._search_timer.start)
         btn_add.clicked.connect(self._on_add_existing)
         btn_new.clicked.connect(self._on_create_new)
-        self._list.itemDoubleClicked.connect(self._on_open_project)
+        btn_import_bundle.clicked.connect(self._on_import_bundle)
+        btn_global_search.clicked.connect(self._on_global_search)
+        self._list.doubleClicked.connect(self._on_open_project)
         self._list.customContextMenuRequested.connect(self._on_context_menu)
 
-        self._refresh()
+    def showEvent(self, event) -> None:  # type: ignore[override]
+        super().showEvent(event)
+        # 처음 보일 때 목록을 읽고, 라이브러리로 돌아올 때마다 최근 열람 순서와 썸네일을 갱신한다
+        # (생성자에서 따로 읽지 않는다: 시작 화면이 곧바로 보이므로 두 번 읽게 됨)
+        # 썸네일 갱신은 보일 때 한 번만 돌린다(검색어 입력마다 돌리지 않는다)
+        self._start_thumbnail_job(self._refresh())
 
-    def _refresh(self) -> None:
+    def _refresh(self) -> list:
+        self._search_timer.stop()
         query = self._search.text().strip()
         projects = self._service.search(query=query)
-        self._list.clear()
-        for p in projects:
-            card = ProjectCard(title=p.title, path=p.project_path, tags=p.tags or "", last_opened_at=p.last_opened_at)
-            item = QListWidgetItem(self._list)
-            item.setData(Qt.UserRole, p.project_path)
-            item.setSizeHint(card.sizeHint())
-            self._list.addItem(item)
-            self._list.setItemWidget(item, card)
-        self._empty_label.setVisible(self._list.count() == 0)
+        get_startup_profiler().mark("library_query")
+        self._model.set_projects(projects)
+        self._empty_label.setVisible(self._model.rowCount() == 0)
+        self._start_file_scan()
+        return projects
+
+    def _start_file_scan(self) -> None:
+        # 카드는 지난 검사 결과(DB)로 바로 그리고, 실제 파일 상태는 백그라운드에서 확인해 갱신한다
+        import time
+
+        if self._scan_running or time.monotonic() - self._last_scan < self.SCAN_INTERVAL_SEC:
+            return
+        self._scan_running = True
+        self._last_scan = time.monotonic()
+        run_in_background(
+            self._scan_service.scan, on_done=self._on_file_scan_done, on_error=self._on_file_scan_failed
+        )
+
+    def _on_file_scan_done(self, checks) -> None:
+        self._scan_running = False
+        self._model.update_file_states(checks)
+
+    def _on_file_scan_failed(self, error: BaseException) -> None:
+        self._scan_running = False
+        print(f"라이브러리 파일 검사 실패: {error}")
+
+    def _start_thumbnail_job(self, projects) -> None:
+        # 오래되었거나 없는 썸네일만 백그라운드에서 다시 만들고 결과를 모델에 반영
+        if self._thumbnail_job_running or not projects:
+            return
+        self._thumbnail_job_running = True
+        run_in_background(
+            self._thumbnail_service.refresh_stale,
+            projects,
+            on_done=self._on_thumbnails_refreshed,
+            on_error=self._on_thumbnails_failed,
+        )
+
+    def _on_thumbnails_refreshed(self, updated) -> None:
+        self._thumbnail_job_running = False
+        if updated:
+            self._model.update_thumbnails(updated)
+
+    def _on_thumbnails_failed(self, error: BaseException) -> None:
+        self._thumbnail_job_running = False
+        print(f"프로젝트 썸네일 생성 실패: {error}")
 
     def _on_add_existing(self) -> None:
         path, _ = QFileDialog.getOpenFileName(self, "프로젝트 파일 선택", "", "CineScribe (*.cinescribe);;SQLite (*.sqlite *.db);;All Files (*)")
         if not path:
             return
         self._service.register_project(path)
-        self._refresh()
+        self._start_thumbnail_job(self._refresh())
 
     def _on_create_new(self) -> None:
         path, _ = QFileDialog.getSaveFileName(self, "새 프로젝트 저장 위치", "untitled.cinescribe", "CineScribe (*.cinescribe)")
@@ -87,10 +165,24 @@ class ProjectLibraryView(QWidget):
         self._refresh()
 
     def _on_open_project(self) -> None:
-        item = self._list.currentItem()
-        if not item:
+        idx = self._list.currentIndex()
+        if not idx.isValid():
+            return
+        self._open_path(idx.data(LibraryListModel.PathRole))
+
+    def _on_global_search(self) -> None:
+        from .global_search_dialog import GlobalSearchDialog
+
+        dialog = GlobalSearchDialog(self)
+        dialog.projectRequested.connect(self._open_path)
+        dialog.exec()
+
+    def _open_path(self, path: str) -> None:
+        import os
+
+        if not os.path.exists(path):
+            self._offer_locate(path)
             return
-        path = item.data(Qt.UserRole)
         set_current_project_path(path)
         # 메인 윈도우의 스택에서 Project Hub로 전환
         # 부모가 MainWindow 구조를 갖고 있으므로, 약한 참조로 상위 위젯을 탐색합니다.
@@ -109,19 +201,143 @@ class ProjectLibraryView(QWidget):
             pass
 
     def _on_context_menu(self, pos) -> None:
-        item = self._list.itemAt(pos)
-        if not item:
+        idx = self._list.indexAt(pos)
+        if not idx.isValid():
             return
-        path = item.data(Qt.UserRole)
+        path = idx.data(LibraryListModel.PathRole)
+        project = idx.data(LibraryListModel.ProjectRole)
         menu = QMenu(self)
+        act_locate = None
+        if project is not None and project.file_state in ("missing", "unreachable"):
+            act_locate = menu.addAction("위치 다시 찾기…")
+        act_export = menu.addAction("번들로 내보내기…")
+        menu.addSeparator()
         act_remove = menu.addAction("라이브러리에서 제거")
         act_delete = menu.addAction("디스크에서 삭제")
         act = menu.exec(self._list.mapToGlobal(pos))
-        if act == act_remove:
+        if act is not None and act == act_locate:
+            self._locate_project(project)
+        elif act == act_export:
+            self._export_bundle(path)
+        elif act == act_remove:
             self._remove_from_library(path)
         elif act == act_delete:
             self._delete_from_disk(path)
 
+    def _offer_locate(self, path: str) -> None:
+        reply = QMessageBox.question(
+            self,
+            "프로젝트 파일 없음",
+            f"프로젝트 파일을 찾을 수 없습니다.\n{path}\n\n옮겨진 위치를 찾아볼까요?",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.Yes,
+        )
+        if reply != QMessageBox.Yes:
+            return
+        project = next((p for p in self._model.projects() if p.project_path == path), None)
+        if project is not None:
+            self._locate_project(project)
+
+    def _locate_project(self, project) -> None:
+        # 검색 폴더를 훑는 동안 화면이 멈추지 않도록 백그라운드에서 찾는다
+        def on_done(candidates) -> None:
+            if candidates:
+                # 이름만 같은 파일이면 다른 프로젝트일 수 있다고 알린다
+                note = "" if self._scan_service.is_same_project(project, candidates[0]) else (
+                    "\n(파일 크기와 프로젝트 정보가 달라 다른 프로젝트일 수 있습니다)"
+                )
+                reply = QMessageBox.question(
+                    self,
+                    "위치 다시 찾기",
+                    f"다음 위치에서 찾았습니다.\n{candidates[0]}{note}\n\n이 위치로 갱신할까요?",
+                    QMessageBox.Yes | QMessageBox.No,
+                    QMessageBox.Yes,
+                )
+                if reply == QMessageBox.Yes:
+                    self._relocate(project.project_path, candidates[0])
+                    return
+            new_path, _ = QFileDialog.getOpenFileName(
+                self, "프로젝트 파일 직접 선택", "", "CineScribe (*.cinescribe);;SQLite (*.sqlite *.db);;All Files (*)"
+            )
+            if new_path:
+                self._relocate(project.project_path, new_path)
+
+        run_in_background(
+            self._scan_service.rediscover,
+            project,
+            on_done=on_done,
+            on_error=lambda e: QMessageBox.warning(self, "위치 다시 찾기", f"검색 실패: {e}"),
+        )
+
+    def _relocate(self, old_path: str, new_path: str) -> None:
+        self._scan_service.relocate(old_path, new_path)
+        self._last_scan = 0.0
+        self._refresh()
+
+    def _export_bundle(self, path: str) -> None:
+        import os
+
+        default = os.path.splitext(os.path.basename(path))[0] + BUNDLE_EXT
+        out_path, _ = QFileDialog.getSaveFileName(self, "번들로 내보내기", default, f"CineScribe 번들 (*{BUNDLE_EXT})")
+        if not out_path:
+            return
+        relay = self._start_progress("번들 내보내는 중…")
+        run_in_background(
+            self._bundle_service.export_bundle,
+            path,
+            out_path,
+            relay,
+            on_done=lambda result: self._finish_progress(f"번들 저장 완료:\n{result}"),
+            on_error=lambda e: self._finish_progress(f"번들 내보내기 실패: {e}", error=True),
+        )
+
+    def _on_import_bundle(self) -> None:
+        bundle_path, _ = QFileDialog.getOpenFileName(self, "번들 가져오기", "", f"CineScribe 번들 (*{BUNDLE_EXT});;All Files (*)")
+        if not bundle_path:
+            return
+        dest_dir = QFileDialog.getExistingDirectory(self, "프로젝트를 풀 폴더 선택")
+        if not dest_dir:
+            return
+        relay = self._start_progress("번들 가져오는 중…")
+
+        def on_done(db_path: str) -> None:
+            self._finish_progress(f"프로젝트를 가져왔습니다:\n{db_path}")
+            self._refresh()
+
+        run_in_background(
+            self._bundle_service.import_bundle,
+            bundle_path,
+            dest_dir,
+            relay,
+            on_done=on_done,
+            on_error=lambda e: self._finish_progress(f"번들 가져오기 실패: {e}", error=True),
+        )
+
+    def _start_progress(self, label: str) -> ProgressRelay:
+        # 진행률은 0~1000으로 환산해 표시(바이트 수는 int 범위를 넘을 수 있음)
+        self._progress = QProgressDialog(label, None, 0, 1000, self)
+        self._progress.setWindowModality(Qt.WindowModal)
+        self._progress.setMinimumDuration(300)
+        self._progress.setValue(0)
+        relay = ProgressRelay(self)
+        relay.progressed.connect(self._on_progress)
+        return relay
+
+    def _on_progress(self, done, total, message: str) -> None:
+        if self._progress is None:
+            return
+        self._progress.setValue(int(done * 1000 / total) if total else 1000)
+        self._progress.setLabelText(message)
+
+    def _finish_progress(self, message: str, error: bool = False) -> None:
+        if self._progress is not None:
+            self._progress.close()
+            self._progress = None
+        if error:
+            QMessageBox.warning(self, "번들", message)
+        else:
+            QMessageBox.information(self, "번들", message)
+
     def _remove_from_library(self, path: str) -> None:
         self._service.remove(path)
         self._refresh()
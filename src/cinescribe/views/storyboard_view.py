@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from PySide6.QtCore import Qt
+import os
+
+from PySide6.QtCore import Qt, QSize
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -10,34 +12,67 @@ from PySide6.QtWidgets import (
     QListWidgetItem,
     QPushButton,
     QFileDialog,
+    QInputDialog,
     QMenu,
+    QMessageBox,
     QDialog,
     QDialogButtonBox,
     QFormLayout,
     QLineEdit,
     QTextEdit,
+    QDoubleSpinBox,
 )
 
 from ..utils.app_state import get_current_project_path
 from ..repository.scene_shot_repository import SceneShotRepository
 from ..service.asset_import_service import AssetImportService
+from ..service.animatic_service import AnimaticOptions, AnimaticService
+from ..service.contact_sheet_service import ContactSheetService
+from ..service.shot_list_service import ShotListService
+from ..viewmodel.background import ProgressRelay, run_in_background
+from ..viewmodel.autosave import get_autosave
+from ..viewmodel.session import restore_scroll_later, visible_ids
+from ..viewmodel.image_budget import get_image_budget
+from ..viewmodel.tile_images import TileImages
+from ..viewmodel.scene_prefetch import ScenePrefetcher, row_image_paths
+from ..widgets.scene_selector import SceneSelector
 from PySide6.QtGui import QPalette, QColor, QBrush
 
 
 class StoryboardView(QWidget):
+    THUMB_SIZE = QSize(200, 112)
+    # 항목에 저장하는 연결 에셋 id (세션 복원 시 보이던 썸네일 예열용)
+    AssetIdRole = Qt.UserRole + 1
+
     def __init__(self) -> None:
         super().__init__()
 
         self._repo: SceneShotRepository | None = None
         self._asset_service: AssetImportService | None = None
         self._current_scene_id: int | None = None
+        self._autosave = get_autosave()
+        self._pending_session: dict | None = None
 
         root = QVBoxLayout(self)
 
+        # 장면 선택: 현재 장면의 샷만 읽고, 이웃 장면은 백그라운드에서 미리 읽는다
+        self._scene_selector = SceneSelector("샷")
+        self._scene_selector.sceneChanged.connect(self._on_scene_changed)
+        self._scene_selector.addRequested.connect(self._on_new_scene)
+        self._scene_selector.deleteRequested.connect(self._on_delete_scene)
+        self._prefetch = ScenePrefetcher(self._shot_image_paths, self.THUMB_SIZE, parent=self)
+        root.addWidget(self._scene_selector)
+
         # Toolbar: simple actions (이미지 임포트만)
         toolbar = QHBoxLayout()
         btn_import_image = QPushButton("이미지 임포트")
         toolbar.addWidget(btn_import_image)
+        self._btn_contact_sheet = QPushButton("콘티 시트 내보내기")
+        toolbar.addWidget(self._btn_contact_sheet)
+        self._btn_animatic = QPushButton("애니매틱 내보내기")
+        toolbar.addWidget(self._btn_animatic)
+        self._btn_shot_list = QPushButton("샷 리스트 내보내기")
+        toolbar.addWidget(self._btn_shot_list)
 
         # Shots grid(list for MVP)
         self._shots_list = QListWidget()
@@ -47,6 +82,9 @@ class StoryboardView(QWidget):
         self._shots_list.customContextMenuRequested.connect(self._on_context_menu)
         self._shots_list.setDragDropMode(QListWidget.InternalMove)
         self._shots_list.model().rowsMoved.connect(self._on_rows_moved)
+        # 썸네일은 공용 로더가 백그라운드에서 디코딩하고, 보이는 타일은 이미지 예산에 알린다
+        self._tiles = TileImages(self._shots_list, self.THUMB_SIZE)
+        get_image_budget().lowMemoryChanged.connect(self._drop_hidden_tiles)
 
         root.addLayout(toolbar)
         root.addWidget(self._shots_list)
@@ -56,9 +94,11 @@ class StoryboardView(QWidget):
         root.addWidget(self._status)
 
         btn_import_image.clicked.connect(self._on_import_image)
+        self._btn_contact_sheet.clicked.connect(self._on_export_contact_sheet)
+        self._btn_animatic.clicked.connect(self._on_export_animatic)
+        self._btn_shot_list.clicked.connect(self._on_export_shot_list)
 
         self._ensure_repo()
-        self._ensure_default_scene()
         self._refresh_scenes()
         self._apply_text_contrast()
 
@@ -69,10 +109,22 @@ class StoryboardView(QWidget):
             pass
         self.refresh()  # _refresh -> refresh로 수정
 
+    def hideEvent(self, event) -> None:  # type: ignore[override]
+        super().hideEvent(event)
+        self._tiles.release()
+        self._drop_hidden_tiles()
+
+    def _drop_hidden_tiles(self, _low_memory: bool = True) -> None:
+        if get_image_budget().is_low_memory() and not self.isVisible() and self._shots_list.count():
+            # 저메모리 모드: 숨겨진 동안 타일 위젯과 이미지를 버리고 다시 보일 때 같은 위치로 새로 만든다
+            self._pending_session = self.session_state()
+            self._shots_list.clear()
+            self._tiles.clear()
+
     def refresh(self) -> None:
-        # 외부에서 호출 가능한 갱신 API
+        # 외부에서 호출 가능한 갱신 API. 숨겨진 동안 다른 화면에서 바뀌었을 수 있으므로 미리 읽은 장면도 버린다
+        self._prefetch.invalidate()
         self._ensure_repo()
-        self._ensure_default_scene()
         self._refresh_scenes()
         self._apply_text_contrast()
 
@@ -89,85 +141,86 @@ class StoryboardView(QWidget):
             return
         if self._repo is None or self._repo._db_path != db_path:
             self._repo = SceneShotRepository(db_path)
+            # 다른 프로젝트의 장면 id를 이어 쓰지 않도록
+            self._current_scene_id = None
             self._asset_service = AssetImportService(db_path)
+            self._prefetch.invalidate()
 
-    def _ensure_default_scene(self) -> None:
-        # 장면이 하나도 없으면 기본 장면을 자동 생성
+    def _refresh_scenes(self) -> None:
+        self._ensure_repo()
         if not self._repo:
             return
         scenes = self._repo.list_scenes()
         if not scenes:
+            # 장면이 하나도 없으면 기본 장면을 자동 생성
             try:
                 self._repo.create_scene(number=1, name="기본 장면", notes="")
             except Exception:
                 pass
-
-    def _refresh_scenes(self) -> None:
-        self._ensure_repo()
-        if not self._repo:
-            return
-        scenes = self._repo.list_scenes()
+            scenes = self._repo.list_scenes()
         if scenes:
-            self._current_scene_id = scenes[0].id
+            scene_ids = {s.id for s in scenes}
+            pending_scene = (self._pending_session or {}).get("scene_id")
+            if pending_scene in scene_ids:
+                self._current_scene_id = pending_scene
+            elif self._current_scene_id not in scene_ids:
+                self._current_scene_id = scenes[0].id
+            # 장면별 샷 수는 GROUP BY 쿼리 하나로 읽는다
+            self._scene_selector.set_scenes(scenes, self._repo.count_shots_by_scene(), self._current_scene_id)
             self._refresh_shots()
 
-    def _refresh_shots(self) -> None:
+    def _shot_image_paths(self, sh) -> tuple:
+        db_path = get_current_project_path()
+        project_dir = os.path.dirname(db_path) if db_path else None
+        return row_image_paths(project_dir, sh.asset_thumbnail_path, sh.asset_project_path)
+
+    def _refresh_shots(self, shots: list | None = None) -> None:
+        # shots: 미리 읽어 둔 현재 장면의 행(없으면 지금 읽는다)
         if not self._repo or self._current_scene_id is None:
             return
-        shots = self._repo.list_shots(self._current_scene_id)
+        # 다시 읽기 전에 대기 중인 메모 변경을 기록해 목록이 오래된 값을 보여주지 않게 한다
+        self._autosave.flush_now()
+        if shots is None:
+            shots = self._repo.list_shots(self._current_scene_id)
         self._shots_list.clear()
-        from PySide6.QtGui import QPixmap
-        import os
-
-        project_dir = None
-        db_path = get_current_project_path()
-        if db_path:
-            project_dir = os.path.dirname(db_path)
+        self._tiles.clear()
 
         for sh in shots:
             item = QListWidgetItem()
             item.setData(Qt.UserRole, sh.id)
+            item.setData(self.AssetIdRole, sh.storyboard_asset_id)
             try:
                 item.setForeground(QBrush(self._shot_text_qcolor))
             except Exception:
                 pass
 
-            # 이미지 경로
-            thumb_abs = None
-            if project_dir:
-                if sh.asset_thumbnail_path:
-                    t = os.path.join(project_dir, sh.asset_thumbnail_path)
-                    if os.path.exists(t):
-                        thumb_abs = t
-                # 썸네일이 없으면 원본 경로로 폴백
-                if not thumb_abs and getattr(sh, 'asset_project_path', None):
-                    t2 = os.path.join(project_dir, sh.asset_project_path)
-                    if os.path.exists(t2):
-                        thumb_abs = t2
+            # 이미지 경로: (썸네일, 원본 폴백). 파일 확인과 디코딩은 로더의 워커 스레드에서 수행
+            thumb_abs, fallback = self._shot_image_paths(sh)
 
             # 위젯 구성: 이미지 + 메모 + 액션 버튼
             w = QWidget()
             row = QHBoxLayout(w)
             row.setContentsMargins(8, 8, 8, 8)
             img_label = QLabel()
-            img_label.setFixedSize(200, 112)
+            img_label.setFixedSize(self.THUMB_SIZE)
             img_label.setAlignment(Qt.AlignCenter)
-            if thumb_abs:
-                try:
-                    pix = QPixmap(thumb_abs)
-                    if not pix.isNull():
-                        img_label.setPixmap(pix.scaled(img_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation))
-                except Exception:
-                    pass
             memo = QTextEdit()
             memo.setPlaceholderText("메모…")
             memo.setPlainText(sh.description or "")
             memo.setFixedHeight(112)
             btns = QVBoxLayout()
-            btn_save = QPushButton("저장")
+            # 애니매틱에서 이 샷을 보여줄 시간(비우면 기본 길이)
+            duration = QDoubleSpinBox()
+            duration.setRange(0.0, 600.0)
+            duration.setDecimals(1)
+            duration.setSingleStep(0.5)
+            duration.setSuffix(" 초")
+            duration.setSpecialValueText("기본")
+            duration.setValue(sh.duration_sec or 0.0)
+            duration.setToolTip("애니매틱 표시 시간")
+            btns.addWidget(duration)
             btn_replace = QPushButton("교체")
             btn_delete = QPushButton("삭제")
-            btns.addWidget(btn_save)
             btns.addWidget(btn_replace)
             btns.addWidget(btn_delete)
             btns.addStretch(1)
@@ -176,10 +229,12 @@ class StoryboardView(QWidget):
             row.addLayout(btns)
 
             # 콜백 연결
-            def do_save(shot_id: int, edit: QTextEdit) -> None:
-                if not self._repo:
-                    return
-                self._repo.update_shot_meta(shot_id, description=edit.toPlainText().strip())
+            def do_autosave(shot_id: int, edit: QTextEdit) -> None:
+                # 메모는 입력 즉시 write-behind 큐에 쌓고, 유휴 시점에 한 트랜잭션으로 기록된다
+                self._autosave.stage("shot", shot_id, description=edit.toPlainText().strip())
+
+            def do_duration(shot_id: int, value: float) -> None:
+                self._autosave.stage("shot", shot_id, duration_sec=value)
 
             def do_replace(shot_id: int) -> None:
                 if not self._asset_service or not self._repo:
@@ -194,24 +249,147 @@ class StoryboardView(QWidget):
             def do_delete(shot_id: int) -> None:
                 if not self._repo:
                     return
+                self._autosave.discard("shot", shot_id)
                 self._repo.delete_shot(shot_id)
                 self._refresh_shots()
 
-            btn_save.clicked.connect(lambda _, sid=sh.id, e=memo: do_save(sid, e))
+            memo.textChanged.connect(lambda sid=sh.id, e=memo: do_autosave(sid, e))
+            duration.valueChanged.connect(lambda value, sid=sh.id: do_duration(sid, value))
             btn_replace.clicked.connect(lambda _, sid=sh.id: do_replace(sid))
             btn_delete.clicked.connect(lambda _, sid=sh.id: do_delete(sid))
 
             item.setSizeHint(w.sizeHint())
             self._shots_list.addItem(item)
             self._shots_list.setItemWidget(item, w)
+            if thumb_abs:
+                self._tiles.add(item, img_label, thumb_abs, fallback)
+
+        self._scene_selector.set_count(self._current_scene_id, len(shots))
+        # 화면에 보일 때의 마지막 갱신에서 복원해야 이후 showEvent 갱신에 덮이지 않는다
+        if self._pending_session is not None and self.isVisible():
+            self._apply_session_state()
+        # 이전/다음 장면의 샷과 썸네일을 백그라운드에서 미리 읽어 장면 전환을 바로 그린다
+        self._prefetch.prefetch(self._repo.list_shots, self._scene_selector.neighbor_ids(self._current_scene_id))
+
+    def session_state(self) -> dict:
+        if self._pending_session is not None and not self._shots_list.count():
+            # 저메모리 모드로 숨겨져 목록을 비운 상태
+            return dict(self._pending_session)
+        current = self._shots_list.currentItem()
+        return {
+            "scene_id": self._current_scene_id,
+            "current_id": int(current.data(Qt.UserRole)) if current else None,
+            "scroll": self._shots_list.verticalScrollBar().value(),
+            "visible_asset_ids": visible_ids(self._shots_list, self.AssetIdRole),
+        }
+
+    def restore_session_state(self, state: dict) -> None:
+        # 다음 목록 갱신 때 장면/선택/스크롤을 되돌린다
+        self._pending_session = dict(state)
+
+    def _apply_session_state(self) -> None:
+        state, self._pending_session = self._pending_session or {}, None
+        current_id = state.get("current_id")
+        if current_id is not None:
+            for i in range(self._shots_list.count()):
+                if self._shots_list.item(i).data(Qt.UserRole) == current_id:
+                    self._shots_list.setCurrentRow(i)
+                    break
+        restore_scroll_later(self._shots_list.verticalScrollBar(), int(state.get("scroll") or 0))
+
+    def _on_scene_changed(self, scene_id: int) -> None:
+        if scene_id == self._current_scene_id:
+            return
+        self._current_scene_id = scene_id
+        self._refresh_shots(self._prefetch.take(scene_id))
 
-    def _on_scene_changed(self, idx: int) -> None:
-        # 단순화된 UI에서는 사용하지 않음 (호환성 유지)
-        self._refresh_shots()
+    def _on_export_contact_sheet(self) -> None:
+        db_path = get_current_project_path()
+        if not db_path:
+            return
+        out_path, _ = QFileDialog.getSaveFileName(
+            self, "콘티 시트 내보내기", "storyboard.pdf", "PDF (*.pdf);;PNG 페이지 (*.png)"
+        )
+        if not out_path:
+            return
+        # 페이지 렌더링은 프로세스 풀에서 돌고, 진행 상황만 상태 표시줄로 받는다
+        self._btn_contact_sheet.setEnabled(False)
+        relay = ProgressRelay(self)
+        relay.progressed.connect(lambda done, total, msg: self._status.setText(f"콘티 시트 내보내는 중… {msg}"))
+
+        def finished(written) -> None:
+            self._btn_contact_sheet.setEnabled(True)
+            self._status.setText(f"콘티 시트 저장 완료: {written[0]}" + (f" 외 {len(written) - 1}개" if len(written) > 1 else ""))
+
+        def failed(e: BaseException) -> None:
+            self._btn_contact_sheet.setEnabled(True)
+            self._status.setText(f"콘티 시트 내보내기 실패: {e}")
+
+        run_in_background(
+            ContactSheetService(db_path).export, out_path, None, None, relay, on_done=finished, on_error=failed
+        )
+
+    def _on_export_animatic(self) -> None:
+        db_path = get_current_project_path()
+        if not db_path:
+            return
+        out_path, _ = QFileDialog.getSaveFileName(
+            self, "애니매틱 내보내기", "animatic.gif", "GIF (*.gif);;APNG (*.png *.apng)"
+        )
+        if not out_path:
+            return
+        # 대기 중인 샷 길이 변경을 먼저 기록해야 내보내기에 반영된다
+        self._autosave.flush_now()
+        self._btn_animatic.setEnabled(False)
+        relay = ProgressRelay(self)
+        relay.progressed.connect(
+            lambda done, total, msg: self._status.setText(f"애니매틱 내보내는 중… {done}/{total} {msg}")
+        )
+
+        def finished(path: str) -> None:
+            self._btn_animatic.setEnabled(True)
+            self._status.setText(f"애니매틱 저장 완료: {path}")
+
+        def failed(e: BaseException) -> None:
+            self._btn_animatic.setEnabled(True)
+            self._status.setText(f"애니매틱 내보내기 실패: {e}")
+
+        run_in_background(
+            AnimaticService(db_path).export, out_path, AnimaticOptions(), None, relay, on_done=finished, on_error=failed
+        )
+
+    def _on_export_shot_list(self) -> None:
+        db_path = get_current_project_path()
+        if not db_path:
+            return
+        out_path, _ = QFileDialog.getSaveFileName(
+            self, "샷 리스트 내보내기", "shots.csv", "CSV (*.csv);;JSON Lines (*.jsonl)"
+        )
+        if not out_path:
+            return
+        self._autosave.flush_now()
+        self._btn_shot_list.setEnabled(False)
+
+        def finished(count: int) -> None:
+            self._btn_shot_list.setEnabled(True)
+            self._status.setText(f"샷 리스트 저장 완료: {out_path} ({count}개 샷)")
+
+        def failed(e: BaseException) -> None:
+            self._btn_shot_list.setEnabled(True)
+            self._status.setText(f"샷 리스트 내보내기 실패: {e}")
+
+        run_in_background(ShotListService(db_path).export, out_path, on_done=finished, on_error=failed)
 
     def _on_new_scene(self) -> None:
-        # 단순화된 UI에서는 사용하지 않음
-        pass
+        self._ensure_repo()
+        if not self._repo:
+            return
+        number = max((s.number for s in self._repo.list_scenes()), default=0) + 1
+        name, ok = QInputDialog.getText(self, "장면 추가", "장면 이름", text=f"장면 {number}")
+        if not ok:
+            return
+        self._current_scene_id = self._repo.create_scene(number=number, name=name.strip() or f"장면 {number}", notes="")
+        self._refresh_scenes()
 
     def _on_add_shot(self) -> None:
         # 단순화된 UI에서는 사용하지 않음
@@ -224,16 +402,15 @@ class StoryboardView(QWidget):
         if not db_path or not self._asset_service:
             self._status.setText("프로젝트가 열려 있지 않거나 초기화되지 않았습니다.")
             return
-        # 현재 장면이 없으면 기본 장면 보장
-        self._ensure_default_scene()
         if not self._repo:
             self._status.setText("데이터 저장소 초기화 실패")
             return
-        scenes = self._repo.list_scenes()
-        if not scenes:
+        # 현재 장면이 없으면 기본 장면 보장(있으면 지금 보고 있는 장면에 추가)
+        if self._current_scene_id is None:
+            self._refresh_scenes()
+        if self._current_scene_id is None:
             self._status.setText("장면 생성 실패")
             return
-        self._current_scene_id = scenes[0].id
 
         path, _ = QFileDialog.getOpenFileName(self, "이미지 선택", "", "Images (*.png *.jpg *.jpeg *.webp *.bmp);;All Files (*)")
         if not path:
@@ -282,9 +459,24 @@ class StoryboardView(QWidget):
             order.append(int(self._shots_list.item(i).data(Qt.UserRole)))
         self._repo.update_shots_order(self._current_scene_id, order)
 
-    def _on_delete_scene(self) -> None:
-        # 단순화된 UI에서는 사용하지 않음
-        pass
+    def _on_delete_scene(self, scene_id: int) -> None:
+        if not self._repo:
+            return
+        count = self._scene_selector.count(scene_id)
+        reply = QMessageBox.question(
+            self,
+            "장면 삭제",
+            f"이 장면을 삭제할까요?\n샷 {count}개와 이 장면의 오디오 큐, 최종 이미지가 함께 삭제되며 되돌릴 수 없습니다.",
+        )
+        if reply != QMessageBox.Yes:
+            return
+        # 지운 장면 대신 다음(없으면 이전) 장면을 보여준다
+        neighbors = self._scene_selector.neighbor_ids(scene_id)
+        self._autosave.flush_now()
+        self._repo.delete_scene(scene_id)
+        self._current_scene_id = neighbors[-1] if neighbors else None
+        self._prefetch.invalidate()
+        self._refresh_scenes()
 
     def _on_move_scene(self, direction: int) -> None:
         # 단순화된 UI에서는 사용하지 않음
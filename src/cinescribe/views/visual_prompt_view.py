@@ -6,7 +6,6 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QLabel,
     QHBoxLayout,
-    QTextEdit,
     QPushButton,
     QFileDialog,
     QSizePolicy,
@@ -14,6 +13,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtGui import QPalette, QColor
 
 from ..utils.app_state import get_current_project_path
+from ..widgets.json_editor import JsonEditor
 from ..service.document_service import DocumentService
 
 
@@ -44,13 +44,9 @@ class VisualPromptView(QWidget):
         toolbar.addWidget(self._btn_save)
         toolbar.addWidget(self._btn_export)
 
-        self._editor = QTextEdit()
+        self._editor = JsonEditor()
         self._editor.setPlaceholderText("비쥬얼 프롬프트용 JSON 코드를 입력하세요…")
         self._editor.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        try:
-            self._editor.setLineWrapMode(QTextEdit.NoWrap)
-        except Exception:
-            pass
         self._apply_text_contrast()
 
         self._status = QLabel("")
@@ -60,9 +56,10 @@ class VisualPromptView(QWidget):
         root.addWidget(self._editor)
         root.addWidget(self._status)
 
-        self._btn_load.clicked.connect(self._on_load)
+        self._btn_load.clicked.connect(self._on_reload)
         self._btn_save.clicked.connect(self._on_save)
         self._btn_export.clicked.connect(self._on_export)
+        self._editor.validationMessage.connect(self._status.setText)
 
     def showEvent(self, event) -> None:  # type: ignore[override]
         super().showEvent(event)
@@ -99,24 +96,25 @@ class VisualPromptView(QWidget):
         self._status.setText(f"현재 프로젝트: {db_path}")
         self._apply_text_contrast()
 
-    def _on_load(self) -> None:
+    def session_state(self) -> dict:
+        return {"editor": self._editor.view_state()}
+
+    def restore_session_state(self, state: dict) -> None:
+        self._editor.restore_view_state(state.get("editor") or {})
+
+    def _on_load(self, force: bool = False) -> None:
         self._ensure_service()
         if not self._doc_service:
             return
-        data = self._doc_service.load_json(self._DOC_KEY)
-        import json as _json
-        if data is None:
-            self._editor.setPlainText("")
-        else:
-            # 데이터 타입에 따라 다르게 표시
-            if isinstance(data, dict) and "type" in data and data["type"] == "text":
-                # 텍스트 형식이면 content만 표시
-                self._editor.setPlainText(data.get("content", ""))
-            else:
-                # JSON 형식이면 포맷팅해서 표시
-                self._editor.setPlainText(_json.dumps(data, ensure_ascii=False, indent=2))
+        raw = self._doc_service.load_text(self._DOC_KEY)
+        # 원문 해시가 이전과 같으면 다시 파싱/렌더링하지 않는다. 텍스트 형식은 content만 표시
+        self._editor.set_source(raw or "", unwrap_text=True, force=force)
         self._status.setText("불러오기 완료: 비쥬얼 프롬프트")
 
+    def _on_reload(self) -> None:
+        # 불러오기 버튼: 편집 중 내용을 버리고 저장된 내용으로 되돌린다
+        self._on_load(force=True)
+
     def _on_save(self) -> None:
         self._ensure_service()
         if not self._doc_service:
@@ -142,6 +140,8 @@ class VisualPromptView(QWidget):
             
             # 데이터 저장
             self._doc_service.save_json(self._DOC_KEY, data)
+            # 저장된 원문(DocumentService.save_json과 같은 직렬화)을 기록해 다음 표시 때 재렌더링 방지
+            self._editor.mark_source(_json.dumps(data, ensure_ascii=False), unwrap_text=True)
             self._status.setText("저장 완료: 비쥬얼 프롬프트")
             
         except Exception as e:
@@ -3,8 +3,28 @@ ShotCanvas - Widgets 패키지
 재사용 가능한 위젯 컴포넌트들
 """
 
-from .project_card import ProjectCard
+from importlib import import_module
 
-__all__ = [
-    'ProjectCard'
-]
+# 공개 이름 -> 정의된 하위 모듈. 처음 접근할 때 import한다
+_LAZY = {
+    'ProjectCard': '.project_card',
+    'ProjectCardDelegate': '.project_card_delegate',
+    'JsonEditor': '.json_editor',
+    'SceneSelector': '.scene_selector'
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    # 다음 접근부터는 모듈 __getattr__를 거치지 않도록 캐시
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+from PySide6.QtCore import QTimer, Signal
+from PySide6.QtGui import QColor, QTextCursor, QTextFormat
+from PySide6.QtWidgets import QPlainTextEdit, QTextEdit, QWidget
+
+from ..utils.json_text import content_hash, pretty_json, validate_json
+from ..viewmodel.background import run_in_background
+from ..viewmodel.session import restore_scroll_later
+
+
+class JsonEditor(QPlainTextEdit):
+    """대용량 JSON 보드/문서 편집기.
+
+    QPlainTextEdit(블록 단위 레이아웃) 기반이라 수 MB 문서도 가볍게 다룬다.
+    입력이 멈추면 백그라운드에서 JSON 검증을 돌려 오류 위치를 알려주고,
+    set_source()는 저장된 원문 해시가 바뀌지 않았으면 아무것도 다시 그리지 않는다.
+    """
+
+    # (유효 여부, 줄, 열, 메시지) - 유효하면 줄/열은 0
+    validationChanged = Signal(bool, int, int, str)
+    # 같은 결과를 상태 표시줄용 문구로 (뷰는 상태 라벨의 setText에 바로 연결한다)
+    validationMessage = Signal(str)
+
+    VALIDATE_DEBOUNCE_MS = 400
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self._source_key: Tuple[str, bool, bool] | None = None
+        self._error: Tuple[int, int, str] | None = None
+        self._validate_generation = 0
+        self._validating = False
+        self._validate_again = False
+        self._pending_view_state: dict | None = None
+
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(self.VALIDATE_DEBOUNCE_MS)
+        self._validate_timer.timeout.connect(self._start_validation)
+        self.textChanged.connect(self._validate_timer.start)
+
+    def set_source(self, raw: str, *, pretty: bool = True, unwrap_text: bool = False, force: bool = False) -> bool:
+        """저장된 원문을 표시한다. 같은 원문이 이미 표시되어 있으면 건너뛰고 False를 돌려준다."""
+        digest = content_hash(raw)
+        key = (digest, pretty, unwrap_text)
+        if not force and key == self._source_key:
+            self._apply_pending_view_state()
+            return False
+        text = pretty_json(raw, unwrap_text=unwrap_text, digest=digest) if pretty else raw
+        self.setPlainText(text)
+        self._source_key = key
+        self._apply_pending_view_state()
+        return True
+
+    def mark_source(self, raw: str, *, pretty: bool = True, unwrap_text: bool = False) -> None:
+        # 저장 직후 호출: 방금 저장한 원문이 현재 편집 내용에 해당함을 기록해 재렌더링을 막는다
+        self._source_key = (content_hash(raw), pretty, unwrap_text)
+
+    def view_state(self) -> dict:
+        # 세션 저장용: 커서 위치와 스크롤 위치
+        return {"cursor": self.textCursor().position(), "scroll": self.verticalScrollBar().value()}
+
+    def restore_view_state(self, state: dict) -> None:
+        # 화면에 보이는 상태에서 다음 set_source가 호출될 때 적용한다
+        self._pending_view_state = dict(state)
+
+    def _apply_pending_view_state(self) -> None:
+        if self._pending_view_state is None or not self.isVisible():
+            return
+        state, self._pending_view_state = self._pending_view_state, None
+        cursor = self.textCursor()
+        cursor.setPosition(min(int(state.get("cursor") or 0), self.document().characterCount() - 1))
+        self.setTextCursor(cursor)
+        restore_scroll_later(self.verticalScrollBar(), int(state.get("scroll") or 0))
+
+    def error(self) -> Tuple[int, int, str] | None:
+        return self._error
+
+    def goto_error(self) -> None:
+        if not self._error:
+            return
+        line, col, _ = self._error
+        block = self.document().findBlockByNumber(max(0, line - 1))
+        cursor = QTextCursor(block)
+        cursor.movePosition(QTextCursor.Right, QTextCursor.MoveAnchor, max(0, col - 1))
+        self.setTextCursor(cursor)
+        self.centerCursor()
+
+    def _start_validation(self) -> None:
+        if self._validating:
+            # 진행 중인 검증이 끝나면 최신 텍스트로 한 번 더 검증
+            self._validate_again = True
+            return
+        self._validating = True
+        self._validate_generation += 1
+        gen = self._validate_generation
+        run_in_background(
+            validate_json,
+            self.toPlainText(),
+            on_done=lambda result, g=gen: self._on_validated(g, result),
+            on_error=lambda e: self._on_validated(gen, None),
+        )
+
+    def _on_validated(self, gen: int, result: Tuple[int, int, str] | None) -> None:
+        self._validating = False
+        if self._validate_again:
+            self._validate_again = False
+            self._start_validation()
+            return
+        if gen != self._validate_generation:
+            return
+        self._error = result
+        self._highlight_error()
+        if result is None:
+            self.validationChanged.emit(True, 0, 0, "")
+        else:
+            line, col, msg = result
+            self.validationChanged.emit(False, line, col, msg)
+        self.validationMessage.emit(self.validation_text(result))
+
+    @staticmethod
+    def validation_text(error: Tuple[int, int, str] | None) -> str:
+        if error is None:
+            return "JSON 형식 확인됨"
+        line, col, msg = error
+        return f"JSON 오류 {line}행 {col}열: {msg} (저장 시 텍스트로 보관)"
+
+    def _highlight_error(self) -> None:
+        selections = []
+        if self._error:
+            sel = QTextEdit.ExtraSelection()
+            sel.format.setBackground(QColor(255, 80, 80, 70))
+            sel.format.setProperty(QTextFormat.FullWidthSelection, True)
+            sel.cursor = QTextCursor(self.document().findBlockByNumber(max(0, self._error[0] - 1)))
+            selections.append(sel)
+        self.setExtraSelections(selections)
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from PySide6.QtCore import QModelIndex, QRect, QSize, Qt
+from PySide6.QtGui import QColor, QFont, QPainter, QPalette
+from PySide6.QtWidgets import QStyle, QStyledItemDelegate, QStyleOptionViewItem
+
+from ..viewmodel.library_model import LibraryListModel
+from ..viewmodel.thumbnail_loader import ThumbnailLoader
+
+
+class ProjectCardDelegate(QStyledItemDelegate):
+    """프로젝트 카드(썸네일+제목+경로+태그+최근 열람)를 위젯 없이 직접 그린다."""
+
+    CARD_SIZE = QSize(260, 225)
+    THUMB_SIZE = QSize(240, 135)
+    MARGIN = 10
+    # 파일 상태 배지(라이브러리 무결성 검사 결과). 'ok'/'unknown'은 표시하지 않는다
+    STATE_BADGES = {
+        "missing": ("파일 없음", QColor(200, 60, 60)),
+        "unreachable": ("드라이브 응답 없음", QColor(200, 140, 40)),
+        "changed": ("외부에서 변경됨", QColor(70, 120, 200)),
+    }
+
+    def __init__(self, loader: ThumbnailLoader, parent=None) -> None:
+        super().__init__(parent)
+        self._loader = loader
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:  # type: ignore[override]
+        return self.CARD_SIZE
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:  # type: ignore[override]
+        p = index.data(LibraryListModel.ProjectRole)
+        if p is None:
+            return
+        painter.save()
+        pal = option.palette
+        card = option.rect.adjusted(4, 4, -4, -4)
+        selected = bool(option.state & QStyle.State_Selected)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(pal.color(QPalette.Highlight if selected else QPalette.Mid))
+        painter.setBrush(pal.color(QPalette.AlternateBase if selected else QPalette.Base))
+        painter.drawRoundedRect(card, 6, 6)
+
+        m = self.MARGIN
+        thumb_rect = QRect(card.left() + m, card.top() + m, card.width() - 2 * m, self.THUMB_SIZE.height())
+        pix = self._loader.pixmap(p.thumbnail, self.THUMB_SIZE) if p.thumbnail else None
+        if pix is not None:
+            scaled = pix.size().scaled(thumb_rect.size(), Qt.KeepAspectRatio)
+            target = QRect(0, 0, scaled.width(), scaled.height())
+            target.moveCenter(thumb_rect.center())
+            painter.drawPixmap(target, pix)
+        else:
+            painter.fillRect(thumb_rect, pal.color(QPalette.Window))
+            painter.setPen(pal.color(QPalette.PlaceholderText))
+            painter.drawText(thumb_rect, Qt.AlignCenter, "미리보기 없음")
+        badge = self.STATE_BADGES.get(p.file_state)
+        if badge is not None:
+            text, color = badge
+            fm_badge = option.fontMetrics
+            badge_rect = QRect(thumb_rect.left() + 6, thumb_rect.top() + 6,
+                               fm_badge.horizontalAdvance(text) + 12, fm_badge.height() + 4)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(color)
+            painter.drawRoundedRect(badge_rect, 4, 4)
+            painter.setPen(QColor(255, 255, 255))
+            painter.drawText(badge_rect, Qt.AlignCenter, text)
+
+        text_left = card.left() + m
+        text_width = card.width() - 2 * m
+        y = thumb_rect.bottom() + 8
+        fm = option.fontMetrics
+
+        title_font = QFont(option.font)
+        title_font.setBold(True)
+        painter.setFont(title_font)
+        painter.setPen(pal.color(QPalette.Text))
+        line_h = fm.height() + 2
+        painter.drawText(QRect(text_left, y, text_width, line_h), Qt.AlignLeft | Qt.AlignVCenter,
+                         painter.fontMetrics().elidedText(p.title, Qt.ElideRight, text_width))
+        y += line_h
+
+        painter.setFont(option.font)
+        painter.setPen(pal.color(QPalette.PlaceholderText))
+        painter.drawText(QRect(text_left, y, text_width, line_h), Qt.AlignLeft | Qt.AlignVCenter,
+                         fm.elidedText(p.project_path, Qt.ElideMiddle, text_width))
+        y += line_h
+
+        tags = f"# {p.tags}" if p.tags else "# (no-tags)"
+        last = p.last_opened_at or "최근 열람 기록 없음"
+        painter.setPen(pal.color(QPalette.Text))
+        painter.drawText(QRect(text_left, y, text_width, line_h), Qt.AlignLeft | Qt.AlignVCenter,
+                         fm.elidedText(tags, Qt.ElideRight, text_width))
+        y += line_h
+        painter.drawText(QRect(text_left, y, text_width, line_h), Qt.AlignLeft | Qt.AlignVCenter,
+                         fm.elidedText(last, Qt.ElideRight, text_width))
+        painter.restore()
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Sequence
+
+from PySide6.QtCore import Signal
+from PySide6.QtWidgets import QComboBox, QHBoxLayout, QLabel, QPushButton, QSizePolicy, QToolButton, QWidget
+
+from ..repository.scene_shot_repository import Scene
+
+
+class SceneSelector(QWidget):
+    """장면 선택 줄: 이전/다음 버튼 + 장면 드롭다운(항목 수 표시) + 장면 추가/삭제.
+
+    장면 목록과 개수는 뷰가 set_scenes()로 채운다. 사용자가 장면을 고르면 sceneChanged(scene_id)가
+    발생하고, 프로그램에서 목록을 다시 채울 때는 발생하지 않는다.
+    """
+
+    sceneChanged = Signal(int)
+    addRequested = Signal()
+    deleteRequested = Signal(int)
+
+    def __init__(self, unit: str, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        # 개수 표시 단위("샷", "이미지")
+        self._unit = unit
+        self._scenes: List[Scene] = []
+        self._counts: Dict[int, int] = {}
+
+        row = QHBoxLayout(self)
+        row.setContentsMargins(0, 0, 0, 0)
+        row.addWidget(QLabel("장면"))
+        self._btn_prev = QToolButton()
+        self._btn_prev.setText("◀")
+        self._btn_prev.setToolTip("이전 장면")
+        self._combo = QComboBox()
+        self._combo.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self._combo.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
+        self._combo.setMinimumContentsLength(24)
+        self._btn_next = QToolButton()
+        self._btn_next.setText("▶")
+        self._btn_next.setToolTip("다음 장면")
+        btn_add = QPushButton("장면 추가")
+        self._btn_delete = QPushButton("장면 삭제")
+        row.addWidget(self._btn_prev)
+        row.addWidget(self._combo, 1)
+        row.addWidget(self._btn_next)
+        row.addWidget(btn_add)
+        row.addWidget(self._btn_delete)
+
+        self._combo.currentIndexChanged.connect(self._on_index_changed)
+        self._btn_prev.clicked.connect(lambda: self._step(-1))
+        self._btn_next.clicked.connect(lambda: self._step(1))
+        btn_add.clicked.connect(self.addRequested)
+        self._btn_delete.clicked.connect(self._on_delete_clicked)
+
+    def set_scenes(self, scenes: Sequence[Scene], counts: Dict[int, int], current_id: Optional[int]) -> None:
+        self._scenes = list(scenes)
+        self._counts = dict(counts)
+        self._combo.blockSignals(True)
+        try:
+            self._combo.clear()
+            for scene in self._scenes:
+                self._combo.addItem(self._label(scene), scene.id)
+            index = self._combo.findData(current_id)
+            self._combo.setCurrentIndex(index if index >= 0 else (0 if self._scenes else -1))
+        finally:
+            self._combo.blockSignals(False)
+        self._update_buttons()
+
+    def set_count(self, scene_id: int, count: int) -> None:
+        # 현재 장면을 다시 읽은 뒤 개수만 바뀐 경우: 선택을 건드리지 않고 표시만 고친다
+        self._counts[scene_id] = count
+        for i, scene in enumerate(self._scenes):
+            if scene.id == scene_id:
+                self._combo.setItemText(i, self._label(scene))
+
+    def current_scene_id(self) -> Optional[int]:
+        data = self._combo.currentData()
+        return int(data) if data is not None else None
+
+    def count(self, scene_id: int) -> int:
+        return self._counts.get(scene_id, 0)
+
+    def neighbor_ids(self, scene_id: Optional[int]) -> List[int]:
+        """scene_id의 이전/다음 장면 id(있는 것만)."""
+        ids = [s.id for s in self._scenes]
+        if scene_id not in ids:
+            return []
+        i = ids.index(scene_id)
+        return [ids[j] for j in (i - 1, i + 1) if 0 <= j < len(ids)]
+
+    def _label(self, scene: Scene) -> str:
+        return f"{scene.number}. {scene.name or '(이름 없음)'}  ·  {self._unit} {self._counts.get(scene.id, 0)}"
+
+    def _step(self, delta: int) -> None:
+        index = self._combo.currentIndex() + delta
+        if 0 <= index < self._combo.count():
+            self._combo.setCurrentIndex(index)
+
+    def _update_buttons(self) -> None:
+        index = self._combo.currentIndex()
+        self._btn_prev.setEnabled(index > 0)
+        self._btn_next.setEnabled(0 <= index < self._combo.count() - 1)
+        # 마지막 장면은 지우지 않는다(뷰가 빈 프로젝트에 기본 장면을 다시 만들 뿐이므로)
+        self._btn_delete.setEnabled(self._combo.count() > 1)
+
+    def _on_index_changed(self, _index: int) -> None:
+        self._update_buttons()
+        scene_id = self.current_scene_id()
+        if scene_id is not None:
+            self.sceneChanged.emit(scene_id)
+
+    def _on_delete_clicked(self) -> None:
+        scene_id = self.current_scene_id()
+        if scene_id is not None:
+            self.deleteRequested.emit(scene_id)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+import 시간/의존성 확인 스크립트
+
+데이터 계층(repository, service, utils)은 PySide6 없이 import되어야 하고,
+스크립트나 작업 프로세스가 빠르게 시작할 수 있을 만큼 가벼워야 한다.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent / "src"
+
+# Qt 없이 import되어야 하는 패키지
+DATA_PACKAGES = ["cinescribe.repository", "cinescribe.service", "cinescribe.utils"]
+
+# 새 인터프리터에서 데이터 계층을 import하는 데 허용하는 시간(초)
+IMPORT_BUDGET_SEC = 1.0
+
+# PySide6를 막은 상태에서 패키지의 공개 이름을 모두 불러오고, 로드된 모듈 목록과 시간을 출력
+_PROBE = """
+import importlib, json, sys, time
+sys.modules['PySide6'] = None
+start = time.perf_counter()
+for name in {packages!r}:
+    pkg = importlib.import_module(name)
+    if {touch_all!r}:
+        for attr in getattr(pkg, '__all__', []):
+            getattr(pkg, attr)
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    'elapsed': elapsed,
+    'qt_modules': sorted(m for m in sys.modules if m.startswith('PySide6') and sys.modules[m] is not None),
+    'view_modules': sorted(m for m in sys.modules if m.startswith(('cinescribe.views', 'cinescribe.widgets', 'cinescribe.viewmodel'))),
+}}))
+"""
+
+
+def _probe(packages, touch_all=True):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(SRC_DIR) + os.pathsep + env.get("PYTHONPATH", "")
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(packages=list(packages), touch_all=touch_all)],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=60,
+    )
+    assert result.returncode == 0, f"import 실패:\n{result.stderr}"
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_data_layer_without_qt():
+    """repository/service/utils가 PySide6나 뷰 모듈 없이 import되는지 확인합니다."""
+    print("데이터 계층 import 확인 중...")
+    info = _probe(DATA_PACKAGES)
+    assert not info["qt_modules"], f"PySide6가 로드됨: {info['qt_modules']}"
+    assert not info["view_modules"], f"뷰 모듈이 로드됨: {info['view_modules']}"
+    print(f"✓ {', '.join(DATA_PACKAGES)} ({info['elapsed'] * 1000:.1f}ms)")
+
+
+def test_import_time_budget():
+    """데이터 계층 import 시간이 예산 안에 있는지 확인합니다."""
+    print("\nimport 시간 확인 중...")
+    # 첫 실행의 바이트코드 컴파일 비용을 빼기 위해 한 번 데운 뒤 측정
+    _probe(DATA_PACKAGES)
+    info = _probe(DATA_PACKAGES)
+    print(f"✓ {info['elapsed'] * 1000:.1f}ms (예산 {IMPORT_BUDGET_SEC * 1000:.0f}ms)")
+    assert info["elapsed"] < IMPORT_BUDGET_SEC, f"import가 너무 느림: {info['elapsed']:.3f}s"
+
+
+def test_root_package_is_lazy():
+    """import cinescribe만으로 하위 패키지가 로드되지 않는지 확인합니다."""
+    print("\n루트 패키지 확인 중...")
+    # 루트의 __all__은 하위 패키지 이름이라 모두 접근하면 뷰까지 불러오므로 import만 한다
+    info = _probe(["cinescribe"], touch_all=False)
+    assert not info["view_modules"], f"뷰 모듈이 로드됨: {info['view_modules']}"
+    print("✓ cinescribe")
+
+
+def main():
+    print("=== import 시간 테스트 ===\n")
+    ok = True
+    for test in (test_data_layer_without_qt, test_import_time_budget, test_root_package_is_lazy):
+        try:
+            test()
+        except AssertionError as e:
+            print(f"✗ {e}")
+            ok = False
+    print("\n🎉 모든 테스트 통과!" if ok else "\n❌ 일부 테스트 실패")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())